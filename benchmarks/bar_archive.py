@@ -0,0 +1,81 @@
+"""
+Bar archive benchmark
+
+Archives --years of synthetic minute bars for one symbol, then times range
+queries of several sizes answered from the memory-mapped archive against the
+same ranges sliced from an in-memory DataFrame, each converted to HistoryRows
+as GetHistory does. The archive holds nothing in memory between queries;
+after the first run its pages come from the page cache.
+
+    uv run python benchmarks/bar_archive.py [--years 2] [--repeat 5]
+"""
+
+import argparse
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "gen"))
+
+from src.bar_archive import BarArchive
+from src.server import _bar_rows, _history_rows
+
+TZ = 'America/New_York'
+
+
+def _minute_bars(years: int) -> pd.DataFrame:
+    days = pd.bdate_range('2020-01-02', periods=252 * years)
+    index = pd.DatetimeIndex(np.concatenate([
+        pd.date_range(day + pd.Timedelta(hours=9, minutes=30), periods=390, freq='min').values for day in days
+    ])).tz_localize(TZ)
+    rng = np.random.default_rng(0)
+    close = 100 + np.cumsum(rng.normal(0, 0.05, len(index)))
+    return pd.DataFrame({
+        'Open': close, 'High': close + 0.02, 'Low': close - 0.02, 'Close': close,
+        'Volume': rng.integers(0, 10 ** 5, len(index)),
+    }, index=index)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--years', type=int, default=2)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    frame = _minute_bars(args.years)
+    first, last = frame.index[0].tz_localize(None), frame.index[-1].tz_localize(None)
+    with tempfile.TemporaryDirectory() as root:
+        archive = BarArchive(root)
+        archive.write('BENCH', '1m', frame, first.to_pydatetime(), last.to_pydatetime(), TZ)
+        print(f"{len(frame)} minute bars archived; the DataFrame holds "
+              f"{frame.memory_usage(index=True).sum() / 2 ** 20:.1f} MiB, the archive none between queries")
+        print(f"{'range':<10} {'rows':>8} {'DataFrame':>12} {'archive':>12}")
+        for label, length in (('1 day', pd.Timedelta(days=1)), ('1 month', pd.Timedelta(days=30)),
+                              ('1 year', pd.Timedelta(days=365))):
+            if length >= last - first:
+                continue
+            start = (frame.index[len(frame) // 2].tz_localize(None) - length / 2).ceil('D')
+            end = start + length
+            expected = frame.loc[start.tz_localize(TZ):end.tz_localize(TZ) - pd.Timedelta(1)]
+
+            def from_frame():
+                return _history_rows(frame.loc[start.tz_localize(TZ):end.tz_localize(TZ) - pd.Timedelta(1)])
+
+            def from_archive():
+                bars = archive.read('BENCH', '1m', start.to_pydatetime(), end.to_pydatetime(), actions=False)
+                return _bar_rows(bars, False)
+
+            assert from_archive() == from_frame()
+            frame_ms = min(timeit.repeat(from_frame, number=1, repeat=args.repeat)) * 1000
+            archive_ms = min(timeit.repeat(from_archive, number=1, repeat=args.repeat)) * 1000
+            print(f"{label:<10} {len(expected):>8} {frame_ms:>9.2f} ms {archive_ms:>9.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
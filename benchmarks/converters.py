@@ -0,0 +1,138 @@
+"""
+Converter micro-benchmarks
+
+Per-value cost of src.convert against the helpers it replaced (copied
+below as the baseline): scalar safe_float/safe_int/safe_str over typical
+yfinance values, Timestamp construction, and whole-column conversion of a
+history frame. Timings are the best of --repeat runs, so the Timestamp
+cache is warm, as it is for dates shared across symbols and requests.
+The "cold" rows clear the cache before every run, as for dates no request
+has seen yet, and "minute bars" converts --minute-rows sequential intraday
+timestamps, more than the cache holds.
+
+    uv run python benchmarks/converters.py [--rows 10000] [--minute-rows 100000] [--repeat 5]
+"""
+
+import argparse
+import sys
+import timeit
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from google.protobuf.timestamp_pb2 import Timestamp
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "gen"))
+
+from src import convert
+
+
+def legacy_safe_float(value) -> float:
+    if pd.isna(value) or value is None:
+        return 0.0
+    return float(value)
+
+
+def legacy_safe_int(value) -> int:
+    if pd.isna(value) or value is None:
+        return 0
+    return int(value)
+
+
+def legacy_safe_str(value) -> str:
+    if value is None or (isinstance(value, float) and pd.isna(value)):
+        return ""
+    return str(value)
+
+
+def legacy_datetime_to_timestamp(dt):
+    if pd.isna(dt):
+        return None
+    if isinstance(dt, pd.Timestamp):
+        dt = dt.to_pydatetime()
+    if isinstance(dt, datetime):
+        ts = Timestamp()
+        ts.FromDatetime(dt)
+        return ts
+    return None
+
+
+def _per_value(fn, values, repeat: int) -> float:
+    """Best nanoseconds per value of fn over values"""
+    best = min(timeit.repeat(lambda: [fn(v) for v in values], number=1, repeat=repeat))
+    return best / len(values) * 1e9
+
+
+def _per_row(fn, rows: int, repeat: int) -> float:
+    return min(timeit.repeat(fn, number=1, repeat=repeat)) / rows * 1e9
+
+
+def _per_row_cold(fn, rows: int, repeat: int) -> float:
+    """Like _per_row, with the Timestamp cache emptied before each run"""
+    return min(timeit.repeat(fn, setup=convert.timestamp_from_ns.cache_clear, number=1, repeat=repeat)) / rows * 1e9
+
+
+def _report(name: str, before: float, after: float):
+    print(f"  {name:<28} {before:9.0f} ns  {after:9.0f} ns  {before / after:6.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=10000)
+    parser.add_argument('--minute-rows', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    n, repeat = args.rows, args.repeat
+
+    rng = np.random.default_rng(0)
+    prices = rng.uniform(10, 500, n)
+    prices[::17] = np.nan
+    index = pd.date_range('2000-01-03', periods=n, freq='D', tz='America/New_York')
+    frame = pd.DataFrame({'Open': prices, 'Close': prices, 'Volume': rng.integers(0, 10 ** 8, n)}, index=index)
+
+    scalars = {
+        'float (Python)': [float(v) for v in prices],
+        'float (NumPy)': list(prices),
+        'int (NumPy)': list(frame['Volume'].to_numpy()),
+        'None': [None] * n,
+    }
+    print(f"{'per value':<30} {'before':>12} {'after':>12} {'speedup':>7}")
+    for name, values in scalars.items():
+        _report(f"safe_float {name}", _per_value(legacy_safe_float, values, repeat),
+                _per_value(convert.safe_float, values, repeat))
+    volumes = list(frame['Volume'].to_numpy())
+    _report("safe_int int (NumPy)", _per_value(legacy_safe_int, volumes, repeat),
+            _per_value(convert.safe_int, volumes, repeat))
+    names = [f"SYM{i % 500}" for i in range(n)]
+    _report("safe_str str", _per_value(legacy_safe_str, names, repeat), _per_value(convert.safe_str, names, repeat))
+    stamps = list(index)
+    _report("timestamp pd.Timestamp", _per_value(legacy_datetime_to_timestamp, stamps, repeat),
+            _per_value(convert.datetime_to_timestamp, stamps, repeat))
+    datetimes = [ts.to_pydatetime() for ts in stamps]
+    _report("timestamp datetime", _per_value(legacy_datetime_to_timestamp, datetimes, repeat),
+            _per_value(convert.datetime_to_timestamp, datetimes, repeat))
+
+    print(f"per row ({n} rows)")
+    _report("float column", _per_row(lambda: [legacy_safe_float(v) for v in frame['Open']], n, repeat),
+            _per_row(lambda: convert.float_column(frame['Open']), n, repeat))
+    _report("int column", _per_row(lambda: [legacy_safe_int(v) for v in frame['Volume']], n, repeat),
+            _per_row(lambda: convert.int_column(frame['Volume']), n, repeat))
+    _report("timestamp column", _per_row(lambda: [legacy_datetime_to_timestamp(v) for v in index], n, repeat),
+            _per_row(lambda: convert.timestamp_column(index), n, repeat))
+    _report("timestamp column (cold)",
+            _per_row_cold(lambda: [legacy_datetime_to_timestamp(v) for v in index], n, repeat),
+            _per_row_cold(lambda: convert.timestamp_column(index), n, repeat))
+
+    m = args.minute_rows
+    minutes = pd.date_range('2020-01-02 09:30', periods=m, freq='min', tz='America/New_York')
+    print(f"per row ({m} minute bars)")
+    _report("timestamp column (cold)",
+            _per_row_cold(lambda: [legacy_datetime_to_timestamp(v) for v in minutes], m, repeat),
+            _per_row_cold(lambda: convert.timestamp_column(minutes), m, repeat))
+
+
+if __name__ == '__main__':
+    main()
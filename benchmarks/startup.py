@@ -0,0 +1,95 @@
+"""
+Cold-start benchmark
+
+Reports import cost per module for `import src.server` (from -X importtime)
+and how long `python -m src.main` takes to accept TCP connections.
+
+    uv run python benchmarks/startup.py [--runs 5] [--top 15]
+"""
+
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+
+
+def _env():
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [str(project_root), str(project_root / "gen"),
+                                                     env.get('PYTHONPATH')]))
+    return env
+
+
+def import_times(module: str = 'src.server'):
+    """[(cumulative microseconds, module)] for module and everything it imports, module first"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=project_root, env=_env(), capture_output=True, text=True, check=True,
+    )
+    subtree = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        entry = (int(cumulative), name.rstrip())
+        # importtime prints children before their parent; an unindented name closes a tree
+        if not name.startswith('  '):
+            if name.strip() == module:
+                return [entry] + subtree
+            subtree = []
+        else:
+            subtree.append(entry)
+    raise RuntimeError(f"{module} not found in -X importtime output")
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def time_to_listen(timeout: float = 30.0) -> float:
+    """Seconds from launching the server process until its port accepts connections"""
+    port = _free_port()
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'src.main', '--port', str(port)],
+        cwd=project_root, env=_env(), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            try:
+                with socket.create_connection(('127.0.0.1', port), timeout=0.1):
+                    return time.perf_counter() - started
+            except OSError:
+                time.sleep(0.005)
+        raise TimeoutError(f"Server did not listen on port {port} within {timeout}s")
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=15)
+    args = parser.parse_args()
+
+    times = import_times()
+    print(f"import src.server: {times[0][0] / 1000:.1f} ms")
+    for cumulative, name in sorted(times[1:], reverse=True)[:args.top]:
+        print(f"  {cumulative / 1000:8.1f} ms  {name}")
+
+    listen = [time_to_listen() for _ in range(args.runs)]
+    print(f"time to listen: median {statistics.median(listen) * 1000:.0f} ms, "
+          f"min {min(listen) * 1000:.0f} ms over {args.runs} runs")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+"""
+TickerInfo builder benchmark
+
+Per-call cost of the compiled create_ticker_info against interpreting
+TICKER_INFO_FIELDS field by field (the previous implementation), for full,
+masked and batch builds. Pass --info with a JSON file holding one
+ticker.info dict or a list of them (e.g. dumped with
+`json.dump([yf.Ticker(s).info for s in symbols], f)`) to measure real
+payloads; otherwise a built-in dict shaped like a large-cap equity's info is
+used.
+
+    uv run python benchmarks/ticker_info.py [--info infos.json] [--repeat 5]
+"""
+
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "gen"))
+
+from src.ticker_info import TICKER_INFO_FIELDS, builder, create_ticker_info
+from yfinance_grpc.v1alpha1 import ticker_pb2
+
+# Shape and value types of a large-cap equity's ticker.info, including keys TickerInfo does not map
+SAMPLE_INFO = {
+    'address1': 'One Apple Park Way', 'city': 'Cupertino', 'state': 'CA', 'zip': '95014',
+    'country': 'United States', 'phone': '(408) 996-1010', 'website': 'https://www.apple.com',
+    'industry': 'Consumer Electronics', 'industryKey': 'consumer-electronics', 'sector': 'Technology',
+    'sectorKey': 'technology', 'longBusinessSummary': 'Apple Inc. designs, manufactures and markets '
+    'smartphones, personal computers, tablets, wearables and accessories worldwide. ' * 8,
+    'fullTimeEmployees': 164000, 'companyOfficers': [{'name': 'Officer', 'title': 'CEO', 'age': 63}] * 10,
+    'auditRisk': 7, 'boardRisk': 1, 'compensationRisk': 3, 'shareHolderRightsRisk': 1, 'overallRisk': 1,
+    'governanceEpochDate': 1727740800, 'compensationAsOfEpochDate': 1703980800, 'irWebsite': 'http://ir',
+    'maxAge': 86400, 'priceHint': 2, 'previousClose': 226.47, 'open': 227.3, 'dayLow': 225.88,
+    'dayHigh': 229.74, 'regularMarketPreviousClose': 226.47, 'regularMarketOpen': 227.3,
+    'regularMarketDayLow': 225.88, 'regularMarketDayHigh': 229.74, 'dividendRate': 1.0,
+    'dividendYield': 0.0044, 'exDividendDate': 1731024000, 'payoutRatio': 0.1612,
+    'fiveYearAvgDividendYield': 0.57, 'beta': 1.24, 'trailingPE': 37.73, 'forwardPE': 30.91,
+    'volume': 42107215, 'regularMarketVolume': 42107215, 'averageVolume': 53119398,
+    'averageVolume10days': 44279930, 'averageDailyVolume10Day': 44279930, 'bid': 228.2, 'ask': 228.4,
+    'bidSize': 100, 'askSize': 400, 'marketCap': 3451275182080, 'fiftyTwoWeekLow': 164.08,
+    'fiftyTwoWeekHigh': 237.49, 'priceToSalesTrailing12Months': 8.9, 'fiftyDayAverage': 226.0,
+    'twoHundredDayAverage': 205.27, 'trailingAnnualDividendRate': 0.98,
+    'trailingAnnualDividendYield': 0.0043, 'currency': 'USD', 'enterpriseValue': 3474920177664,
+    'profitMargins': 0.23971, 'floatShares': 15091184209, 'sharesOutstanding': 15115799552,
+    'sharesShort': 133785123, 'sharesShortPriorMonth': 153012324, 'heldPercentInsiders': 0.0203,
+    'heldPercentInstitutions': 0.6131, 'shortRatio': 2.56, 'impliedSharesOutstanding': 15425200128,
+    'bookValue': 3.767, 'priceToBook': 60.6, 'lastFiscalYearEnd': 1727481600,
+    'nextFiscalYearEnd': 1759017600, 'mostRecentQuarter': 1727481600, 'earningsQuarterlyGrowth': -0.358,
+    'netIncomeToCommon': 93736001536, 'trailingEps': 6.05, 'forwardEps': 7.39, 'lastSplitFactor': '4:1',
+    'lastSplitDate': 1598832000, 'enterpriseToRevenue': 8.982, 'enterpriseToEbitda': 26.519,
+    '52WeekChange': 0.2384, 'SandP52WeekChange': 0.3041, 'lastDividendValue': 0.25,
+    'lastDividendDate': 1731024000, 'exchange': 'NMS', 'quoteType': 'EQUITY', 'symbol': 'AAPL',
+    'underlyingSymbol': 'AAPL', 'shortName': 'Apple Inc.', 'longName': 'Apple Inc.',
+    'firstTradeDateEpochUtc': 345479400, 'timeZoneFullName': 'America/New_York',
+    'timeZoneShortName': 'EST', 'uuid': '8b10e4ae-9eeb-3684-921a-9ab27e4d87aa', 'messageBoardId': 'x',
+    'gmtOffSetMilliseconds': -18000000, 'currentPrice': 228.28, 'targetHighPrice': 300.0,
+    'targetLowPrice': 184.0, 'targetMeanPrice': 244.98, 'targetMedianPrice': 250.0,
+    'recommendationMean': 2.0, 'recommendationKey': 'buy', 'numberOfAnalystOpinions': 40,
+    'totalCash': 65171001344, 'totalCashPerShare': 4.311, 'ebitda': 131033997312,
+    'totalDebt': 119058997248, 'quickRatio': 0.745, 'currentRatio': 0.867, 'totalRevenue': 391034994688,
+    'debtToEquity': 209.059, 'revenuePerShare': 25.485, 'returnOnAssets': 0.21464,
+    'returnOnEquity': 1.5741299, 'grossProfits': 180682997760, 'freeCashflow': 110846001152,
+    'operatingCashflow': 118254002176, 'earningsGrowth': -0.341, 'revenueGrowth': 0.061,
+    'grossMargins': 0.46206, 'ebitdaMargins': 0.3351, 'operatingMargins': 0.31171,
+    'financialCurrency': 'USD', 'trailingPegRatio': 2.2,
+}
+
+
+def legacy_create_ticker_info(info: dict, symbol: str, fields=None) -> ticker_pb2.TickerInfo:
+    kwargs = {}
+    for name in (TICKER_INFO_FIELDS if fields is None else fields):
+        key, convert, default = TICKER_INFO_FIELDS[name]
+        if name == 'symbol':
+            default = symbol
+        kwargs[name] = convert(info.get(key, default))
+    return ticker_pb2.TickerInfo(**kwargs)
+
+
+def _per_call(fn, calls: int, repeat: int) -> float:
+    """Best microseconds per call of fn, which makes calls builds"""
+    return min(timeit.repeat(fn, number=1, repeat=repeat)) / calls * 1e6
+
+
+def _report(name: str, before: float, after: float):
+    print(f"  {name:<34} {before:8.2f} us  {after:8.2f} us  {before / after:6.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--info', help="JSON file with a ticker.info dict or a list of them")
+    parser.add_argument('--batch', type=int, default=5000, help="symbols per batch build")
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    if args.info:
+        with open(args.info) as f:
+            loaded = json.load(f)
+        infos = loaded if isinstance(loaded, list) else [loaded]
+    else:
+        infos = [SAMPLE_INFO]
+    batch = [(info.get('symbol', 'SYM'), info) for info in infos] * (args.batch // len(infos) or 1)
+    n = len(batch)
+    mask = ['symbol', 'current_price', 'previous_close', 'market_cap', 'volume', 'currency']
+
+    for symbol, info in batch[:len(infos)]:
+        assert create_ticker_info(info, symbol) == legacy_create_ticker_info(info, symbol)
+
+    print(f"{len(infos)} info dict(s), {n} builds per run")
+    print(f"{'per call':<36} {'before':>11} {'after':>11} {'speedup':>7}")
+    _report("full", _per_call(lambda: [legacy_create_ticker_info(i, s) for s, i in batch], n, args.repeat),
+            _per_call(lambda: [create_ticker_info(i, s) for s, i in batch], n, args.repeat))
+    _report(f"masked ({len(mask)} fields)",
+            _per_call(lambda: [legacy_create_ticker_info(i, s, mask) for s, i in batch], n, args.repeat),
+            _per_call(lambda: [create_ticker_info(i, s, mask) for s, i in batch], n, args.repeat))
+    build = builder()
+    _report("batch, builder reused",
+            _per_call(lambda: [legacy_create_ticker_info(i, s) for s, i in batch], n, args.repeat),
+            _per_call(lambda: [build(i, s) for s, i in batch], n, args.repeat))
+
+
+if __name__ == '__main__':
+    main()
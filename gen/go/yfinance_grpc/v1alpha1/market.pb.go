@@ -22,6 +22,62 @@ const (
 	_ = protoimpl.EnforceVersion(protoimpl.MaxVersion - 20)
 )
 
+// MarketSession is the trading session computed from the cached open/close times.
+type MarketSession int32
+
+const (
+	MarketSession_MARKET_SESSION_UNSPECIFIED MarketSession = 0
+	MarketSession_MARKET_SESSION_PRE         MarketSession = 1
+	MarketSession_MARKET_SESSION_REGULAR     MarketSession = 2
+	MarketSession_MARKET_SESSION_POST        MarketSession = 3
+	MarketSession_MARKET_SESSION_CLOSED      MarketSession = 4
+)
+
+// Enum value maps for MarketSession.
+var (
+	MarketSession_name = map[int32]string{
+		0: "MARKET_SESSION_UNSPECIFIED",
+		1: "MARKET_SESSION_PRE",
+		2: "MARKET_SESSION_REGULAR",
+		3: "MARKET_SESSION_POST",
+		4: "MARKET_SESSION_CLOSED",
+	}
+	MarketSession_value = map[string]int32{
+		"MARKET_SESSION_UNSPECIFIED": 0,
+		"MARKET_SESSION_PRE":         1,
+		"MARKET_SESSION_REGULAR":     2,
+		"MARKET_SESSION_POST":        3,
+		"MARKET_SESSION_CLOSED":      4,
+	}
+)
+
+func (x MarketSession) Enum() *MarketSession {
+	p := new(MarketSession)
+	*p = x
+	return p
+}
+
+func (x MarketSession) String() string {
+	return protoimpl.X.EnumStringOf(x.Descriptor(), protoreflect.EnumNumber(x))
+}
+
+func (MarketSession) Descriptor() protoreflect.EnumDescriptor {
+	return file_yfinance_grpc_v1alpha1_market_proto_enumTypes[0].Descriptor()
+}
+
+func (MarketSession) Type() protoreflect.EnumType {
+	return &file_yfinance_grpc_v1alpha1_market_proto_enumTypes[0]
+}
+
+func (x MarketSession) Number() protoreflect.EnumNumber {
+	return protoreflect.EnumNumber(x)
+}
+
+// Deprecated: Use MarketSession.Descriptor instead.
+func (MarketSession) EnumDescriptor() ([]byte, []int) {
+	return file_yfinance_grpc_v1alpha1_market_proto_rawDescGZIP(), []int{0}
+}
+
 type GetMarketStatusRequest struct {
 	state protoimpl.MessageState `protogen:"open.v1"`
 	// Yahoo Finance market identifier, e.g. "us_market", "gb_market", "jp_market".
@@ -77,8 +133,12 @@ type MarketStatus struct {
 	TimezoneShort string `protobuf:"bytes,4,opt,name=timezone_short,json=timezoneShort,proto3" json:"timezone_short,omitempty"`
 	// GMT offset in milliseconds.
 	TimezoneGmtoffset int32 `protobuf:"varint,5,opt,name=timezone_gmtoffset,json=timezoneGmtoffset,proto3" json:"timezone_gmtoffset,omitempty"`
-	unknownFields     protoimpl.UnknownFields
-	sizeCache         protoimpl.SizeCache
+	// Current session, computed server-side from open/close (US markets include pre/post windows).
+	Session MarketSession `protobuf:"varint,6,opt,name=session,proto3,enum=yfinance_grpc.v1alpha1.MarketSession" json:"session,omitempty"`
+	// When session next changes; unset when the next session has not been published yet.
+	NextTransition *timestamppb.Timestamp `protobuf:"bytes,7,opt,name=next_transition,json=nextTransition,proto3" json:"next_transition,omitempty"`
+	unknownFields  protoimpl.UnknownFields
+	sizeCache      protoimpl.SizeCache
 }
 
 func (x *MarketStatus) Reset() {
@@ -146,6 +206,20 @@ func (x *MarketStatus) GetTimezoneGmtoffset() int32 {
 	return 0
 }
 
+func (x *MarketStatus) GetSession() MarketSession {
+	if x != nil {
+		return x.Session
+	}
+	return MarketSession_MARKET_SESSION_UNSPECIFIED
+}
+
+func (x *MarketStatus) GetNextTransition() *timestamppb.Timestamp {
+	if x != nil {
+		return x.NextTransition
+	}
+	return nil
+}
+
 type GetMarketStatusResponse struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
 	Status        *MarketStatus          `protobuf:"bytes,1,opt,name=status,proto3" json:"status,omitempty"`
@@ -348,20 +422,119 @@ func (x *GetMarketSummaryResponse) GetSummary() map[string]*MarketSummaryItem {
 	return nil
 }
 
+type WatchMarketStatusRequest struct {
+	state protoimpl.MessageState `protogen:"open.v1"`
+	// Yahoo Finance market identifiers, e.g. ["us_market", "gb_market"].
+	Markets       []string `protobuf:"bytes,1,rep,name=markets,proto3" json:"markets,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *WatchMarketStatusRequest) Reset() {
+	*x = WatchMarketStatusRequest{}
+	mi := &file_yfinance_grpc_v1alpha1_market_proto_msgTypes[6]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *WatchMarketStatusRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*WatchMarketStatusRequest) ProtoMessage() {}
+
+func (x *WatchMarketStatusRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_yfinance_grpc_v1alpha1_market_proto_msgTypes[6]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use WatchMarketStatusRequest.ProtoReflect.Descriptor instead.
+func (*WatchMarketStatusRequest) Descriptor() ([]byte, []int) {
+	return file_yfinance_grpc_v1alpha1_market_proto_rawDescGZIP(), []int{6}
+}
+
+func (x *WatchMarketStatusRequest) GetMarkets() []string {
+	if x != nil {
+		return x.Markets
+	}
+	return nil
+}
+
+type WatchMarketStatusResponse struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	Market        string                 `protobuf:"bytes,1,opt,name=market,proto3" json:"market,omitempty"`
+	Status        *MarketStatus          `protobuf:"bytes,2,opt,name=status,proto3" json:"status,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *WatchMarketStatusResponse) Reset() {
+	*x = WatchMarketStatusResponse{}
+	mi := &file_yfinance_grpc_v1alpha1_market_proto_msgTypes[7]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *WatchMarketStatusResponse) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*WatchMarketStatusResponse) ProtoMessage() {}
+
+func (x *WatchMarketStatusResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_yfinance_grpc_v1alpha1_market_proto_msgTypes[7]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use WatchMarketStatusResponse.ProtoReflect.Descriptor instead.
+func (*WatchMarketStatusResponse) Descriptor() ([]byte, []int) {
+	return file_yfinance_grpc_v1alpha1_market_proto_rawDescGZIP(), []int{7}
+}
+
+func (x *WatchMarketStatusResponse) GetMarket() string {
+	if x != nil {
+		return x.Market
+	}
+	return ""
+}
+
+func (x *WatchMarketStatusResponse) GetStatus() *MarketStatus {
+	if x != nil {
+		return x.Status
+	}
+	return nil
+}
+
 var File_yfinance_grpc_v1alpha1_market_proto protoreflect.FileDescriptor
 
 const file_yfinance_grpc_v1alpha1_market_proto_rawDesc = "" +
 	"\n" +
 	"#yfinance_grpc/v1alpha1/market.proto\x12\x16yfinance_grpc.v1alpha1\x1a\x1fgoogle/protobuf/timestamp.proto\"0\n" +
 	"\x16GetMarketStatusRequest\x12\x16\n" +
-	"\x06market\x18\x01 \x01(\tR\x06market\"\xe7\x01\n" +
+	"\x06market\x18\x01 \x01(\tR\x06market\"\xed\x02\n" +
 	"\fMarketStatus\x12\x1f\n" +
 	"\vmarket_type\x18\x01 \x01(\tR\n" +
 	"marketType\x12.\n" +
 	"\x04open\x18\x02 \x01(\v2\x1a.google.protobuf.TimestampR\x04open\x120\n" +
 	"\x05close\x18\x03 \x01(\v2\x1a.google.protobuf.TimestampR\x05close\x12%\n" +
 	"\x0etimezone_short\x18\x04 \x01(\tR\rtimezoneShort\x12-\n" +
-	"\x12timezone_gmtoffset\x18\x05 \x01(\x05R\x11timezoneGmtoffset\"W\n" +
+	"\x12timezone_gmtoffset\x18\x05 \x01(\x05R\x11timezoneGmtoffset\x12?\n" +
+	"\asession\x18\x06 \x01(\x0e2%.yfinance_grpc.v1alpha1.MarketSessionR\asession\x12C\n" +
+	"\x0fnext_transition\x18\a \x01(\v2\x1a.google.protobuf.TimestampR\x0enextTransition\"W\n" +
 	"\x17GetMarketStatusResponse\x12<\n" +
 	"\x06status\x18\x01 \x01(\v2$.yfinance_grpc.v1alpha1.MarketStatusR\x06status\"1\n" +
 	"\x17GetMarketSummaryRequest\x12\x16\n" +
@@ -376,10 +549,22 @@ const file_yfinance_grpc_v1alpha1_market_proto_rawDesc = "" +
 	"\asummary\x18\x01 \x03(\v2=.yfinance_grpc.v1alpha1.GetMarketSummaryResponse.SummaryEntryR\asummary\x1ae\n" +
 	"\fSummaryEntry\x12\x10\n" +
 	"\x03key\x18\x01 \x01(\tR\x03key\x12?\n" +
-	"\x05value\x18\x02 \x01(\v2).yfinance_grpc.v1alpha1.MarketSummaryItemR\x05value:\x028\x012\xfa\x01\n" +
+	"\x05value\x18\x02 \x01(\v2).yfinance_grpc.v1alpha1.MarketSummaryItemR\x05value:\x028\x01\"4\n" +
+	"\x18WatchMarketStatusRequest\x12\x18\n" +
+	"\amarkets\x18\x01 \x03(\tR\amarkets\"q\n" +
+	"\x19WatchMarketStatusResponse\x12\x16\n" +
+	"\x06market\x18\x01 \x01(\tR\x06market\x12<\n" +
+	"\x06status\x18\x02 \x01(\v2$.yfinance_grpc.v1alpha1.MarketStatusR\x06status*\x97\x01\n" +
+	"\rMarketSession\x12\x1e\n" +
+	"\x1aMARKET_SESSION_UNSPECIFIED\x10\x00\x12\x16\n" +
+	"\x12MARKET_SESSION_PRE\x10\x01\x12\x1a\n" +
+	"\x16MARKET_SESSION_REGULAR\x10\x02\x12\x17\n" +
+	"\x13MARKET_SESSION_POST\x10\x03\x12\x19\n" +
+	"\x15MARKET_SESSION_CLOSED\x10\x042\xf6\x02\n" +
 	"\rMarketService\x12r\n" +
 	"\x0fGetMarketStatus\x12..yfinance_grpc.v1alpha1.GetMarketStatusRequest\x1a/.yfinance_grpc.v1alpha1.GetMarketStatusResponse\x12u\n" +
-	"\x10GetMarketSummary\x12/.yfinance_grpc.v1alpha1.GetMarketSummaryRequest\x1a0.yfinance_grpc.v1alpha1.GetMarketSummaryResponseB\xf6\x01\n" +
+	"\x10GetMarketSummary\x12/.yfinance_grpc.v1alpha1.GetMarketSummaryRequest\x1a0.yfinance_grpc.v1alpha1.GetMarketSummaryResponse\x12z\n" +
+	"\x11WatchMarketStatus\x120.yfinance_grpc.v1alpha1.WatchMarketStatusRequest\x1a1.yfinance_grpc.v1alpha1.WatchMarketStatusResponse0\x01B\xf6\x01\n" +
 	"\x1acom.yfinance_grpc.v1alpha1B\vMarketProtoP\x01ZVgithub.com/idebeijer/yfinance-grpc/gen/go/yfinance_grpc/v1alpha1;yfinance_grpcv1alpha1\xa2\x02\x03YXX\xaa\x02\x15YfinanceGrpc.V1alpha1\xca\x02\x15YfinanceGrpc\\V1alpha1\xe2\x02!YfinanceGrpc\\V1alpha1\\GPBMetadata\xea\x02\x16YfinanceGrpc::V1alpha1b\x06proto3"
 
 var (
@@ -394,32 +579,41 @@ func file_yfinance_grpc_v1alpha1_market_proto_rawDescGZIP() []byte {
 	return file_yfinance_grpc_v1alpha1_market_proto_rawDescData
 }
 
-var file_yfinance_grpc_v1alpha1_market_proto_msgTypes = make([]protoimpl.MessageInfo, 7)
+var file_yfinance_grpc_v1alpha1_market_proto_enumTypes = make([]protoimpl.EnumInfo, 1)
+var file_yfinance_grpc_v1alpha1_market_proto_msgTypes = make([]protoimpl.MessageInfo, 9)
 var file_yfinance_grpc_v1alpha1_market_proto_goTypes = []any{
-	(*GetMarketStatusRequest)(nil),   // 0: yfinance_grpc.v1alpha1.GetMarketStatusRequest
-	(*MarketStatus)(nil),             // 1: yfinance_grpc.v1alpha1.MarketStatus
-	(*GetMarketStatusResponse)(nil),  // 2: yfinance_grpc.v1alpha1.GetMarketStatusResponse
-	(*GetMarketSummaryRequest)(nil),  // 3: yfinance_grpc.v1alpha1.GetMarketSummaryRequest
-	(*MarketSummaryItem)(nil),        // 4: yfinance_grpc.v1alpha1.MarketSummaryItem
-	(*GetMarketSummaryResponse)(nil), // 5: yfinance_grpc.v1alpha1.GetMarketSummaryResponse
-	nil,                              // 6: yfinance_grpc.v1alpha1.GetMarketSummaryResponse.SummaryEntry
-	(*timestamppb.Timestamp)(nil),    // 7: google.protobuf.Timestamp
+	(MarketSession)(0),                // 0: yfinance_grpc.v1alpha1.MarketSession
+	(*GetMarketStatusRequest)(nil),    // 1: yfinance_grpc.v1alpha1.GetMarketStatusRequest
+	(*MarketStatus)(nil),              // 2: yfinance_grpc.v1alpha1.MarketStatus
+	(*GetMarketStatusResponse)(nil),   // 3: yfinance_grpc.v1alpha1.GetMarketStatusResponse
+	(*GetMarketSummaryRequest)(nil),   // 4: yfinance_grpc.v1alpha1.GetMarketSummaryRequest
+	(*MarketSummaryItem)(nil),         // 5: yfinance_grpc.v1alpha1.MarketSummaryItem
+	(*GetMarketSummaryResponse)(nil),  // 6: yfinance_grpc.v1alpha1.GetMarketSummaryResponse
+	(*WatchMarketStatusRequest)(nil),  // 7: yfinance_grpc.v1alpha1.WatchMarketStatusRequest
+	(*WatchMarketStatusResponse)(nil), // 8: yfinance_grpc.v1alpha1.WatchMarketStatusResponse
+	nil,                               // 9: yfinance_grpc.v1alpha1.GetMarketSummaryResponse.SummaryEntry
+	(*timestamppb.Timestamp)(nil),     // 10: google.protobuf.Timestamp
 }
 var file_yfinance_grpc_v1alpha1_market_proto_depIdxs = []int32{
-	7, // 0: yfinance_grpc.v1alpha1.MarketStatus.open:type_name -> google.protobuf.Timestamp
-	7, // 1: yfinance_grpc.v1alpha1.MarketStatus.close:type_name -> google.protobuf.Timestamp
-	1, // 2: yfinance_grpc.v1alpha1.GetMarketStatusResponse.status:type_name -> yfinance_grpc.v1alpha1.MarketStatus
-	6, // 3: yfinance_grpc.v1alpha1.GetMarketSummaryResponse.summary:type_name -> yfinance_grpc.v1alpha1.GetMarketSummaryResponse.SummaryEntry
-	4, // 4: yfinance_grpc.v1alpha1.GetMarketSummaryResponse.SummaryEntry.value:type_name -> yfinance_grpc.v1alpha1.MarketSummaryItem
-	0, // 5: yfinance_grpc.v1alpha1.MarketService.GetMarketStatus:input_type -> yfinance_grpc.v1alpha1.GetMarketStatusRequest
-	3, // 6: yfinance_grpc.v1alpha1.MarketService.GetMarketSummary:input_type -> yfinance_grpc.v1alpha1.GetMarketSummaryRequest
-	2, // 7: yfinance_grpc.v1alpha1.MarketService.GetMarketStatus:output_type -> yfinance_grpc.v1alpha1.GetMarketStatusResponse
-	5, // 8: yfinance_grpc.v1alpha1.MarketService.GetMarketSummary:output_type -> yfinance_grpc.v1alpha1.GetMarketSummaryResponse
-	7, // [7:9] is the sub-list for method output_type
-	5, // [5:7] is the sub-list for method input_type
-	5, // [5:5] is the sub-list for extension type_name
-	5, // [5:5] is the sub-list for extension extendee
-	0, // [0:5] is the sub-list for field type_name
+	10, // 0: yfinance_grpc.v1alpha1.MarketStatus.open:type_name -> google.protobuf.Timestamp
+	10, // 1: yfinance_grpc.v1alpha1.MarketStatus.close:type_name -> google.protobuf.Timestamp
+	0,  // 2: yfinance_grpc.v1alpha1.MarketStatus.session:type_name -> yfinance_grpc.v1alpha1.MarketSession
+	10, // 3: yfinance_grpc.v1alpha1.MarketStatus.next_transition:type_name -> google.protobuf.Timestamp
+	2,  // 4: yfinance_grpc.v1alpha1.GetMarketStatusResponse.status:type_name -> yfinance_grpc.v1alpha1.MarketStatus
+	9,  // 5: yfinance_grpc.v1alpha1.GetMarketSummaryResponse.summary:type_name -> yfinance_grpc.v1alpha1.GetMarketSummaryResponse.SummaryEntry
+	2,  // 6: yfinance_grpc.v1alpha1.WatchMarketStatusResponse.status:type_name -> yfinance_grpc.v1alpha1.MarketStatus
+	5,  // 7: yfinance_grpc.v1alpha1.GetMarketSummaryResponse.SummaryEntry.value:type_name -> yfinance_grpc.v1alpha1.MarketSummaryItem
+	1,  // 8: yfinance_grpc.v1alpha1.MarketService.GetMarketStatus:input_type -> yfinance_grpc.v1alpha1.GetMarketStatusRequest
+	4,  // 9: yfinance_grpc.v1alpha1.MarketService.GetMarketSummary:input_type -> yfinance_grpc.v1alpha1.GetMarketSummaryRequest
+	7,  // 10: yfinance_grpc.v1alpha1.MarketService.WatchMarketStatus:input_type -> yfinance_grpc.v1alpha1.WatchMarketStatusRequest
+	3,  // 11: yfinance_grpc.v1alpha1.MarketService.GetMarketStatus:output_type -> yfinance_grpc.v1alpha1.GetMarketStatusResponse
+	6,  // 12: yfinance_grpc.v1alpha1.MarketService.GetMarketSummary:output_type -> yfinance_grpc.v1alpha1.GetMarketSummaryResponse
+	8,  // 13: yfinance_grpc.v1alpha1.MarketService.WatchMarketStatus:output_type -> yfinance_grpc.v1alpha1.WatchMarketStatusResponse
+	11, // [11:14] is the sub-list for method output_type
+	8,  // [8:11] is the sub-list for method input_type
+	8,  // [8:8] is the sub-list for extension type_name
+	8,  // [8:8] is the sub-list for extension extendee
+	0,  // [0:8] is the sub-list for field type_name
 }
 
 func init() { file_yfinance_grpc_v1alpha1_market_proto_init() }
@@ -432,13 +626,14 @@ func file_yfinance_grpc_v1alpha1_market_proto_init() {
 		File: protoimpl.DescBuilder{
 			GoPackagePath: reflect.TypeOf(x{}).PkgPath(),
 			RawDescriptor: unsafe.Slice(unsafe.StringData(file_yfinance_grpc_v1alpha1_market_proto_rawDesc), len(file_yfinance_grpc_v1alpha1_market_proto_rawDesc)),
-			NumEnums:      0,
-			NumMessages:   7,
+			NumEnums:      1,
+			NumMessages:   9,
 			NumExtensions: 0,
 			NumServices:   1,
 		},
 		GoTypes:           file_yfinance_grpc_v1alpha1_market_proto_goTypes,
 		DependencyIndexes: file_yfinance_grpc_v1alpha1_market_proto_depIdxs,
+		EnumInfos:         file_yfinance_grpc_v1alpha1_market_proto_enumTypes,
 		MessageInfos:      file_yfinance_grpc_v1alpha1_market_proto_msgTypes,
 	}.Build()
 	File_yfinance_grpc_v1alpha1_market_proto = out.File
@@ -19,8 +19,9 @@ import (
 const _ = grpc.SupportPackageIsVersion9
 
 const (
-	MarketService_GetMarketStatus_FullMethodName  = "/yfinance_grpc.v1alpha1.MarketService/GetMarketStatus"
-	MarketService_GetMarketSummary_FullMethodName = "/yfinance_grpc.v1alpha1.MarketService/GetMarketSummary"
+	MarketService_GetMarketStatus_FullMethodName   = "/yfinance_grpc.v1alpha1.MarketService/GetMarketStatus"
+	MarketService_GetMarketSummary_FullMethodName  = "/yfinance_grpc.v1alpha1.MarketService/GetMarketSummary"
+	MarketService_WatchMarketStatus_FullMethodName = "/yfinance_grpc.v1alpha1.MarketService/WatchMarketStatus"
 )
 
 // MarketServiceClient is the client API for MarketService service.
@@ -33,6 +34,9 @@ type MarketServiceClient interface {
 	GetMarketStatus(ctx context.Context, in *GetMarketStatusRequest, opts ...grpc.CallOption) (*GetMarketStatusResponse, error)
 	// GetMarketSummary returns a price summary of major instruments in a market.
 	GetMarketSummary(ctx context.Context, in *GetMarketSummaryRequest, opts ...grpc.CallOption) (*GetMarketSummaryResponse, error)
+	// WatchMarketStatus streams the current status of each requested market, then one
+	// message per session transition (or newly published session) until cancelled.
+	WatchMarketStatus(ctx context.Context, in *WatchMarketStatusRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[WatchMarketStatusResponse], error)
 }
 
 type marketServiceClient struct {
@@ -63,6 +67,25 @@ func (c *marketServiceClient) GetMarketSummary(ctx context.Context, in *GetMarke
 	return out, nil
 }
 
+func (c *marketServiceClient) WatchMarketStatus(ctx context.Context, in *WatchMarketStatusRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[WatchMarketStatusResponse], error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	stream, err := c.cc.NewStream(ctx, &MarketService_ServiceDesc.Streams[0], MarketService_WatchMarketStatus_FullMethodName, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	x := &grpc.GenericClientStream[WatchMarketStatusRequest, WatchMarketStatusResponse]{ClientStream: stream}
+	if err := x.ClientStream.SendMsg(in); err != nil {
+		return nil, err
+	}
+	if err := x.ClientStream.CloseSend(); err != nil {
+		return nil, err
+	}
+	return x, nil
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type MarketService_WatchMarketStatusClient = grpc.ServerStreamingClient[WatchMarketStatusResponse]
+
 // MarketServiceServer is the server API for MarketService service.
 // All implementations must embed UnimplementedMarketServiceServer
 // for forward compatibility.
@@ -73,6 +96,9 @@ type MarketServiceServer interface {
 	GetMarketStatus(context.Context, *GetMarketStatusRequest) (*GetMarketStatusResponse, error)
 	// GetMarketSummary returns a price summary of major instruments in a market.
 	GetMarketSummary(context.Context, *GetMarketSummaryRequest) (*GetMarketSummaryResponse, error)
+	// WatchMarketStatus streams the current status of each requested market, then one
+	// message per session transition (or newly published session) until cancelled.
+	WatchMarketStatus(*WatchMarketStatusRequest, grpc.ServerStreamingServer[WatchMarketStatusResponse]) error
 	mustEmbedUnimplementedMarketServiceServer()
 }
 
@@ -89,6 +115,9 @@ func (UnimplementedMarketServiceServer) GetMarketStatus(context.Context, *GetMar
 func (UnimplementedMarketServiceServer) GetMarketSummary(context.Context, *GetMarketSummaryRequest) (*GetMarketSummaryResponse, error) {
 	return nil, status.Error(codes.Unimplemented, "method GetMarketSummary not implemented")
 }
+func (UnimplementedMarketServiceServer) WatchMarketStatus(*WatchMarketStatusRequest, grpc.ServerStreamingServer[WatchMarketStatusResponse]) error {
+	return status.Error(codes.Unimplemented, "method WatchMarketStatus not implemented")
+}
 func (UnimplementedMarketServiceServer) mustEmbedUnimplementedMarketServiceServer() {}
 func (UnimplementedMarketServiceServer) testEmbeddedByValue()                       {}
 
@@ -146,6 +175,17 @@ func _MarketService_GetMarketSummary_Handler(srv interface{}, ctx context.Contex
 	return interceptor(ctx, in, info, handler)
 }
 
+func _MarketService_WatchMarketStatus_Handler(srv interface{}, stream grpc.ServerStream) error {
+	m := new(WatchMarketStatusRequest)
+	if err := stream.RecvMsg(m); err != nil {
+		return err
+	}
+	return srv.(MarketServiceServer).WatchMarketStatus(m, &grpc.GenericServerStream[WatchMarketStatusRequest, WatchMarketStatusResponse]{ServerStream: stream})
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type MarketService_WatchMarketStatusServer = grpc.ServerStreamingServer[WatchMarketStatusResponse]
+
 // MarketService_ServiceDesc is the grpc.ServiceDesc for MarketService service.
 // It's only intended for direct use with grpc.RegisterService,
 // and not to be introspected or modified (even as a copy)
@@ -162,6 +202,12 @@ var MarketService_ServiceDesc = grpc.ServiceDesc{
 			Handler:    _MarketService_GetMarketSummary_Handler,
 		},
 	},
-	Streams:  []grpc.StreamDesc{},
+	Streams: []grpc.StreamDesc{
+		{
+			StreamName:    "WatchMarketStatus",
+			Handler:       _MarketService_WatchMarketStatus_Handler,
+			ServerStreams: true,
+		},
+	},
 	Metadata: "yfinance_grpc/v1alpha1/market.proto",
 }
@@ -9,6 +9,7 @@ package yfinance_grpcv1alpha1
 import (
 	protoreflect "google.golang.org/protobuf/reflect/protoreflect"
 	protoimpl "google.golang.org/protobuf/runtime/protoimpl"
+	fieldmaskpb "google.golang.org/protobuf/types/known/fieldmaskpb"
 	timestamppb "google.golang.org/protobuf/types/known/timestamppb"
 	reflect "reflect"
 	sync "sync"
@@ -22,9 +23,116 @@ const (
 	_ = protoimpl.EnforceVersion(protoimpl.MaxVersion - 20)
 )
 
+// InfoSource records which upstream path produced a TickerInfo.
+type InfoSource int32
+
+const (
+	InfoSource_INFO_SOURCE_UNSPECIFIED InfoSource = 0
+	InfoSource_INFO_SOURCE_FULL        InfoSource = 1 // ticker.info (full quoteSummary)
+	InfoSource_INFO_SOURCE_FAST        InfoSource = 2 // ticker.get_fast_info() (lightweight chart data)
+)
+
+// Enum value maps for InfoSource.
+var (
+	InfoSource_name = map[int32]string{
+		0: "INFO_SOURCE_UNSPECIFIED",
+		1: "INFO_SOURCE_FULL",
+		2: "INFO_SOURCE_FAST",
+	}
+	InfoSource_value = map[string]int32{
+		"INFO_SOURCE_UNSPECIFIED": 0,
+		"INFO_SOURCE_FULL":        1,
+		"INFO_SOURCE_FAST":        2,
+	}
+)
+
+func (x InfoSource) Enum() *InfoSource {
+	p := new(InfoSource)
+	*p = x
+	return p
+}
+
+func (x InfoSource) String() string {
+	return protoimpl.X.EnumStringOf(x.Descriptor(), protoreflect.EnumNumber(x))
+}
+
+func (InfoSource) Descriptor() protoreflect.EnumDescriptor {
+	return file_yfinance_grpc_v1alpha1_ticker_proto_enumTypes[0].Descriptor()
+}
+
+func (InfoSource) Type() protoreflect.EnumType {
+	return &file_yfinance_grpc_v1alpha1_ticker_proto_enumTypes[0]
+}
+
+func (x InfoSource) Number() protoreflect.EnumNumber {
+	return protoreflect.EnumNumber(x)
+}
+
+// Deprecated: Use InfoSource.Descriptor instead.
+func (InfoSource) EnumDescriptor() ([]byte, []int) {
+	return file_yfinance_grpc_v1alpha1_ticker_proto_rawDescGZIP(), []int{0}
+}
+
+// InfoFreshness hints how GetInfo and GetMultipleInfo should source TickerInfo fields.
+type InfoFreshness int32
+
+const (
+	// Use the fast path when every read_mask field can be served from fast info, otherwise full info.
+	InfoFreshness_INFO_FRESHNESS_UNSPECIFIED InfoFreshness = 0
+	// Always use the fast path; fields it cannot supply are left unset.
+	InfoFreshness_INFO_FRESHNESS_FAST InfoFreshness = 1
+	// Always fetch the full info dict.
+	InfoFreshness_INFO_FRESHNESS_FULL InfoFreshness = 2
+)
+
+// Enum value maps for InfoFreshness.
+var (
+	InfoFreshness_name = map[int32]string{
+		0: "INFO_FRESHNESS_UNSPECIFIED",
+		1: "INFO_FRESHNESS_FAST",
+		2: "INFO_FRESHNESS_FULL",
+	}
+	InfoFreshness_value = map[string]int32{
+		"INFO_FRESHNESS_UNSPECIFIED": 0,
+		"INFO_FRESHNESS_FAST":        1,
+		"INFO_FRESHNESS_FULL":        2,
+	}
+)
+
+func (x InfoFreshness) Enum() *InfoFreshness {
+	p := new(InfoFreshness)
+	*p = x
+	return p
+}
+
+func (x InfoFreshness) String() string {
+	return protoimpl.X.EnumStringOf(x.Descriptor(), protoreflect.EnumNumber(x))
+}
+
+func (InfoFreshness) Descriptor() protoreflect.EnumDescriptor {
+	return file_yfinance_grpc_v1alpha1_ticker_proto_enumTypes[1].Descriptor()
+}
+
+func (InfoFreshness) Type() protoreflect.EnumType {
+	return &file_yfinance_grpc_v1alpha1_ticker_proto_enumTypes[1]
+}
+
+func (x InfoFreshness) Number() protoreflect.EnumNumber {
+	return protoreflect.EnumNumber(x)
+}
+
+// Deprecated: Use InfoFreshness.Descriptor instead.
+func (InfoFreshness) EnumDescriptor() ([]byte, []int) {
+	return file_yfinance_grpc_v1alpha1_ticker_proto_rawDescGZIP(), []int{1}
+}
+
 type GetInfoRequest struct {
-	state         protoimpl.MessageState `protogen:"open.v1"`
-	Ticker        string                 `protobuf:"bytes,1,opt,name=ticker,proto3" json:"ticker,omitempty"` // Ticker symbol (e.g., "AAPL")
+	state  protoimpl.MessageState `protogen:"open.v1"`
+	Ticker string                 `protobuf:"bytes,1,opt,name=ticker,proto3" json:"ticker,omitempty"` // Ticker symbol (e.g., "AAPL")
+	// Optional TickerInfo field paths to populate (e.g., ["current_price", "market_cap"]).
+	// Unset or empty returns every field.
+	ReadMask      *fieldmaskpb.FieldMask `protobuf:"bytes,2,opt,name=read_mask,json=readMask,proto3" json:"read_mask,omitempty"`
+	Freshness     InfoFreshness          `protobuf:"varint,3,opt,name=freshness,proto3,enum=yfinance_grpc.v1alpha1.InfoFreshness" json:"freshness,omitempty"` // Source planning hint (default: planner decides from read_mask)
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
@@ -66,9 +174,24 @@ func (x *GetInfoRequest) GetTicker() string {
 	return ""
 }
 
+func (x *GetInfoRequest) GetReadMask() *fieldmaskpb.FieldMask {
+	if x != nil {
+		return x.ReadMask
+	}
+	return nil
+}
+
+func (x *GetInfoRequest) GetFreshness() InfoFreshness {
+	if x != nil {
+		return x.Freshness
+	}
+	return InfoFreshness_INFO_FRESHNESS_UNSPECIFIED
+}
+
 type GetInfoResponse struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
 	Info          *TickerInfo            `protobuf:"bytes,1,opt,name=info,proto3" json:"info,omitempty"`
+	Source        InfoSource             `protobuf:"varint,2,opt,name=source,proto3,enum=yfinance_grpc.v1alpha1.InfoSource" json:"source,omitempty"` // Upstream path that served this response
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
@@ -110,6 +233,13 @@ func (x *GetInfoResponse) GetInfo() *TickerInfo {
 	return nil
 }
 
+func (x *GetInfoResponse) GetSource() InfoSource {
+	if x != nil {
+		return x.Source
+	}
+	return InfoSource_INFO_SOURCE_UNSPECIFIED
+}
+
 type TickerInfo struct {
 	state protoimpl.MessageState `protogen:"open.v1"`
 	// Company Information
@@ -1423,11 +1553,13 @@ func (x *ActionRow) GetCapitalGains() float64 {
 }
 
 type GetFinancialsRequest struct {
-	state         protoimpl.MessageState `protogen:"open.v1"`
-	Ticker        string                 `protobuf:"bytes,1,opt,name=ticker,proto3" json:"ticker,omitempty"`
-	Freq          string                 `protobuf:"bytes,2,opt,name=freq,proto3" json:"freq,omitempty"`                    // "yearly", "quarterly", or "trailing" (default: "yearly")
-	AsDict        bool                   `protobuf:"varint,3,opt,name=as_dict,json=asDict,proto3" json:"as_dict,omitempty"` // Return as dictionary format
-	Pretty        bool                   `protobuf:"varint,4,opt,name=pretty,proto3" json:"pretty,omitempty"`               // Format row names nicely for readability
+	state  protoimpl.MessageState `protogen:"open.v1"`
+	Ticker string                 `protobuf:"bytes,1,opt,name=ticker,proto3" json:"ticker,omitempty"`
+	Freq   string                 `protobuf:"bytes,2,opt,name=freq,proto3" json:"freq,omitempty"`                    // "yearly", "quarterly", or "trailing" (default: "yearly")
+	AsDict bool                   `protobuf:"varint,3,opt,name=as_dict,json=asDict,proto3" json:"as_dict,omitempty"` // Return as dictionary format
+	Pretty bool                   `protobuf:"varint,4,opt,name=pretty,proto3" json:"pretty,omitempty"`               // Format row names nicely for readability
+	// Return an empty not_modified response when the content hash still equals this etag.
+	IfNoneMatch   string `protobuf:"bytes,5,opt,name=if_none_match,json=ifNoneMatch,proto3" json:"if_none_match,omitempty"`
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
@@ -1490,9 +1622,18 @@ func (x *GetFinancialsRequest) GetPretty() bool {
 	return false
 }
 
+func (x *GetFinancialsRequest) GetIfNoneMatch() string {
+	if x != nil {
+		return x.IfNoneMatch
+	}
+	return ""
+}
+
 type GetFinancialsResponse struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
 	Statements    []*FinancialStatement  `protobuf:"bytes,1,rep,name=statements,proto3" json:"statements,omitempty"`
+	Etag          string                 `protobuf:"bytes,2,opt,name=etag,proto3" json:"etag,omitempty"`                                   // Content hash of this response; pass back as if_none_match
+	NotModified   bool                   `protobuf:"varint,3,opt,name=not_modified,json=notModified,proto3" json:"not_modified,omitempty"` // True when if_none_match matched and the payload was omitted
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
@@ -1534,6 +1675,20 @@ func (x *GetFinancialsResponse) GetStatements() []*FinancialStatement {
 	return nil
 }
 
+func (x *GetFinancialsResponse) GetEtag() string {
+	if x != nil {
+		return x.Etag
+	}
+	return ""
+}
+
+func (x *GetFinancialsResponse) GetNotModified() bool {
+	if x != nil {
+		return x.NotModified
+	}
+	return false
+}
+
 type FinancialStatement struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
 	Date          *timestamppb.Timestamp `protobuf:"bytes,1,opt,name=date,proto3" json:"date,omitempty"`
@@ -3135,8 +3290,10 @@ func (x *GetMajorHoldersResponse) GetHolders() map[string]string {
 }
 
 type GetInstitutionalHoldersRequest struct {
-	state         protoimpl.MessageState `protogen:"open.v1"`
-	Ticker        string                 `protobuf:"bytes,1,opt,name=ticker,proto3" json:"ticker,omitempty"`
+	state  protoimpl.MessageState `protogen:"open.v1"`
+	Ticker string                 `protobuf:"bytes,1,opt,name=ticker,proto3" json:"ticker,omitempty"`
+	// Return an empty not_modified response when the content hash still equals this etag.
+	IfNoneMatch   string `protobuf:"bytes,2,opt,name=if_none_match,json=ifNoneMatch,proto3" json:"if_none_match,omitempty"`
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
@@ -3178,9 +3335,18 @@ func (x *GetInstitutionalHoldersRequest) GetTicker() string {
 	return ""
 }
 
+func (x *GetInstitutionalHoldersRequest) GetIfNoneMatch() string {
+	if x != nil {
+		return x.IfNoneMatch
+	}
+	return ""
+}
+
 type GetInstitutionalHoldersResponse struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
 	Holders       []*InstitutionalHolder `protobuf:"bytes,1,rep,name=holders,proto3" json:"holders,omitempty"`
+	Etag          string                 `protobuf:"bytes,2,opt,name=etag,proto3" json:"etag,omitempty"`                                   // Content hash of this response; pass back as if_none_match
+	NotModified   bool                   `protobuf:"varint,3,opt,name=not_modified,json=notModified,proto3" json:"not_modified,omitempty"` // True when if_none_match matched and the payload was omitted
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
@@ -3222,6 +3388,20 @@ func (x *GetInstitutionalHoldersResponse) GetHolders() []*InstitutionalHolder {
 	return nil
 }
 
+func (x *GetInstitutionalHoldersResponse) GetEtag() string {
+	if x != nil {
+		return x.Etag
+	}
+	return ""
+}
+
+func (x *GetInstitutionalHoldersResponse) GetNotModified() bool {
+	if x != nil {
+		return x.NotModified
+	}
+	return false
+}
+
 type InstitutionalHolder struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
 	Holder        string                 `protobuf:"bytes,1,opt,name=holder,proto3" json:"holder,omitempty"`
@@ -3463,8 +3643,11 @@ func (x *MutualFundHolder) GetValue() float64 {
 }
 
 type GetMultipleInfoRequest struct {
-	state         protoimpl.MessageState `protogen:"open.v1"`
-	Tickers       []string               `protobuf:"bytes,1,rep,name=tickers,proto3" json:"tickers,omitempty"` // List of ticker symbols (e.g., ["AAPL", "MSFT", "GOOGL"])
+	state   protoimpl.MessageState `protogen:"open.v1"`
+	Tickers []string               `protobuf:"bytes,1,rep,name=tickers,proto3" json:"tickers,omitempty"` // List of ticker symbols (e.g., ["AAPL", "MSFT", "GOOGL"])
+	// Optional TickerInfo field paths applied to every ticker. Unset or empty returns every field.
+	ReadMask      *fieldmaskpb.FieldMask `protobuf:"bytes,2,opt,name=read_mask,json=readMask,proto3" json:"read_mask,omitempty"`
+	Freshness     InfoFreshness          `protobuf:"varint,3,opt,name=freshness,proto3,enum=yfinance_grpc.v1alpha1.InfoFreshness" json:"freshness,omitempty"` // Source planning hint (default: planner decides from read_mask)
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
@@ -3506,9 +3689,24 @@ func (x *GetMultipleInfoRequest) GetTickers() []string {
 	return nil
 }
 
+func (x *GetMultipleInfoRequest) GetReadMask() *fieldmaskpb.FieldMask {
+	if x != nil {
+		return x.ReadMask
+	}
+	return nil
+}
+
+func (x *GetMultipleInfoRequest) GetFreshness() InfoFreshness {
+	if x != nil {
+		return x.Freshness
+	}
+	return InfoFreshness_INFO_FRESHNESS_UNSPECIFIED
+}
+
 type GetMultipleInfoResponse struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
 	Info          map[string]*TickerInfo `protobuf:"bytes,1,rep,name=info,proto3" json:"info,omitempty" protobuf_key:"bytes,1,opt,name=key" protobuf_val:"bytes,2,opt,name=value"` // Map of ticker symbol to info
+	Source        InfoSource             `protobuf:"varint,2,opt,name=source,proto3,enum=yfinance_grpc.v1alpha1.InfoSource" json:"source,omitempty"`                               // Upstream path that served every entry
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
@@ -3550,6 +3748,13 @@ func (x *GetMultipleInfoResponse) GetInfo() map[string]*TickerInfo {
 	return nil
 }
 
+func (x *GetMultipleInfoResponse) GetSource() InfoSource {
+	if x != nil {
+		return x.Source
+	}
+	return InfoSource_INFO_SOURCE_UNSPECIFIED
+}
+
 type DownloadHistoryRequest struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
 	Tickers       []string               `protobuf:"bytes,1,rep,name=tickers,proto3" json:"tickers,omitempty"`                                // List of ticker symbols to download
@@ -4379,8 +4584,10 @@ func (x *FastInfo) GetYearLow() float64 {
 }
 
 type GetSustainabilityRequest struct {
-	state         protoimpl.MessageState `protogen:"open.v1"`
-	Ticker        string                 `protobuf:"bytes,1,opt,name=ticker,proto3" json:"ticker,omitempty"`
+	state  protoimpl.MessageState `protogen:"open.v1"`
+	Ticker string                 `protobuf:"bytes,1,opt,name=ticker,proto3" json:"ticker,omitempty"`
+	// Return an empty not_modified response when the content hash still equals this etag.
+	IfNoneMatch   string `protobuf:"bytes,2,opt,name=if_none_match,json=ifNoneMatch,proto3" json:"if_none_match,omitempty"`
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
@@ -4422,6 +4629,13 @@ func (x *GetSustainabilityRequest) GetTicker() string {
 	return ""
 }
 
+func (x *GetSustainabilityRequest) GetIfNoneMatch() string {
+	if x != nil {
+		return x.IfNoneMatch
+	}
+	return ""
+}
+
 type GetSustainabilityResponse struct {
 	state            protoimpl.MessageState `protogen:"open.v1"`
 	TotalEsg         float64                `protobuf:"fixed64,1,opt,name=total_esg,json=totalEsg,proto3" json:"total_esg,omitempty"`
@@ -4432,21 +4646,23 @@ type GetSustainabilityResponse struct {
 	Percentile       float64                `protobuf:"fixed64,6,opt,name=percentile,proto3" json:"percentile,omitempty"`
 	PeerGroup        string                 `protobuf:"bytes,7,opt,name=peer_group,json=peerGroup,proto3" json:"peer_group,omitempty"`
 	// Controversy flags
-	Adult                bool `protobuf:"varint,20,opt,name=adult,proto3" json:"adult,omitempty"`
-	Alcoholic            bool `protobuf:"varint,21,opt,name=alcoholic,proto3" json:"alcoholic,omitempty"`
-	AnimalTesting        bool `protobuf:"varint,22,opt,name=animal_testing,json=animalTesting,proto3" json:"animal_testing,omitempty"`
-	Catholic             bool `protobuf:"varint,23,opt,name=catholic,proto3" json:"catholic,omitempty"`
-	ControversialWeapons bool `protobuf:"varint,24,opt,name=controversial_weapons,json=controversialWeapons,proto3" json:"controversial_weapons,omitempty"`
-	SmallArms            bool `protobuf:"varint,25,opt,name=small_arms,json=smallArms,proto3" json:"small_arms,omitempty"`
-	FurLeather           bool `protobuf:"varint,26,opt,name=fur_leather,json=furLeather,proto3" json:"fur_leather,omitempty"`
-	Gambling             bool `protobuf:"varint,27,opt,name=gambling,proto3" json:"gambling,omitempty"`
-	Gmo                  bool `protobuf:"varint,28,opt,name=gmo,proto3" json:"gmo,omitempty"`
-	MilitaryContract     bool `protobuf:"varint,29,opt,name=military_contract,json=militaryContract,proto3" json:"military_contract,omitempty"`
-	Nuclear              bool `protobuf:"varint,30,opt,name=nuclear,proto3" json:"nuclear,omitempty"`
-	Pesticides           bool `protobuf:"varint,31,opt,name=pesticides,proto3" json:"pesticides,omitempty"`
-	PalmOil              bool `protobuf:"varint,32,opt,name=palm_oil,json=palmOil,proto3" json:"palm_oil,omitempty"`
-	Coal                 bool `protobuf:"varint,33,opt,name=coal,proto3" json:"coal,omitempty"`
-	Tobacco              bool `protobuf:"varint,34,opt,name=tobacco,proto3" json:"tobacco,omitempty"`
+	Adult                bool   `protobuf:"varint,20,opt,name=adult,proto3" json:"adult,omitempty"`
+	Alcoholic            bool   `protobuf:"varint,21,opt,name=alcoholic,proto3" json:"alcoholic,omitempty"`
+	AnimalTesting        bool   `protobuf:"varint,22,opt,name=animal_testing,json=animalTesting,proto3" json:"animal_testing,omitempty"`
+	Catholic             bool   `protobuf:"varint,23,opt,name=catholic,proto3" json:"catholic,omitempty"`
+	ControversialWeapons bool   `protobuf:"varint,24,opt,name=controversial_weapons,json=controversialWeapons,proto3" json:"controversial_weapons,omitempty"`
+	SmallArms            bool   `protobuf:"varint,25,opt,name=small_arms,json=smallArms,proto3" json:"small_arms,omitempty"`
+	FurLeather           bool   `protobuf:"varint,26,opt,name=fur_leather,json=furLeather,proto3" json:"fur_leather,omitempty"`
+	Gambling             bool   `protobuf:"varint,27,opt,name=gambling,proto3" json:"gambling,omitempty"`
+	Gmo                  bool   `protobuf:"varint,28,opt,name=gmo,proto3" json:"gmo,omitempty"`
+	MilitaryContract     bool   `protobuf:"varint,29,opt,name=military_contract,json=militaryContract,proto3" json:"military_contract,omitempty"`
+	Nuclear              bool   `protobuf:"varint,30,opt,name=nuclear,proto3" json:"nuclear,omitempty"`
+	Pesticides           bool   `protobuf:"varint,31,opt,name=pesticides,proto3" json:"pesticides,omitempty"`
+	PalmOil              bool   `protobuf:"varint,32,opt,name=palm_oil,json=palmOil,proto3" json:"palm_oil,omitempty"`
+	Coal                 bool   `protobuf:"varint,33,opt,name=coal,proto3" json:"coal,omitempty"`
+	Tobacco              bool   `protobuf:"varint,34,opt,name=tobacco,proto3" json:"tobacco,omitempty"`
+	Etag                 string `protobuf:"bytes,40,opt,name=etag,proto3" json:"etag,omitempty"`                                   // Content hash of this response; pass back as if_none_match
+	NotModified          bool   `protobuf:"varint,41,opt,name=not_modified,json=notModified,proto3" json:"not_modified,omitempty"` // True when if_none_match matched and the payload was omitted
 	unknownFields        protoimpl.UnknownFields
 	sizeCache            protoimpl.SizeCache
 }
@@ -4635,6 +4851,20 @@ func (x *GetSustainabilityResponse) GetTobacco() bool {
 	return false
 }
 
+func (x *GetSustainabilityResponse) GetEtag() string {
+	if x != nil {
+		return x.Etag
+	}
+	return ""
+}
+
+func (x *GetSustainabilityResponse) GetNotModified() bool {
+	if x != nil {
+		return x.NotModified
+	}
+	return false
+}
+
 type GetInsiderPurchasesRequest struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
 	Ticker        string                 `protobuf:"bytes,1,opt,name=ticker,proto3" json:"ticker,omitempty"`
@@ -6826,8 +7056,10 @@ func (x *GetHistoryMetadataResponse) GetValidRanges() []string {
 }
 
 type GetSecFilingsRequest struct {
-	state         protoimpl.MessageState `protogen:"open.v1"`
-	Ticker        string                 `protobuf:"bytes,1,opt,name=ticker,proto3" json:"ticker,omitempty"`
+	state  protoimpl.MessageState `protogen:"open.v1"`
+	Ticker string                 `protobuf:"bytes,1,opt,name=ticker,proto3" json:"ticker,omitempty"`
+	// Return an empty not_modified response when the content hash still equals this etag.
+	IfNoneMatch   string `protobuf:"bytes,2,opt,name=if_none_match,json=ifNoneMatch,proto3" json:"if_none_match,omitempty"`
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
@@ -6869,9 +7101,18 @@ func (x *GetSecFilingsRequest) GetTicker() string {
 	return ""
 }
 
+func (x *GetSecFilingsRequest) GetIfNoneMatch() string {
+	if x != nil {
+		return x.IfNoneMatch
+	}
+	return ""
+}
+
 type GetSecFilingsResponse struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
 	Filings       []*SecFiling           `protobuf:"bytes,1,rep,name=filings,proto3" json:"filings,omitempty"`
+	Etag          string                 `protobuf:"bytes,2,opt,name=etag,proto3" json:"etag,omitempty"`                                   // Content hash of this response; pass back as if_none_match
+	NotModified   bool                   `protobuf:"varint,3,opt,name=not_modified,json=notModified,proto3" json:"not_modified,omitempty"` // True when if_none_match matched and the payload was omitted
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
@@ -6913,6 +7154,20 @@ func (x *GetSecFilingsResponse) GetFilings() []*SecFiling {
 	return nil
 }
 
+func (x *GetSecFilingsResponse) GetEtag() string {
+	if x != nil {
+		return x.Etag
+	}
+	return ""
+}
+
+func (x *GetSecFilingsResponse) GetNotModified() bool {
+	if x != nil {
+		return x.NotModified
+	}
+	return false
+}
+
 type SecFiling struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
 	Date          *timestamppb.Timestamp `protobuf:"bytes,1,opt,name=date,proto3" json:"date,omitempty"`
@@ -6981,116 +7236,687 @@ func (x *SecFiling) GetUrl() string {
 	return ""
 }
 
-var File_yfinance_grpc_v1alpha1_ticker_proto protoreflect.FileDescriptor
+type SubscribeQuotesRequest struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	Tickers       []string               `protobuf:"bytes,1,rep,name=tickers,proto3" json:"tickers,omitempty"` // Ticker symbols to watch (e.g., ["AAPL", "MSFT"])
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
 
-const file_yfinance_grpc_v1alpha1_ticker_proto_rawDesc = "" +
-	"\n" +
-	"#yfinance_grpc/v1alpha1/ticker.proto\x12\x16yfinance_grpc.v1alpha1\x1a\x1fgoogle/protobuf/timestamp.proto\"(\n" +
-	"\x0eGetInfoRequest\x12\x16\n" +
-	"\x06ticker\x18\x01 \x01(\tR\x06ticker\"I\n" +
-	"\x0fGetInfoResponse\x126\n" +
-	"\x04info\x18\x01 \x01(\v2\".yfinance_grpc.v1alpha1.TickerInfoR\x04info\"\xee\x13\n" +
-	"\n" +
-	"TickerInfo\x12\x16\n" +
-	"\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x1d\n" +
-	"\n" +
-	"short_name\x18\x02 \x01(\tR\tshortName\x12\x1b\n" +
-	"\tlong_name\x18\x03 \x01(\tR\blongName\x12\x1a\n" +
-	"\bindustry\x18\x04 \x01(\tR\bindustry\x12\x16\n" +
-	"\x06sector\x18\x05 \x01(\tR\x06sector\x12\x18\n" +
-	"\acountry\x18\x06 \x01(\tR\acountry\x12\x12\n" +
-	"\x04city\x18\a \x01(\tR\x04city\x12\x14\n" +
-	"\x05state\x18\b \x01(\tR\x05state\x12\x10\n" +
-	"\x03zip\x18\t \x01(\tR\x03zip\x12\x18\n" +
-	"\awebsite\x18\n" +
-	" \x01(\tR\awebsite\x122\n" +
-	"\x15long_business_summary\x18\v \x01(\tR\x13longBusinessSummary\x12%\n" +
-	"\x0eprevious_close\x18\x14 \x01(\x01R\rpreviousClose\x12\x12\n" +
-	"\x04open\x18\x15 \x01(\x01R\x04open\x12\x17\n" +
-	"\aday_low\x18\x16 \x01(\x01R\x06dayLow\x12\x19\n" +
-	"\bday_high\x18\x17 \x01(\x01R\adayHigh\x12A\n" +
-	"\x1dregular_market_previous_close\x18\x18 \x01(\x01R\x1aregularMarketPreviousClose\x12.\n" +
-	"\x13regular_market_open\x18\x19 \x01(\x01R\x11regularMarketOpen\x123\n" +
-	"\x16regular_market_day_low\x18\x1a \x01(\x01R\x13regularMarketDayLow\x125\n" +
-	"\x17regular_market_day_high\x18\x1b \x01(\x01R\x14regularMarketDayHigh\x12#\n" +
-	"\rcurrent_price\x18\x1c \x01(\x01R\fcurrentPrice\x12\x16\n" +
-	"\x06volume\x18\x1e \x01(\x03R\x06volume\x122\n" +
-	"\x15regular_market_volume\x18\x1f \x01(\x03R\x13regularMarketVolume\x12%\n" +
-	"\x0eaverage_volume\x18  \x01(\x03R\raverageVolume\x122\n" +
-	"\x15average_volume_10days\x18! \x01(\x03R\x13averageVolume10days\x12-\n" +
-	"\x12shares_outstanding\x18\" \x01(\x03R\x11sharesOutstanding\x12!\n" +
-	"\ffloat_shares\x18# \x01(\x03R\vfloatShares\x12\x1d\n" +
-	"\n" +
-	"market_cap\x18( \x01(\x03R\tmarketCap\x12)\n" +
-	"\x10enterprise_value\x18) \x01(\x01R\x0fenterpriseValue\x12\x1f\n" +
-	"\vtrailing_pe\x18* \x01(\x01R\n" +
-	"trailingPe\x12\x1d\n" +
-	"\n" +
-	"forward_pe\x18+ \x01(\x01R\tforwardPe\x12\"\n" +
-	"\rprice_to_book\x18, \x01(\x01R\vpriceToBook\x12F\n" +
-	" price_to_sales_trailing_12months\x18- \x01(\x01R\x1cpriceToSalesTrailing12months\x122\n" +
-	"\x15enterprise_to_revenue\x18. \x01(\x01R\x13enterpriseToRevenue\x120\n" +
-	"\x14enterprise_to_ebitda\x18/ \x01(\x01R\x12enterpriseToEbitda\x12#\n" +
-	"\rdividend_rate\x182 \x01(\x01R\fdividendRate\x12%\n" +
-	"\x0edividend_yield\x183 \x01(\x01R\rdividendYield\x12(\n" +
-	"\x10ex_dividend_date\x184 \x01(\x03R\x0eexDividendDate\x12!\n" +
-	"\fpayout_ratio\x185 \x01(\x01R\vpayoutRatio\x12>\n" +
-	"\x1cfive_year_avg_dividend_yield\x186 \x01(\x01R\x18fiveYearAvgDividendYield\x12\x12\n" +
-	"\x04beta\x18< \x01(\x01R\x04beta\x12!\n" +
-	"\ftrailing_eps\x18= \x01(\x01R\vtrailingEps\x12\x1f\n" +
-	"\vforward_eps\x18> \x01(\x01R\n" +
-	"forwardEps\x12\x1d\n" +
-	"\n" +
-	"book_value\x18? \x01(\x01R\tbookValue\x12%\n" +
-	"\x0eprofit_margins\x18@ \x01(\x01R\rprofitMargins\x12*\n" +
-	"\x11revenue_per_share\x18A \x01(\x01R\x0frevenuePerShare\x12(\n" +
-	"\x10return_on_assets\x18B \x01(\x01R\x0ereturnOnAssets\x12(\n" +
-	"\x10return_on_equity\x18C \x01(\x01R\x0ereturnOnEquity\x12%\n" +
-	"\x0erevenue_growth\x18D \x01(\x01R\rrevenueGrowth\x12'\n" +
-	"\x0fearnings_growth\x18E \x01(\x01R\x0eearningsGrowth\x12+\n" +
-	"\x11operating_margins\x18F \x01(\x01R\x10operatingMargins\x12%\n" +
-	"\x0eebitda_margins\x18G \x01(\x01R\rebitdaMargins\x12+\n" +
-	"\x12fifty_two_week_low\x18P \x01(\x01R\x0ffiftyTwoWeekLow\x12-\n" +
-	"\x13fifty_two_week_high\x18Q \x01(\x01R\x10fiftyTwoWeekHigh\x12*\n" +
-	"\x11fifty_day_average\x18R \x01(\x01R\x0ffiftyDayAverage\x125\n" +
-	"\x17two_hundred_day_average\x18S \x01(\x01R\x14twoHundredDayAverage\x12*\n" +
-	"\x11target_high_price\x18Z \x01(\x01R\x0ftargetHighPrice\x12(\n" +
-	"\x10target_low_price\x18[ \x01(\x01R\x0etargetLowPrice\x12*\n" +
-	"\x11target_mean_price\x18\\ \x01(\x01R\x0ftargetMeanPrice\x12.\n" +
-	"\x13target_median_price\x18] \x01(\x01R\x11targetMedianPrice\x12;\n" +
-	"\x1anumber_of_analyst_opinions\x18^ \x01(\x05R\x17numberOfAnalystOpinions\x12\x1a\n" +
-	"\bcurrency\x18d \x01(\tR\bcurrency\x12\x1a\n" +
-	"\bexchange\x18e \x01(\tR\bexchange\x12\x1d\n" +
-	"\n" +
-	"quote_type\x18f \x01(\tR\tquoteType\x12-\n" +
-	"\x12financial_currency\x18g \x01(\tR\x11financialCurrency\x12\x1d\n" +
-	"\n" +
-	"price_hint\x18h \x01(\x05R\tpriceHint\"\xab\x04\n" +
-	"\x11GetHistoryRequest\x12\x16\n" +
-	"\x06ticker\x18\x01 \x01(\tR\x06ticker\x12\x1b\n" +
-	"\x06period\x18\x02 \x01(\tH\x00R\x06period\x88\x01\x01\x125\n" +
-	"\x05start\x18\x03 \x01(\v2\x1a.google.protobuf.TimestampH\x01R\x05start\x88\x01\x01\x121\n" +
-	"\x03end\x18\x04 \x01(\v2\x1a.google.protobuf.TimestampH\x02R\x03end\x88\x01\x01\x12\x1a\n" +
-	"\binterval\x18\x05 \x01(\tR\binterval\x12\x1d\n" +
-	"\aprepost\x18\x06 \x01(\bH\x03R\aprepost\x88\x01\x01\x12\x1d\n" +
-	"\aactions\x18\a \x01(\bH\x04R\aactions\x88\x01\x01\x12$\n" +
-	"\vauto_adjust\x18\b \x01(\bH\x05R\n" +
-	"autoAdjust\x88\x01\x01\x12$\n" +
-	"\vback_adjust\x18\t \x01(\bH\x06R\n" +
-	"backAdjust\x88\x01\x01\x12\x1b\n" +
-	"\x06repair\x18\n" +
-	" \x01(\bH\aR\x06repair\x88\x01\x01\x12\x1b\n" +
-	"\x06keepna\x18\v \x01(\bH\bR\x06keepna\x88\x01\x01\x12\x1f\n" +
-	"\brounding\x18\f \x01(\bH\tR\brounding\x88\x01\x01B\t\n" +
-	"\a_periodB\b\n" +
-	"\x06_startB\x06\n" +
-	"\x04_endB\n" +
-	"\n" +
-	"\b_prepostB\n" +
-	"\n" +
-	"\b_actionsB\x0e\n" +
-	"\f_auto_adjustB\x0e\n" +
-	"\f_back_adjustB\t\n" +
+func (x *SubscribeQuotesRequest) Reset() {
+	*x = SubscribeQuotesRequest{}
+	mi := &file_yfinance_grpc_v1alpha1_ticker_proto_msgTypes[108]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *SubscribeQuotesRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*SubscribeQuotesRequest) ProtoMessage() {}
+
+func (x *SubscribeQuotesRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_yfinance_grpc_v1alpha1_ticker_proto_msgTypes[108]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use SubscribeQuotesRequest.ProtoReflect.Descriptor instead.
+func (*SubscribeQuotesRequest) Descriptor() ([]byte, []int) {
+	return file_yfinance_grpc_v1alpha1_ticker_proto_rawDescGZIP(), []int{108}
+}
+
+func (x *SubscribeQuotesRequest) GetTickers() []string {
+	if x != nil {
+		return x.Tickers
+	}
+	return nil
+}
+
+type Quote struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	Symbol        string                 `protobuf:"bytes,1,opt,name=symbol,proto3" json:"symbol,omitempty"`
+	LastPrice     float64                `protobuf:"fixed64,2,opt,name=last_price,json=lastPrice,proto3" json:"last_price,omitempty"`
+	PreviousClose float64                `protobuf:"fixed64,3,opt,name=previous_close,json=previousClose,proto3" json:"previous_close,omitempty"`
+	Open          float64                `protobuf:"fixed64,4,opt,name=open,proto3" json:"open,omitempty"`
+	DayHigh       float64                `protobuf:"fixed64,5,opt,name=day_high,json=dayHigh,proto3" json:"day_high,omitempty"`
+	DayLow        float64                `protobuf:"fixed64,6,opt,name=day_low,json=dayLow,proto3" json:"day_low,omitempty"`
+	LastVolume    int64                  `protobuf:"varint,7,opt,name=last_volume,json=lastVolume,proto3" json:"last_volume,omitempty"`
+	Currency      string                 `protobuf:"bytes,8,opt,name=currency,proto3" json:"currency,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *Quote) Reset() {
+	*x = Quote{}
+	mi := &file_yfinance_grpc_v1alpha1_ticker_proto_msgTypes[109]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *Quote) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*Quote) ProtoMessage() {}
+
+func (x *Quote) ProtoReflect() protoreflect.Message {
+	mi := &file_yfinance_grpc_v1alpha1_ticker_proto_msgTypes[109]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use Quote.ProtoReflect.Descriptor instead.
+func (*Quote) Descriptor() ([]byte, []int) {
+	return file_yfinance_grpc_v1alpha1_ticker_proto_rawDescGZIP(), []int{109}
+}
+
+func (x *Quote) GetSymbol() string {
+	if x != nil {
+		return x.Symbol
+	}
+	return ""
+}
+
+func (x *Quote) GetLastPrice() float64 {
+	if x != nil {
+		return x.LastPrice
+	}
+	return 0
+}
+
+func (x *Quote) GetPreviousClose() float64 {
+	if x != nil {
+		return x.PreviousClose
+	}
+	return 0
+}
+
+func (x *Quote) GetOpen() float64 {
+	if x != nil {
+		return x.Open
+	}
+	return 0
+}
+
+func (x *Quote) GetDayHigh() float64 {
+	if x != nil {
+		return x.DayHigh
+	}
+	return 0
+}
+
+func (x *Quote) GetDayLow() float64 {
+	if x != nil {
+		return x.DayLow
+	}
+	return 0
+}
+
+func (x *Quote) GetLastVolume() int64 {
+	if x != nil {
+		return x.LastVolume
+	}
+	return 0
+}
+
+func (x *Quote) GetCurrency() string {
+	if x != nil {
+		return x.Currency
+	}
+	return ""
+}
+
+type SubscribeQuotesResponse struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	Quote         *Quote                 `protobuf:"bytes,1,opt,name=quote,proto3" json:"quote,omitempty"`                                      // Only symbol and the fields listed in changed_fields are populated
+	ChangedFields *fieldmaskpb.FieldMask `protobuf:"bytes,2,opt,name=changed_fields,json=changedFields,proto3" json:"changed_fields,omitempty"` // The first update per symbol lists every field
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *SubscribeQuotesResponse) Reset() {
+	*x = SubscribeQuotesResponse{}
+	mi := &file_yfinance_grpc_v1alpha1_ticker_proto_msgTypes[110]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *SubscribeQuotesResponse) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*SubscribeQuotesResponse) ProtoMessage() {}
+
+func (x *SubscribeQuotesResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_yfinance_grpc_v1alpha1_ticker_proto_msgTypes[110]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use SubscribeQuotesResponse.ProtoReflect.Descriptor instead.
+func (*SubscribeQuotesResponse) Descriptor() ([]byte, []int) {
+	return file_yfinance_grpc_v1alpha1_ticker_proto_rawDescGZIP(), []int{110}
+}
+
+func (x *SubscribeQuotesResponse) GetQuote() *Quote {
+	if x != nil {
+		return x.Quote
+	}
+	return nil
+}
+
+func (x *SubscribeQuotesResponse) GetChangedFields() *fieldmaskpb.FieldMask {
+	if x != nil {
+		return x.ChangedFields
+	}
+	return nil
+}
+
+type SessionRequest struct {
+	state     protoimpl.MessageState `protogen:"open.v1"`
+	RequestId string                 `protobuf:"bytes,1,opt,name=request_id,json=requestId,proto3" json:"request_id,omitempty"` // Client-chosen id echoed on the matching SessionResponse
+	// Types that are valid to be assigned to Request:
+	//
+	//	*SessionRequest_Info
+	//	*SessionRequest_History
+	//	*SessionRequest_OptionChain
+	//	*SessionRequest_News
+	//	*SessionRequest_Cancel
+	Request       isSessionRequest_Request `protobuf_oneof:"request"`
+	Priority      int32                    `protobuf:"varint,7,opt,name=priority,proto3" json:"priority,omitempty"` // Queued requests with higher priority start first; ties run in arrival order
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *SessionRequest) Reset() {
+	*x = SessionRequest{}
+	mi := &file_yfinance_grpc_v1alpha1_ticker_proto_msgTypes[111]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *SessionRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*SessionRequest) ProtoMessage() {}
+
+func (x *SessionRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_yfinance_grpc_v1alpha1_ticker_proto_msgTypes[111]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use SessionRequest.ProtoReflect.Descriptor instead.
+func (*SessionRequest) Descriptor() ([]byte, []int) {
+	return file_yfinance_grpc_v1alpha1_ticker_proto_rawDescGZIP(), []int{111}
+}
+
+func (x *SessionRequest) GetRequestId() string {
+	if x != nil {
+		return x.RequestId
+	}
+	return ""
+}
+
+func (x *SessionRequest) GetRequest() isSessionRequest_Request {
+	if x != nil {
+		return x.Request
+	}
+	return nil
+}
+
+func (x *SessionRequest) GetInfo() *GetInfoRequest {
+	if x != nil {
+		if x, ok := x.Request.(*SessionRequest_Info); ok {
+			return x.Info
+		}
+	}
+	return nil
+}
+
+func (x *SessionRequest) GetHistory() *GetHistoryRequest {
+	if x != nil {
+		if x, ok := x.Request.(*SessionRequest_History); ok {
+			return x.History
+		}
+	}
+	return nil
+}
+
+func (x *SessionRequest) GetOptionChain() *GetOptionChainRequest {
+	if x != nil {
+		if x, ok := x.Request.(*SessionRequest_OptionChain); ok {
+			return x.OptionChain
+		}
+	}
+	return nil
+}
+
+func (x *SessionRequest) GetNews() *GetNewsRequest {
+	if x != nil {
+		if x, ok := x.Request.(*SessionRequest_News); ok {
+			return x.News
+		}
+	}
+	return nil
+}
+
+func (x *SessionRequest) GetCancel() *SessionCancel {
+	if x != nil {
+		if x, ok := x.Request.(*SessionRequest_Cancel); ok {
+			return x.Cancel
+		}
+	}
+	return nil
+}
+
+func (x *SessionRequest) GetPriority() int32 {
+	if x != nil {
+		return x.Priority
+	}
+	return 0
+}
+
+type isSessionRequest_Request interface {
+	isSessionRequest_Request()
+}
+
+type SessionRequest_Info struct {
+	Info *GetInfoRequest `protobuf:"bytes,2,opt,name=info,proto3,oneof"`
+}
+
+type SessionRequest_History struct {
+	History *GetHistoryRequest `protobuf:"bytes,3,opt,name=history,proto3,oneof"`
+}
+
+type SessionRequest_OptionChain struct {
+	OptionChain *GetOptionChainRequest `protobuf:"bytes,4,opt,name=option_chain,json=optionChain,proto3,oneof"`
+}
+
+type SessionRequest_News struct {
+	News *GetNewsRequest `protobuf:"bytes,5,opt,name=news,proto3,oneof"`
+}
+
+type SessionRequest_Cancel struct {
+	Cancel *SessionCancel `protobuf:"bytes,6,opt,name=cancel,proto3,oneof"` // Cancels the in-flight request with the same request_id
+}
+
+func (*SessionRequest_Info) isSessionRequest_Request() {}
+
+func (*SessionRequest_History) isSessionRequest_Request() {}
+
+func (*SessionRequest_OptionChain) isSessionRequest_Request() {}
+
+func (*SessionRequest_News) isSessionRequest_Request() {}
+
+func (*SessionRequest_Cancel) isSessionRequest_Request() {}
+
+type SessionCancel struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *SessionCancel) Reset() {
+	*x = SessionCancel{}
+	mi := &file_yfinance_grpc_v1alpha1_ticker_proto_msgTypes[112]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *SessionCancel) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*SessionCancel) ProtoMessage() {}
+
+func (x *SessionCancel) ProtoReflect() protoreflect.Message {
+	mi := &file_yfinance_grpc_v1alpha1_ticker_proto_msgTypes[112]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use SessionCancel.ProtoReflect.Descriptor instead.
+func (*SessionCancel) Descriptor() ([]byte, []int) {
+	return file_yfinance_grpc_v1alpha1_ticker_proto_rawDescGZIP(), []int{112}
+}
+
+type SessionResponse struct {
+	state     protoimpl.MessageState `protogen:"open.v1"`
+	RequestId string                 `protobuf:"bytes,1,opt,name=request_id,json=requestId,proto3" json:"request_id,omitempty"`
+	// Types that are valid to be assigned to Response:
+	//
+	//	*SessionResponse_Info
+	//	*SessionResponse_History
+	//	*SessionResponse_OptionChain
+	//	*SessionResponse_News
+	//	*SessionResponse_Error
+	Response      isSessionResponse_Response `protobuf_oneof:"response"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *SessionResponse) Reset() {
+	*x = SessionResponse{}
+	mi := &file_yfinance_grpc_v1alpha1_ticker_proto_msgTypes[113]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *SessionResponse) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*SessionResponse) ProtoMessage() {}
+
+func (x *SessionResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_yfinance_grpc_v1alpha1_ticker_proto_msgTypes[113]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use SessionResponse.ProtoReflect.Descriptor instead.
+func (*SessionResponse) Descriptor() ([]byte, []int) {
+	return file_yfinance_grpc_v1alpha1_ticker_proto_rawDescGZIP(), []int{113}
+}
+
+func (x *SessionResponse) GetRequestId() string {
+	if x != nil {
+		return x.RequestId
+	}
+	return ""
+}
+
+func (x *SessionResponse) GetResponse() isSessionResponse_Response {
+	if x != nil {
+		return x.Response
+	}
+	return nil
+}
+
+func (x *SessionResponse) GetInfo() *GetInfoResponse {
+	if x != nil {
+		if x, ok := x.Response.(*SessionResponse_Info); ok {
+			return x.Info
+		}
+	}
+	return nil
+}
+
+func (x *SessionResponse) GetHistory() *GetHistoryResponse {
+	if x != nil {
+		if x, ok := x.Response.(*SessionResponse_History); ok {
+			return x.History
+		}
+	}
+	return nil
+}
+
+func (x *SessionResponse) GetOptionChain() *GetOptionChainResponse {
+	if x != nil {
+		if x, ok := x.Response.(*SessionResponse_OptionChain); ok {
+			return x.OptionChain
+		}
+	}
+	return nil
+}
+
+func (x *SessionResponse) GetNews() *GetNewsResponse {
+	if x != nil {
+		if x, ok := x.Response.(*SessionResponse_News); ok {
+			return x.News
+		}
+	}
+	return nil
+}
+
+func (x *SessionResponse) GetError() *SessionError {
+	if x != nil {
+		if x, ok := x.Response.(*SessionResponse_Error); ok {
+			return x.Error
+		}
+	}
+	return nil
+}
+
+type isSessionResponse_Response interface {
+	isSessionResponse_Response()
+}
+
+type SessionResponse_Info struct {
+	Info *GetInfoResponse `protobuf:"bytes,2,opt,name=info,proto3,oneof"`
+}
+
+type SessionResponse_History struct {
+	History *GetHistoryResponse `protobuf:"bytes,3,opt,name=history,proto3,oneof"`
+}
+
+type SessionResponse_OptionChain struct {
+	OptionChain *GetOptionChainResponse `protobuf:"bytes,4,opt,name=option_chain,json=optionChain,proto3,oneof"`
+}
+
+type SessionResponse_News struct {
+	News *GetNewsResponse `protobuf:"bytes,5,opt,name=news,proto3,oneof"`
+}
+
+type SessionResponse_Error struct {
+	Error *SessionError `protobuf:"bytes,6,opt,name=error,proto3,oneof"` // The request failed or was cancelled
+}
+
+func (*SessionResponse_Info) isSessionResponse_Response() {}
+
+func (*SessionResponse_History) isSessionResponse_Response() {}
+
+func (*SessionResponse_OptionChain) isSessionResponse_Response() {}
+
+func (*SessionResponse_News) isSessionResponse_Response() {}
+
+func (*SessionResponse_Error) isSessionResponse_Response() {}
+
+type SessionError struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	Code          int32                  `protobuf:"varint,1,opt,name=code,proto3" json:"code,omitempty"` // gRPC status code (e.g. 1 = CANCELLED, 3 = INVALID_ARGUMENT, 13 = INTERNAL)
+	Message       string                 `protobuf:"bytes,2,opt,name=message,proto3" json:"message,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *SessionError) Reset() {
+	*x = SessionError{}
+	mi := &file_yfinance_grpc_v1alpha1_ticker_proto_msgTypes[114]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *SessionError) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*SessionError) ProtoMessage() {}
+
+func (x *SessionError) ProtoReflect() protoreflect.Message {
+	mi := &file_yfinance_grpc_v1alpha1_ticker_proto_msgTypes[114]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use SessionError.ProtoReflect.Descriptor instead.
+func (*SessionError) Descriptor() ([]byte, []int) {
+	return file_yfinance_grpc_v1alpha1_ticker_proto_rawDescGZIP(), []int{114}
+}
+
+func (x *SessionError) GetCode() int32 {
+	if x != nil {
+		return x.Code
+	}
+	return 0
+}
+
+func (x *SessionError) GetMessage() string {
+	if x != nil {
+		return x.Message
+	}
+	return ""
+}
+
+var File_yfinance_grpc_v1alpha1_ticker_proto protoreflect.FileDescriptor
+
+const file_yfinance_grpc_v1alpha1_ticker_proto_rawDesc = "" +
+	"\n" +
+	"#yfinance_grpc/v1alpha1/ticker.proto\x12\x16yfinance_grpc.v1alpha1\x1a google/protobuf/field_mask.proto\x1a\x1fgoogle/protobuf/timestamp.proto\"\xa6\x01\n" +
+	"\x0eGetInfoRequest\x12\x16\n" +
+	"\x06ticker\x18\x01 \x01(\tR\x06ticker\x127\n" +
+	"\tread_mask\x18\x02 \x01(\v2\x1a.google.protobuf.FieldMaskR\breadMask\x12C\n" +
+	"\tfreshness\x18\x03 \x01(\x0e2%.yfinance_grpc.v1alpha1.InfoFreshnessR\tfreshness\"\x85\x01\n" +
+	"\x0fGetInfoResponse\x126\n" +
+	"\x04info\x18\x01 \x01(\v2\".yfinance_grpc.v1alpha1.TickerInfoR\x04info\x12:\n" +
+	"\x06source\x18\x02 \x01(\x0e2\".yfinance_grpc.v1alpha1.InfoSourceR\x06source\"\xee\x13\n" +
+	"\n" +
+	"TickerInfo\x12\x16\n" +
+	"\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x1d\n" +
+	"\n" +
+	"short_name\x18\x02 \x01(\tR\tshortName\x12\x1b\n" +
+	"\tlong_name\x18\x03 \x01(\tR\blongName\x12\x1a\n" +
+	"\bindustry\x18\x04 \x01(\tR\bindustry\x12\x16\n" +
+	"\x06sector\x18\x05 \x01(\tR\x06sector\x12\x18\n" +
+	"\acountry\x18\x06 \x01(\tR\acountry\x12\x12\n" +
+	"\x04city\x18\a \x01(\tR\x04city\x12\x14\n" +
+	"\x05state\x18\b \x01(\tR\x05state\x12\x10\n" +
+	"\x03zip\x18\t \x01(\tR\x03zip\x12\x18\n" +
+	"\awebsite\x18\n" +
+	" \x01(\tR\awebsite\x122\n" +
+	"\x15long_business_summary\x18\v \x01(\tR\x13longBusinessSummary\x12%\n" +
+	"\x0eprevious_close\x18\x14 \x01(\x01R\rpreviousClose\x12\x12\n" +
+	"\x04open\x18\x15 \x01(\x01R\x04open\x12\x17\n" +
+	"\aday_low\x18\x16 \x01(\x01R\x06dayLow\x12\x19\n" +
+	"\bday_high\x18\x17 \x01(\x01R\adayHigh\x12A\n" +
+	"\x1dregular_market_previous_close\x18\x18 \x01(\x01R\x1aregularMarketPreviousClose\x12.\n" +
+	"\x13regular_market_open\x18\x19 \x01(\x01R\x11regularMarketOpen\x123\n" +
+	"\x16regular_market_day_low\x18\x1a \x01(\x01R\x13regularMarketDayLow\x125\n" +
+	"\x17regular_market_day_high\x18\x1b \x01(\x01R\x14regularMarketDayHigh\x12#\n" +
+	"\rcurrent_price\x18\x1c \x01(\x01R\fcurrentPrice\x12\x16\n" +
+	"\x06volume\x18\x1e \x01(\x03R\x06volume\x122\n" +
+	"\x15regular_market_volume\x18\x1f \x01(\x03R\x13regularMarketVolume\x12%\n" +
+	"\x0eaverage_volume\x18  \x01(\x03R\raverageVolume\x122\n" +
+	"\x15average_volume_10days\x18! \x01(\x03R\x13averageVolume10days\x12-\n" +
+	"\x12shares_outstanding\x18\" \x01(\x03R\x11sharesOutstanding\x12!\n" +
+	"\ffloat_shares\x18# \x01(\x03R\vfloatShares\x12\x1d\n" +
+	"\n" +
+	"market_cap\x18( \x01(\x03R\tmarketCap\x12)\n" +
+	"\x10enterprise_value\x18) \x01(\x01R\x0fenterpriseValue\x12\x1f\n" +
+	"\vtrailing_pe\x18* \x01(\x01R\n" +
+	"trailingPe\x12\x1d\n" +
+	"\n" +
+	"forward_pe\x18+ \x01(\x01R\tforwardPe\x12\"\n" +
+	"\rprice_to_book\x18, \x01(\x01R\vpriceToBook\x12F\n" +
+	" price_to_sales_trailing_12months\x18- \x01(\x01R\x1cpriceToSalesTrailing12months\x122\n" +
+	"\x15enterprise_to_revenue\x18. \x01(\x01R\x13enterpriseToRevenue\x120\n" +
+	"\x14enterprise_to_ebitda\x18/ \x01(\x01R\x12enterpriseToEbitda\x12#\n" +
+	"\rdividend_rate\x182 \x01(\x01R\fdividendRate\x12%\n" +
+	"\x0edividend_yield\x183 \x01(\x01R\rdividendYield\x12(\n" +
+	"\x10ex_dividend_date\x184 \x01(\x03R\x0eexDividendDate\x12!\n" +
+	"\fpayout_ratio\x185 \x01(\x01R\vpayoutRatio\x12>\n" +
+	"\x1cfive_year_avg_dividend_yield\x186 \x01(\x01R\x18fiveYearAvgDividendYield\x12\x12\n" +
+	"\x04beta\x18< \x01(\x01R\x04beta\x12!\n" +
+	"\ftrailing_eps\x18= \x01(\x01R\vtrailingEps\x12\x1f\n" +
+	"\vforward_eps\x18> \x01(\x01R\n" +
+	"forwardEps\x12\x1d\n" +
+	"\n" +
+	"book_value\x18? \x01(\x01R\tbookValue\x12%\n" +
+	"\x0eprofit_margins\x18@ \x01(\x01R\rprofitMargins\x12*\n" +
+	"\x11revenue_per_share\x18A \x01(\x01R\x0frevenuePerShare\x12(\n" +
+	"\x10return_on_assets\x18B \x01(\x01R\x0ereturnOnAssets\x12(\n" +
+	"\x10return_on_equity\x18C \x01(\x01R\x0ereturnOnEquity\x12%\n" +
+	"\x0erevenue_growth\x18D \x01(\x01R\rrevenueGrowth\x12'\n" +
+	"\x0fearnings_growth\x18E \x01(\x01R\x0eearningsGrowth\x12+\n" +
+	"\x11operating_margins\x18F \x01(\x01R\x10operatingMargins\x12%\n" +
+	"\x0eebitda_margins\x18G \x01(\x01R\rebitdaMargins\x12+\n" +
+	"\x12fifty_two_week_low\x18P \x01(\x01R\x0ffiftyTwoWeekLow\x12-\n" +
+	"\x13fifty_two_week_high\x18Q \x01(\x01R\x10fiftyTwoWeekHigh\x12*\n" +
+	"\x11fifty_day_average\x18R \x01(\x01R\x0ffiftyDayAverage\x125\n" +
+	"\x17two_hundred_day_average\x18S \x01(\x01R\x14twoHundredDayAverage\x12*\n" +
+	"\x11target_high_price\x18Z \x01(\x01R\x0ftargetHighPrice\x12(\n" +
+	"\x10target_low_price\x18[ \x01(\x01R\x0etargetLowPrice\x12*\n" +
+	"\x11target_mean_price\x18\\ \x01(\x01R\x0ftargetMeanPrice\x12.\n" +
+	"\x13target_median_price\x18] \x01(\x01R\x11targetMedianPrice\x12;\n" +
+	"\x1anumber_of_analyst_opinions\x18^ \x01(\x05R\x17numberOfAnalystOpinions\x12\x1a\n" +
+	"\bcurrency\x18d \x01(\tR\bcurrency\x12\x1a\n" +
+	"\bexchange\x18e \x01(\tR\bexchange\x12\x1d\n" +
+	"\n" +
+	"quote_type\x18f \x01(\tR\tquoteType\x12-\n" +
+	"\x12financial_currency\x18g \x01(\tR\x11financialCurrency\x12\x1d\n" +
+	"\n" +
+	"price_hint\x18h \x01(\x05R\tpriceHint\"\xab\x04\n" +
+	"\x11GetHistoryRequest\x12\x16\n" +
+	"\x06ticker\x18\x01 \x01(\tR\x06ticker\x12\x1b\n" +
+	"\x06period\x18\x02 \x01(\tH\x00R\x06period\x88\x01\x01\x125\n" +
+	"\x05start\x18\x03 \x01(\v2\x1a.google.protobuf.TimestampH\x01R\x05start\x88\x01\x01\x121\n" +
+	"\x03end\x18\x04 \x01(\v2\x1a.google.protobuf.TimestampH\x02R\x03end\x88\x01\x01\x12\x1a\n" +
+	"\binterval\x18\x05 \x01(\tR\binterval\x12\x1d\n" +
+	"\aprepost\x18\x06 \x01(\bH\x03R\aprepost\x88\x01\x01\x12\x1d\n" +
+	"\aactions\x18\a \x01(\bH\x04R\aactions\x88\x01\x01\x12$\n" +
+	"\vauto_adjust\x18\b \x01(\bH\x05R\n" +
+	"autoAdjust\x88\x01\x01\x12$\n" +
+	"\vback_adjust\x18\t \x01(\bH\x06R\n" +
+	"backAdjust\x88\x01\x01\x12\x1b\n" +
+	"\x06repair\x18\n" +
+	" \x01(\bH\aR\x06repair\x88\x01\x01\x12\x1b\n" +
+	"\x06keepna\x18\v \x01(\bH\bR\x06keepna\x88\x01\x01\x12\x1f\n" +
+	"\brounding\x18\f \x01(\bH\tR\brounding\x88\x01\x01B\t\n" +
+	"\a_periodB\b\n" +
+	"\x06_startB\x06\n" +
+	"\x04_endB\n" +
+	"\n" +
+	"\b_prepostB\n" +
+	"\n" +
+	"\b_actionsB\x0e\n" +
+	"\f_auto_adjustB\x0e\n" +
+	"\f_back_adjustB\t\n" +
 	"\a_repairB\t\n" +
 	"\a_keepnaB\v\n" +
 	"\t_rounding\"L\n" +
@@ -7143,16 +7969,19 @@ const file_yfinance_grpc_v1alpha1_ticker_proto_rawDesc = "" +
 	"\n" +
 	"_dividendsB\x0f\n" +
 	"\r_stock_splitsB\x10\n" +
-	"\x0e_capital_gains\"s\n" +
+	"\x0e_capital_gains\"\x97\x01\n" +
 	"\x14GetFinancialsRequest\x12\x16\n" +
 	"\x06ticker\x18\x01 \x01(\tR\x06ticker\x12\x12\n" +
 	"\x04freq\x18\x02 \x01(\tR\x04freq\x12\x17\n" +
 	"\aas_dict\x18\x03 \x01(\bR\x06asDict\x12\x16\n" +
-	"\x06pretty\x18\x04 \x01(\bR\x06pretty\"c\n" +
+	"\x06pretty\x18\x04 \x01(\bR\x06pretty\x12\"\n" +
+	"\rif_none_match\x18\x05 \x01(\tR\vifNoneMatch\"\x9a\x01\n" +
 	"\x15GetFinancialsResponse\x12J\n" +
 	"\n" +
 	"statements\x18\x01 \x03(\v2*.yfinance_grpc.v1alpha1.FinancialStatementR\n" +
-	"statements\"\xcf\x01\n" +
+	"statements\x12\x12\n" +
+	"\x04etag\x18\x02 \x01(\tR\x04etag\x12!\n" +
+	"\fnot_modified\x18\x03 \x01(\bR\vnotModified\"\xcf\x01\n" +
 	"\x12FinancialStatement\x12.\n" +
 	"\x04date\x18\x01 \x01(\v2\x1a.google.protobuf.TimestampR\x04date\x12N\n" +
 	"\x06values\x18\x02 \x03(\v26.yfinance_grpc.v1alpha1.FinancialStatement.ValuesEntryR\x06values\x1a9\n" +
@@ -7287,11 +8116,14 @@ const file_yfinance_grpc_v1alpha1_ticker_proto_rawDesc = "" +
 	"\aholders\x18\x01 \x03(\v2<.yfinance_grpc.v1alpha1.GetMajorHoldersResponse.HoldersEntryR\aholders\x1a:\n" +
 	"\fHoldersEntry\x12\x10\n" +
 	"\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n" +
-	"\x05value\x18\x02 \x01(\tR\x05value:\x028\x01\"8\n" +
+	"\x05value\x18\x02 \x01(\tR\x05value:\x028\x01\"\\\n" +
 	"\x1eGetInstitutionalHoldersRequest\x12\x16\n" +
-	"\x06ticker\x18\x01 \x01(\tR\x06ticker\"h\n" +
+	"\x06ticker\x18\x01 \x01(\tR\x06ticker\x12\"\n" +
+	"\rif_none_match\x18\x02 \x01(\tR\vifNoneMatch\"\x9f\x01\n" +
 	"\x1fGetInstitutionalHoldersResponse\x12E\n" +
-	"\aholders\x18\x01 \x03(\v2+.yfinance_grpc.v1alpha1.InstitutionalHolderR\aholders\"\xb5\x01\n" +
+	"\aholders\x18\x01 \x03(\v2+.yfinance_grpc.v1alpha1.InstitutionalHolderR\aholders\x12\x12\n" +
+	"\x04etag\x18\x02 \x01(\tR\x04etag\x12!\n" +
+	"\fnot_modified\x18\x03 \x01(\bR\vnotModified\"\xb5\x01\n" +
 	"\x13InstitutionalHolder\x12\x16\n" +
 	"\x06holder\x18\x01 \x01(\tR\x06holder\x12\x16\n" +
 	"\x06shares\x18\x02 \x01(\x03R\x06shares\x12?\n" +
@@ -7307,11 +8139,14 @@ const file_yfinance_grpc_v1alpha1_ticker_proto_rawDesc = "" +
 	"\x06shares\x18\x02 \x01(\x03R\x06shares\x12?\n" +
 	"\rdate_reported\x18\x03 \x01(\v2\x1a.google.protobuf.TimestampR\fdateReported\x12\x17\n" +
 	"\apct_out\x18\x04 \x01(\x01R\x06pctOut\x12\x14\n" +
-	"\x05value\x18\x05 \x01(\x01R\x05value\"2\n" +
+	"\x05value\x18\x05 \x01(\x01R\x05value\"\xb0\x01\n" +
 	"\x16GetMultipleInfoRequest\x12\x18\n" +
-	"\atickers\x18\x01 \x03(\tR\atickers\"\xc5\x01\n" +
+	"\atickers\x18\x01 \x03(\tR\atickers\x127\n" +
+	"\tread_mask\x18\x02 \x01(\v2\x1a.google.protobuf.FieldMaskR\breadMask\x12C\n" +
+	"\tfreshness\x18\x03 \x01(\x0e2%.yfinance_grpc.v1alpha1.InfoFreshnessR\tfreshness\"\x81\x02\n" +
 	"\x17GetMultipleInfoResponse\x12M\n" +
-	"\x04info\x18\x01 \x03(\v29.yfinance_grpc.v1alpha1.GetMultipleInfoResponse.InfoEntryR\x04info\x1a[\n" +
+	"\x04info\x18\x01 \x03(\v29.yfinance_grpc.v1alpha1.GetMultipleInfoResponse.InfoEntryR\x04info\x12:\n" +
+	"\x06source\x18\x02 \x01(\x0e2\".yfinance_grpc.v1alpha1.InfoSourceR\x06source\x1a[\n" +
 	"\tInfoEntry\x12\x10\n" +
 	"\x03key\x18\x01 \x01(\tR\x03key\x128\n" +
 	"\x05value\x18\x02 \x01(\v2\".yfinance_grpc.v1alpha1.TickerInfoR\x05value:\x028\x01\"\xba\x02\n" +
@@ -7387,9 +8222,10 @@ const file_yfinance_grpc_v1alpha1_ticker_proto_rawDesc = "" +
 	"\vyear_change\x18\x14 \x01(\x01R\n" +
 	"yearChange\x12\x1b\n" +
 	"\tyear_high\x18\x15 \x01(\x01R\byearHigh\x12\x19\n" +
-	"\byear_low\x18\x16 \x01(\x01R\ayearLow\"2\n" +
+	"\byear_low\x18\x16 \x01(\x01R\ayearLow\"V\n" +
 	"\x18GetSustainabilityRequest\x12\x16\n" +
-	"\x06ticker\x18\x01 \x01(\tR\x06ticker\"\xe5\x05\n" +
+	"\x06ticker\x18\x01 \x01(\tR\x06ticker\x12\"\n" +
+	"\rif_none_match\x18\x02 \x01(\tR\vifNoneMatch\"\x9c\x06\n" +
 	"\x19GetSustainabilityResponse\x12\x1b\n" +
 	"\ttotal_esg\x18\x01 \x01(\x01R\btotalEsg\x12'\n" +
 	"\x0fesg_performance\x18\x02 \x01(\tR\x0eesgPerformance\x12+\n" +
@@ -7419,7 +8255,9 @@ const file_yfinance_grpc_v1alpha1_ticker_proto_rawDesc = "" +
 	"pesticides\x12\x19\n" +
 	"\bpalm_oil\x18  \x01(\bR\apalmOil\x12\x12\n" +
 	"\x04coal\x18! \x01(\bR\x04coal\x12\x18\n" +
-	"\atobacco\x18\" \x01(\bR\atobacco\"4\n" +
+	"\atobacco\x18\" \x01(\bR\atobacco\x12\x12\n" +
+	"\x04etag\x18( \x01(\tR\x04etag\x12!\n" +
+	"\fnot_modified\x18) \x01(\bR\vnotModified\"4\n" +
 	"\x1aGetInsiderPurchasesRequest\x12\x16\n" +
 	"\x06ticker\x18\x01 \x01(\tR\x06ticker\"d\n" +
 	"\x1bGetInsiderPurchasesResponse\x12E\n" +
@@ -7577,16 +8415,68 @@ const file_yfinance_grpc_v1alpha1_ticker_proto_rawDesc = "" +
 	"\x12fifty_two_week_low\x18\x0e \x01(\x01R\x0ffiftyTwoWeekLow\x12)\n" +
 	"\x10data_granularity\x18\x0f \x01(\tR\x0fdataGranularity\x12\x14\n" +
 	"\x05range\x18\x10 \x01(\tR\x05range\x12!\n" +
-	"\fvalid_ranges\x18\x11 \x03(\tR\vvalidRanges\".\n" +
+	"\fvalid_ranges\x18\x11 \x03(\tR\vvalidRanges\"R\n" +
 	"\x14GetSecFilingsRequest\x12\x16\n" +
-	"\x06ticker\x18\x01 \x01(\tR\x06ticker\"T\n" +
+	"\x06ticker\x18\x01 \x01(\tR\x06ticker\x12\"\n" +
+	"\rif_none_match\x18\x02 \x01(\tR\vifNoneMatch\"\x8b\x01\n" +
 	"\x15GetSecFilingsResponse\x12;\n" +
-	"\afilings\x18\x01 \x03(\v2!.yfinance_grpc.v1alpha1.SecFilingR\afilings\"w\n" +
+	"\afilings\x18\x01 \x03(\v2!.yfinance_grpc.v1alpha1.SecFilingR\afilings\x12\x12\n" +
+	"\x04etag\x18\x02 \x01(\tR\x04etag\x12!\n" +
+	"\fnot_modified\x18\x03 \x01(\bR\vnotModified\"w\n" +
 	"\tSecFiling\x12.\n" +
 	"\x04date\x18\x01 \x01(\v2\x1a.google.protobuf.TimestampR\x04date\x12\x12\n" +
 	"\x04type\x18\x02 \x01(\tR\x04type\x12\x14\n" +
 	"\x05title\x18\x03 \x01(\tR\x05title\x12\x10\n" +
-	"\x03url\x18\x04 \x01(\tR\x03url2\xcc\"\n" +
+	"\x03url\x18\x04 \x01(\tR\x03url\"2\n" +
+	"\x16SubscribeQuotesRequest\x12\x18\n" +
+	"\atickers\x18\x01 \x03(\tR\atickers\"\xea\x01\n" +
+	"\x05Quote\x12\x16\n" +
+	"\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x1d\n" +
+	"\n" +
+	"last_price\x18\x02 \x01(\x01R\tlastPrice\x12%\n" +
+	"\x0eprevious_close\x18\x03 \x01(\x01R\rpreviousClose\x12\x12\n" +
+	"\x04open\x18\x04 \x01(\x01R\x04open\x12\x19\n" +
+	"\bday_high\x18\x05 \x01(\x01R\adayHigh\x12\x17\n" +
+	"\aday_low\x18\x06 \x01(\x01R\x06dayLow\x12\x1f\n" +
+	"\vlast_volume\x18\a \x01(\x03R\n" +
+	"lastVolume\x12\x1a\n" +
+	"\bcurrency\x18\b \x01(\tR\bcurrency\"\x91\x01\n" +
+	"\x17SubscribeQuotesResponse\x123\n" +
+	"\x05quote\x18\x01 \x01(\v2\x1d.yfinance_grpc.v1alpha1.QuoteR\x05quote\x12A\n" +
+	"\x0echanged_fields\x18\x02 \x01(\v2\x1a.google.protobuf.FieldMaskR\rchangedFields\"\xae\x03\n" +
+	"\x0eSessionRequest\x12\x1d\n" +
+	"\n" +
+	"request_id\x18\x01 \x01(\tR\trequestId\x12<\n" +
+	"\x04info\x18\x02 \x01(\v2&.yfinance_grpc.v1alpha1.GetInfoRequestH\x00R\x04info\x12E\n" +
+	"\ahistory\x18\x03 \x01(\v2).yfinance_grpc.v1alpha1.GetHistoryRequestH\x00R\ahistory\x12R\n" +
+	"\foption_chain\x18\x04 \x01(\v2-.yfinance_grpc.v1alpha1.GetOptionChainRequestH\x00R\voptionChain\x12<\n" +
+	"\x04news\x18\x05 \x01(\v2&.yfinance_grpc.v1alpha1.GetNewsRequestH\x00R\x04news\x12?\n" +
+	"\x06cancel\x18\x06 \x01(\v2%.yfinance_grpc.v1alpha1.SessionCancelH\x00R\x06cancel\x12\x1a\n" +
+	"\bpriority\x18\a \x01(\x05R\bpriorityB\t\n" +
+	"\arequest\"\x0f\n" +
+	"\rSessionCancel\"\x95\x03\n" +
+	"\x0fSessionResponse\x12\x1d\n" +
+	"\n" +
+	"request_id\x18\x01 \x01(\tR\trequestId\x12=\n" +
+	"\x04info\x18\x02 \x01(\v2'.yfinance_grpc.v1alpha1.GetInfoResponseH\x00R\x04info\x12F\n" +
+	"\ahistory\x18\x03 \x01(\v2*.yfinance_grpc.v1alpha1.GetHistoryResponseH\x00R\ahistory\x12S\n" +
+	"\foption_chain\x18\x04 \x01(\v2..yfinance_grpc.v1alpha1.GetOptionChainResponseH\x00R\voptionChain\x12=\n" +
+	"\x04news\x18\x05 \x01(\v2'.yfinance_grpc.v1alpha1.GetNewsResponseH\x00R\x04news\x12<\n" +
+	"\x05error\x18\x06 \x01(\v2$.yfinance_grpc.v1alpha1.SessionErrorH\x00R\x05errorB\n" +
+	"\n" +
+	"\bresponse\"<\n" +
+	"\fSessionError\x12\x12\n" +
+	"\x04code\x18\x01 \x01(\x05R\x04code\x12\x18\n" +
+	"\amessage\x18\x02 \x01(\tR\amessage*U\n" +
+	"\n" +
+	"InfoSource\x12\x1b\n" +
+	"\x17INFO_SOURCE_UNSPECIFIED\x10\x00\x12\x14\n" +
+	"\x10INFO_SOURCE_FULL\x10\x01\x12\x14\n" +
+	"\x10INFO_SOURCE_FAST\x10\x02*a\n" +
+	"\rInfoFreshness\x12\x1e\n" +
+	"\x1aINFO_FRESHNESS_UNSPECIFIED\x10\x00\x12\x17\n" +
+	"\x13INFO_FRESHNESS_FAST\x10\x01\x12\x17\n" +
+	"\x13INFO_FRESHNESS_FULL\x10\x022\xa2$\n" +
 	"\rTickerService\x12Z\n" +
 	"\aGetInfo\x12&.yfinance_grpc.v1alpha1.GetInfoRequest\x1a'.yfinance_grpc.v1alpha1.GetInfoResponse\x12c\n" +
 	"\n" +
@@ -7628,7 +8518,9 @@ const file_yfinance_grpc_v1alpha1_ticker_proto_rawDesc = "" +
 	"\x12GetGrowthEstimates\x121.yfinance_grpc.v1alpha1.GetGrowthEstimatesRequest\x1a2.yfinance_grpc.v1alpha1.GetGrowthEstimatesResponse\x12u\n" +
 	"\x10GetEarningsDates\x12/.yfinance_grpc.v1alpha1.GetEarningsDatesRequest\x1a0.yfinance_grpc.v1alpha1.GetEarningsDatesResponse\x12{\n" +
 	"\x12GetHistoryMetadata\x121.yfinance_grpc.v1alpha1.GetHistoryMetadataRequest\x1a2.yfinance_grpc.v1alpha1.GetHistoryMetadataResponse\x12l\n" +
-	"\rGetSecFilings\x12,.yfinance_grpc.v1alpha1.GetSecFilingsRequest\x1a-.yfinance_grpc.v1alpha1.GetSecFilingsResponseB\xf6\x01\n" +
+	"\rGetSecFilings\x12,.yfinance_grpc.v1alpha1.GetSecFilingsRequest\x1a-.yfinance_grpc.v1alpha1.GetSecFilingsResponse\x12t\n" +
+	"\x0fSubscribeQuotes\x12..yfinance_grpc.v1alpha1.SubscribeQuotesRequest\x1a/.yfinance_grpc.v1alpha1.SubscribeQuotesResponse0\x01\x12^\n" +
+	"\aSession\x12&.yfinance_grpc.v1alpha1.SessionRequest\x1a'.yfinance_grpc.v1alpha1.SessionResponse(\x010\x01B\xf6\x01\n" +
 	"\x1acom.yfinance_grpc.v1alpha1B\vTickerProtoP\x01ZVgithub.com/idebeijer/yfinance-grpc/gen/go/yfinance_grpc/v1alpha1;yfinance_grpcv1alpha1\xa2\x02\x03YXX\xaa\x02\x15YfinanceGrpc.V1alpha1\xca\x02\x15YfinanceGrpc\\V1alpha1\xe2\x02!YfinanceGrpc\\V1alpha1\\GPBMetadata\xea\x02\x16YfinanceGrpc::V1alpha1b\x06proto3"
 
 var (
@@ -7643,277 +8535,310 @@ func file_yfinance_grpc_v1alpha1_ticker_proto_rawDescGZIP() []byte {
 	return file_yfinance_grpc_v1alpha1_ticker_proto_rawDescData
 }
 
-var file_yfinance_grpc_v1alpha1_ticker_proto_msgTypes = make([]protoimpl.MessageInfo, 114)
+var file_yfinance_grpc_v1alpha1_ticker_proto_enumTypes = make([]protoimpl.EnumInfo, 2)
+var file_yfinance_grpc_v1alpha1_ticker_proto_msgTypes = make([]protoimpl.MessageInfo, 121)
 var file_yfinance_grpc_v1alpha1_ticker_proto_goTypes = []any{
-	(*GetInfoRequest)(nil),                    // 0: yfinance_grpc.v1alpha1.GetInfoRequest
-	(*GetInfoResponse)(nil),                   // 1: yfinance_grpc.v1alpha1.GetInfoResponse
-	(*TickerInfo)(nil),                        // 2: yfinance_grpc.v1alpha1.TickerInfo
-	(*GetHistoryRequest)(nil),                 // 3: yfinance_grpc.v1alpha1.GetHistoryRequest
-	(*GetHistoryResponse)(nil),                // 4: yfinance_grpc.v1alpha1.GetHistoryResponse
-	(*HistoryRow)(nil),                        // 5: yfinance_grpc.v1alpha1.HistoryRow
-	(*GetDividendsRequest)(nil),               // 6: yfinance_grpc.v1alpha1.GetDividendsRequest
-	(*GetDividendsResponse)(nil),              // 7: yfinance_grpc.v1alpha1.GetDividendsResponse
-	(*DividendRow)(nil),                       // 8: yfinance_grpc.v1alpha1.DividendRow
-	(*GetSplitsRequest)(nil),                  // 9: yfinance_grpc.v1alpha1.GetSplitsRequest
-	(*GetSplitsResponse)(nil),                 // 10: yfinance_grpc.v1alpha1.GetSplitsResponse
-	(*SplitRow)(nil),                          // 11: yfinance_grpc.v1alpha1.SplitRow
-	(*GetActionsRequest)(nil),                 // 12: yfinance_grpc.v1alpha1.GetActionsRequest
-	(*GetActionsResponse)(nil),                // 13: yfinance_grpc.v1alpha1.GetActionsResponse
-	(*ActionRow)(nil),                         // 14: yfinance_grpc.v1alpha1.ActionRow
-	(*GetFinancialsRequest)(nil),              // 15: yfinance_grpc.v1alpha1.GetFinancialsRequest
-	(*GetFinancialsResponse)(nil),             // 16: yfinance_grpc.v1alpha1.GetFinancialsResponse
-	(*FinancialStatement)(nil),                // 17: yfinance_grpc.v1alpha1.FinancialStatement
-	(*GetBalanceSheetRequest)(nil),            // 18: yfinance_grpc.v1alpha1.GetBalanceSheetRequest
-	(*GetBalanceSheetResponse)(nil),           // 19: yfinance_grpc.v1alpha1.GetBalanceSheetResponse
-	(*BalanceSheetStatement)(nil),             // 20: yfinance_grpc.v1alpha1.BalanceSheetStatement
-	(*GetCashFlowRequest)(nil),                // 21: yfinance_grpc.v1alpha1.GetCashFlowRequest
-	(*GetCashFlowResponse)(nil),               // 22: yfinance_grpc.v1alpha1.GetCashFlowResponse
-	(*CashFlowStatement)(nil),                 // 23: yfinance_grpc.v1alpha1.CashFlowStatement
-	(*GetEarningsRequest)(nil),                // 24: yfinance_grpc.v1alpha1.GetEarningsRequest
-	(*GetEarningsResponse)(nil),               // 25: yfinance_grpc.v1alpha1.GetEarningsResponse
-	(*EarningsRow)(nil),                       // 26: yfinance_grpc.v1alpha1.EarningsRow
-	(*GetRecommendationsRequest)(nil),         // 27: yfinance_grpc.v1alpha1.GetRecommendationsRequest
-	(*GetRecommendationsResponse)(nil),        // 28: yfinance_grpc.v1alpha1.GetRecommendationsResponse
-	(*RecommendationRow)(nil),                 // 29: yfinance_grpc.v1alpha1.RecommendationRow
-	(*GetOptionsRequest)(nil),                 // 30: yfinance_grpc.v1alpha1.GetOptionsRequest
-	(*GetOptionsResponse)(nil),                // 31: yfinance_grpc.v1alpha1.GetOptionsResponse
-	(*GetOptionChainRequest)(nil),             // 32: yfinance_grpc.v1alpha1.GetOptionChainRequest
-	(*GetOptionChainResponse)(nil),            // 33: yfinance_grpc.v1alpha1.GetOptionChainResponse
-	(*OptionContract)(nil),                    // 34: yfinance_grpc.v1alpha1.OptionContract
-	(*GetCalendarRequest)(nil),                // 35: yfinance_grpc.v1alpha1.GetCalendarRequest
-	(*GetCalendarResponse)(nil),               // 36: yfinance_grpc.v1alpha1.GetCalendarResponse
-	(*EarningsDate)(nil),                      // 37: yfinance_grpc.v1alpha1.EarningsDate
-	(*DividendDate)(nil),                      // 38: yfinance_grpc.v1alpha1.DividendDate
-	(*CalendarEvent)(nil),                     // 39: yfinance_grpc.v1alpha1.CalendarEvent
-	(*GetNewsRequest)(nil),                    // 40: yfinance_grpc.v1alpha1.GetNewsRequest
-	(*GetNewsResponse)(nil),                   // 41: yfinance_grpc.v1alpha1.GetNewsResponse
-	(*NewsArticle)(nil),                       // 42: yfinance_grpc.v1alpha1.NewsArticle
-	(*GetMajorHoldersRequest)(nil),            // 43: yfinance_grpc.v1alpha1.GetMajorHoldersRequest
-	(*GetMajorHoldersResponse)(nil),           // 44: yfinance_grpc.v1alpha1.GetMajorHoldersResponse
-	(*GetInstitutionalHoldersRequest)(nil),    // 45: yfinance_grpc.v1alpha1.GetInstitutionalHoldersRequest
-	(*GetInstitutionalHoldersResponse)(nil),   // 46: yfinance_grpc.v1alpha1.GetInstitutionalHoldersResponse
-	(*InstitutionalHolder)(nil),               // 47: yfinance_grpc.v1alpha1.InstitutionalHolder
-	(*GetMutualFundHoldersRequest)(nil),       // 48: yfinance_grpc.v1alpha1.GetMutualFundHoldersRequest
-	(*GetMutualFundHoldersResponse)(nil),      // 49: yfinance_grpc.v1alpha1.GetMutualFundHoldersResponse
-	(*MutualFundHolder)(nil),                  // 50: yfinance_grpc.v1alpha1.MutualFundHolder
-	(*GetMultipleInfoRequest)(nil),            // 51: yfinance_grpc.v1alpha1.GetMultipleInfoRequest
-	(*GetMultipleInfoResponse)(nil),           // 52: yfinance_grpc.v1alpha1.GetMultipleInfoResponse
-	(*DownloadHistoryRequest)(nil),            // 53: yfinance_grpc.v1alpha1.DownloadHistoryRequest
-	(*DownloadHistoryResponse)(nil),           // 54: yfinance_grpc.v1alpha1.DownloadHistoryResponse
-	(*GetCapitalGainsRequest)(nil),            // 55: yfinance_grpc.v1alpha1.GetCapitalGainsRequest
-	(*GetCapitalGainsResponse)(nil),           // 56: yfinance_grpc.v1alpha1.GetCapitalGainsResponse
-	(*CapitalGainsRow)(nil),                   // 57: yfinance_grpc.v1alpha1.CapitalGainsRow
-	(*GetSharesHistoryRequest)(nil),           // 58: yfinance_grpc.v1alpha1.GetSharesHistoryRequest
-	(*GetSharesHistoryResponse)(nil),          // 59: yfinance_grpc.v1alpha1.GetSharesHistoryResponse
-	(*SharesHistoryRow)(nil),                  // 60: yfinance_grpc.v1alpha1.SharesHistoryRow
-	(*GetIsinRequest)(nil),                    // 61: yfinance_grpc.v1alpha1.GetIsinRequest
-	(*GetIsinResponse)(nil),                   // 62: yfinance_grpc.v1alpha1.GetIsinResponse
-	(*GetFastInfoRequest)(nil),                // 63: yfinance_grpc.v1alpha1.GetFastInfoRequest
-	(*GetFastInfoResponse)(nil),               // 64: yfinance_grpc.v1alpha1.GetFastInfoResponse
-	(*FastInfo)(nil),                          // 65: yfinance_grpc.v1alpha1.FastInfo
-	(*GetSustainabilityRequest)(nil),          // 66: yfinance_grpc.v1alpha1.GetSustainabilityRequest
-	(*GetSustainabilityResponse)(nil),         // 67: yfinance_grpc.v1alpha1.GetSustainabilityResponse
-	(*GetInsiderPurchasesRequest)(nil),        // 68: yfinance_grpc.v1alpha1.GetInsiderPurchasesRequest
-	(*GetInsiderPurchasesResponse)(nil),       // 69: yfinance_grpc.v1alpha1.GetInsiderPurchasesResponse
-	(*InsiderPurchaseSummaryRow)(nil),         // 70: yfinance_grpc.v1alpha1.InsiderPurchaseSummaryRow
-	(*GetInsiderTransactionsRequest)(nil),     // 71: yfinance_grpc.v1alpha1.GetInsiderTransactionsRequest
-	(*GetInsiderTransactionsResponse)(nil),    // 72: yfinance_grpc.v1alpha1.GetInsiderTransactionsResponse
-	(*InsiderTransaction)(nil),                // 73: yfinance_grpc.v1alpha1.InsiderTransaction
-	(*GetInsiderRosterHoldersRequest)(nil),    // 74: yfinance_grpc.v1alpha1.GetInsiderRosterHoldersRequest
-	(*GetInsiderRosterHoldersResponse)(nil),   // 75: yfinance_grpc.v1alpha1.GetInsiderRosterHoldersResponse
-	(*InsiderRosterHolder)(nil),               // 76: yfinance_grpc.v1alpha1.InsiderRosterHolder
-	(*GetAnalystPriceTargetsRequest)(nil),     // 77: yfinance_grpc.v1alpha1.GetAnalystPriceTargetsRequest
-	(*GetAnalystPriceTargetsResponse)(nil),    // 78: yfinance_grpc.v1alpha1.GetAnalystPriceTargetsResponse
-	(*GetRecommendationsSummaryRequest)(nil),  // 79: yfinance_grpc.v1alpha1.GetRecommendationsSummaryRequest
-	(*GetRecommendationsSummaryResponse)(nil), // 80: yfinance_grpc.v1alpha1.GetRecommendationsSummaryResponse
-	(*RecommendationSummaryRow)(nil),          // 81: yfinance_grpc.v1alpha1.RecommendationSummaryRow
-	(*GetEarningsEstimateRequest)(nil),        // 82: yfinance_grpc.v1alpha1.GetEarningsEstimateRequest
-	(*GetEarningsEstimateResponse)(nil),       // 83: yfinance_grpc.v1alpha1.GetEarningsEstimateResponse
-	(*EarningsEstimateRow)(nil),               // 84: yfinance_grpc.v1alpha1.EarningsEstimateRow
-	(*GetRevenueEstimateRequest)(nil),         // 85: yfinance_grpc.v1alpha1.GetRevenueEstimateRequest
-	(*GetRevenueEstimateResponse)(nil),        // 86: yfinance_grpc.v1alpha1.GetRevenueEstimateResponse
-	(*RevenueEstimateRow)(nil),                // 87: yfinance_grpc.v1alpha1.RevenueEstimateRow
-	(*GetEarningsHistoryRequest)(nil),         // 88: yfinance_grpc.v1alpha1.GetEarningsHistoryRequest
-	(*GetEarningsHistoryResponse)(nil),        // 89: yfinance_grpc.v1alpha1.GetEarningsHistoryResponse
-	(*EarningsHistoryRow)(nil),                // 90: yfinance_grpc.v1alpha1.EarningsHistoryRow
-	(*GetEpsTrendRequest)(nil),                // 91: yfinance_grpc.v1alpha1.GetEpsTrendRequest
-	(*GetEpsTrendResponse)(nil),               // 92: yfinance_grpc.v1alpha1.GetEpsTrendResponse
-	(*EpsTrendRow)(nil),                       // 93: yfinance_grpc.v1alpha1.EpsTrendRow
-	(*GetEpsRevisionsRequest)(nil),            // 94: yfinance_grpc.v1alpha1.GetEpsRevisionsRequest
-	(*GetEpsRevisionsResponse)(nil),           // 95: yfinance_grpc.v1alpha1.GetEpsRevisionsResponse
-	(*EpsRevisionsRow)(nil),                   // 96: yfinance_grpc.v1alpha1.EpsRevisionsRow
-	(*GetGrowthEstimatesRequest)(nil),         // 97: yfinance_grpc.v1alpha1.GetGrowthEstimatesRequest
-	(*GetGrowthEstimatesResponse)(nil),        // 98: yfinance_grpc.v1alpha1.GetGrowthEstimatesResponse
-	(*GrowthEstimatesRow)(nil),                // 99: yfinance_grpc.v1alpha1.GrowthEstimatesRow
-	(*GetEarningsDatesRequest)(nil),           // 100: yfinance_grpc.v1alpha1.GetEarningsDatesRequest
-	(*GetEarningsDatesResponse)(nil),          // 101: yfinance_grpc.v1alpha1.GetEarningsDatesResponse
-	(*EarningsDateRow)(nil),                   // 102: yfinance_grpc.v1alpha1.EarningsDateRow
-	(*GetHistoryMetadataRequest)(nil),         // 103: yfinance_grpc.v1alpha1.GetHistoryMetadataRequest
-	(*GetHistoryMetadataResponse)(nil),        // 104: yfinance_grpc.v1alpha1.GetHistoryMetadataResponse
-	(*GetSecFilingsRequest)(nil),              // 105: yfinance_grpc.v1alpha1.GetSecFilingsRequest
-	(*GetSecFilingsResponse)(nil),             // 106: yfinance_grpc.v1alpha1.GetSecFilingsResponse
-	(*SecFiling)(nil),                         // 107: yfinance_grpc.v1alpha1.SecFiling
-	nil,                                       // 108: yfinance_grpc.v1alpha1.FinancialStatement.ValuesEntry
-	nil,                                       // 109: yfinance_grpc.v1alpha1.BalanceSheetStatement.ValuesEntry
-	nil,                                       // 110: yfinance_grpc.v1alpha1.CashFlowStatement.ValuesEntry
-	nil,                                       // 111: yfinance_grpc.v1alpha1.GetMajorHoldersResponse.HoldersEntry
-	nil,                                       // 112: yfinance_grpc.v1alpha1.GetMultipleInfoResponse.InfoEntry
-	nil,                                       // 113: yfinance_grpc.v1alpha1.InsiderPurchaseSummaryRow.ValuesEntry
-	(*timestamppb.Timestamp)(nil),             // 114: google.protobuf.Timestamp
+	(InfoSource)(0),                           // 0: yfinance_grpc.v1alpha1.InfoSource
+	(InfoFreshness)(0),                        // 1: yfinance_grpc.v1alpha1.InfoFreshness
+	(*GetInfoRequest)(nil),                    // 2: yfinance_grpc.v1alpha1.GetInfoRequest
+	(*GetInfoResponse)(nil),                   // 3: yfinance_grpc.v1alpha1.GetInfoResponse
+	(*TickerInfo)(nil),                        // 4: yfinance_grpc.v1alpha1.TickerInfo
+	(*GetHistoryRequest)(nil),                 // 5: yfinance_grpc.v1alpha1.GetHistoryRequest
+	(*GetHistoryResponse)(nil),                // 6: yfinance_grpc.v1alpha1.GetHistoryResponse
+	(*HistoryRow)(nil),                        // 7: yfinance_grpc.v1alpha1.HistoryRow
+	(*GetDividendsRequest)(nil),               // 8: yfinance_grpc.v1alpha1.GetDividendsRequest
+	(*GetDividendsResponse)(nil),              // 9: yfinance_grpc.v1alpha1.GetDividendsResponse
+	(*DividendRow)(nil),                       // 10: yfinance_grpc.v1alpha1.DividendRow
+	(*GetSplitsRequest)(nil),                  // 11: yfinance_grpc.v1alpha1.GetSplitsRequest
+	(*GetSplitsResponse)(nil),                 // 12: yfinance_grpc.v1alpha1.GetSplitsResponse
+	(*SplitRow)(nil),                          // 13: yfinance_grpc.v1alpha1.SplitRow
+	(*GetActionsRequest)(nil),                 // 14: yfinance_grpc.v1alpha1.GetActionsRequest
+	(*GetActionsResponse)(nil),                // 15: yfinance_grpc.v1alpha1.GetActionsResponse
+	(*ActionRow)(nil),                         // 16: yfinance_grpc.v1alpha1.ActionRow
+	(*GetFinancialsRequest)(nil),              // 17: yfinance_grpc.v1alpha1.GetFinancialsRequest
+	(*GetFinancialsResponse)(nil),             // 18: yfinance_grpc.v1alpha1.GetFinancialsResponse
+	(*FinancialStatement)(nil),                // 19: yfinance_grpc.v1alpha1.FinancialStatement
+	(*GetBalanceSheetRequest)(nil),            // 20: yfinance_grpc.v1alpha1.GetBalanceSheetRequest
+	(*GetBalanceSheetResponse)(nil),           // 21: yfinance_grpc.v1alpha1.GetBalanceSheetResponse
+	(*BalanceSheetStatement)(nil),             // 22: yfinance_grpc.v1alpha1.BalanceSheetStatement
+	(*GetCashFlowRequest)(nil),                // 23: yfinance_grpc.v1alpha1.GetCashFlowRequest
+	(*GetCashFlowResponse)(nil),               // 24: yfinance_grpc.v1alpha1.GetCashFlowResponse
+	(*CashFlowStatement)(nil),                 // 25: yfinance_grpc.v1alpha1.CashFlowStatement
+	(*GetEarningsRequest)(nil),                // 26: yfinance_grpc.v1alpha1.GetEarningsRequest
+	(*GetEarningsResponse)(nil),               // 27: yfinance_grpc.v1alpha1.GetEarningsResponse
+	(*EarningsRow)(nil),                       // 28: yfinance_grpc.v1alpha1.EarningsRow
+	(*GetRecommendationsRequest)(nil),         // 29: yfinance_grpc.v1alpha1.GetRecommendationsRequest
+	(*GetRecommendationsResponse)(nil),        // 30: yfinance_grpc.v1alpha1.GetRecommendationsResponse
+	(*RecommendationRow)(nil),                 // 31: yfinance_grpc.v1alpha1.RecommendationRow
+	(*GetOptionsRequest)(nil),                 // 32: yfinance_grpc.v1alpha1.GetOptionsRequest
+	(*GetOptionsResponse)(nil),                // 33: yfinance_grpc.v1alpha1.GetOptionsResponse
+	(*GetOptionChainRequest)(nil),             // 34: yfinance_grpc.v1alpha1.GetOptionChainRequest
+	(*GetOptionChainResponse)(nil),            // 35: yfinance_grpc.v1alpha1.GetOptionChainResponse
+	(*OptionContract)(nil),                    // 36: yfinance_grpc.v1alpha1.OptionContract
+	(*GetCalendarRequest)(nil),                // 37: yfinance_grpc.v1alpha1.GetCalendarRequest
+	(*GetCalendarResponse)(nil),               // 38: yfinance_grpc.v1alpha1.GetCalendarResponse
+	(*EarningsDate)(nil),                      // 39: yfinance_grpc.v1alpha1.EarningsDate
+	(*DividendDate)(nil),                      // 40: yfinance_grpc.v1alpha1.DividendDate
+	(*CalendarEvent)(nil),                     // 41: yfinance_grpc.v1alpha1.CalendarEvent
+	(*GetNewsRequest)(nil),                    // 42: yfinance_grpc.v1alpha1.GetNewsRequest
+	(*GetNewsResponse)(nil),                   // 43: yfinance_grpc.v1alpha1.GetNewsResponse
+	(*NewsArticle)(nil),                       // 44: yfinance_grpc.v1alpha1.NewsArticle
+	(*GetMajorHoldersRequest)(nil),            // 45: yfinance_grpc.v1alpha1.GetMajorHoldersRequest
+	(*GetMajorHoldersResponse)(nil),           // 46: yfinance_grpc.v1alpha1.GetMajorHoldersResponse
+	(*GetInstitutionalHoldersRequest)(nil),    // 47: yfinance_grpc.v1alpha1.GetInstitutionalHoldersRequest
+	(*GetInstitutionalHoldersResponse)(nil),   // 48: yfinance_grpc.v1alpha1.GetInstitutionalHoldersResponse
+	(*InstitutionalHolder)(nil),               // 49: yfinance_grpc.v1alpha1.InstitutionalHolder
+	(*GetMutualFundHoldersRequest)(nil),       // 50: yfinance_grpc.v1alpha1.GetMutualFundHoldersRequest
+	(*GetMutualFundHoldersResponse)(nil),      // 51: yfinance_grpc.v1alpha1.GetMutualFundHoldersResponse
+	(*MutualFundHolder)(nil),                  // 52: yfinance_grpc.v1alpha1.MutualFundHolder
+	(*GetMultipleInfoRequest)(nil),            // 53: yfinance_grpc.v1alpha1.GetMultipleInfoRequest
+	(*GetMultipleInfoResponse)(nil),           // 54: yfinance_grpc.v1alpha1.GetMultipleInfoResponse
+	(*DownloadHistoryRequest)(nil),            // 55: yfinance_grpc.v1alpha1.DownloadHistoryRequest
+	(*DownloadHistoryResponse)(nil),           // 56: yfinance_grpc.v1alpha1.DownloadHistoryResponse
+	(*GetCapitalGainsRequest)(nil),            // 57: yfinance_grpc.v1alpha1.GetCapitalGainsRequest
+	(*GetCapitalGainsResponse)(nil),           // 58: yfinance_grpc.v1alpha1.GetCapitalGainsResponse
+	(*CapitalGainsRow)(nil),                   // 59: yfinance_grpc.v1alpha1.CapitalGainsRow
+	(*GetSharesHistoryRequest)(nil),           // 60: yfinance_grpc.v1alpha1.GetSharesHistoryRequest
+	(*GetSharesHistoryResponse)(nil),          // 61: yfinance_grpc.v1alpha1.GetSharesHistoryResponse
+	(*SharesHistoryRow)(nil),                  // 62: yfinance_grpc.v1alpha1.SharesHistoryRow
+	(*GetIsinRequest)(nil),                    // 63: yfinance_grpc.v1alpha1.GetIsinRequest
+	(*GetIsinResponse)(nil),                   // 64: yfinance_grpc.v1alpha1.GetIsinResponse
+	(*GetFastInfoRequest)(nil),                // 65: yfinance_grpc.v1alpha1.GetFastInfoRequest
+	(*GetFastInfoResponse)(nil),               // 66: yfinance_grpc.v1alpha1.GetFastInfoResponse
+	(*FastInfo)(nil),                          // 67: yfinance_grpc.v1alpha1.FastInfo
+	(*GetSustainabilityRequest)(nil),          // 68: yfinance_grpc.v1alpha1.GetSustainabilityRequest
+	(*GetSustainabilityResponse)(nil),         // 69: yfinance_grpc.v1alpha1.GetSustainabilityResponse
+	(*GetInsiderPurchasesRequest)(nil),        // 70: yfinance_grpc.v1alpha1.GetInsiderPurchasesRequest
+	(*GetInsiderPurchasesResponse)(nil),       // 71: yfinance_grpc.v1alpha1.GetInsiderPurchasesResponse
+	(*InsiderPurchaseSummaryRow)(nil),         // 72: yfinance_grpc.v1alpha1.InsiderPurchaseSummaryRow
+	(*GetInsiderTransactionsRequest)(nil),     // 73: yfinance_grpc.v1alpha1.GetInsiderTransactionsRequest
+	(*GetInsiderTransactionsResponse)(nil),    // 74: yfinance_grpc.v1alpha1.GetInsiderTransactionsResponse
+	(*InsiderTransaction)(nil),                // 75: yfinance_grpc.v1alpha1.InsiderTransaction
+	(*GetInsiderRosterHoldersRequest)(nil),    // 76: yfinance_grpc.v1alpha1.GetInsiderRosterHoldersRequest
+	(*GetInsiderRosterHoldersResponse)(nil),   // 77: yfinance_grpc.v1alpha1.GetInsiderRosterHoldersResponse
+	(*InsiderRosterHolder)(nil),               // 78: yfinance_grpc.v1alpha1.InsiderRosterHolder
+	(*GetAnalystPriceTargetsRequest)(nil),     // 79: yfinance_grpc.v1alpha1.GetAnalystPriceTargetsRequest
+	(*GetAnalystPriceTargetsResponse)(nil),    // 80: yfinance_grpc.v1alpha1.GetAnalystPriceTargetsResponse
+	(*GetRecommendationsSummaryRequest)(nil),  // 81: yfinance_grpc.v1alpha1.GetRecommendationsSummaryRequest
+	(*GetRecommendationsSummaryResponse)(nil), // 82: yfinance_grpc.v1alpha1.GetRecommendationsSummaryResponse
+	(*RecommendationSummaryRow)(nil),          // 83: yfinance_grpc.v1alpha1.RecommendationSummaryRow
+	(*GetEarningsEstimateRequest)(nil),        // 84: yfinance_grpc.v1alpha1.GetEarningsEstimateRequest
+	(*GetEarningsEstimateResponse)(nil),       // 85: yfinance_grpc.v1alpha1.GetEarningsEstimateResponse
+	(*EarningsEstimateRow)(nil),               // 86: yfinance_grpc.v1alpha1.EarningsEstimateRow
+	(*GetRevenueEstimateRequest)(nil),         // 87: yfinance_grpc.v1alpha1.GetRevenueEstimateRequest
+	(*GetRevenueEstimateResponse)(nil),        // 88: yfinance_grpc.v1alpha1.GetRevenueEstimateResponse
+	(*RevenueEstimateRow)(nil),                // 89: yfinance_grpc.v1alpha1.RevenueEstimateRow
+	(*GetEarningsHistoryRequest)(nil),         // 90: yfinance_grpc.v1alpha1.GetEarningsHistoryRequest
+	(*GetEarningsHistoryResponse)(nil),        // 91: yfinance_grpc.v1alpha1.GetEarningsHistoryResponse
+	(*EarningsHistoryRow)(nil),                // 92: yfinance_grpc.v1alpha1.EarningsHistoryRow
+	(*GetEpsTrendRequest)(nil),                // 93: yfinance_grpc.v1alpha1.GetEpsTrendRequest
+	(*GetEpsTrendResponse)(nil),               // 94: yfinance_grpc.v1alpha1.GetEpsTrendResponse
+	(*EpsTrendRow)(nil),                       // 95: yfinance_grpc.v1alpha1.EpsTrendRow
+	(*GetEpsRevisionsRequest)(nil),            // 96: yfinance_grpc.v1alpha1.GetEpsRevisionsRequest
+	(*GetEpsRevisionsResponse)(nil),           // 97: yfinance_grpc.v1alpha1.GetEpsRevisionsResponse
+	(*EpsRevisionsRow)(nil),                   // 98: yfinance_grpc.v1alpha1.EpsRevisionsRow
+	(*GetGrowthEstimatesRequest)(nil),         // 99: yfinance_grpc.v1alpha1.GetGrowthEstimatesRequest
+	(*GetGrowthEstimatesResponse)(nil),        // 100: yfinance_grpc.v1alpha1.GetGrowthEstimatesResponse
+	(*GrowthEstimatesRow)(nil),                // 101: yfinance_grpc.v1alpha1.GrowthEstimatesRow
+	(*GetEarningsDatesRequest)(nil),           // 102: yfinance_grpc.v1alpha1.GetEarningsDatesRequest
+	(*GetEarningsDatesResponse)(nil),          // 103: yfinance_grpc.v1alpha1.GetEarningsDatesResponse
+	(*EarningsDateRow)(nil),                   // 104: yfinance_grpc.v1alpha1.EarningsDateRow
+	(*GetHistoryMetadataRequest)(nil),         // 105: yfinance_grpc.v1alpha1.GetHistoryMetadataRequest
+	(*GetHistoryMetadataResponse)(nil),        // 106: yfinance_grpc.v1alpha1.GetHistoryMetadataResponse
+	(*GetSecFilingsRequest)(nil),              // 107: yfinance_grpc.v1alpha1.GetSecFilingsRequest
+	(*GetSecFilingsResponse)(nil),             // 108: yfinance_grpc.v1alpha1.GetSecFilingsResponse
+	(*SecFiling)(nil),                         // 109: yfinance_grpc.v1alpha1.SecFiling
+	(*SubscribeQuotesRequest)(nil),            // 110: yfinance_grpc.v1alpha1.SubscribeQuotesRequest
+	(*Quote)(nil),                             // 111: yfinance_grpc.v1alpha1.Quote
+	(*SubscribeQuotesResponse)(nil),           // 112: yfinance_grpc.v1alpha1.SubscribeQuotesResponse
+	(*SessionRequest)(nil),                    // 113: yfinance_grpc.v1alpha1.SessionRequest
+	(*SessionCancel)(nil),                     // 114: yfinance_grpc.v1alpha1.SessionCancel
+	(*SessionResponse)(nil),                   // 115: yfinance_grpc.v1alpha1.SessionResponse
+	(*SessionError)(nil),                      // 116: yfinance_grpc.v1alpha1.SessionError
+	nil,                                       // 117: yfinance_grpc.v1alpha1.FinancialStatement.ValuesEntry
+	nil,                                       // 118: yfinance_grpc.v1alpha1.BalanceSheetStatement.ValuesEntry
+	nil,                                       // 119: yfinance_grpc.v1alpha1.CashFlowStatement.ValuesEntry
+	nil,                                       // 120: yfinance_grpc.v1alpha1.GetMajorHoldersResponse.HoldersEntry
+	nil,                                       // 121: yfinance_grpc.v1alpha1.GetMultipleInfoResponse.InfoEntry
+	nil,                                       // 122: yfinance_grpc.v1alpha1.InsiderPurchaseSummaryRow.ValuesEntry
+	(*fieldmaskpb.FieldMask)(nil),             // 123: google.protobuf.FieldMask
+	(*timestamppb.Timestamp)(nil),             // 124: google.protobuf.Timestamp
 }
 var file_yfinance_grpc_v1alpha1_ticker_proto_depIdxs = []int32{
-	2,   // 0: yfinance_grpc.v1alpha1.GetInfoResponse.info:type_name -> yfinance_grpc.v1alpha1.TickerInfo
-	114, // 1: yfinance_grpc.v1alpha1.GetHistoryRequest.start:type_name -> google.protobuf.Timestamp
-	114, // 2: yfinance_grpc.v1alpha1.GetHistoryRequest.end:type_name -> google.protobuf.Timestamp
-	5,   // 3: yfinance_grpc.v1alpha1.GetHistoryResponse.rows:type_name -> yfinance_grpc.v1alpha1.HistoryRow
-	114, // 4: yfinance_grpc.v1alpha1.HistoryRow.date:type_name -> google.protobuf.Timestamp
-	8,   // 5: yfinance_grpc.v1alpha1.GetDividendsResponse.rows:type_name -> yfinance_grpc.v1alpha1.DividendRow
-	114, // 6: yfinance_grpc.v1alpha1.DividendRow.date:type_name -> google.protobuf.Timestamp
-	11,  // 7: yfinance_grpc.v1alpha1.GetSplitsResponse.rows:type_name -> yfinance_grpc.v1alpha1.SplitRow
-	114, // 8: yfinance_grpc.v1alpha1.SplitRow.date:type_name -> google.protobuf.Timestamp
-	14,  // 9: yfinance_grpc.v1alpha1.GetActionsResponse.rows:type_name -> yfinance_grpc.v1alpha1.ActionRow
-	114, // 10: yfinance_grpc.v1alpha1.ActionRow.date:type_name -> google.protobuf.Timestamp
-	17,  // 11: yfinance_grpc.v1alpha1.GetFinancialsResponse.statements:type_name -> yfinance_grpc.v1alpha1.FinancialStatement
-	114, // 12: yfinance_grpc.v1alpha1.FinancialStatement.date:type_name -> google.protobuf.Timestamp
-	108, // 13: yfinance_grpc.v1alpha1.FinancialStatement.values:type_name -> yfinance_grpc.v1alpha1.FinancialStatement.ValuesEntry
-	20,  // 14: yfinance_grpc.v1alpha1.GetBalanceSheetResponse.statements:type_name -> yfinance_grpc.v1alpha1.BalanceSheetStatement
-	114, // 15: yfinance_grpc.v1alpha1.BalanceSheetStatement.date:type_name -> google.protobuf.Timestamp
-	109, // 16: yfinance_grpc.v1alpha1.BalanceSheetStatement.values:type_name -> yfinance_grpc.v1alpha1.BalanceSheetStatement.ValuesEntry
-	23,  // 17: yfinance_grpc.v1alpha1.GetCashFlowResponse.statements:type_name -> yfinance_grpc.v1alpha1.CashFlowStatement
-	114, // 18: yfinance_grpc.v1alpha1.CashFlowStatement.date:type_name -> google.protobuf.Timestamp
-	110, // 19: yfinance_grpc.v1alpha1.CashFlowStatement.values:type_name -> yfinance_grpc.v1alpha1.CashFlowStatement.ValuesEntry
-	26,  // 20: yfinance_grpc.v1alpha1.GetEarningsResponse.rows:type_name -> yfinance_grpc.v1alpha1.EarningsRow
-	114, // 21: yfinance_grpc.v1alpha1.EarningsRow.date:type_name -> google.protobuf.Timestamp
-	29,  // 22: yfinance_grpc.v1alpha1.GetRecommendationsResponse.rows:type_name -> yfinance_grpc.v1alpha1.RecommendationRow
-	114, // 23: yfinance_grpc.v1alpha1.RecommendationRow.date:type_name -> google.protobuf.Timestamp
-	34,  // 24: yfinance_grpc.v1alpha1.GetOptionChainResponse.calls:type_name -> yfinance_grpc.v1alpha1.OptionContract
-	34,  // 25: yfinance_grpc.v1alpha1.GetOptionChainResponse.puts:type_name -> yfinance_grpc.v1alpha1.OptionContract
-	114, // 26: yfinance_grpc.v1alpha1.OptionContract.last_trade_date:type_name -> google.protobuf.Timestamp
-	37,  // 27: yfinance_grpc.v1alpha1.GetCalendarResponse.earnings:type_name -> yfinance_grpc.v1alpha1.EarningsDate
-	38,  // 28: yfinance_grpc.v1alpha1.GetCalendarResponse.ex_dividend_date:type_name -> yfinance_grpc.v1alpha1.DividendDate
-	39,  // 29: yfinance_grpc.v1alpha1.GetCalendarResponse.events:type_name -> yfinance_grpc.v1alpha1.CalendarEvent
-	114, // 30: yfinance_grpc.v1alpha1.EarningsDate.start:type_name -> google.protobuf.Timestamp
-	114, // 31: yfinance_grpc.v1alpha1.EarningsDate.end:type_name -> google.protobuf.Timestamp
-	114, // 32: yfinance_grpc.v1alpha1.DividendDate.date:type_name -> google.protobuf.Timestamp
-	114, // 33: yfinance_grpc.v1alpha1.CalendarEvent.date:type_name -> google.protobuf.Timestamp
-	42,  // 34: yfinance_grpc.v1alpha1.GetNewsResponse.articles:type_name -> yfinance_grpc.v1alpha1.NewsArticle
-	114, // 35: yfinance_grpc.v1alpha1.NewsArticle.provider_publish_time:type_name -> google.protobuf.Timestamp
-	111, // 36: yfinance_grpc.v1alpha1.GetMajorHoldersResponse.holders:type_name -> yfinance_grpc.v1alpha1.GetMajorHoldersResponse.HoldersEntry
-	47,  // 37: yfinance_grpc.v1alpha1.GetInstitutionalHoldersResponse.holders:type_name -> yfinance_grpc.v1alpha1.InstitutionalHolder
-	114, // 38: yfinance_grpc.v1alpha1.InstitutionalHolder.date_reported:type_name -> google.protobuf.Timestamp
-	50,  // 39: yfinance_grpc.v1alpha1.GetMutualFundHoldersResponse.holders:type_name -> yfinance_grpc.v1alpha1.MutualFundHolder
-	114, // 40: yfinance_grpc.v1alpha1.MutualFundHolder.date_reported:type_name -> google.protobuf.Timestamp
-	112, // 41: yfinance_grpc.v1alpha1.GetMultipleInfoResponse.info:type_name -> yfinance_grpc.v1alpha1.GetMultipleInfoResponse.InfoEntry
-	114, // 42: yfinance_grpc.v1alpha1.DownloadHistoryRequest.start:type_name -> google.protobuf.Timestamp
-	114, // 43: yfinance_grpc.v1alpha1.DownloadHistoryRequest.end:type_name -> google.protobuf.Timestamp
-	5,   // 44: yfinance_grpc.v1alpha1.DownloadHistoryResponse.rows:type_name -> yfinance_grpc.v1alpha1.HistoryRow
-	57,  // 45: yfinance_grpc.v1alpha1.GetCapitalGainsResponse.rows:type_name -> yfinance_grpc.v1alpha1.CapitalGainsRow
-	114, // 46: yfinance_grpc.v1alpha1.CapitalGainsRow.date:type_name -> google.protobuf.Timestamp
-	114, // 47: yfinance_grpc.v1alpha1.GetSharesHistoryRequest.start:type_name -> google.protobuf.Timestamp
-	114, // 48: yfinance_grpc.v1alpha1.GetSharesHistoryRequest.end:type_name -> google.protobuf.Timestamp
-	60,  // 49: yfinance_grpc.v1alpha1.GetSharesHistoryResponse.rows:type_name -> yfinance_grpc.v1alpha1.SharesHistoryRow
-	114, // 50: yfinance_grpc.v1alpha1.SharesHistoryRow.date:type_name -> google.protobuf.Timestamp
-	65,  // 51: yfinance_grpc.v1alpha1.GetFastInfoResponse.info:type_name -> yfinance_grpc.v1alpha1.FastInfo
-	70,  // 52: yfinance_grpc.v1alpha1.GetInsiderPurchasesResponse.rows:type_name -> yfinance_grpc.v1alpha1.InsiderPurchaseSummaryRow
-	113, // 53: yfinance_grpc.v1alpha1.InsiderPurchaseSummaryRow.values:type_name -> yfinance_grpc.v1alpha1.InsiderPurchaseSummaryRow.ValuesEntry
-	73,  // 54: yfinance_grpc.v1alpha1.GetInsiderTransactionsResponse.transactions:type_name -> yfinance_grpc.v1alpha1.InsiderTransaction
-	114, // 55: yfinance_grpc.v1alpha1.InsiderTransaction.start_date:type_name -> google.protobuf.Timestamp
-	76,  // 56: yfinance_grpc.v1alpha1.GetInsiderRosterHoldersResponse.holders:type_name -> yfinance_grpc.v1alpha1.InsiderRosterHolder
-	114, // 57: yfinance_grpc.v1alpha1.InsiderRosterHolder.most_recent_transaction:type_name -> google.protobuf.Timestamp
-	81,  // 58: yfinance_grpc.v1alpha1.GetRecommendationsSummaryResponse.rows:type_name -> yfinance_grpc.v1alpha1.RecommendationSummaryRow
-	84,  // 59: yfinance_grpc.v1alpha1.GetEarningsEstimateResponse.rows:type_name -> yfinance_grpc.v1alpha1.EarningsEstimateRow
-	87,  // 60: yfinance_grpc.v1alpha1.GetRevenueEstimateResponse.rows:type_name -> yfinance_grpc.v1alpha1.RevenueEstimateRow
-	90,  // 61: yfinance_grpc.v1alpha1.GetEarningsHistoryResponse.rows:type_name -> yfinance_grpc.v1alpha1.EarningsHistoryRow
-	114, // 62: yfinance_grpc.v1alpha1.EarningsHistoryRow.date:type_name -> google.protobuf.Timestamp
-	93,  // 63: yfinance_grpc.v1alpha1.GetEpsTrendResponse.rows:type_name -> yfinance_grpc.v1alpha1.EpsTrendRow
-	96,  // 64: yfinance_grpc.v1alpha1.GetEpsRevisionsResponse.rows:type_name -> yfinance_grpc.v1alpha1.EpsRevisionsRow
-	99,  // 65: yfinance_grpc.v1alpha1.GetGrowthEstimatesResponse.rows:type_name -> yfinance_grpc.v1alpha1.GrowthEstimatesRow
-	102, // 66: yfinance_grpc.v1alpha1.GetEarningsDatesResponse.rows:type_name -> yfinance_grpc.v1alpha1.EarningsDateRow
-	114, // 67: yfinance_grpc.v1alpha1.EarningsDateRow.date:type_name -> google.protobuf.Timestamp
-	107, // 68: yfinance_grpc.v1alpha1.GetSecFilingsResponse.filings:type_name -> yfinance_grpc.v1alpha1.SecFiling
-	114, // 69: yfinance_grpc.v1alpha1.SecFiling.date:type_name -> google.protobuf.Timestamp
-	2,   // 70: yfinance_grpc.v1alpha1.GetMultipleInfoResponse.InfoEntry.value:type_name -> yfinance_grpc.v1alpha1.TickerInfo
-	0,   // 71: yfinance_grpc.v1alpha1.TickerService.GetInfo:input_type -> yfinance_grpc.v1alpha1.GetInfoRequest
-	3,   // 72: yfinance_grpc.v1alpha1.TickerService.GetHistory:input_type -> yfinance_grpc.v1alpha1.GetHistoryRequest
-	6,   // 73: yfinance_grpc.v1alpha1.TickerService.GetDividends:input_type -> yfinance_grpc.v1alpha1.GetDividendsRequest
-	9,   // 74: yfinance_grpc.v1alpha1.TickerService.GetSplits:input_type -> yfinance_grpc.v1alpha1.GetSplitsRequest
-	12,  // 75: yfinance_grpc.v1alpha1.TickerService.GetActions:input_type -> yfinance_grpc.v1alpha1.GetActionsRequest
-	15,  // 76: yfinance_grpc.v1alpha1.TickerService.GetFinancials:input_type -> yfinance_grpc.v1alpha1.GetFinancialsRequest
-	18,  // 77: yfinance_grpc.v1alpha1.TickerService.GetBalanceSheet:input_type -> yfinance_grpc.v1alpha1.GetBalanceSheetRequest
-	21,  // 78: yfinance_grpc.v1alpha1.TickerService.GetCashFlow:input_type -> yfinance_grpc.v1alpha1.GetCashFlowRequest
-	24,  // 79: yfinance_grpc.v1alpha1.TickerService.GetEarnings:input_type -> yfinance_grpc.v1alpha1.GetEarningsRequest
-	27,  // 80: yfinance_grpc.v1alpha1.TickerService.GetRecommendations:input_type -> yfinance_grpc.v1alpha1.GetRecommendationsRequest
-	30,  // 81: yfinance_grpc.v1alpha1.TickerService.GetOptions:input_type -> yfinance_grpc.v1alpha1.GetOptionsRequest
-	32,  // 82: yfinance_grpc.v1alpha1.TickerService.GetOptionChain:input_type -> yfinance_grpc.v1alpha1.GetOptionChainRequest
-	35,  // 83: yfinance_grpc.v1alpha1.TickerService.GetCalendar:input_type -> yfinance_grpc.v1alpha1.GetCalendarRequest
-	40,  // 84: yfinance_grpc.v1alpha1.TickerService.GetNews:input_type -> yfinance_grpc.v1alpha1.GetNewsRequest
-	43,  // 85: yfinance_grpc.v1alpha1.TickerService.GetMajorHolders:input_type -> yfinance_grpc.v1alpha1.GetMajorHoldersRequest
-	45,  // 86: yfinance_grpc.v1alpha1.TickerService.GetInstitutionalHolders:input_type -> yfinance_grpc.v1alpha1.GetInstitutionalHoldersRequest
-	48,  // 87: yfinance_grpc.v1alpha1.TickerService.GetMutualFundHolders:input_type -> yfinance_grpc.v1alpha1.GetMutualFundHoldersRequest
-	51,  // 88: yfinance_grpc.v1alpha1.TickerService.GetMultipleInfo:input_type -> yfinance_grpc.v1alpha1.GetMultipleInfoRequest
-	53,  // 89: yfinance_grpc.v1alpha1.TickerService.DownloadHistory:input_type -> yfinance_grpc.v1alpha1.DownloadHistoryRequest
-	55,  // 90: yfinance_grpc.v1alpha1.TickerService.GetCapitalGains:input_type -> yfinance_grpc.v1alpha1.GetCapitalGainsRequest
-	58,  // 91: yfinance_grpc.v1alpha1.TickerService.GetSharesHistory:input_type -> yfinance_grpc.v1alpha1.GetSharesHistoryRequest
-	61,  // 92: yfinance_grpc.v1alpha1.TickerService.GetIsin:input_type -> yfinance_grpc.v1alpha1.GetIsinRequest
-	63,  // 93: yfinance_grpc.v1alpha1.TickerService.GetFastInfo:input_type -> yfinance_grpc.v1alpha1.GetFastInfoRequest
-	66,  // 94: yfinance_grpc.v1alpha1.TickerService.GetSustainability:input_type -> yfinance_grpc.v1alpha1.GetSustainabilityRequest
-	68,  // 95: yfinance_grpc.v1alpha1.TickerService.GetInsiderPurchases:input_type -> yfinance_grpc.v1alpha1.GetInsiderPurchasesRequest
-	71,  // 96: yfinance_grpc.v1alpha1.TickerService.GetInsiderTransactions:input_type -> yfinance_grpc.v1alpha1.GetInsiderTransactionsRequest
-	74,  // 97: yfinance_grpc.v1alpha1.TickerService.GetInsiderRosterHolders:input_type -> yfinance_grpc.v1alpha1.GetInsiderRosterHoldersRequest
-	77,  // 98: yfinance_grpc.v1alpha1.TickerService.GetAnalystPriceTargets:input_type -> yfinance_grpc.v1alpha1.GetAnalystPriceTargetsRequest
-	79,  // 99: yfinance_grpc.v1alpha1.TickerService.GetRecommendationsSummary:input_type -> yfinance_grpc.v1alpha1.GetRecommendationsSummaryRequest
-	82,  // 100: yfinance_grpc.v1alpha1.TickerService.GetEarningsEstimate:input_type -> yfinance_grpc.v1alpha1.GetEarningsEstimateRequest
-	85,  // 101: yfinance_grpc.v1alpha1.TickerService.GetRevenueEstimate:input_type -> yfinance_grpc.v1alpha1.GetRevenueEstimateRequest
-	88,  // 102: yfinance_grpc.v1alpha1.TickerService.GetEarningsHistory:input_type -> yfinance_grpc.v1alpha1.GetEarningsHistoryRequest
-	91,  // 103: yfinance_grpc.v1alpha1.TickerService.GetEpsTrend:input_type -> yfinance_grpc.v1alpha1.GetEpsTrendRequest
-	94,  // 104: yfinance_grpc.v1alpha1.TickerService.GetEpsRevisions:input_type -> yfinance_grpc.v1alpha1.GetEpsRevisionsRequest
-	97,  // 105: yfinance_grpc.v1alpha1.TickerService.GetGrowthEstimates:input_type -> yfinance_grpc.v1alpha1.GetGrowthEstimatesRequest
-	100, // 106: yfinance_grpc.v1alpha1.TickerService.GetEarningsDates:input_type -> yfinance_grpc.v1alpha1.GetEarningsDatesRequest
-	103, // 107: yfinance_grpc.v1alpha1.TickerService.GetHistoryMetadata:input_type -> yfinance_grpc.v1alpha1.GetHistoryMetadataRequest
-	105, // 108: yfinance_grpc.v1alpha1.TickerService.GetSecFilings:input_type -> yfinance_grpc.v1alpha1.GetSecFilingsRequest
-	1,   // 109: yfinance_grpc.v1alpha1.TickerService.GetInfo:output_type -> yfinance_grpc.v1alpha1.GetInfoResponse
-	4,   // 110: yfinance_grpc.v1alpha1.TickerService.GetHistory:output_type -> yfinance_grpc.v1alpha1.GetHistoryResponse
-	7,   // 111: yfinance_grpc.v1alpha1.TickerService.GetDividends:output_type -> yfinance_grpc.v1alpha1.GetDividendsResponse
-	10,  // 112: yfinance_grpc.v1alpha1.TickerService.GetSplits:output_type -> yfinance_grpc.v1alpha1.GetSplitsResponse
-	13,  // 113: yfinance_grpc.v1alpha1.TickerService.GetActions:output_type -> yfinance_grpc.v1alpha1.GetActionsResponse
-	16,  // 114: yfinance_grpc.v1alpha1.TickerService.GetFinancials:output_type -> yfinance_grpc.v1alpha1.GetFinancialsResponse
-	19,  // 115: yfinance_grpc.v1alpha1.TickerService.GetBalanceSheet:output_type -> yfinance_grpc.v1alpha1.GetBalanceSheetResponse
-	22,  // 116: yfinance_grpc.v1alpha1.TickerService.GetCashFlow:output_type -> yfinance_grpc.v1alpha1.GetCashFlowResponse
-	25,  // 117: yfinance_grpc.v1alpha1.TickerService.GetEarnings:output_type -> yfinance_grpc.v1alpha1.GetEarningsResponse
-	28,  // 118: yfinance_grpc.v1alpha1.TickerService.GetRecommendations:output_type -> yfinance_grpc.v1alpha1.GetRecommendationsResponse
-	31,  // 119: yfinance_grpc.v1alpha1.TickerService.GetOptions:output_type -> yfinance_grpc.v1alpha1.GetOptionsResponse
-	33,  // 120: yfinance_grpc.v1alpha1.TickerService.GetOptionChain:output_type -> yfinance_grpc.v1alpha1.GetOptionChainResponse
-	36,  // 121: yfinance_grpc.v1alpha1.TickerService.GetCalendar:output_type -> yfinance_grpc.v1alpha1.GetCalendarResponse
-	41,  // 122: yfinance_grpc.v1alpha1.TickerService.GetNews:output_type -> yfinance_grpc.v1alpha1.GetNewsResponse
-	44,  // 123: yfinance_grpc.v1alpha1.TickerService.GetMajorHolders:output_type -> yfinance_grpc.v1alpha1.GetMajorHoldersResponse
-	46,  // 124: yfinance_grpc.v1alpha1.TickerService.GetInstitutionalHolders:output_type -> yfinance_grpc.v1alpha1.GetInstitutionalHoldersResponse
-	49,  // 125: yfinance_grpc.v1alpha1.TickerService.GetMutualFundHolders:output_type -> yfinance_grpc.v1alpha1.GetMutualFundHoldersResponse
-	52,  // 126: yfinance_grpc.v1alpha1.TickerService.GetMultipleInfo:output_type -> yfinance_grpc.v1alpha1.GetMultipleInfoResponse
-	54,  // 127: yfinance_grpc.v1alpha1.TickerService.DownloadHistory:output_type -> yfinance_grpc.v1alpha1.DownloadHistoryResponse
-	56,  // 128: yfinance_grpc.v1alpha1.TickerService.GetCapitalGains:output_type -> yfinance_grpc.v1alpha1.GetCapitalGainsResponse
-	59,  // 129: yfinance_grpc.v1alpha1.TickerService.GetSharesHistory:output_type -> yfinance_grpc.v1alpha1.GetSharesHistoryResponse
-	62,  // 130: yfinance_grpc.v1alpha1.TickerService.GetIsin:output_type -> yfinance_grpc.v1alpha1.GetIsinResponse
-	64,  // 131: yfinance_grpc.v1alpha1.TickerService.GetFastInfo:output_type -> yfinance_grpc.v1alpha1.GetFastInfoResponse
-	67,  // 132: yfinance_grpc.v1alpha1.TickerService.GetSustainability:output_type -> yfinance_grpc.v1alpha1.GetSustainabilityResponse
-	69,  // 133: yfinance_grpc.v1alpha1.TickerService.GetInsiderPurchases:output_type -> yfinance_grpc.v1alpha1.GetInsiderPurchasesResponse
-	72,  // 134: yfinance_grpc.v1alpha1.TickerService.GetInsiderTransactions:output_type -> yfinance_grpc.v1alpha1.GetInsiderTransactionsResponse
-	75,  // 135: yfinance_grpc.v1alpha1.TickerService.GetInsiderRosterHolders:output_type -> yfinance_grpc.v1alpha1.GetInsiderRosterHoldersResponse
-	78,  // 136: yfinance_grpc.v1alpha1.TickerService.GetAnalystPriceTargets:output_type -> yfinance_grpc.v1alpha1.GetAnalystPriceTargetsResponse
-	80,  // 137: yfinance_grpc.v1alpha1.TickerService.GetRecommendationsSummary:output_type -> yfinance_grpc.v1alpha1.GetRecommendationsSummaryResponse
-	83,  // 138: yfinance_grpc.v1alpha1.TickerService.GetEarningsEstimate:output_type -> yfinance_grpc.v1alpha1.GetEarningsEstimateResponse
-	86,  // 139: yfinance_grpc.v1alpha1.TickerService.GetRevenueEstimate:output_type -> yfinance_grpc.v1alpha1.GetRevenueEstimateResponse
-	89,  // 140: yfinance_grpc.v1alpha1.TickerService.GetEarningsHistory:output_type -> yfinance_grpc.v1alpha1.GetEarningsHistoryResponse
-	92,  // 141: yfinance_grpc.v1alpha1.TickerService.GetEpsTrend:output_type -> yfinance_grpc.v1alpha1.GetEpsTrendResponse
-	95,  // 142: yfinance_grpc.v1alpha1.TickerService.GetEpsRevisions:output_type -> yfinance_grpc.v1alpha1.GetEpsRevisionsResponse
-	98,  // 143: yfinance_grpc.v1alpha1.TickerService.GetGrowthEstimates:output_type -> yfinance_grpc.v1alpha1.GetGrowthEstimatesResponse
-	101, // 144: yfinance_grpc.v1alpha1.TickerService.GetEarningsDates:output_type -> yfinance_grpc.v1alpha1.GetEarningsDatesResponse
-	104, // 145: yfinance_grpc.v1alpha1.TickerService.GetHistoryMetadata:output_type -> yfinance_grpc.v1alpha1.GetHistoryMetadataResponse
-	106, // 146: yfinance_grpc.v1alpha1.TickerService.GetSecFilings:output_type -> yfinance_grpc.v1alpha1.GetSecFilingsResponse
-	109, // [109:147] is the sub-list for method output_type
-	71,  // [71:109] is the sub-list for method input_type
-	71,  // [71:71] is the sub-list for extension type_name
-	71,  // [71:71] is the sub-list for extension extendee
-	0,   // [0:71] is the sub-list for field type_name
+	123, // 0: yfinance_grpc.v1alpha1.GetInfoRequest.read_mask:type_name -> google.protobuf.FieldMask
+	1,   // 1: yfinance_grpc.v1alpha1.GetInfoRequest.freshness:type_name -> yfinance_grpc.v1alpha1.InfoFreshness
+	4,   // 2: yfinance_grpc.v1alpha1.GetInfoResponse.info:type_name -> yfinance_grpc.v1alpha1.TickerInfo
+	0,   // 3: yfinance_grpc.v1alpha1.GetInfoResponse.source:type_name -> yfinance_grpc.v1alpha1.InfoSource
+	124, // 4: yfinance_grpc.v1alpha1.GetHistoryRequest.start:type_name -> google.protobuf.Timestamp
+	124, // 5: yfinance_grpc.v1alpha1.GetHistoryRequest.end:type_name -> google.protobuf.Timestamp
+	7,   // 6: yfinance_grpc.v1alpha1.GetHistoryResponse.rows:type_name -> yfinance_grpc.v1alpha1.HistoryRow
+	124, // 7: yfinance_grpc.v1alpha1.HistoryRow.date:type_name -> google.protobuf.Timestamp
+	10,  // 8: yfinance_grpc.v1alpha1.GetDividendsResponse.rows:type_name -> yfinance_grpc.v1alpha1.DividendRow
+	124, // 9: yfinance_grpc.v1alpha1.DividendRow.date:type_name -> google.protobuf.Timestamp
+	13,  // 10: yfinance_grpc.v1alpha1.GetSplitsResponse.rows:type_name -> yfinance_grpc.v1alpha1.SplitRow
+	124, // 11: yfinance_grpc.v1alpha1.SplitRow.date:type_name -> google.protobuf.Timestamp
+	16,  // 12: yfinance_grpc.v1alpha1.GetActionsResponse.rows:type_name -> yfinance_grpc.v1alpha1.ActionRow
+	124, // 13: yfinance_grpc.v1alpha1.ActionRow.date:type_name -> google.protobuf.Timestamp
+	19,  // 14: yfinance_grpc.v1alpha1.GetFinancialsResponse.statements:type_name -> yfinance_grpc.v1alpha1.FinancialStatement
+	124, // 15: yfinance_grpc.v1alpha1.FinancialStatement.date:type_name -> google.protobuf.Timestamp
+	117, // 16: yfinance_grpc.v1alpha1.FinancialStatement.values:type_name -> yfinance_grpc.v1alpha1.FinancialStatement.ValuesEntry
+	22,  // 17: yfinance_grpc.v1alpha1.GetBalanceSheetResponse.statements:type_name -> yfinance_grpc.v1alpha1.BalanceSheetStatement
+	124, // 18: yfinance_grpc.v1alpha1.BalanceSheetStatement.date:type_name -> google.protobuf.Timestamp
+	118, // 19: yfinance_grpc.v1alpha1.BalanceSheetStatement.values:type_name -> yfinance_grpc.v1alpha1.BalanceSheetStatement.ValuesEntry
+	25,  // 20: yfinance_grpc.v1alpha1.GetCashFlowResponse.statements:type_name -> yfinance_grpc.v1alpha1.CashFlowStatement
+	124, // 21: yfinance_grpc.v1alpha1.CashFlowStatement.date:type_name -> google.protobuf.Timestamp
+	119, // 22: yfinance_grpc.v1alpha1.CashFlowStatement.values:type_name -> yfinance_grpc.v1alpha1.CashFlowStatement.ValuesEntry
+	28,  // 23: yfinance_grpc.v1alpha1.GetEarningsResponse.rows:type_name -> yfinance_grpc.v1alpha1.EarningsRow
+	124, // 24: yfinance_grpc.v1alpha1.EarningsRow.date:type_name -> google.protobuf.Timestamp
+	31,  // 25: yfinance_grpc.v1alpha1.GetRecommendationsResponse.rows:type_name -> yfinance_grpc.v1alpha1.RecommendationRow
+	124, // 26: yfinance_grpc.v1alpha1.RecommendationRow.date:type_name -> google.protobuf.Timestamp
+	36,  // 27: yfinance_grpc.v1alpha1.GetOptionChainResponse.calls:type_name -> yfinance_grpc.v1alpha1.OptionContract
+	36,  // 28: yfinance_grpc.v1alpha1.GetOptionChainResponse.puts:type_name -> yfinance_grpc.v1alpha1.OptionContract
+	124, // 29: yfinance_grpc.v1alpha1.OptionContract.last_trade_date:type_name -> google.protobuf.Timestamp
+	39,  // 30: yfinance_grpc.v1alpha1.GetCalendarResponse.earnings:type_name -> yfinance_grpc.v1alpha1.EarningsDate
+	40,  // 31: yfinance_grpc.v1alpha1.GetCalendarResponse.ex_dividend_date:type_name -> yfinance_grpc.v1alpha1.DividendDate
+	41,  // 32: yfinance_grpc.v1alpha1.GetCalendarResponse.events:type_name -> yfinance_grpc.v1alpha1.CalendarEvent
+	124, // 33: yfinance_grpc.v1alpha1.EarningsDate.start:type_name -> google.protobuf.Timestamp
+	124, // 34: yfinance_grpc.v1alpha1.EarningsDate.end:type_name -> google.protobuf.Timestamp
+	124, // 35: yfinance_grpc.v1alpha1.DividendDate.date:type_name -> google.protobuf.Timestamp
+	124, // 36: yfinance_grpc.v1alpha1.CalendarEvent.date:type_name -> google.protobuf.Timestamp
+	44,  // 37: yfinance_grpc.v1alpha1.GetNewsResponse.articles:type_name -> yfinance_grpc.v1alpha1.NewsArticle
+	124, // 38: yfinance_grpc.v1alpha1.NewsArticle.provider_publish_time:type_name -> google.protobuf.Timestamp
+	120, // 39: yfinance_grpc.v1alpha1.GetMajorHoldersResponse.holders:type_name -> yfinance_grpc.v1alpha1.GetMajorHoldersResponse.HoldersEntry
+	49,  // 40: yfinance_grpc.v1alpha1.GetInstitutionalHoldersResponse.holders:type_name -> yfinance_grpc.v1alpha1.InstitutionalHolder
+	124, // 41: yfinance_grpc.v1alpha1.InstitutionalHolder.date_reported:type_name -> google.protobuf.Timestamp
+	52,  // 42: yfinance_grpc.v1alpha1.GetMutualFundHoldersResponse.holders:type_name -> yfinance_grpc.v1alpha1.MutualFundHolder
+	124, // 43: yfinance_grpc.v1alpha1.MutualFundHolder.date_reported:type_name -> google.protobuf.Timestamp
+	123, // 44: yfinance_grpc.v1alpha1.GetMultipleInfoRequest.read_mask:type_name -> google.protobuf.FieldMask
+	1,   // 45: yfinance_grpc.v1alpha1.GetMultipleInfoRequest.freshness:type_name -> yfinance_grpc.v1alpha1.InfoFreshness
+	121, // 46: yfinance_grpc.v1alpha1.GetMultipleInfoResponse.info:type_name -> yfinance_grpc.v1alpha1.GetMultipleInfoResponse.InfoEntry
+	0,   // 47: yfinance_grpc.v1alpha1.GetMultipleInfoResponse.source:type_name -> yfinance_grpc.v1alpha1.InfoSource
+	124, // 48: yfinance_grpc.v1alpha1.DownloadHistoryRequest.start:type_name -> google.protobuf.Timestamp
+	124, // 49: yfinance_grpc.v1alpha1.DownloadHistoryRequest.end:type_name -> google.protobuf.Timestamp
+	7,   // 50: yfinance_grpc.v1alpha1.DownloadHistoryResponse.rows:type_name -> yfinance_grpc.v1alpha1.HistoryRow
+	59,  // 51: yfinance_grpc.v1alpha1.GetCapitalGainsResponse.rows:type_name -> yfinance_grpc.v1alpha1.CapitalGainsRow
+	124, // 52: yfinance_grpc.v1alpha1.CapitalGainsRow.date:type_name -> google.protobuf.Timestamp
+	124, // 53: yfinance_grpc.v1alpha1.GetSharesHistoryRequest.start:type_name -> google.protobuf.Timestamp
+	124, // 54: yfinance_grpc.v1alpha1.GetSharesHistoryRequest.end:type_name -> google.protobuf.Timestamp
+	62,  // 55: yfinance_grpc.v1alpha1.GetSharesHistoryResponse.rows:type_name -> yfinance_grpc.v1alpha1.SharesHistoryRow
+	124, // 56: yfinance_grpc.v1alpha1.SharesHistoryRow.date:type_name -> google.protobuf.Timestamp
+	67,  // 57: yfinance_grpc.v1alpha1.GetFastInfoResponse.info:type_name -> yfinance_grpc.v1alpha1.FastInfo
+	72,  // 58: yfinance_grpc.v1alpha1.GetInsiderPurchasesResponse.rows:type_name -> yfinance_grpc.v1alpha1.InsiderPurchaseSummaryRow
+	122, // 59: yfinance_grpc.v1alpha1.InsiderPurchaseSummaryRow.values:type_name -> yfinance_grpc.v1alpha1.InsiderPurchaseSummaryRow.ValuesEntry
+	75,  // 60: yfinance_grpc.v1alpha1.GetInsiderTransactionsResponse.transactions:type_name -> yfinance_grpc.v1alpha1.InsiderTransaction
+	124, // 61: yfinance_grpc.v1alpha1.InsiderTransaction.start_date:type_name -> google.protobuf.Timestamp
+	78,  // 62: yfinance_grpc.v1alpha1.GetInsiderRosterHoldersResponse.holders:type_name -> yfinance_grpc.v1alpha1.InsiderRosterHolder
+	124, // 63: yfinance_grpc.v1alpha1.InsiderRosterHolder.most_recent_transaction:type_name -> google.protobuf.Timestamp
+	83,  // 64: yfinance_grpc.v1alpha1.GetRecommendationsSummaryResponse.rows:type_name -> yfinance_grpc.v1alpha1.RecommendationSummaryRow
+	86,  // 65: yfinance_grpc.v1alpha1.GetEarningsEstimateResponse.rows:type_name -> yfinance_grpc.v1alpha1.EarningsEstimateRow
+	89,  // 66: yfinance_grpc.v1alpha1.GetRevenueEstimateResponse.rows:type_name -> yfinance_grpc.v1alpha1.RevenueEstimateRow
+	92,  // 67: yfinance_grpc.v1alpha1.GetEarningsHistoryResponse.rows:type_name -> yfinance_grpc.v1alpha1.EarningsHistoryRow
+	124, // 68: yfinance_grpc.v1alpha1.EarningsHistoryRow.date:type_name -> google.protobuf.Timestamp
+	95,  // 69: yfinance_grpc.v1alpha1.GetEpsTrendResponse.rows:type_name -> yfinance_grpc.v1alpha1.EpsTrendRow
+	98,  // 70: yfinance_grpc.v1alpha1.GetEpsRevisionsResponse.rows:type_name -> yfinance_grpc.v1alpha1.EpsRevisionsRow
+	101, // 71: yfinance_grpc.v1alpha1.GetGrowthEstimatesResponse.rows:type_name -> yfinance_grpc.v1alpha1.GrowthEstimatesRow
+	104, // 72: yfinance_grpc.v1alpha1.GetEarningsDatesResponse.rows:type_name -> yfinance_grpc.v1alpha1.EarningsDateRow
+	124, // 73: yfinance_grpc.v1alpha1.EarningsDateRow.date:type_name -> google.protobuf.Timestamp
+	109, // 74: yfinance_grpc.v1alpha1.GetSecFilingsResponse.filings:type_name -> yfinance_grpc.v1alpha1.SecFiling
+	124, // 75: yfinance_grpc.v1alpha1.SecFiling.date:type_name -> google.protobuf.Timestamp
+	111, // 76: yfinance_grpc.v1alpha1.SubscribeQuotesResponse.quote:type_name -> yfinance_grpc.v1alpha1.Quote
+	123, // 77: yfinance_grpc.v1alpha1.SubscribeQuotesResponse.changed_fields:type_name -> google.protobuf.FieldMask
+	2,   // 78: yfinance_grpc.v1alpha1.SessionRequest.info:type_name -> yfinance_grpc.v1alpha1.GetInfoRequest
+	5,   // 79: yfinance_grpc.v1alpha1.SessionRequest.history:type_name -> yfinance_grpc.v1alpha1.GetHistoryRequest
+	34,  // 80: yfinance_grpc.v1alpha1.SessionRequest.option_chain:type_name -> yfinance_grpc.v1alpha1.GetOptionChainRequest
+	42,  // 81: yfinance_grpc.v1alpha1.SessionRequest.news:type_name -> yfinance_grpc.v1alpha1.GetNewsRequest
+	114, // 82: yfinance_grpc.v1alpha1.SessionRequest.cancel:type_name -> yfinance_grpc.v1alpha1.SessionCancel
+	3,   // 83: yfinance_grpc.v1alpha1.SessionResponse.info:type_name -> yfinance_grpc.v1alpha1.GetInfoResponse
+	6,   // 84: yfinance_grpc.v1alpha1.SessionResponse.history:type_name -> yfinance_grpc.v1alpha1.GetHistoryResponse
+	35,  // 85: yfinance_grpc.v1alpha1.SessionResponse.option_chain:type_name -> yfinance_grpc.v1alpha1.GetOptionChainResponse
+	43,  // 86: yfinance_grpc.v1alpha1.SessionResponse.news:type_name -> yfinance_grpc.v1alpha1.GetNewsResponse
+	116, // 87: yfinance_grpc.v1alpha1.SessionResponse.error:type_name -> yfinance_grpc.v1alpha1.SessionError
+	4,   // 88: yfinance_grpc.v1alpha1.GetMultipleInfoResponse.InfoEntry.value:type_name -> yfinance_grpc.v1alpha1.TickerInfo
+	2,   // 89: yfinance_grpc.v1alpha1.TickerService.GetInfo:input_type -> yfinance_grpc.v1alpha1.GetInfoRequest
+	5,   // 90: yfinance_grpc.v1alpha1.TickerService.GetHistory:input_type -> yfinance_grpc.v1alpha1.GetHistoryRequest
+	8,   // 91: yfinance_grpc.v1alpha1.TickerService.GetDividends:input_type -> yfinance_grpc.v1alpha1.GetDividendsRequest
+	11,  // 92: yfinance_grpc.v1alpha1.TickerService.GetSplits:input_type -> yfinance_grpc.v1alpha1.GetSplitsRequest
+	14,  // 93: yfinance_grpc.v1alpha1.TickerService.GetActions:input_type -> yfinance_grpc.v1alpha1.GetActionsRequest
+	17,  // 94: yfinance_grpc.v1alpha1.TickerService.GetFinancials:input_type -> yfinance_grpc.v1alpha1.GetFinancialsRequest
+	20,  // 95: yfinance_grpc.v1alpha1.TickerService.GetBalanceSheet:input_type -> yfinance_grpc.v1alpha1.GetBalanceSheetRequest
+	23,  // 96: yfinance_grpc.v1alpha1.TickerService.GetCashFlow:input_type -> yfinance_grpc.v1alpha1.GetCashFlowRequest
+	26,  // 97: yfinance_grpc.v1alpha1.TickerService.GetEarnings:input_type -> yfinance_grpc.v1alpha1.GetEarningsRequest
+	29,  // 98: yfinance_grpc.v1alpha1.TickerService.GetRecommendations:input_type -> yfinance_grpc.v1alpha1.GetRecommendationsRequest
+	32,  // 99: yfinance_grpc.v1alpha1.TickerService.GetOptions:input_type -> yfinance_grpc.v1alpha1.GetOptionsRequest
+	34,  // 100: yfinance_grpc.v1alpha1.TickerService.GetOptionChain:input_type -> yfinance_grpc.v1alpha1.GetOptionChainRequest
+	37,  // 101: yfinance_grpc.v1alpha1.TickerService.GetCalendar:input_type -> yfinance_grpc.v1alpha1.GetCalendarRequest
+	42,  // 102: yfinance_grpc.v1alpha1.TickerService.GetNews:input_type -> yfinance_grpc.v1alpha1.GetNewsRequest
+	45,  // 103: yfinance_grpc.v1alpha1.TickerService.GetMajorHolders:input_type -> yfinance_grpc.v1alpha1.GetMajorHoldersRequest
+	47,  // 104: yfinance_grpc.v1alpha1.TickerService.GetInstitutionalHolders:input_type -> yfinance_grpc.v1alpha1.GetInstitutionalHoldersRequest
+	50,  // 105: yfinance_grpc.v1alpha1.TickerService.GetMutualFundHolders:input_type -> yfinance_grpc.v1alpha1.GetMutualFundHoldersRequest
+	53,  // 106: yfinance_grpc.v1alpha1.TickerService.GetMultipleInfo:input_type -> yfinance_grpc.v1alpha1.GetMultipleInfoRequest
+	55,  // 107: yfinance_grpc.v1alpha1.TickerService.DownloadHistory:input_type -> yfinance_grpc.v1alpha1.DownloadHistoryRequest
+	57,  // 108: yfinance_grpc.v1alpha1.TickerService.GetCapitalGains:input_type -> yfinance_grpc.v1alpha1.GetCapitalGainsRequest
+	60,  // 109: yfinance_grpc.v1alpha1.TickerService.GetSharesHistory:input_type -> yfinance_grpc.v1alpha1.GetSharesHistoryRequest
+	63,  // 110: yfinance_grpc.v1alpha1.TickerService.GetIsin:input_type -> yfinance_grpc.v1alpha1.GetIsinRequest
+	65,  // 111: yfinance_grpc.v1alpha1.TickerService.GetFastInfo:input_type -> yfinance_grpc.v1alpha1.GetFastInfoRequest
+	68,  // 112: yfinance_grpc.v1alpha1.TickerService.GetSustainability:input_type -> yfinance_grpc.v1alpha1.GetSustainabilityRequest
+	70,  // 113: yfinance_grpc.v1alpha1.TickerService.GetInsiderPurchases:input_type -> yfinance_grpc.v1alpha1.GetInsiderPurchasesRequest
+	73,  // 114: yfinance_grpc.v1alpha1.TickerService.GetInsiderTransactions:input_type -> yfinance_grpc.v1alpha1.GetInsiderTransactionsRequest
+	76,  // 115: yfinance_grpc.v1alpha1.TickerService.GetInsiderRosterHolders:input_type -> yfinance_grpc.v1alpha1.GetInsiderRosterHoldersRequest
+	79,  // 116: yfinance_grpc.v1alpha1.TickerService.GetAnalystPriceTargets:input_type -> yfinance_grpc.v1alpha1.GetAnalystPriceTargetsRequest
+	81,  // 117: yfinance_grpc.v1alpha1.TickerService.GetRecommendationsSummary:input_type -> yfinance_grpc.v1alpha1.GetRecommendationsSummaryRequest
+	84,  // 118: yfinance_grpc.v1alpha1.TickerService.GetEarningsEstimate:input_type -> yfinance_grpc.v1alpha1.GetEarningsEstimateRequest
+	87,  // 119: yfinance_grpc.v1alpha1.TickerService.GetRevenueEstimate:input_type -> yfinance_grpc.v1alpha1.GetRevenueEstimateRequest
+	90,  // 120: yfinance_grpc.v1alpha1.TickerService.GetEarningsHistory:input_type -> yfinance_grpc.v1alpha1.GetEarningsHistoryRequest
+	93,  // 121: yfinance_grpc.v1alpha1.TickerService.GetEpsTrend:input_type -> yfinance_grpc.v1alpha1.GetEpsTrendRequest
+	96,  // 122: yfinance_grpc.v1alpha1.TickerService.GetEpsRevisions:input_type -> yfinance_grpc.v1alpha1.GetEpsRevisionsRequest
+	99,  // 123: yfinance_grpc.v1alpha1.TickerService.GetGrowthEstimates:input_type -> yfinance_grpc.v1alpha1.GetGrowthEstimatesRequest
+	102, // 124: yfinance_grpc.v1alpha1.TickerService.GetEarningsDates:input_type -> yfinance_grpc.v1alpha1.GetEarningsDatesRequest
+	105, // 125: yfinance_grpc.v1alpha1.TickerService.GetHistoryMetadata:input_type -> yfinance_grpc.v1alpha1.GetHistoryMetadataRequest
+	107, // 126: yfinance_grpc.v1alpha1.TickerService.GetSecFilings:input_type -> yfinance_grpc.v1alpha1.GetSecFilingsRequest
+	110, // 127: yfinance_grpc.v1alpha1.TickerService.SubscribeQuotes:input_type -> yfinance_grpc.v1alpha1.SubscribeQuotesRequest
+	113, // 128: yfinance_grpc.v1alpha1.TickerService.Session:input_type -> yfinance_grpc.v1alpha1.SessionRequest
+	3,   // 129: yfinance_grpc.v1alpha1.TickerService.GetInfo:output_type -> yfinance_grpc.v1alpha1.GetInfoResponse
+	6,   // 130: yfinance_grpc.v1alpha1.TickerService.GetHistory:output_type -> yfinance_grpc.v1alpha1.GetHistoryResponse
+	9,   // 131: yfinance_grpc.v1alpha1.TickerService.GetDividends:output_type -> yfinance_grpc.v1alpha1.GetDividendsResponse
+	12,  // 132: yfinance_grpc.v1alpha1.TickerService.GetSplits:output_type -> yfinance_grpc.v1alpha1.GetSplitsResponse
+	15,  // 133: yfinance_grpc.v1alpha1.TickerService.GetActions:output_type -> yfinance_grpc.v1alpha1.GetActionsResponse
+	18,  // 134: yfinance_grpc.v1alpha1.TickerService.GetFinancials:output_type -> yfinance_grpc.v1alpha1.GetFinancialsResponse
+	21,  // 135: yfinance_grpc.v1alpha1.TickerService.GetBalanceSheet:output_type -> yfinance_grpc.v1alpha1.GetBalanceSheetResponse
+	24,  // 136: yfinance_grpc.v1alpha1.TickerService.GetCashFlow:output_type -> yfinance_grpc.v1alpha1.GetCashFlowResponse
+	27,  // 137: yfinance_grpc.v1alpha1.TickerService.GetEarnings:output_type -> yfinance_grpc.v1alpha1.GetEarningsResponse
+	30,  // 138: yfinance_grpc.v1alpha1.TickerService.GetRecommendations:output_type -> yfinance_grpc.v1alpha1.GetRecommendationsResponse
+	33,  // 139: yfinance_grpc.v1alpha1.TickerService.GetOptions:output_type -> yfinance_grpc.v1alpha1.GetOptionsResponse
+	35,  // 140: yfinance_grpc.v1alpha1.TickerService.GetOptionChain:output_type -> yfinance_grpc.v1alpha1.GetOptionChainResponse
+	38,  // 141: yfinance_grpc.v1alpha1.TickerService.GetCalendar:output_type -> yfinance_grpc.v1alpha1.GetCalendarResponse
+	43,  // 142: yfinance_grpc.v1alpha1.TickerService.GetNews:output_type -> yfinance_grpc.v1alpha1.GetNewsResponse
+	46,  // 143: yfinance_grpc.v1alpha1.TickerService.GetMajorHolders:output_type -> yfinance_grpc.v1alpha1.GetMajorHoldersResponse
+	48,  // 144: yfinance_grpc.v1alpha1.TickerService.GetInstitutionalHolders:output_type -> yfinance_grpc.v1alpha1.GetInstitutionalHoldersResponse
+	51,  // 145: yfinance_grpc.v1alpha1.TickerService.GetMutualFundHolders:output_type -> yfinance_grpc.v1alpha1.GetMutualFundHoldersResponse
+	54,  // 146: yfinance_grpc.v1alpha1.TickerService.GetMultipleInfo:output_type -> yfinance_grpc.v1alpha1.GetMultipleInfoResponse
+	56,  // 147: yfinance_grpc.v1alpha1.TickerService.DownloadHistory:output_type -> yfinance_grpc.v1alpha1.DownloadHistoryResponse
+	58,  // 148: yfinance_grpc.v1alpha1.TickerService.GetCapitalGains:output_type -> yfinance_grpc.v1alpha1.GetCapitalGainsResponse
+	61,  // 149: yfinance_grpc.v1alpha1.TickerService.GetSharesHistory:output_type -> yfinance_grpc.v1alpha1.GetSharesHistoryResponse
+	64,  // 150: yfinance_grpc.v1alpha1.TickerService.GetIsin:output_type -> yfinance_grpc.v1alpha1.GetIsinResponse
+	66,  // 151: yfinance_grpc.v1alpha1.TickerService.GetFastInfo:output_type -> yfinance_grpc.v1alpha1.GetFastInfoResponse
+	69,  // 152: yfinance_grpc.v1alpha1.TickerService.GetSustainability:output_type -> yfinance_grpc.v1alpha1.GetSustainabilityResponse
+	71,  // 153: yfinance_grpc.v1alpha1.TickerService.GetInsiderPurchases:output_type -> yfinance_grpc.v1alpha1.GetInsiderPurchasesResponse
+	74,  // 154: yfinance_grpc.v1alpha1.TickerService.GetInsiderTransactions:output_type -> yfinance_grpc.v1alpha1.GetInsiderTransactionsResponse
+	77,  // 155: yfinance_grpc.v1alpha1.TickerService.GetInsiderRosterHolders:output_type -> yfinance_grpc.v1alpha1.GetInsiderRosterHoldersResponse
+	80,  // 156: yfinance_grpc.v1alpha1.TickerService.GetAnalystPriceTargets:output_type -> yfinance_grpc.v1alpha1.GetAnalystPriceTargetsResponse
+	82,  // 157: yfinance_grpc.v1alpha1.TickerService.GetRecommendationsSummary:output_type -> yfinance_grpc.v1alpha1.GetRecommendationsSummaryResponse
+	85,  // 158: yfinance_grpc.v1alpha1.TickerService.GetEarningsEstimate:output_type -> yfinance_grpc.v1alpha1.GetEarningsEstimateResponse
+	88,  // 159: yfinance_grpc.v1alpha1.TickerService.GetRevenueEstimate:output_type -> yfinance_grpc.v1alpha1.GetRevenueEstimateResponse
+	91,  // 160: yfinance_grpc.v1alpha1.TickerService.GetEarningsHistory:output_type -> yfinance_grpc.v1alpha1.GetEarningsHistoryResponse
+	94,  // 161: yfinance_grpc.v1alpha1.TickerService.GetEpsTrend:output_type -> yfinance_grpc.v1alpha1.GetEpsTrendResponse
+	97,  // 162: yfinance_grpc.v1alpha1.TickerService.GetEpsRevisions:output_type -> yfinance_grpc.v1alpha1.GetEpsRevisionsResponse
+	100, // 163: yfinance_grpc.v1alpha1.TickerService.GetGrowthEstimates:output_type -> yfinance_grpc.v1alpha1.GetGrowthEstimatesResponse
+	103, // 164: yfinance_grpc.v1alpha1.TickerService.GetEarningsDates:output_type -> yfinance_grpc.v1alpha1.GetEarningsDatesResponse
+	106, // 165: yfinance_grpc.v1alpha1.TickerService.GetHistoryMetadata:output_type -> yfinance_grpc.v1alpha1.GetHistoryMetadataResponse
+	108, // 166: yfinance_grpc.v1alpha1.TickerService.GetSecFilings:output_type -> yfinance_grpc.v1alpha1.GetSecFilingsResponse
+	112, // 167: yfinance_grpc.v1alpha1.TickerService.SubscribeQuotes:output_type -> yfinance_grpc.v1alpha1.SubscribeQuotesResponse
+	115, // 168: yfinance_grpc.v1alpha1.TickerService.Session:output_type -> yfinance_grpc.v1alpha1.SessionResponse
+	129, // [129:169] is the sub-list for method output_type
+	89,  // [89:129] is the sub-list for method input_type
+	89,  // [89:89] is the sub-list for extension type_name
+	89,  // [89:89] is the sub-list for extension extendee
+	0,   // [0:89] is the sub-list for field type_name
 }
 
 func init() { file_yfinance_grpc_v1alpha1_ticker_proto_init() }
@@ -7938,18 +8863,33 @@ func file_yfinance_grpc_v1alpha1_ticker_proto_init() {
 	file_yfinance_grpc_v1alpha1_ticker_proto_msgTypes[58].OneofWrappers = []any{}
 	file_yfinance_grpc_v1alpha1_ticker_proto_msgTypes[100].OneofWrappers = []any{}
 	file_yfinance_grpc_v1alpha1_ticker_proto_msgTypes[102].OneofWrappers = []any{}
+	file_yfinance_grpc_v1alpha1_ticker_proto_msgTypes[111].OneofWrappers = []any{
+		(*SessionRequest_Info)(nil),
+		(*SessionRequest_History)(nil),
+		(*SessionRequest_OptionChain)(nil),
+		(*SessionRequest_News)(nil),
+		(*SessionRequest_Cancel)(nil),
+	}
+	file_yfinance_grpc_v1alpha1_ticker_proto_msgTypes[113].OneofWrappers = []any{
+		(*SessionResponse_Info)(nil),
+		(*SessionResponse_History)(nil),
+		(*SessionResponse_OptionChain)(nil),
+		(*SessionResponse_News)(nil),
+		(*SessionResponse_Error)(nil),
+	}
 	type x struct{}
 	out := protoimpl.TypeBuilder{
 		File: protoimpl.DescBuilder{
 			GoPackagePath: reflect.TypeOf(x{}).PkgPath(),
 			RawDescriptor: unsafe.Slice(unsafe.StringData(file_yfinance_grpc_v1alpha1_ticker_proto_rawDesc), len(file_yfinance_grpc_v1alpha1_ticker_proto_rawDesc)),
-			NumEnums:      0,
-			NumMessages:   114,
+			NumEnums:      2,
+			NumMessages:   121,
 			NumExtensions: 0,
 			NumServices:   1,
 		},
 		GoTypes:           file_yfinance_grpc_v1alpha1_ticker_proto_goTypes,
 		DependencyIndexes: file_yfinance_grpc_v1alpha1_ticker_proto_depIdxs,
+		EnumInfos:         file_yfinance_grpc_v1alpha1_ticker_proto_enumTypes,
 		MessageInfos:      file_yfinance_grpc_v1alpha1_ticker_proto_msgTypes,
 	}.Build()
 	File_yfinance_grpc_v1alpha1_ticker_proto = out.File
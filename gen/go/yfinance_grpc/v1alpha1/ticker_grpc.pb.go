@@ -57,6 +57,8 @@ const (
 	TickerService_GetEarningsDates_FullMethodName          = "/yfinance_grpc.v1alpha1.TickerService/GetEarningsDates"
 	TickerService_GetHistoryMetadata_FullMethodName        = "/yfinance_grpc.v1alpha1.TickerService/GetHistoryMetadata"
 	TickerService_GetSecFilings_FullMethodName             = "/yfinance_grpc.v1alpha1.TickerService/GetSecFilings"
+	TickerService_SubscribeQuotes_FullMethodName           = "/yfinance_grpc.v1alpha1.TickerService/SubscribeQuotes"
+	TickerService_Session_FullMethodName                   = "/yfinance_grpc.v1alpha1.TickerService/Session"
 )
 
 // TickerServiceClient is the client API for TickerService service.
@@ -141,6 +143,11 @@ type TickerServiceClient interface {
 	GetHistoryMetadata(ctx context.Context, in *GetHistoryMetadataRequest, opts ...grpc.CallOption) (*GetHistoryMetadataResponse, error)
 	// GetSecFilings returns SEC filings for a ticker
 	GetSecFilings(ctx context.Context, in *GetSecFilingsRequest, opts ...grpc.CallOption) (*GetSecFilingsResponse, error)
+	// SubscribeQuotes streams quote changes for a set of tickers from a shared server-side poller
+	SubscribeQuotes(ctx context.Context, in *SubscribeQuotesRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[SubscribeQuotesResponse], error)
+	// Session multiplexes info, history, option chain and news requests over one bidirectional stream.
+	// Responses carry the request_id they answer and may arrive out of order.
+	Session(ctx context.Context, opts ...grpc.CallOption) (grpc.BidiStreamingClient[SessionRequest, SessionResponse], error)
 }
 
 type tickerServiceClient struct {
@@ -540,6 +547,38 @@ func (c *tickerServiceClient) GetSecFilings(ctx context.Context, in *GetSecFilin
 	return out, nil
 }
 
+func (c *tickerServiceClient) SubscribeQuotes(ctx context.Context, in *SubscribeQuotesRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[SubscribeQuotesResponse], error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	stream, err := c.cc.NewStream(ctx, &TickerService_ServiceDesc.Streams[1], TickerService_SubscribeQuotes_FullMethodName, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	x := &grpc.GenericClientStream[SubscribeQuotesRequest, SubscribeQuotesResponse]{ClientStream: stream}
+	if err := x.ClientStream.SendMsg(in); err != nil {
+		return nil, err
+	}
+	if err := x.ClientStream.CloseSend(); err != nil {
+		return nil, err
+	}
+	return x, nil
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type TickerService_SubscribeQuotesClient = grpc.ServerStreamingClient[SubscribeQuotesResponse]
+
+func (c *tickerServiceClient) Session(ctx context.Context, opts ...grpc.CallOption) (grpc.BidiStreamingClient[SessionRequest, SessionResponse], error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	stream, err := c.cc.NewStream(ctx, &TickerService_ServiceDesc.Streams[2], TickerService_Session_FullMethodName, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	x := &grpc.GenericClientStream[SessionRequest, SessionResponse]{ClientStream: stream}
+	return x, nil
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type TickerService_SessionClient = grpc.BidiStreamingClient[SessionRequest, SessionResponse]
+
 // TickerServiceServer is the server API for TickerService service.
 // All implementations must embed UnimplementedTickerServiceServer
 // for forward compatibility.
@@ -622,6 +661,11 @@ type TickerServiceServer interface {
 	GetHistoryMetadata(context.Context, *GetHistoryMetadataRequest) (*GetHistoryMetadataResponse, error)
 	// GetSecFilings returns SEC filings for a ticker
 	GetSecFilings(context.Context, *GetSecFilingsRequest) (*GetSecFilingsResponse, error)
+	// SubscribeQuotes streams quote changes for a set of tickers from a shared server-side poller
+	SubscribeQuotes(*SubscribeQuotesRequest, grpc.ServerStreamingServer[SubscribeQuotesResponse]) error
+	// Session multiplexes info, history, option chain and news requests over one bidirectional stream.
+	// Responses carry the request_id they answer and may arrive out of order.
+	Session(grpc.BidiStreamingServer[SessionRequest, SessionResponse]) error
 	mustEmbedUnimplementedTickerServiceServer()
 }
 
@@ -746,6 +790,12 @@ func (UnimplementedTickerServiceServer) GetHistoryMetadata(context.Context, *Get
 func (UnimplementedTickerServiceServer) GetSecFilings(context.Context, *GetSecFilingsRequest) (*GetSecFilingsResponse, error) {
 	return nil, status.Error(codes.Unimplemented, "method GetSecFilings not implemented")
 }
+func (UnimplementedTickerServiceServer) SubscribeQuotes(*SubscribeQuotesRequest, grpc.ServerStreamingServer[SubscribeQuotesResponse]) error {
+	return status.Error(codes.Unimplemented, "method SubscribeQuotes not implemented")
+}
+func (UnimplementedTickerServiceServer) Session(grpc.BidiStreamingServer[SessionRequest, SessionResponse]) error {
+	return status.Error(codes.Unimplemented, "method Session not implemented")
+}
 func (UnimplementedTickerServiceServer) mustEmbedUnimplementedTickerServiceServer() {}
 func (UnimplementedTickerServiceServer) testEmbeddedByValue()                       {}
 
@@ -1444,6 +1494,24 @@ func _TickerService_GetSecFilings_Handler(srv interface{}, ctx context.Context,
 	return interceptor(ctx, in, info, handler)
 }
 
+func _TickerService_SubscribeQuotes_Handler(srv interface{}, stream grpc.ServerStream) error {
+	m := new(SubscribeQuotesRequest)
+	if err := stream.RecvMsg(m); err != nil {
+		return err
+	}
+	return srv.(TickerServiceServer).SubscribeQuotes(m, &grpc.GenericServerStream[SubscribeQuotesRequest, SubscribeQuotesResponse]{ServerStream: stream})
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type TickerService_SubscribeQuotesServer = grpc.ServerStreamingServer[SubscribeQuotesResponse]
+
+func _TickerService_Session_Handler(srv interface{}, stream grpc.ServerStream) error {
+	return srv.(TickerServiceServer).Session(&grpc.GenericServerStream[SessionRequest, SessionResponse]{ServerStream: stream})
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type TickerService_SessionServer = grpc.BidiStreamingServer[SessionRequest, SessionResponse]
+
 // TickerService_ServiceDesc is the grpc.ServiceDesc for TickerService service.
 // It's only intended for direct use with grpc.RegisterService,
 // and not to be introspected or modified (even as a copy)
@@ -1606,6 +1674,17 @@ var TickerService_ServiceDesc = grpc.ServiceDesc{
 			Handler:       _TickerService_DownloadHistory_Handler,
 			ServerStreams: true,
 		},
+		{
+			StreamName:    "SubscribeQuotes",
+			Handler:       _TickerService_SubscribeQuotes_Handler,
+			ServerStreams: true,
+		},
+		{
+			StreamName:    "Session",
+			Handler:       _TickerService_Session_Handler,
+			ServerStreams: true,
+			ClientStreams: true,
+		},
 	},
 	Metadata: "yfinance_grpc/v1alpha1/ticker.proto",
 }
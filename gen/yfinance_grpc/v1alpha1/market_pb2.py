@@ -25,7 +25,7 @@ _sym_db = _symbol_database.Default()
 from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n#yfinance_grpc/v1alpha1/market.proto\x12\x16yfinance_grpc.v1alpha1\x1a\x1fgoogle/protobuf/timestamp.proto\"0\n\x16GetMarketStatusRequest\x12\x16\n\x06market\x18\x01 \x01(\tR\x06market\"\xe7\x01\n\x0cMarketStatus\x12\x1f\n\x0bmarket_type\x18\x01 \x01(\tR\nmarketType\x12.\n\x04open\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x04open\x12\x30\n\x05\x63lose\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x05\x63lose\x12%\n\x0etimezone_short\x18\x04 \x01(\tR\rtimezoneShort\x12-\n\x12timezone_gmtoffset\x18\x05 \x01(\x05R\x11timezoneGmtoffset\"W\n\x17GetMarketStatusResponse\x12<\n\x06status\x18\x01 \x01(\x0b\x32$.yfinance_grpc.v1alpha1.MarketStatusR\x06status\"1\n\x17GetMarketSummaryRequest\x12\x16\n\x06market\x18\x01 \x01(\tR\x06market\"\xdb\x01\n\x11MarketSummaryItem\x12\x1d\n\nshort_name\x18\x01 \x01(\tR\tshortName\x12\x30\n\x14regular_market_price\x18\x02 \x01(\x01R\x12regularMarketPrice\x12\x32\n\x15regular_market_change\x18\x03 \x01(\x01R\x13regularMarketChange\x12\x41\n\x1dregular_market_change_percent\x18\x04 \x01(\x01R\x1aregularMarketChangePercent\"\xda\x01\n\x18GetMarketSummaryResponse\x12W\n\x07summary\x18\x01 \x03(\x0b\x32=.yfinance_grpc.v1alpha1.GetMarketSummaryResponse.SummaryEntryR\x07summary\x1a\x65\n\x0cSummaryEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12?\n\x05value\x18\x02 \x01(\x0b\x32).yfinance_grpc.v1alpha1.MarketSummaryItemR\x05value:\x02\x38\x01\x32\xfa\x01\n\rMarketService\x12r\n\x0fGetMarketStatus\x12..yfinance_grpc.v1alpha1.GetMarketStatusRequest\x1a/.yfinance_grpc.v1alpha1.GetMarketStatusResponse\x12u\n\x10GetMarketSummary\x12/.yfinance_grpc.v1alpha1.GetMarketSummaryRequest\x1a\x30.yfinance_grpc.v1alpha1.GetMarketSummaryResponseB\xf6\x01\n\x1a\x63om.yfinance_grpc.v1alpha1B\x0bMarketProtoP\x01ZVgithub.com/idebeijer/yfinance-grpc/gen/go/yfinance_grpc/v1alpha1;yfinance_grpcv1alpha1\xa2\x02\x03YXX\xaa\x02\x15YfinanceGrpc.V1alpha1\xca\x02\x15YfinanceGrpc\\V1alpha1\xe2\x02!YfinanceGrpc\\V1alpha1\\GPBMetadata\xea\x02\x16YfinanceGrpc::V1alpha1b\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n#yfinance_grpc/v1alpha1/market.proto\x12\x16yfinance_grpc.v1alpha1\x1a\x1fgoogle/protobuf/timestamp.proto\"0\n\x16GetMarketStatusRequest\x12\x16\n\x06market\x18\x01 \x01(\tR\x06market\"\xed\x02\n\x0cMarketStatus\x12\x1f\n\x0bmarket_type\x18\x01 \x01(\tR\nmarketType\x12.\n\x04open\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x04open\x12\x30\n\x05\x63lose\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x05\x63lose\x12%\n\x0etimezone_short\x18\x04 \x01(\tR\rtimezoneShort\x12-\n\x12timezone_gmtoffset\x18\x05 \x01(\x05R\x11timezoneGmtoffset\x12?\n\x07session\x18\x06 \x01(\x0e\x32%.yfinance_grpc.v1alpha1.MarketSessionR\x07session\x12\x43\n\x0fnext_transition\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x0enextTransition\"W\n\x17GetMarketStatusResponse\x12<\n\x06status\x18\x01 \x01(\x0b\x32$.yfinance_grpc.v1alpha1.MarketStatusR\x06status\"1\n\x17GetMarketSummaryRequest\x12\x16\n\x06market\x18\x01 \x01(\tR\x06market\"\xdb\x01\n\x11MarketSummaryItem\x12\x1d\n\nshort_name\x18\x01 \x01(\tR\tshortName\x12\x30\n\x14regular_market_price\x18\x02 \x01(\x01R\x12regularMarketPrice\x12\x32\n\x15regular_market_change\x18\x03 \x01(\x01R\x13regularMarketChange\x12\x41\n\x1dregular_market_change_percent\x18\x04 \x01(\x01R\x1aregularMarketChangePercent\"\xda\x01\n\x18GetMarketSummaryResponse\x12W\n\x07summary\x18\x01 \x03(\x0b\x32=.yfinance_grpc.v1alpha1.GetMarketSummaryResponse.SummaryEntryR\x07summary\x1a\x65\n\x0cSummaryEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12?\n\x05value\x18\x02 \x01(\x0b\x32).yfinance_grpc.v1alpha1.MarketSummaryItemR\x05value:\x02\x38\x01\"4\n\x18WatchMarketStatusRequest\x12\x18\n\x07markets\x18\x01 \x03(\tR\x07markets\"q\n\x19WatchMarketStatusResponse\x12\x16\n\x06market\x18\x01 \x01(\tR\x06market\x12<\n\x06status\x18\x02 \x01(\x0b\x32$.yfinance_grpc.v1alpha1.MarketStatusR\x06status*\x97\x01\n\rMarketSession\x12\x1e\n\x1aMARKET_SESSION_UNSPECIFIED\x10\x00\x12\x16\n\x12MARKET_SESSION_PRE\x10\x01\x12\x1a\n\x16MARKET_SESSION_REGULAR\x10\x02\x12\x17\n\x13MARKET_SESSION_POST\x10\x03\x12\x19\n\x15MARKET_SESSION_CLOSED\x10\x04\x32\xf6\x02\n\rMarketService\x12r\n\x0fGetMarketStatus\x12..yfinance_grpc.v1alpha1.GetMarketStatusRequest\x1a/.yfinance_grpc.v1alpha1.GetMarketStatusResponse\x12u\n\x10GetMarketSummary\x12/.yfinance_grpc.v1alpha1.GetMarketSummaryRequest\x1a\x30.yfinance_grpc.v1alpha1.GetMarketSummaryResponse\x12z\n\x11WatchMarketStatus\x12\x30.yfinance_grpc.v1alpha1.WatchMarketStatusRequest\x1a\x31.yfinance_grpc.v1alpha1.WatchMarketStatusResponse0\x01\x42\xf6\x01\n\x1a\x63om.yfinance_grpc.v1alpha1B\x0bMarketProtoP\x01ZVgithub.com/idebeijer/yfinance-grpc/gen/go/yfinance_grpc/v1alpha1;yfinance_grpcv1alpha1\xa2\x02\x03YXX\xaa\x02\x15YfinanceGrpc.V1alpha1\xca\x02\x15YfinanceGrpc\\V1alpha1\xe2\x02!YfinanceGrpc\\V1alpha1\\GPBMetadata\xea\x02\x16YfinanceGrpc::V1alpha1b\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -35,20 +35,26 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['DESCRIPTOR']._serialized_options = b'\n\032com.yfinance_grpc.v1alpha1B\013MarketProtoP\001ZVgithub.com/idebeijer/yfinance-grpc/gen/go/yfinance_grpc/v1alpha1;yfinance_grpcv1alpha1\242\002\003YXX\252\002\025YfinanceGrpc.V1alpha1\312\002\025YfinanceGrpc\\V1alpha1\342\002!YfinanceGrpc\\V1alpha1\\GPBMetadata\352\002\026YfinanceGrpc::V1alpha1'
   _globals['_GETMARKETSUMMARYRESPONSE_SUMMARYENTRY']._loaded_options = None
   _globals['_GETMARKETSUMMARYRESPONSE_SUMMARYENTRY']._serialized_options = b'8\001'
+  _globals['_MARKETSESSION']._serialized_start=1267
+  _globals['_MARKETSESSION']._serialized_end=1418
   _globals['_GETMARKETSTATUSREQUEST']._serialized_start=96
   _globals['_GETMARKETSTATUSREQUEST']._serialized_end=144
   _globals['_MARKETSTATUS']._serialized_start=147
-  _globals['_MARKETSTATUS']._serialized_end=378
-  _globals['_GETMARKETSTATUSRESPONSE']._serialized_start=380
-  _globals['_GETMARKETSTATUSRESPONSE']._serialized_end=467
-  _globals['_GETMARKETSUMMARYREQUEST']._serialized_start=469
-  _globals['_GETMARKETSUMMARYREQUEST']._serialized_end=518
-  _globals['_MARKETSUMMARYITEM']._serialized_start=521
-  _globals['_MARKETSUMMARYITEM']._serialized_end=740
-  _globals['_GETMARKETSUMMARYRESPONSE']._serialized_start=743
-  _globals['_GETMARKETSUMMARYRESPONSE']._serialized_end=961
-  _globals['_GETMARKETSUMMARYRESPONSE_SUMMARYENTRY']._serialized_start=860
-  _globals['_GETMARKETSUMMARYRESPONSE_SUMMARYENTRY']._serialized_end=961
-  _globals['_MARKETSERVICE']._serialized_start=964
-  _globals['_MARKETSERVICE']._serialized_end=1214
+  _globals['_MARKETSTATUS']._serialized_end=512
+  _globals['_GETMARKETSTATUSRESPONSE']._serialized_start=514
+  _globals['_GETMARKETSTATUSRESPONSE']._serialized_end=601
+  _globals['_GETMARKETSUMMARYREQUEST']._serialized_start=603
+  _globals['_GETMARKETSUMMARYREQUEST']._serialized_end=652
+  _globals['_MARKETSUMMARYITEM']._serialized_start=655
+  _globals['_MARKETSUMMARYITEM']._serialized_end=874
+  _globals['_GETMARKETSUMMARYRESPONSE']._serialized_start=877
+  _globals['_GETMARKETSUMMARYRESPONSE']._serialized_end=1095
+  _globals['_GETMARKETSUMMARYRESPONSE_SUMMARYENTRY']._serialized_start=994
+  _globals['_GETMARKETSUMMARYRESPONSE_SUMMARYENTRY']._serialized_end=1095
+  _globals['_WATCHMARKETSTATUSREQUEST']._serialized_start=1097
+  _globals['_WATCHMARKETSTATUSREQUEST']._serialized_end=1149
+  _globals['_WATCHMARKETSTATUSRESPONSE']._serialized_start=1151
+  _globals['_WATCHMARKETSTATUSRESPONSE']._serialized_end=1264
+  _globals['_MARKETSERVICE']._serialized_start=1421
+  _globals['_MARKETSERVICE']._serialized_end=1795
 # @@protoc_insertion_point(module_scope)
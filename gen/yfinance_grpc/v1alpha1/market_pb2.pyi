@@ -2,13 +2,27 @@ import datetime
 
 from google.protobuf import timestamp_pb2 as _timestamp_pb2
 from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
-from collections.abc import Mapping as _Mapping
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
 from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
 
 DESCRIPTOR: _descriptor.FileDescriptor
 
+class MarketSession(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    MARKET_SESSION_UNSPECIFIED: _ClassVar[MarketSession]
+    MARKET_SESSION_PRE: _ClassVar[MarketSession]
+    MARKET_SESSION_REGULAR: _ClassVar[MarketSession]
+    MARKET_SESSION_POST: _ClassVar[MarketSession]
+    MARKET_SESSION_CLOSED: _ClassVar[MarketSession]
+MARKET_SESSION_UNSPECIFIED: MarketSession
+MARKET_SESSION_PRE: MarketSession
+MARKET_SESSION_REGULAR: MarketSession
+MARKET_SESSION_POST: MarketSession
+MARKET_SESSION_CLOSED: MarketSession
+
 class GetMarketStatusRequest(_message.Message):
     __slots__ = ()
     MARKET_FIELD_NUMBER: _ClassVar[int]
@@ -22,12 +36,16 @@ class MarketStatus(_message.Message):
     CLOSE_FIELD_NUMBER: _ClassVar[int]
     TIMEZONE_SHORT_FIELD_NUMBER: _ClassVar[int]
     TIMEZONE_GMTOFFSET_FIELD_NUMBER: _ClassVar[int]
+    SESSION_FIELD_NUMBER: _ClassVar[int]
+    NEXT_TRANSITION_FIELD_NUMBER: _ClassVar[int]
     market_type: str
     open: _timestamp_pb2.Timestamp
     close: _timestamp_pb2.Timestamp
     timezone_short: str
     timezone_gmtoffset: int
-    def __init__(self, market_type: _Optional[str] = ..., open: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., close: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., timezone_short: _Optional[str] = ..., timezone_gmtoffset: _Optional[int] = ...) -> None: ...
+    session: MarketSession
+    next_transition: _timestamp_pb2.Timestamp
+    def __init__(self, market_type: _Optional[str] = ..., open: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., close: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., timezone_short: _Optional[str] = ..., timezone_gmtoffset: _Optional[int] = ..., session: _Optional[_Union[MarketSession, str]] = ..., next_transition: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ...) -> None: ...
 
 class GetMarketStatusResponse(_message.Message):
     __slots__ = ()
@@ -65,3 +83,17 @@ class GetMarketSummaryResponse(_message.Message):
     SUMMARY_FIELD_NUMBER: _ClassVar[int]
     summary: _containers.MessageMap[str, MarketSummaryItem]
     def __init__(self, summary: _Optional[_Mapping[str, MarketSummaryItem]] = ...) -> None: ...
+
+class WatchMarketStatusRequest(_message.Message):
+    __slots__ = ()
+    MARKETS_FIELD_NUMBER: _ClassVar[int]
+    markets: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, markets: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class WatchMarketStatusResponse(_message.Message):
+    __slots__ = ()
+    MARKET_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    market: str
+    status: MarketStatus
+    def __init__(self, market: _Optional[str] = ..., status: _Optional[_Union[MarketStatus, _Mapping]] = ...) -> None: ...
@@ -25,6 +25,11 @@ class MarketServiceStub(object):
                 request_serializer=yfinance__grpc_dot_v1alpha1_dot_market__pb2.GetMarketSummaryRequest.SerializeToString,
                 response_deserializer=yfinance__grpc_dot_v1alpha1_dot_market__pb2.GetMarketSummaryResponse.FromString,
                 _registered_method=True)
+        self.WatchMarketStatus = channel.unary_stream(
+                '/yfinance_grpc.v1alpha1.MarketService/WatchMarketStatus',
+                request_serializer=yfinance__grpc_dot_v1alpha1_dot_market__pb2.WatchMarketStatusRequest.SerializeToString,
+                response_deserializer=yfinance__grpc_dot_v1alpha1_dot_market__pb2.WatchMarketStatusResponse.FromString,
+                _registered_method=True)
 
 
 class MarketServiceServicer(object):
@@ -45,6 +50,14 @@ class MarketServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def WatchMarketStatus(self, request, context):
+        """WatchMarketStatus streams the current status of each requested market, then one
+        message per session transition (or newly published session) until cancelled.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_MarketServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -58,6 +71,11 @@ def add_MarketServiceServicer_to_server(servicer, server):
                     request_deserializer=yfinance__grpc_dot_v1alpha1_dot_market__pb2.GetMarketSummaryRequest.FromString,
                     response_serializer=yfinance__grpc_dot_v1alpha1_dot_market__pb2.GetMarketSummaryResponse.SerializeToString,
             ),
+            'WatchMarketStatus': grpc.unary_stream_rpc_method_handler(
+                    servicer.WatchMarketStatus,
+                    request_deserializer=yfinance__grpc_dot_v1alpha1_dot_market__pb2.WatchMarketStatusRequest.FromString,
+                    response_serializer=yfinance__grpc_dot_v1alpha1_dot_market__pb2.WatchMarketStatusResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'yfinance_grpc.v1alpha1.MarketService', rpc_method_handlers)
@@ -123,3 +141,30 @@ class MarketService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def WatchMarketStatus(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/yfinance_grpc.v1alpha1.MarketService/WatchMarketStatus',
+            yfinance__grpc_dot_v1alpha1_dot_market__pb2.WatchMarketStatusRequest.SerializeToString,
+            yfinance__grpc_dot_v1alpha1_dot_market__pb2.WatchMarketStatusResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
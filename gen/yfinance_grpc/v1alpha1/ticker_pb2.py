@@ -22,10 +22,11 @@ _runtime_version.ValidateProtobufRuntimeVersion(
 _sym_db = _symbol_database.Default()
 
 
+from google.protobuf import field_mask_pb2 as google_dot_protobuf_dot_field__mask__pb2
 from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n#yfinance_grpc/v1alpha1/ticker.proto\x12\x16yfinance_grpc.v1alpha1\x1a\x1fgoogle/protobuf/timestamp.proto\"(\n\x0eGetInfoRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\"I\n\x0fGetInfoResponse\x12\x36\n\x04info\x18\x01 \x01(\x0b\x32\".yfinance_grpc.v1alpha1.TickerInfoR\x04info\"\xee\x13\n\nTickerInfo\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x1d\n\nshort_name\x18\x02 \x01(\tR\tshortName\x12\x1b\n\tlong_name\x18\x03 \x01(\tR\x08longName\x12\x1a\n\x08industry\x18\x04 \x01(\tR\x08industry\x12\x16\n\x06sector\x18\x05 \x01(\tR\x06sector\x12\x18\n\x07\x63ountry\x18\x06 \x01(\tR\x07\x63ountry\x12\x12\n\x04\x63ity\x18\x07 \x01(\tR\x04\x63ity\x12\x14\n\x05state\x18\x08 \x01(\tR\x05state\x12\x10\n\x03zip\x18\t \x01(\tR\x03zip\x12\x18\n\x07website\x18\n \x01(\tR\x07website\x12\x32\n\x15long_business_summary\x18\x0b \x01(\tR\x13longBusinessSummary\x12%\n\x0eprevious_close\x18\x14 \x01(\x01R\rpreviousClose\x12\x12\n\x04open\x18\x15 \x01(\x01R\x04open\x12\x17\n\x07\x64\x61y_low\x18\x16 \x01(\x01R\x06\x64\x61yLow\x12\x19\n\x08\x64\x61y_high\x18\x17 \x01(\x01R\x07\x64\x61yHigh\x12\x41\n\x1dregular_market_previous_close\x18\x18 \x01(\x01R\x1aregularMarketPreviousClose\x12.\n\x13regular_market_open\x18\x19 \x01(\x01R\x11regularMarketOpen\x12\x33\n\x16regular_market_day_low\x18\x1a \x01(\x01R\x13regularMarketDayLow\x12\x35\n\x17regular_market_day_high\x18\x1b \x01(\x01R\x14regularMarketDayHigh\x12#\n\rcurrent_price\x18\x1c \x01(\x01R\x0c\x63urrentPrice\x12\x16\n\x06volume\x18\x1e \x01(\x03R\x06volume\x12\x32\n\x15regular_market_volume\x18\x1f \x01(\x03R\x13regularMarketVolume\x12%\n\x0e\x61verage_volume\x18  \x01(\x03R\raverageVolume\x12\x32\n\x15\x61verage_volume_10days\x18! \x01(\x03R\x13\x61verageVolume10days\x12-\n\x12shares_outstanding\x18\" \x01(\x03R\x11sharesOutstanding\x12!\n\x0c\x66loat_shares\x18# \x01(\x03R\x0b\x66loatShares\x12\x1d\n\nmarket_cap\x18( \x01(\x03R\tmarketCap\x12)\n\x10\x65nterprise_value\x18) \x01(\x01R\x0f\x65nterpriseValue\x12\x1f\n\x0btrailing_pe\x18* \x01(\x01R\ntrailingPe\x12\x1d\n\nforward_pe\x18+ \x01(\x01R\tforwardPe\x12\"\n\rprice_to_book\x18, \x01(\x01R\x0bpriceToBook\x12\x46\n price_to_sales_trailing_12months\x18- \x01(\x01R\x1cpriceToSalesTrailing12months\x12\x32\n\x15\x65nterprise_to_revenue\x18. \x01(\x01R\x13\x65nterpriseToRevenue\x12\x30\n\x14\x65nterprise_to_ebitda\x18/ \x01(\x01R\x12\x65nterpriseToEbitda\x12#\n\rdividend_rate\x18\x32 \x01(\x01R\x0c\x64ividendRate\x12%\n\x0e\x64ividend_yield\x18\x33 \x01(\x01R\rdividendYield\x12(\n\x10\x65x_dividend_date\x18\x34 \x01(\x03R\x0e\x65xDividendDate\x12!\n\x0cpayout_ratio\x18\x35 \x01(\x01R\x0bpayoutRatio\x12>\n\x1c\x66ive_year_avg_dividend_yield\x18\x36 \x01(\x01R\x18\x66iveYearAvgDividendYield\x12\x12\n\x04\x62\x65ta\x18< \x01(\x01R\x04\x62\x65ta\x12!\n\x0ctrailing_eps\x18= \x01(\x01R\x0btrailingEps\x12\x1f\n\x0b\x66orward_eps\x18> \x01(\x01R\nforwardEps\x12\x1d\n\nbook_value\x18? \x01(\x01R\tbookValue\x12%\n\x0eprofit_margins\x18@ \x01(\x01R\rprofitMargins\x12*\n\x11revenue_per_share\x18\x41 \x01(\x01R\x0frevenuePerShare\x12(\n\x10return_on_assets\x18\x42 \x01(\x01R\x0ereturnOnAssets\x12(\n\x10return_on_equity\x18\x43 \x01(\x01R\x0ereturnOnEquity\x12%\n\x0erevenue_growth\x18\x44 \x01(\x01R\rrevenueGrowth\x12\'\n\x0f\x65\x61rnings_growth\x18\x45 \x01(\x01R\x0e\x65\x61rningsGrowth\x12+\n\x11operating_margins\x18\x46 \x01(\x01R\x10operatingMargins\x12%\n\x0e\x65\x62itda_margins\x18G \x01(\x01R\rebitdaMargins\x12+\n\x12\x66ifty_two_week_low\x18P \x01(\x01R\x0f\x66iftyTwoWeekLow\x12-\n\x13\x66ifty_two_week_high\x18Q \x01(\x01R\x10\x66iftyTwoWeekHigh\x12*\n\x11\x66ifty_day_average\x18R \x01(\x01R\x0f\x66iftyDayAverage\x12\x35\n\x17two_hundred_day_average\x18S \x01(\x01R\x14twoHundredDayAverage\x12*\n\x11target_high_price\x18Z \x01(\x01R\x0ftargetHighPrice\x12(\n\x10target_low_price\x18[ \x01(\x01R\x0etargetLowPrice\x12*\n\x11target_mean_price\x18\\ \x01(\x01R\x0ftargetMeanPrice\x12.\n\x13target_median_price\x18] \x01(\x01R\x11targetMedianPrice\x12;\n\x1anumber_of_analyst_opinions\x18^ \x01(\x05R\x17numberOfAnalystOpinions\x12\x1a\n\x08\x63urrency\x18\x64 \x01(\tR\x08\x63urrency\x12\x1a\n\x08\x65xchange\x18\x65 \x01(\tR\x08\x65xchange\x12\x1d\n\nquote_type\x18\x66 \x01(\tR\tquoteType\x12-\n\x12\x66inancial_currency\x18g \x01(\tR\x11\x66inancialCurrency\x12\x1d\n\nprice_hint\x18h \x01(\x05R\tpriceHint\"\xab\x04\n\x11GetHistoryRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\x12\x1b\n\x06period\x18\x02 \x01(\tH\x00R\x06period\x88\x01\x01\x12\x35\n\x05start\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x01R\x05start\x88\x01\x01\x12\x31\n\x03\x65nd\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x02R\x03\x65nd\x88\x01\x01\x12\x1a\n\x08interval\x18\x05 \x01(\tR\x08interval\x12\x1d\n\x07prepost\x18\x06 \x01(\x08H\x03R\x07prepost\x88\x01\x01\x12\x1d\n\x07\x61\x63tions\x18\x07 \x01(\x08H\x04R\x07\x61\x63tions\x88\x01\x01\x12$\n\x0b\x61uto_adjust\x18\x08 \x01(\x08H\x05R\nautoAdjust\x88\x01\x01\x12$\n\x0b\x62\x61\x63k_adjust\x18\t \x01(\x08H\x06R\nbackAdjust\x88\x01\x01\x12\x1b\n\x06repair\x18\n \x01(\x08H\x07R\x06repair\x88\x01\x01\x12\x1b\n\x06keepna\x18\x0b \x01(\x08H\x08R\x06keepna\x88\x01\x01\x12\x1f\n\x08rounding\x18\x0c \x01(\x08H\tR\x08rounding\x88\x01\x01\x42\t\n\x07_periodB\x08\n\x06_startB\x06\n\x04_endB\n\n\x08_prepostB\n\n\x08_actionsB\x0e\n\x0c_auto_adjustB\x0e\n\x0c_back_adjustB\t\n\x07_repairB\t\n\x07_keepnaB\x0b\n\t_rounding\"L\n\x12GetHistoryResponse\x12\x36\n\x04rows\x18\x01 \x03(\x0b\x32\".yfinance_grpc.v1alpha1.HistoryRowR\x04rows\"\xca\x02\n\nHistoryRow\x12.\n\x04\x64\x61te\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x04\x64\x61te\x12\x12\n\x04open\x18\x02 \x01(\x01R\x04open\x12\x12\n\x04high\x18\x03 \x01(\x01R\x04high\x12\x10\n\x03low\x18\x04 \x01(\x01R\x03low\x12\x14\n\x05\x63lose\x18\x05 \x01(\x01R\x05\x63lose\x12\x16\n\x06volume\x18\x06 \x01(\x03R\x06volume\x12!\n\tdividends\x18\x07 \x01(\x01H\x00R\tdividends\x88\x01\x01\x12&\n\x0cstock_splits\x18\x08 \x01(\x01H\x01R\x0bstockSplits\x88\x01\x01\x12(\n\rcapital_gains\x18\t \x01(\x01H\x02R\x0c\x63\x61pitalGains\x88\x01\x01\x42\x0c\n\n_dividendsB\x0f\n\r_stock_splitsB\x10\n\x0e_capital_gains\"U\n\x13GetDividendsRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\x12\x1b\n\x06period\x18\x02 \x01(\tH\x00R\x06period\x88\x01\x01\x42\t\n\x07_period\"O\n\x14GetDividendsResponse\x12\x37\n\x04rows\x18\x01 \x03(\x0b\x32#.yfinance_grpc.v1alpha1.DividendRowR\x04rows\"U\n\x0b\x44ividendRow\x12.\n\x04\x64\x61te\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x04\x64\x61te\x12\x16\n\x06\x61mount\x18\x02 \x01(\x01R\x06\x61mount\"R\n\x10GetSplitsRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\x12\x1b\n\x06period\x18\x02 \x01(\tH\x00R\x06period\x88\x01\x01\x42\t\n\x07_period\"I\n\x11GetSplitsResponse\x12\x34\n\x04rows\x18\x01 \x03(\x0b\x32 .yfinance_grpc.v1alpha1.SplitRowR\x04rows\"P\n\x08SplitRow\x12.\n\x04\x64\x61te\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x04\x64\x61te\x12\x14\n\x05ratio\x18\x02 \x01(\x01R\x05ratio\"S\n\x11GetActionsRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\x12\x1b\n\x06period\x18\x02 \x01(\tH\x00R\x06period\x88\x01\x01\x42\t\n\x07_period\"K\n\x12GetActionsResponse\x12\x35\n\x04rows\x18\x01 \x03(\x0b\x32!.yfinance_grpc.v1alpha1.ActionRowR\x04rows\"\xe1\x01\n\tActionRow\x12.\n\x04\x64\x61te\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x04\x64\x61te\x12!\n\tdividends\x18\x02 \x01(\x01H\x00R\tdividends\x88\x01\x01\x12&\n\x0cstock_splits\x18\x03 \x01(\x01H\x01R\x0bstockSplits\x88\x01\x01\x12(\n\rcapital_gains\x18\x04 \x01(\x01H\x02R\x0c\x63\x61pitalGains\x88\x01\x01\x42\x0c\n\n_dividendsB\x0f\n\r_stock_splitsB\x10\n\x0e_capital_gains\"s\n\x14GetFinancialsRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\x12\x12\n\x04\x66req\x18\x02 \x01(\tR\x04\x66req\x12\x17\n\x07\x61s_dict\x18\x03 \x01(\x08R\x06\x61sDict\x12\x16\n\x06pretty\x18\x04 \x01(\x08R\x06pretty\"c\n\x15GetFinancialsResponse\x12J\n\nstatements\x18\x01 \x03(\x0b\x32*.yfinance_grpc.v1alpha1.FinancialStatementR\nstatements\"\xcf\x01\n\x12\x46inancialStatement\x12.\n\x04\x64\x61te\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x04\x64\x61te\x12N\n\x06values\x18\x02 \x03(\x0b\x32\x36.yfinance_grpc.v1alpha1.FinancialStatement.ValuesEntryR\x06values\x1a\x39\n\x0bValuesEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n\x05value\x18\x02 \x01(\x01R\x05value:\x02\x38\x01\"u\n\x16GetBalanceSheetRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\x12\x12\n\x04\x66req\x18\x02 \x01(\tR\x04\x66req\x12\x17\n\x07\x61s_dict\x18\x03 \x01(\x08R\x06\x61sDict\x12\x16\n\x06pretty\x18\x04 \x01(\x08R\x06pretty\"h\n\x17GetBalanceSheetResponse\x12M\n\nstatements\x18\x01 \x03(\x0b\x32-.yfinance_grpc.v1alpha1.BalanceSheetStatementR\nstatements\"\xd5\x01\n\x15\x42\x61lanceSheetStatement\x12.\n\x04\x64\x61te\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x04\x64\x61te\x12Q\n\x06values\x18\x02 \x03(\x0b\x32\x39.yfinance_grpc.v1alpha1.BalanceSheetStatement.ValuesEntryR\x06values\x1a\x39\n\x0bValuesEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n\x05value\x18\x02 \x01(\x01R\x05value:\x02\x38\x01\"q\n\x12GetCashFlowRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\x12\x12\n\x04\x66req\x18\x02 \x01(\tR\x04\x66req\x12\x17\n\x07\x61s_dict\x18\x03 \x01(\x08R\x06\x61sDict\x12\x16\n\x06pretty\x18\x04 \x01(\x08R\x06pretty\"`\n\x13GetCashFlowResponse\x12I\n\nstatements\x18\x01 \x03(\x0b\x32).yfinance_grpc.v1alpha1.CashFlowStatementR\nstatements\"\xcd\x01\n\x11\x43\x61shFlowStatement\x12.\n\x04\x64\x61te\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x04\x64\x61te\x12M\n\x06values\x18\x02 \x03(\x0b\x32\x35.yfinance_grpc.v1alpha1.CashFlowStatement.ValuesEntryR\x06values\x1a\x39\n\x0bValuesEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n\x05value\x18\x02 \x01(\x01R\x05value:\x02\x38\x01\"Y\n\x12GetEarningsRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\x12\x12\n\x04\x66req\x18\x02 \x01(\tR\x04\x66req\x12\x17\n\x07\x61s_dict\x18\x03 \x01(\x08R\x06\x61sDict\"N\n\x13GetEarningsResponse\x12\x37\n\x04rows\x18\x01 \x03(\x0b\x32#.yfinance_grpc.v1alpha1.EarningsRowR\x04rows\"\x96\x01\n\x0b\x45\x61rningsRow\x12.\n\x04\x64\x61te\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x04\x64\x61te\x12\x1d\n\x07revenue\x18\x02 \x01(\x01H\x00R\x07revenue\x88\x01\x01\x12\x1f\n\x08\x65\x61rnings\x18\x03 \x01(\x01H\x01R\x08\x65\x61rnings\x88\x01\x01\x42\n\n\x08_revenueB\x0b\n\t_earnings\"3\n\x19GetRecommendationsRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\"[\n\x1aGetRecommendationsResponse\x12=\n\x04rows\x18\x01 \x03(\x0b\x32).yfinance_grpc.v1alpha1.RecommendationRowR\x04rows\"\xa9\x01\n\x11RecommendationRow\x12.\n\x04\x64\x61te\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x04\x64\x61te\x12\x12\n\x04\x66irm\x18\x02 \x01(\tR\x04\x66irm\x12\x19\n\x08to_grade\x18\x03 \x01(\tR\x07toGrade\x12\x1d\n\nfrom_grade\x18\x04 \x01(\tR\tfromGrade\x12\x16\n\x06\x61\x63tion\x18\x05 \x01(\tR\x06\x61\x63tion\"+\n\x11GetOptionsRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\"?\n\x12GetOptionsResponse\x12)\n\x10\x65xpiration_dates\x18\x01 \x03(\tR\x0f\x65xpirationDates\"m\n\x15GetOptionChainRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\x12\x17\n\x04\x64\x61te\x18\x02 \x01(\tH\x00R\x04\x64\x61te\x88\x01\x01\x12\x13\n\x02tz\x18\x03 \x01(\tH\x01R\x02tz\x88\x01\x01\x42\x07\n\x05_dateB\x05\n\x03_tz\"\x92\x01\n\x16GetOptionChainResponse\x12<\n\x05\x63\x61lls\x18\x01 \x03(\x0b\x32&.yfinance_grpc.v1alpha1.OptionContractR\x05\x63\x61lls\x12:\n\x04puts\x18\x02 \x03(\x0b\x32&.yfinance_grpc.v1alpha1.OptionContractR\x04puts\"\xe6\x03\n\x0eOptionContract\x12\'\n\x0f\x63ontract_symbol\x18\x01 \x01(\tR\x0e\x63ontractSymbol\x12\x16\n\x06strike\x18\x02 \x01(\x01R\x06strike\x12\x1a\n\x08\x63urrency\x18\x03 \x01(\tR\x08\x63urrency\x12\x1d\n\nlast_price\x18\x04 \x01(\x01R\tlastPrice\x12\x10\n\x03\x62id\x18\x05 \x01(\x01R\x03\x62id\x12\x10\n\x03\x61sk\x18\x06 \x01(\x01R\x03\x61sk\x12\x16\n\x06\x63hange\x18\x07 \x01(\x01R\x06\x63hange\x12%\n\x0epercent_change\x18\x08 \x01(\x01R\rpercentChange\x12\x16\n\x06volume\x18\t \x01(\x03R\x06volume\x12#\n\ropen_interest\x18\n \x01(\x03R\x0copenInterest\x12-\n\x12implied_volatility\x18\x0b \x01(\x01R\x11impliedVolatility\x12 \n\x0cin_the_money\x18\x0c \x01(\x08R\ninTheMoney\x12#\n\rcontract_size\x18\r \x01(\tR\x0c\x63ontractSize\x12\x42\n\x0flast_trade_date\x18\x0e \x01(\x0b\x32\x1a.google.protobuf.TimestampR\rlastTradeDate\",\n\x12GetCalendarRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\"\x92\x02\n\x13GetCalendarResponse\x12\x45\n\x08\x65\x61rnings\x18\x01 \x01(\x0b\x32$.yfinance_grpc.v1alpha1.EarningsDateH\x00R\x08\x65\x61rnings\x88\x01\x01\x12S\n\x10\x65x_dividend_date\x18\x02 \x01(\x0b\x32$.yfinance_grpc.v1alpha1.DividendDateH\x01R\x0e\x65xDividendDate\x88\x01\x01\x12=\n\x06\x65vents\x18\x03 \x03(\x0b\x32%.yfinance_grpc.v1alpha1.CalendarEventR\x06\x65ventsB\x0b\n\t_earningsB\x13\n\x11_ex_dividend_date\"\x8a\x01\n\x0c\x45\x61rningsDate\x12\x35\n\x05start\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x00R\x05start\x88\x01\x01\x12\x31\n\x03\x65nd\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x01R\x03\x65nd\x88\x01\x01\x42\x08\n\x06_startB\x06\n\x04_end\"L\n\x0c\x44ividendDate\x12\x33\n\x04\x64\x61te\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x00R\x04\x64\x61te\x88\x01\x01\x42\x07\n\x05_date\"\x80\x01\n\rCalendarEvent\x12\x1d\n\nevent_type\x18\x01 \x01(\tR\teventType\x12.\n\x04\x64\x61te\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x04\x64\x61te\x12 \n\x0b\x64\x65scription\x18\x03 \x01(\tR\x0b\x64\x65scription\">\n\x0eGetNewsRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\x12\x14\n\x05\x63ount\x18\x02 \x01(\x05R\x05\x63ount\"R\n\x0fGetNewsResponse\x12?\n\x08\x61rticles\x18\x01 \x03(\x0b\x32#.yfinance_grpc.v1alpha1.NewsArticleR\x08\x61rticles\"\xa7\x02\n\x0bNewsArticle\x12\x12\n\x04uuid\x18\x01 \x01(\tR\x04uuid\x12\x14\n\x05title\x18\x02 \x01(\tR\x05title\x12\x1c\n\tpublisher\x18\x03 \x01(\tR\tpublisher\x12\x12\n\x04link\x18\x04 \x01(\tR\x04link\x12N\n\x15provider_publish_time\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x13providerPublishTime\x12\x12\n\x04type\x18\x06 \x01(\tR\x04type\x12!\n\tthumbnail\x18\x07 \x01(\tH\x00R\tthumbnail\x88\x01\x01\x12\'\n\x0frelated_tickers\x18\x08 \x03(\tR\x0erelatedTickersB\x0c\n\n_thumbnail\"0\n\x16GetMajorHoldersRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\"\xad\x01\n\x17GetMajorHoldersResponse\x12V\n\x07holders\x18\x01 \x03(\x0b\x32<.yfinance_grpc.v1alpha1.GetMajorHoldersResponse.HoldersEntryR\x07holders\x1a:\n\x0cHoldersEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n\x05value\x18\x02 \x01(\tR\x05value:\x02\x38\x01\"8\n\x1eGetInstitutionalHoldersRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\"h\n\x1fGetInstitutionalHoldersResponse\x12\x45\n\x07holders\x18\x01 \x03(\x0b\x32+.yfinance_grpc.v1alpha1.InstitutionalHolderR\x07holders\"\xb5\x01\n\x13InstitutionalHolder\x12\x16\n\x06holder\x18\x01 \x01(\tR\x06holder\x12\x16\n\x06shares\x18\x02 \x01(\x03R\x06shares\x12?\n\rdate_reported\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x0c\x64\x61teReported\x12\x17\n\x07pct_out\x18\x04 \x01(\x01R\x06pctOut\x12\x14\n\x05value\x18\x05 \x01(\x01R\x05value\"5\n\x1bGetMutualFundHoldersRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\"b\n\x1cGetMutualFundHoldersResponse\x12\x42\n\x07holders\x18\x01 \x03(\x0b\x32(.yfinance_grpc.v1alpha1.MutualFundHolderR\x07holders\"\xb2\x01\n\x10MutualFundHolder\x12\x16\n\x06holder\x18\x01 \x01(\tR\x06holder\x12\x16\n\x06shares\x18\x02 \x01(\x03R\x06shares\x12?\n\rdate_reported\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x0c\x64\x61teReported\x12\x17\n\x07pct_out\x18\x04 \x01(\x01R\x06pctOut\x12\x14\n\x05value\x18\x05 \x01(\x01R\x05value\"2\n\x16GetMultipleInfoRequest\x12\x18\n\x07tickers\x18\x01 \x03(\tR\x07tickers\"\xc5\x01\n\x17GetMultipleInfoResponse\x12M\n\x04info\x18\x01 \x03(\x0b\x32\x39.yfinance_grpc.v1alpha1.GetMultipleInfoResponse.InfoEntryR\x04info\x1a[\n\tInfoEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12\x38\n\x05value\x18\x02 \x01(\x0b\x32\".yfinance_grpc.v1alpha1.TickerInfoR\x05value:\x02\x38\x01\"\xba\x02\n\x16\x44ownloadHistoryRequest\x12\x18\n\x07tickers\x18\x01 \x03(\tR\x07tickers\x12\x1b\n\x06period\x18\x02 \x01(\tH\x00R\x06period\x88\x01\x01\x12\x1f\n\x08interval\x18\x03 \x01(\tH\x01R\x08interval\x88\x01\x01\x12\x35\n\x05start\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x02R\x05start\x88\x01\x01\x12\x31\n\x03\x65nd\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x03R\x03\x65nd\x88\x01\x01\x12$\n\x0b\x61uto_adjust\x18\x06 \x01(\x08H\x04R\nautoAdjust\x88\x01\x01\x42\t\n\x07_periodB\x0b\n\t_intervalB\x08\n\x06_startB\x06\n\x04_endB\x0e\n\x0c_auto_adjust\"i\n\x17\x44ownloadHistoryResponse\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\x12\x36\n\x04rows\x18\x02 \x03(\x0b\x32\".yfinance_grpc.v1alpha1.HistoryRowR\x04rows\"X\n\x16GetCapitalGainsRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\x12\x1b\n\x06period\x18\x02 \x01(\tH\x00R\x06period\x88\x01\x01\x42\t\n\x07_period\"V\n\x17GetCapitalGainsResponse\x12;\n\x04rows\x18\x01 \x03(\x0b\x32\'.yfinance_grpc.v1alpha1.CapitalGainsRowR\x04rows\"Y\n\x0f\x43\x61pitalGainsRow\x12.\n\x04\x64\x61te\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x04\x64\x61te\x12\x16\n\x06\x61mount\x18\x02 \x01(\x01R\x06\x61mount\"\xad\x01\n\x17GetSharesHistoryRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\x12\x35\n\x05start\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x00R\x05start\x88\x01\x01\x12\x31\n\x03\x65nd\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x01R\x03\x65nd\x88\x01\x01\x42\x08\n\x06_startB\x06\n\x04_end\"X\n\x18GetSharesHistoryResponse\x12<\n\x04rows\x18\x01 \x03(\x0b\x32(.yfinance_grpc.v1alpha1.SharesHistoryRowR\x04rows\"Z\n\x10SharesHistoryRow\x12.\n\x04\x64\x61te\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x04\x64\x61te\x12\x16\n\x06shares\x18\x02 \x01(\x03R\x06shares\"(\n\x0eGetIsinRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\"%\n\x0fGetIsinResponse\x12\x12\n\x04isin\x18\x01 \x01(\tR\x04isin\",\n\x12GetFastInfoRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\"K\n\x13GetFastInfoResponse\x12\x34\n\x04info\x18\x01 \x01(\x0b\x32 .yfinance_grpc.v1alpha1.FastInfoR\x04info\"\xf8\x06\n\x08\x46\x61stInfo\x12\x1a\n\x08\x63urrency\x18\x01 \x01(\tR\x08\x63urrency\x12\x1a\n\x08\x65xchange\x18\x02 \x01(\tR\x08\x65xchange\x12\x37\n\x18\x65xchange_data_delayed_by\x18\x03 \x01(\x05R\x15\x65xchangeDataDelayedBy\x12\x34\n\x16\x65xchange_timezone_name\x18\x04 \x01(\tR\x14\x65xchangeTimezoneName\x12\x1d\n\nlast_price\x18\x05 \x01(\x01R\tlastPrice\x12\x1f\n\x0blast_volume\x18\x06 \x01(\x03R\nlastVolume\x12\x1d\n\nmarket_cap\x18\x07 \x01(\x03R\tmarketCap\x12\x12\n\x04open\x18\x08 \x01(\x01R\x04open\x12%\n\x0eprevious_close\x18\t \x01(\x01R\rpreviousClose\x12\x1d\n\nquote_type\x18\n \x01(\tR\tquoteType\x12\x35\n\x17regular_market_day_high\x18\x0b \x01(\x01R\x14regularMarketDayHigh\x12\x33\n\x16regular_market_day_low\x18\x0c \x01(\x01R\x13regularMarketDayLow\x12\x41\n\x1dregular_market_previous_close\x18\r \x01(\x01R\x1aregularMarketPreviousClose\x12\x30\n\x14regular_market_price\x18\x0e \x01(\x01R\x12regularMarketPrice\x12\x16\n\x06shares\x18\x0f \x01(\x03R\x06shares\x12;\n\x1athree_month_average_volume\x18\x10 \x01(\x01R\x17threeMonthAverageVolume\x12\x1a\n\x08timezone\x18\x11 \x01(\tR\x08timezone\x12*\n\x11\x66ifty_day_average\x18\x12 \x01(\x01R\x0f\x66iftyDayAverage\x12\x35\n\x17two_hundred_day_average\x18\x13 \x01(\x01R\x14twoHundredDayAverage\x12\x1f\n\x0byear_change\x18\x14 \x01(\x01R\nyearChange\x12\x1b\n\tyear_high\x18\x15 \x01(\x01R\x08yearHigh\x12\x19\n\x08year_low\x18\x16 \x01(\x01R\x07yearLow\"2\n\x18GetSustainabilityRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\"\xe5\x05\n\x19GetSustainabilityResponse\x12\x1b\n\ttotal_esg\x18\x01 \x01(\x01R\x08totalEsg\x12\'\n\x0f\x65sg_performance\x18\x02 \x01(\tR\x0e\x65sgPerformance\x12+\n\x11\x65nvironment_score\x18\x03 \x01(\x01R\x10\x65nvironmentScore\x12!\n\x0csocial_score\x18\x04 \x01(\x01R\x0bsocialScore\x12)\n\x10governance_score\x18\x05 \x01(\x01R\x0fgovernanceScore\x12\x1e\n\npercentile\x18\x06 \x01(\x01R\npercentile\x12\x1d\n\npeer_group\x18\x07 \x01(\tR\tpeerGroup\x12\x14\n\x05\x61\x64ult\x18\x14 \x01(\x08R\x05\x61\x64ult\x12\x1c\n\talcoholic\x18\x15 \x01(\x08R\talcoholic\x12%\n\x0e\x61nimal_testing\x18\x16 \x01(\x08R\ranimalTesting\x12\x1a\n\x08\x63\x61tholic\x18\x17 \x01(\x08R\x08\x63\x61tholic\x12\x33\n\x15\x63ontroversial_weapons\x18\x18 \x01(\x08R\x14\x63ontroversialWeapons\x12\x1d\n\nsmall_arms\x18\x19 \x01(\x08R\tsmallArms\x12\x1f\n\x0b\x66ur_leather\x18\x1a \x01(\x08R\nfurLeather\x12\x1a\n\x08gambling\x18\x1b \x01(\x08R\x08gambling\x12\x10\n\x03gmo\x18\x1c \x01(\x08R\x03gmo\x12+\n\x11military_contract\x18\x1d \x01(\x08R\x10militaryContract\x12\x18\n\x07nuclear\x18\x1e \x01(\x08R\x07nuclear\x12\x1e\n\npesticides\x18\x1f \x01(\x08R\npesticides\x12\x19\n\x08palm_oil\x18  \x01(\x08R\x07palmOil\x12\x12\n\x04\x63oal\x18! \x01(\x08R\x04\x63oal\x12\x18\n\x07tobacco\x18\" \x01(\x08R\x07tobacco\"4\n\x1aGetInsiderPurchasesRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\"d\n\x1bGetInsiderPurchasesResponse\x12\x45\n\x04rows\x18\x01 \x03(\x0b\x32\x31.yfinance_grpc.v1alpha1.InsiderPurchaseSummaryRowR\x04rows\"\xc3\x01\n\x19InsiderPurchaseSummaryRow\x12\x14\n\x05label\x18\x01 \x01(\tR\x05label\x12U\n\x06values\x18\x02 \x03(\x0b\x32=.yfinance_grpc.v1alpha1.InsiderPurchaseSummaryRow.ValuesEntryR\x06values\x1a\x39\n\x0bValuesEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n\x05value\x18\x02 \x01(\tR\x05value:\x02\x38\x01\"7\n\x1dGetInsiderTransactionsRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\"p\n\x1eGetInsiderTransactionsResponse\x12N\n\x0ctransactions\x18\x01 \x03(\x0b\x32*.yfinance_grpc.v1alpha1.InsiderTransactionR\x0ctransactions\"\xfb\x01\n\x12InsiderTransaction\x12\x39\n\nstart_date\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\tstartDate\x12\x18\n\x07insider\x18\x02 \x01(\tR\x07insider\x12\x1a\n\x08position\x18\x03 \x01(\tR\x08position\x12 \n\x0btransaction\x18\x04 \x01(\tR\x0btransaction\x12\x16\n\x06shares\x18\x05 \x01(\x03R\x06shares\x12\x14\n\x05value\x18\x06 \x01(\x01R\x05value\x12\x12\n\x04text\x18\x07 \x01(\tR\x04text\x12\x10\n\x03url\x18\x08 \x01(\tR\x03url\"8\n\x1eGetInsiderRosterHoldersRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\"h\n\x1fGetInsiderRosterHoldersResponse\x12\x45\n\x07holders\x18\x01 \x03(\x0b\x32+.yfinance_grpc.v1alpha1.InsiderRosterHolderR\x07holders\"\xe7\x01\n\x13InsiderRosterHolder\x12\x12\n\x04name\x18\x01 \x01(\tR\x04name\x12\x1a\n\x08position\x18\x02 \x01(\tR\x08position\x12\x10\n\x03url\x18\x03 \x01(\tR\x03url\x12R\n\x17most_recent_transaction\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x15mostRecentTransaction\x12:\n\x19latest_transaction_shares\x18\x05 \x01(\x03R\x17latestTransactionShares\"7\n\x1dGetAnalystPriceTargetsRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\"\x8c\x01\n\x1eGetAnalystPriceTargetsResponse\x12\x18\n\x07\x63urrent\x18\x01 \x01(\x01R\x07\x63urrent\x12\x10\n\x03low\x18\x02 \x01(\x01R\x03low\x12\x12\n\x04high\x18\x03 \x01(\x01R\x04high\x12\x12\n\x04mean\x18\x04 \x01(\x01R\x04mean\x12\x16\n\x06median\x18\x05 \x01(\x01R\x06median\":\n GetRecommendationsSummaryRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\"i\n!GetRecommendationsSummaryResponse\x12\x44\n\x04rows\x18\x01 \x03(\x0b\x32\x30.yfinance_grpc.v1alpha1.RecommendationSummaryRowR\x04rows\"\xac\x01\n\x18RecommendationSummaryRow\x12\x16\n\x06period\x18\x01 \x01(\tR\x06period\x12\x1d\n\nstrong_buy\x18\x02 \x01(\x05R\tstrongBuy\x12\x10\n\x03\x62uy\x18\x03 \x01(\x05R\x03\x62uy\x12\x12\n\x04hold\x18\x04 \x01(\x05R\x04hold\x12\x12\n\x04sell\x18\x05 \x01(\x05R\x04sell\x12\x1f\n\x0bstrong_sell\x18\x06 \x01(\x05R\nstrongSell\"4\n\x1aGetEarningsEstimateRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\"^\n\x1bGetEarningsEstimateResponse\x12?\n\x04rows\x18\x01 \x03(\x0b\x32+.yfinance_grpc.v1alpha1.EarningsEstimateRowR\x04rows\"\xcd\x01\n\x13\x45\x61rningsEstimateRow\x12\x16\n\x06period\x18\x01 \x01(\tR\x06period\x12,\n\x12number_of_analysts\x18\x02 \x01(\x05R\x10numberOfAnalysts\x12\x10\n\x03\x61vg\x18\x03 \x01(\x01R\x03\x61vg\x12\x10\n\x03low\x18\x04 \x01(\x01R\x03low\x12\x12\n\x04high\x18\x05 \x01(\x01R\x04high\x12 \n\x0cyear_ago_eps\x18\x06 \x01(\x01R\nyearAgoEps\x12\x16\n\x06growth\x18\x07 \x01(\x01R\x06growth\"3\n\x19GetRevenueEstimateRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\"\\\n\x1aGetRevenueEstimateResponse\x12>\n\x04rows\x18\x01 \x03(\x0b\x32*.yfinance_grpc.v1alpha1.RevenueEstimateRowR\x04rows\"\xd4\x01\n\x12RevenueEstimateRow\x12\x16\n\x06period\x18\x01 \x01(\tR\x06period\x12,\n\x12number_of_analysts\x18\x02 \x01(\x05R\x10numberOfAnalysts\x12\x10\n\x03\x61vg\x18\x03 \x01(\x01R\x03\x61vg\x12\x10\n\x03low\x18\x04 \x01(\x01R\x03low\x12\x12\n\x04high\x18\x05 \x01(\x01R\x04high\x12(\n\x10year_ago_revenue\x18\x06 \x01(\x01R\x0eyearAgoRevenue\x12\x16\n\x06growth\x18\x07 \x01(\x01R\x06growth\"3\n\x19GetEarningsHistoryRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\"\\\n\x1aGetEarningsHistoryResponse\x12>\n\x04rows\x18\x01 \x03(\x0b\x32*.yfinance_grpc.v1alpha1.EarningsHistoryRowR\x04rows\"\xd8\x01\n\x12\x45\x61rningsHistoryRow\x12.\n\x04\x64\x61te\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x04\x64\x61te\x12!\n\x0c\x65ps_estimate\x18\x02 \x01(\x01R\x0b\x65psEstimate\x12\x1d\n\neps_actual\x18\x03 \x01(\x01R\tepsActual\x12%\n\x0e\x65ps_difference\x18\x04 \x01(\x01R\repsDifference\x12)\n\x10surprise_percent\x18\x05 \x01(\x01R\x0fsurprisePercent\",\n\x12GetEpsTrendRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\"N\n\x13GetEpsTrendResponse\x12\x37\n\x04rows\x18\x01 \x03(\x0b\x32#.yfinance_grpc.v1alpha1.EpsTrendRowR\x04rows\"\xdb\x01\n\x0b\x45psTrendRow\x12\x16\n\x06period\x18\x01 \x01(\tR\x06period\x12\x18\n\x07\x63urrent\x18\x02 \x01(\x01R\x07\x63urrent\x12$\n\x0eseven_days_ago\x18\x03 \x01(\x01R\x0csevenDaysAgo\x12&\n\x0fthirty_days_ago\x18\x04 \x01(\x01R\rthirtyDaysAgo\x12$\n\x0esixty_days_ago\x18\x05 \x01(\x01R\x0csixtyDaysAgo\x12&\n\x0fninety_days_ago\x18\x06 \x01(\x01R\rninetyDaysAgo\"0\n\x16GetEpsRevisionsRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\"V\n\x17GetEpsRevisionsResponse\x12;\n\x04rows\x18\x01 \x03(\x0b\x32\'.yfinance_grpc.v1alpha1.EpsRevisionsRowR\x04rows\"\xc5\x01\n\x0f\x45psRevisionsRow\x12\x16\n\x06period\x18\x01 \x01(\tR\x06period\x12\"\n\rup_last_7days\x18\x02 \x01(\x05R\x0bupLast7days\x12$\n\x0eup_last_30days\x18\x03 \x01(\x05R\x0cupLast30days\x12&\n\x0f\x64own_last_7days\x18\x04 \x01(\x05R\rdownLast7days\x12(\n\x10\x64own_last_30days\x18\x05 \x01(\x05R\x0e\x64ownLast30days\"3\n\x19GetGrowthEstimatesRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\"\\\n\x1aGetGrowthEstimatesResponse\x12>\n\x04rows\x18\x01 \x03(\x0b\x32*.yfinance_grpc.v1alpha1.GrowthEstimatesRowR\x04rows\"\x8c\x01\n\x12GrowthEstimatesRow\x12\x16\n\x06period\x18\x01 \x01(\tR\x06period\x12\x14\n\x05stock\x18\x02 \x01(\x01R\x05stock\x12\x1a\n\x08industry\x18\x03 \x01(\x01R\x08industry\x12\x16\n\x06sector\x18\x04 \x01(\x01R\x06sector\x12\x14\n\x05index\x18\x05 \x01(\x01R\x05index\"V\n\x17GetEarningsDatesRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\x12\x19\n\x05limit\x18\x02 \x01(\x05H\x00R\x05limit\x88\x01\x01\x42\x08\n\x06_limit\"W\n\x18GetEarningsDatesResponse\x12;\n\x04rows\x18\x01 \x03(\x0b\x32\'.yfinance_grpc.v1alpha1.EarningsDateRowR\x04rows\"\xec\x01\n\x0f\x45\x61rningsDateRow\x12.\n\x04\x64\x61te\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x04\x64\x61te\x12&\n\x0c\x65ps_estimate\x18\x02 \x01(\x01H\x00R\x0b\x65psEstimate\x88\x01\x01\x12&\n\x0creported_eps\x18\x03 \x01(\x01H\x01R\x0breportedEps\x88\x01\x01\x12&\n\x0csurprise_pct\x18\x04 \x01(\x01H\x02R\x0bsurprisePct\x88\x01\x01\x42\x0f\n\r_eps_estimateB\x0f\n\r_reported_epsB\x0f\n\r_surprise_pct\"3\n\x19GetHistoryMetadataRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\"\xc1\x05\n\x1aGetHistoryMetadataResponse\x12\x1a\n\x08\x63urrency\x18\x01 \x01(\tR\x08\x63urrency\x12\x16\n\x06symbol\x18\x02 \x01(\tR\x06symbol\x12#\n\rexchange_name\x18\x03 \x01(\tR\x0c\x65xchangeName\x12,\n\x12\x66ull_exchange_name\x18\x04 \x01(\tR\x10\x66ullExchangeName\x12\'\n\x0finstrument_type\x18\x05 \x01(\tR\x0einstrumentType\x12(\n\x10\x66irst_trade_date\x18\x06 \x01(\x03R\x0e\x66irstTradeDate\x12.\n\x13regular_market_time\x18\x07 \x01(\x03R\x11regularMarketTime\x12\x36\n\x18has_pre_post_market_data\x18\x08 \x01(\x08R\x14hasPrePostMarketData\x12\x1d\n\ngmt_offset\x18\t \x01(\x05R\tgmtOffset\x12\x1a\n\x08timezone\x18\n \x01(\tR\x08timezone\x12\x34\n\x16\x65xchange_timezone_name\x18\x0b \x01(\tR\x14\x65xchangeTimezoneName\x12\x30\n\x14regular_market_price\x18\x0c \x01(\x01R\x12regularMarketPrice\x12-\n\x13\x66ifty_two_week_high\x18\r \x01(\x01R\x10\x66iftyTwoWeekHigh\x12+\n\x12\x66ifty_two_week_low\x18\x0e \x01(\x01R\x0f\x66iftyTwoWeekLow\x12)\n\x10\x64\x61ta_granularity\x18\x0f \x01(\tR\x0f\x64\x61taGranularity\x12\x14\n\x05range\x18\x10 \x01(\tR\x05range\x12!\n\x0cvalid_ranges\x18\x11 \x03(\tR\x0bvalidRanges\".\n\x14GetSecFilingsRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\"T\n\x15GetSecFilingsResponse\x12;\n\x07\x66ilings\x18\x01 \x03(\x0b\x32!.yfinance_grpc.v1alpha1.SecFilingR\x07\x66ilings\"w\n\tSecFiling\x12.\n\x04\x64\x61te\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x04\x64\x61te\x12\x12\n\x04type\x18\x02 \x01(\tR\x04type\x12\x14\n\x05title\x18\x03 \x01(\tR\x05title\x12\x10\n\x03url\x18\x04 \x01(\tR\x03url2\xcc\"\n\rTickerService\x12Z\n\x07GetInfo\x12&.yfinance_grpc.v1alpha1.GetInfoRequest\x1a\'.yfinance_grpc.v1alpha1.GetInfoResponse\x12\x63\n\nGetHistory\x12).yfinance_grpc.v1alpha1.GetHistoryRequest\x1a*.yfinance_grpc.v1alpha1.GetHistoryResponse\x12i\n\x0cGetDividends\x12+.yfinance_grpc.v1alpha1.GetDividendsRequest\x1a,.yfinance_grpc.v1alpha1.GetDividendsResponse\x12`\n\tGetSplits\x12(.yfinance_grpc.v1alpha1.GetSplitsRequest\x1a).yfinance_grpc.v1alpha1.GetSplitsResponse\x12\x63\n\nGetActions\x12).yfinance_grpc.v1alpha1.GetActionsRequest\x1a*.yfinance_grpc.v1alpha1.GetActionsResponse\x12l\n\rGetFinancials\x12,.yfinance_grpc.v1alpha1.GetFinancialsRequest\x1a-.yfinance_grpc.v1alpha1.GetFinancialsResponse\x12r\n\x0fGetBalanceSheet\x12..yfinance_grpc.v1alpha1.GetBalanceSheetRequest\x1a/.yfinance_grpc.v1alpha1.GetBalanceSheetResponse\x12\x66\n\x0bGetCashFlow\x12*.yfinance_grpc.v1alpha1.GetCashFlowRequest\x1a+.yfinance_grpc.v1alpha1.GetCashFlowResponse\x12\x66\n\x0bGetEarnings\x12*.yfinance_grpc.v1alpha1.GetEarningsRequest\x1a+.yfinance_grpc.v1alpha1.GetEarningsResponse\x12{\n\x12GetRecommendations\x12\x31.yfinance_grpc.v1alpha1.GetRecommendationsRequest\x1a\x32.yfinance_grpc.v1alpha1.GetRecommendationsResponse\x12\x63\n\nGetOptions\x12).yfinance_grpc.v1alpha1.GetOptionsRequest\x1a*.yfinance_grpc.v1alpha1.GetOptionsResponse\x12o\n\x0eGetOptionChain\x12-.yfinance_grpc.v1alpha1.GetOptionChainRequest\x1a..yfinance_grpc.v1alpha1.GetOptionChainResponse\x12\x66\n\x0bGetCalendar\x12*.yfinance_grpc.v1alpha1.GetCalendarRequest\x1a+.yfinance_grpc.v1alpha1.GetCalendarResponse\x12Z\n\x07GetNews\x12&.yfinance_grpc.v1alpha1.GetNewsRequest\x1a\'.yfinance_grpc.v1alpha1.GetNewsResponse\x12r\n\x0fGetMajorHolders\x12..yfinance_grpc.v1alpha1.GetMajorHoldersRequest\x1a/.yfinance_grpc.v1alpha1.GetMajorHoldersResponse\x12\x8a\x01\n\x17GetInstitutionalHolders\x12\x36.yfinance_grpc.v1alpha1.GetInstitutionalHoldersRequest\x1a\x37.yfinance_grpc.v1alpha1.GetInstitutionalHoldersResponse\x12\x81\x01\n\x14GetMutualFundHolders\x12\x33.yfinance_grpc.v1alpha1.GetMutualFundHoldersRequest\x1a\x34.yfinance_grpc.v1alpha1.GetMutualFundHoldersResponse\x12r\n\x0fGetMultipleInfo\x12..yfinance_grpc.v1alpha1.GetMultipleInfoRequest\x1a/.yfinance_grpc.v1alpha1.GetMultipleInfoResponse\x12t\n\x0f\x44ownloadHistory\x12..yfinance_grpc.v1alpha1.DownloadHistoryRequest\x1a/.yfinance_grpc.v1alpha1.DownloadHistoryResponse0\x01\x12r\n\x0fGetCapitalGains\x12..yfinance_grpc.v1alpha1.GetCapitalGainsRequest\x1a/.yfinance_grpc.v1alpha1.GetCapitalGainsResponse\x12u\n\x10GetSharesHistory\x12/.yfinance_grpc.v1alpha1.GetSharesHistoryRequest\x1a\x30.yfinance_grpc.v1alpha1.GetSharesHistoryResponse\x12Z\n\x07GetIsin\x12&.yfinance_grpc.v1alpha1.GetIsinRequest\x1a\'.yfinance_grpc.v1alpha1.GetIsinResponse\x12\x66\n\x0bGetFastInfo\x12*.yfinance_grpc.v1alpha1.GetFastInfoRequest\x1a+.yfinance_grpc.v1alpha1.GetFastInfoResponse\x12x\n\x11GetSustainability\x12\x30.yfinance_grpc.v1alpha1.GetSustainabilityRequest\x1a\x31.yfinance_grpc.v1alpha1.GetSustainabilityResponse\x12~\n\x13GetInsiderPurchases\x12\x32.yfinance_grpc.v1alpha1.GetInsiderPurchasesRequest\x1a\x33.yfinance_grpc.v1alpha1.GetInsiderPurchasesResponse\x12\x87\x01\n\x16GetInsiderTransactions\x12\x35.yfinance_grpc.v1alpha1.GetInsiderTransactionsRequest\x1a\x36.yfinance_grpc.v1alpha1.GetInsiderTransactionsResponse\x12\x8a\x01\n\x17GetInsiderRosterHolders\x12\x36.yfinance_grpc.v1alpha1.GetInsiderRosterHoldersRequest\x1a\x37.yfinance_grpc.v1alpha1.GetInsiderRosterHoldersResponse\x12\x87\x01\n\x16GetAnalystPriceTargets\x12\x35.yfinance_grpc.v1alpha1.GetAnalystPriceTargetsRequest\x1a\x36.yfinance_grpc.v1alpha1.GetAnalystPriceTargetsResponse\x12\x90\x01\n\x19GetRecommendationsSummary\x12\x38.yfinance_grpc.v1alpha1.GetRecommendationsSummaryRequest\x1a\x39.yfinance_grpc.v1alpha1.GetRecommendationsSummaryResponse\x12~\n\x13GetEarningsEstimate\x12\x32.yfinance_grpc.v1alpha1.GetEarningsEstimateRequest\x1a\x33.yfinance_grpc.v1alpha1.GetEarningsEstimateResponse\x12{\n\x12GetRevenueEstimate\x12\x31.yfinance_grpc.v1alpha1.GetRevenueEstimateRequest\x1a\x32.yfinance_grpc.v1alpha1.GetRevenueEstimateResponse\x12{\n\x12GetEarningsHistory\x12\x31.yfinance_grpc.v1alpha1.GetEarningsHistoryRequest\x1a\x32.yfinance_grpc.v1alpha1.GetEarningsHistoryResponse\x12\x66\n\x0bGetEpsTrend\x12*.yfinance_grpc.v1alpha1.GetEpsTrendRequest\x1a+.yfinance_grpc.v1alpha1.GetEpsTrendResponse\x12r\n\x0fGetEpsRevisions\x12..yfinance_grpc.v1alpha1.GetEpsRevisionsRequest\x1a/.yfinance_grpc.v1alpha1.GetEpsRevisionsResponse\x12{\n\x12GetGrowthEstimates\x12\x31.yfinance_grpc.v1alpha1.GetGrowthEstimatesRequest\x1a\x32.yfinance_grpc.v1alpha1.GetGrowthEstimatesResponse\x12u\n\x10GetEarningsDates\x12/.yfinance_grpc.v1alpha1.GetEarningsDatesRequest\x1a\x30.yfinance_grpc.v1alpha1.GetEarningsDatesResponse\x12{\n\x12GetHistoryMetadata\x12\x31.yfinance_grpc.v1alpha1.GetHistoryMetadataRequest\x1a\x32.yfinance_grpc.v1alpha1.GetHistoryMetadataResponse\x12l\n\rGetSecFilings\x12,.yfinance_grpc.v1alpha1.GetSecFilingsRequest\x1a-.yfinance_grpc.v1alpha1.GetSecFilingsResponseB\xf6\x01\n\x1a\x63om.yfinance_grpc.v1alpha1B\x0bTickerProtoP\x01ZVgithub.com/idebeijer/yfinance-grpc/gen/go/yfinance_grpc/v1alpha1;yfinance_grpcv1alpha1\xa2\x02\x03YXX\xaa\x02\x15YfinanceGrpc.V1alpha1\xca\x02\x15YfinanceGrpc\\V1alpha1\xe2\x02!YfinanceGrpc\\V1alpha1\\GPBMetadata\xea\x02\x16YfinanceGrpc::V1alpha1b\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n#yfinance_grpc/v1alpha1/ticker.proto\x12\x16yfinance_grpc.v1alpha1\x1a google/protobuf/field_mask.proto\x1a\x1fgoogle/protobuf/timestamp.proto\"\xa6\x01\n\x0eGetInfoRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\x12\x37\n\tread_mask\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.FieldMaskR\x08readMask\x12\x43\n\tfreshness\x18\x03 \x01(\x0e\x32%.yfinance_grpc.v1alpha1.InfoFreshnessR\tfreshness\"\x85\x01\n\x0fGetInfoResponse\x12\x36\n\x04info\x18\x01 \x01(\x0b\x32\".yfinance_grpc.v1alpha1.TickerInfoR\x04info\x12:\n\x06source\x18\x02 \x01(\x0e\x32\".yfinance_grpc.v1alpha1.InfoSourceR\x06source\"\xee\x13\n\nTickerInfo\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x1d\n\nshort_name\x18\x02 \x01(\tR\tshortName\x12\x1b\n\tlong_name\x18\x03 \x01(\tR\x08longName\x12\x1a\n\x08industry\x18\x04 \x01(\tR\x08industry\x12\x16\n\x06sector\x18\x05 \x01(\tR\x06sector\x12\x18\n\x07\x63ountry\x18\x06 \x01(\tR\x07\x63ountry\x12\x12\n\x04\x63ity\x18\x07 \x01(\tR\x04\x63ity\x12\x14\n\x05state\x18\x08 \x01(\tR\x05state\x12\x10\n\x03zip\x18\t \x01(\tR\x03zip\x12\x18\n\x07website\x18\n \x01(\tR\x07website\x12\x32\n\x15long_business_summary\x18\x0b \x01(\tR\x13longBusinessSummary\x12%\n\x0eprevious_close\x18\x14 \x01(\x01R\rpreviousClose\x12\x12\n\x04open\x18\x15 \x01(\x01R\x04open\x12\x17\n\x07\x64\x61y_low\x18\x16 \x01(\x01R\x06\x64\x61yLow\x12\x19\n\x08\x64\x61y_high\x18\x17 \x01(\x01R\x07\x64\x61yHigh\x12\x41\n\x1dregular_market_previous_close\x18\x18 \x01(\x01R\x1aregularMarketPreviousClose\x12.\n\x13regular_market_open\x18\x19 \x01(\x01R\x11regularMarketOpen\x12\x33\n\x16regular_market_day_low\x18\x1a \x01(\x01R\x13regularMarketDayLow\x12\x35\n\x17regular_market_day_high\x18\x1b \x01(\x01R\x14regularMarketDayHigh\x12#\n\rcurrent_price\x18\x1c \x01(\x01R\x0c\x63urrentPrice\x12\x16\n\x06volume\x18\x1e \x01(\x03R\x06volume\x12\x32\n\x15regular_market_volume\x18\x1f \x01(\x03R\x13regularMarketVolume\x12%\n\x0e\x61verage_volume\x18  \x01(\x03R\raverageVolume\x12\x32\n\x15\x61verage_volume_10days\x18! \x01(\x03R\x13\x61verageVolume10days\x12-\n\x12shares_outstanding\x18\" \x01(\x03R\x11sharesOutstanding\x12!\n\x0c\x66loat_shares\x18# \x01(\x03R\x0b\x66loatShares\x12\x1d\n\nmarket_cap\x18( \x01(\x03R\tmarketCap\x12)\n\x10\x65nterprise_value\x18) \x01(\x01R\x0f\x65nterpriseValue\x12\x1f\n\x0btrailing_pe\x18* \x01(\x01R\ntrailingPe\x12\x1d\n\nforward_pe\x18+ \x01(\x01R\tforwardPe\x12\"\n\rprice_to_book\x18, \x01(\x01R\x0bpriceToBook\x12\x46\n price_to_sales_trailing_12months\x18- \x01(\x01R\x1cpriceToSalesTrailing12months\x12\x32\n\x15\x65nterprise_to_revenue\x18. \x01(\x01R\x13\x65nterpriseToRevenue\x12\x30\n\x14\x65nterprise_to_ebitda\x18/ \x01(\x01R\x12\x65nterpriseToEbitda\x12#\n\rdividend_rate\x18\x32 \x01(\x01R\x0c\x64ividendRate\x12%\n\x0e\x64ividend_yield\x18\x33 \x01(\x01R\rdividendYield\x12(\n\x10\x65x_dividend_date\x18\x34 \x01(\x03R\x0e\x65xDividendDate\x12!\n\x0cpayout_ratio\x18\x35 \x01(\x01R\x0bpayoutRatio\x12>\n\x1c\x66ive_year_avg_dividend_yield\x18\x36 \x01(\x01R\x18\x66iveYearAvgDividendYield\x12\x12\n\x04\x62\x65ta\x18< \x01(\x01R\x04\x62\x65ta\x12!\n\x0ctrailing_eps\x18= \x01(\x01R\x0btrailingEps\x12\x1f\n\x0b\x66orward_eps\x18> \x01(\x01R\nforwardEps\x12\x1d\n\nbook_value\x18? \x01(\x01R\tbookValue\x12%\n\x0eprofit_margins\x18@ \x01(\x01R\rprofitMargins\x12*\n\x11revenue_per_share\x18\x41 \x01(\x01R\x0frevenuePerShare\x12(\n\x10return_on_assets\x18\x42 \x01(\x01R\x0ereturnOnAssets\x12(\n\x10return_on_equity\x18\x43 \x01(\x01R\x0ereturnOnEquity\x12%\n\x0erevenue_growth\x18\x44 \x01(\x01R\rrevenueGrowth\x12\'\n\x0f\x65\x61rnings_growth\x18\x45 \x01(\x01R\x0e\x65\x61rningsGrowth\x12+\n\x11operating_margins\x18\x46 \x01(\x01R\x10operatingMargins\x12%\n\x0e\x65\x62itda_margins\x18G \x01(\x01R\rebitdaMargins\x12+\n\x12\x66ifty_two_week_low\x18P \x01(\x01R\x0f\x66iftyTwoWeekLow\x12-\n\x13\x66ifty_two_week_high\x18Q \x01(\x01R\x10\x66iftyTwoWeekHigh\x12*\n\x11\x66ifty_day_average\x18R \x01(\x01R\x0f\x66iftyDayAverage\x12\x35\n\x17two_hundred_day_average\x18S \x01(\x01R\x14twoHundredDayAverage\x12*\n\x11target_high_price\x18Z \x01(\x01R\x0ftargetHighPrice\x12(\n\x10target_low_price\x18[ \x01(\x01R\x0etargetLowPrice\x12*\n\x11target_mean_price\x18\\ \x01(\x01R\x0ftargetMeanPrice\x12.\n\x13target_median_price\x18] \x01(\x01R\x11targetMedianPrice\x12;\n\x1anumber_of_analyst_opinions\x18^ \x01(\x05R\x17numberOfAnalystOpinions\x12\x1a\n\x08\x63urrency\x18\x64 \x01(\tR\x08\x63urrency\x12\x1a\n\x08\x65xchange\x18\x65 \x01(\tR\x08\x65xchange\x12\x1d\n\nquote_type\x18\x66 \x01(\tR\tquoteType\x12-\n\x12\x66inancial_currency\x18g \x01(\tR\x11\x66inancialCurrency\x12\x1d\n\nprice_hint\x18h \x01(\x05R\tpriceHint\"\xab\x04\n\x11GetHistoryRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\x12\x1b\n\x06period\x18\x02 \x01(\tH\x00R\x06period\x88\x01\x01\x12\x35\n\x05start\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x01R\x05start\x88\x01\x01\x12\x31\n\x03\x65nd\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x02R\x03\x65nd\x88\x01\x01\x12\x1a\n\x08interval\x18\x05 \x01(\tR\x08interval\x12\x1d\n\x07prepost\x18\x06 \x01(\x08H\x03R\x07prepost\x88\x01\x01\x12\x1d\n\x07\x61\x63tions\x18\x07 \x01(\x08H\x04R\x07\x61\x63tions\x88\x01\x01\x12$\n\x0b\x61uto_adjust\x18\x08 \x01(\x08H\x05R\nautoAdjust\x88\x01\x01\x12$\n\x0b\x62\x61\x63k_adjust\x18\t \x01(\x08H\x06R\nbackAdjust\x88\x01\x01\x12\x1b\n\x06repair\x18\n \x01(\x08H\x07R\x06repair\x88\x01\x01\x12\x1b\n\x06keepna\x18\x0b \x01(\x08H\x08R\x06keepna\x88\x01\x01\x12\x1f\n\x08rounding\x18\x0c \x01(\x08H\tR\x08rounding\x88\x01\x01\x42\t\n\x07_periodB\x08\n\x06_startB\x06\n\x04_endB\n\n\x08_prepostB\n\n\x08_actionsB\x0e\n\x0c_auto_adjustB\x0e\n\x0c_back_adjustB\t\n\x07_repairB\t\n\x07_keepnaB\x0b\n\t_rounding\"L\n\x12GetHistoryResponse\x12\x36\n\x04rows\x18\x01 \x03(\x0b\x32\".yfinance_grpc.v1alpha1.HistoryRowR\x04rows\"\xca\x02\n\nHistoryRow\x12.\n\x04\x64\x61te\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x04\x64\x61te\x12\x12\n\x04open\x18\x02 \x01(\x01R\x04open\x12\x12\n\x04high\x18\x03 \x01(\x01R\x04high\x12\x10\n\x03low\x18\x04 \x01(\x01R\x03low\x12\x14\n\x05\x63lose\x18\x05 \x01(\x01R\x05\x63lose\x12\x16\n\x06volume\x18\x06 \x01(\x03R\x06volume\x12!\n\tdividends\x18\x07 \x01(\x01H\x00R\tdividends\x88\x01\x01\x12&\n\x0cstock_splits\x18\x08 \x01(\x01H\x01R\x0bstockSplits\x88\x01\x01\x12(\n\rcapital_gains\x18\t \x01(\x01H\x02R\x0c\x63\x61pitalGains\x88\x01\x01\x42\x0c\n\n_dividendsB\x0f\n\r_stock_splitsB\x10\n\x0e_capital_gains\"U\n\x13GetDividendsRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\x12\x1b\n\x06period\x18\x02 \x01(\tH\x00R\x06period\x88\x01\x01\x42\t\n\x07_period\"O\n\x14GetDividendsResponse\x12\x37\n\x04rows\x18\x01 \x03(\x0b\x32#.yfinance_grpc.v1alpha1.DividendRowR\x04rows\"U\n\x0b\x44ividendRow\x12.\n\x04\x64\x61te\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x04\x64\x61te\x12\x16\n\x06\x61mount\x18\x02 \x01(\x01R\x06\x61mount\"R\n\x10GetSplitsRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\x12\x1b\n\x06period\x18\x02 \x01(\tH\x00R\x06period\x88\x01\x01\x42\t\n\x07_period\"I\n\x11GetSplitsResponse\x12\x34\n\x04rows\x18\x01 \x03(\x0b\x32 .yfinance_grpc.v1alpha1.SplitRowR\x04rows\"P\n\x08SplitRow\x12.\n\x04\x64\x61te\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x04\x64\x61te\x12\x14\n\x05ratio\x18\x02 \x01(\x01R\x05ratio\"S\n\x11GetActionsRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\x12\x1b\n\x06period\x18\x02 \x01(\tH\x00R\x06period\x88\x01\x01\x42\t\n\x07_period\"K\n\x12GetActionsResponse\x12\x35\n\x04rows\x18\x01 \x03(\x0b\x32!.yfinance_grpc.v1alpha1.ActionRowR\x04rows\"\xe1\x01\n\tActionRow\x12.\n\x04\x64\x61te\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x04\x64\x61te\x12!\n\tdividends\x18\x02 \x01(\x01H\x00R\tdividends\x88\x01\x01\x12&\n\x0cstock_splits\x18\x03 \x01(\x01H\x01R\x0bstockSplits\x88\x01\x01\x12(\n\rcapital_gains\x18\x04 \x01(\x01H\x02R\x0c\x63\x61pitalGains\x88\x01\x01\x42\x0c\n\n_dividendsB\x0f\n\r_stock_splitsB\x10\n\x0e_capital_gains\"\x97\x01\n\x14GetFinancialsRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\x12\x12\n\x04\x66req\x18\x02 \x01(\tR\x04\x66req\x12\x17\n\x07\x61s_dict\x18\x03 \x01(\x08R\x06\x61sDict\x12\x16\n\x06pretty\x18\x04 \x01(\x08R\x06pretty\x12\"\n\rif_none_match\x18\x05 \x01(\tR\x0bifNoneMatch\"\x9a\x01\n\x15GetFinancialsResponse\x12J\n\nstatements\x18\x01 \x03(\x0b\x32*.yfinance_grpc.v1alpha1.FinancialStatementR\nstatements\x12\x12\n\x04\x65tag\x18\x02 \x01(\tR\x04\x65tag\x12!\n\x0cnot_modified\x18\x03 \x01(\x08R\x0bnotModified\"\xcf\x01\n\x12\x46inancialStatement\x12.\n\x04\x64\x61te\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x04\x64\x61te\x12N\n\x06values\x18\x02 \x03(\x0b\x32\x36.yfinance_grpc.v1alpha1.FinancialStatement.ValuesEntryR\x06values\x1a\x39\n\x0bValuesEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n\x05value\x18\x02 \x01(\x01R\x05value:\x02\x38\x01\"u\n\x16GetBalanceSheetRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\x12\x12\n\x04\x66req\x18\x02 \x01(\tR\x04\x66req\x12\x17\n\x07\x61s_dict\x18\x03 \x01(\x08R\x06\x61sDict\x12\x16\n\x06pretty\x18\x04 \x01(\x08R\x06pretty\"h\n\x17GetBalanceSheetResponse\x12M\n\nstatements\x18\x01 \x03(\x0b\x32-.yfinance_grpc.v1alpha1.BalanceSheetStatementR\nstatements\"\xd5\x01\n\x15\x42\x61lanceSheetStatement\x12.\n\x04\x64\x61te\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x04\x64\x61te\x12Q\n\x06values\x18\x02 \x03(\x0b\x32\x39.yfinance_grpc.v1alpha1.BalanceSheetStatement.ValuesEntryR\x06values\x1a\x39\n\x0bValuesEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n\x05value\x18\x02 \x01(\x01R\x05value:\x02\x38\x01\"q\n\x12GetCashFlowRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\x12\x12\n\x04\x66req\x18\x02 \x01(\tR\x04\x66req\x12\x17\n\x07\x61s_dict\x18\x03 \x01(\x08R\x06\x61sDict\x12\x16\n\x06pretty\x18\x04 \x01(\x08R\x06pretty\"`\n\x13GetCashFlowResponse\x12I\n\nstatements\x18\x01 \x03(\x0b\x32).yfinance_grpc.v1alpha1.CashFlowStatementR\nstatements\"\xcd\x01\n\x11\x43\x61shFlowStatement\x12.\n\x04\x64\x61te\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x04\x64\x61te\x12M\n\x06values\x18\x02 \x03(\x0b\x32\x35.yfinance_grpc.v1alpha1.CashFlowStatement.ValuesEntryR\x06values\x1a\x39\n\x0bValuesEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n\x05value\x18\x02 \x01(\x01R\x05value:\x02\x38\x01\"Y\n\x12GetEarningsRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\x12\x12\n\x04\x66req\x18\x02 \x01(\tR\x04\x66req\x12\x17\n\x07\x61s_dict\x18\x03 \x01(\x08R\x06\x61sDict\"N\n\x13GetEarningsResponse\x12\x37\n\x04rows\x18\x01 \x03(\x0b\x32#.yfinance_grpc.v1alpha1.EarningsRowR\x04rows\"\x96\x01\n\x0b\x45\x61rningsRow\x12.\n\x04\x64\x61te\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x04\x64\x61te\x12\x1d\n\x07revenue\x18\x02 \x01(\x01H\x00R\x07revenue\x88\x01\x01\x12\x1f\n\x08\x65\x61rnings\x18\x03 \x01(\x01H\x01R\x08\x65\x61rnings\x88\x01\x01\x42\n\n\x08_revenueB\x0b\n\t_earnings\"3\n\x19GetRecommendationsRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\"[\n\x1aGetRecommendationsResponse\x12=\n\x04rows\x18\x01 \x03(\x0b\x32).yfinance_grpc.v1alpha1.RecommendationRowR\x04rows\"\xa9\x01\n\x11RecommendationRow\x12.\n\x04\x64\x61te\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x04\x64\x61te\x12\x12\n\x04\x66irm\x18\x02 \x01(\tR\x04\x66irm\x12\x19\n\x08to_grade\x18\x03 \x01(\tR\x07toGrade\x12\x1d\n\nfrom_grade\x18\x04 \x01(\tR\tfromGrade\x12\x16\n\x06\x61\x63tion\x18\x05 \x01(\tR\x06\x61\x63tion\"+\n\x11GetOptionsRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\"?\n\x12GetOptionsResponse\x12)\n\x10\x65xpiration_dates\x18\x01 \x03(\tR\x0f\x65xpirationDates\"m\n\x15GetOptionChainRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\x12\x17\n\x04\x64\x61te\x18\x02 \x01(\tH\x00R\x04\x64\x61te\x88\x01\x01\x12\x13\n\x02tz\x18\x03 \x01(\tH\x01R\x02tz\x88\x01\x01\x42\x07\n\x05_dateB\x05\n\x03_tz\"\x92\x01\n\x16GetOptionChainResponse\x12<\n\x05\x63\x61lls\x18\x01 \x03(\x0b\x32&.yfinance_grpc.v1alpha1.OptionContractR\x05\x63\x61lls\x12:\n\x04puts\x18\x02 \x03(\x0b\x32&.yfinance_grpc.v1alpha1.OptionContractR\x04puts\"\xe6\x03\n\x0eOptionContract\x12\'\n\x0f\x63ontract_symbol\x18\x01 \x01(\tR\x0e\x63ontractSymbol\x12\x16\n\x06strike\x18\x02 \x01(\x01R\x06strike\x12\x1a\n\x08\x63urrency\x18\x03 \x01(\tR\x08\x63urrency\x12\x1d\n\nlast_price\x18\x04 \x01(\x01R\tlastPrice\x12\x10\n\x03\x62id\x18\x05 \x01(\x01R\x03\x62id\x12\x10\n\x03\x61sk\x18\x06 \x01(\x01R\x03\x61sk\x12\x16\n\x06\x63hange\x18\x07 \x01(\x01R\x06\x63hange\x12%\n\x0epercent_change\x18\x08 \x01(\x01R\rpercentChange\x12\x16\n\x06volume\x18\t \x01(\x03R\x06volume\x12#\n\ropen_interest\x18\n \x01(\x03R\x0copenInterest\x12-\n\x12implied_volatility\x18\x0b \x01(\x01R\x11impliedVolatility\x12 \n\x0cin_the_money\x18\x0c \x01(\x08R\ninTheMoney\x12#\n\rcontract_size\x18\r \x01(\tR\x0c\x63ontractSize\x12\x42\n\x0flast_trade_date\x18\x0e \x01(\x0b\x32\x1a.google.protobuf.TimestampR\rlastTradeDate\",\n\x12GetCalendarRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\"\x92\x02\n\x13GetCalendarResponse\x12\x45\n\x08\x65\x61rnings\x18\x01 \x01(\x0b\x32$.yfinance_grpc.v1alpha1.EarningsDateH\x00R\x08\x65\x61rnings\x88\x01\x01\x12S\n\x10\x65x_dividend_date\x18\x02 \x01(\x0b\x32$.yfinance_grpc.v1alpha1.DividendDateH\x01R\x0e\x65xDividendDate\x88\x01\x01\x12=\n\x06\x65vents\x18\x03 \x03(\x0b\x32%.yfinance_grpc.v1alpha1.CalendarEventR\x06\x65ventsB\x0b\n\t_earningsB\x13\n\x11_ex_dividend_date\"\x8a\x01\n\x0c\x45\x61rningsDate\x12\x35\n\x05start\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x00R\x05start\x88\x01\x01\x12\x31\n\x03\x65nd\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x01R\x03\x65nd\x88\x01\x01\x42\x08\n\x06_startB\x06\n\x04_end\"L\n\x0c\x44ividendDate\x12\x33\n\x04\x64\x61te\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x00R\x04\x64\x61te\x88\x01\x01\x42\x07\n\x05_date\"\x80\x01\n\rCalendarEvent\x12\x1d\n\nevent_type\x18\x01 \x01(\tR\teventType\x12.\n\x04\x64\x61te\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x04\x64\x61te\x12 \n\x0b\x64\x65scription\x18\x03 \x01(\tR\x0b\x64\x65scription\">\n\x0eGetNewsRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\x12\x14\n\x05\x63ount\x18\x02 \x01(\x05R\x05\x63ount\"R\n\x0fGetNewsResponse\x12?\n\x08\x61rticles\x18\x01 \x03(\x0b\x32#.yfinance_grpc.v1alpha1.NewsArticleR\x08\x61rticles\"\xa7\x02\n\x0bNewsArticle\x12\x12\n\x04uuid\x18\x01 \x01(\tR\x04uuid\x12\x14\n\x05title\x18\x02 \x01(\tR\x05title\x12\x1c\n\tpublisher\x18\x03 \x01(\tR\tpublisher\x12\x12\n\x04link\x18\x04 \x01(\tR\x04link\x12N\n\x15provider_publish_time\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x13providerPublishTime\x12\x12\n\x04type\x18\x06 \x01(\tR\x04type\x12!\n\tthumbnail\x18\x07 \x01(\tH\x00R\tthumbnail\x88\x01\x01\x12\'\n\x0frelated_tickers\x18\x08 \x03(\tR\x0erelatedTickersB\x0c\n\n_thumbnail\"0\n\x16GetMajorHoldersRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\"\xad\x01\n\x17GetMajorHoldersResponse\x12V\n\x07holders\x18\x01 \x03(\x0b\x32<.yfinance_grpc.v1alpha1.GetMajorHoldersResponse.HoldersEntryR\x07holders\x1a:\n\x0cHoldersEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n\x05value\x18\x02 \x01(\tR\x05value:\x02\x38\x01\"\\\n\x1eGetInstitutionalHoldersRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\x12\"\n\rif_none_match\x18\x02 \x01(\tR\x0bifNoneMatch\"\x9f\x01\n\x1fGetInstitutionalHoldersResponse\x12\x45\n\x07holders\x18\x01 \x03(\x0b\x32+.yfinance_grpc.v1alpha1.InstitutionalHolderR\x07holders\x12\x12\n\x04\x65tag\x18\x02 \x01(\tR\x04\x65tag\x12!\n\x0cnot_modified\x18\x03 \x01(\x08R\x0bnotModified\"\xb5\x01\n\x13InstitutionalHolder\x12\x16\n\x06holder\x18\x01 \x01(\tR\x06holder\x12\x16\n\x06shares\x18\x02 \x01(\x03R\x06shares\x12?\n\rdate_reported\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x0c\x64\x61teReported\x12\x17\n\x07pct_out\x18\x04 \x01(\x01R\x06pctOut\x12\x14\n\x05value\x18\x05 \x01(\x01R\x05value\"5\n\x1bGetMutualFundHoldersRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\"b\n\x1cGetMutualFundHoldersResponse\x12\x42\n\x07holders\x18\x01 \x03(\x0b\x32(.yfinance_grpc.v1alpha1.MutualFundHolderR\x07holders\"\xb2\x01\n\x10MutualFundHolder\x12\x16\n\x06holder\x18\x01 \x01(\tR\x06holder\x12\x16\n\x06shares\x18\x02 \x01(\x03R\x06shares\x12?\n\rdate_reported\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x0c\x64\x61teReported\x12\x17\n\x07pct_out\x18\x04 \x01(\x01R\x06pctOut\x12\x14\n\x05value\x18\x05 \x01(\x01R\x05value\"\xb0\x01\n\x16GetMultipleInfoRequest\x12\x18\n\x07tickers\x18\x01 \x03(\tR\x07tickers\x12\x37\n\tread_mask\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.FieldMaskR\x08readMask\x12\x43\n\tfreshness\x18\x03 \x01(\x0e\x32%.yfinance_grpc.v1alpha1.InfoFreshnessR\tfreshness\"\x81\x02\n\x17GetMultipleInfoResponse\x12M\n\x04info\x18\x01 \x03(\x0b\x32\x39.yfinance_grpc.v1alpha1.GetMultipleInfoResponse.InfoEntryR\x04info\x12:\n\x06source\x18\x02 \x01(\x0e\x32\".yfinance_grpc.v1alpha1.InfoSourceR\x06source\x1a[\n\tInfoEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12\x38\n\x05value\x18\x02 \x01(\x0b\x32\".yfinance_grpc.v1alpha1.TickerInfoR\x05value:\x02\x38\x01\"\xba\x02\n\x16\x44ownloadHistoryRequest\x12\x18\n\x07tickers\x18\x01 \x03(\tR\x07tickers\x12\x1b\n\x06period\x18\x02 \x01(\tH\x00R\x06period\x88\x01\x01\x12\x1f\n\x08interval\x18\x03 \x01(\tH\x01R\x08interval\x88\x01\x01\x12\x35\n\x05start\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x02R\x05start\x88\x01\x01\x12\x31\n\x03\x65nd\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x03R\x03\x65nd\x88\x01\x01\x12$\n\x0b\x61uto_adjust\x18\x06 \x01(\x08H\x04R\nautoAdjust\x88\x01\x01\x42\t\n\x07_periodB\x0b\n\t_intervalB\x08\n\x06_startB\x06\n\x04_endB\x0e\n\x0c_auto_adjust\"i\n\x17\x44ownloadHistoryResponse\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\x12\x36\n\x04rows\x18\x02 \x03(\x0b\x32\".yfinance_grpc.v1alpha1.HistoryRowR\x04rows\"X\n\x16GetCapitalGainsRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\x12\x1b\n\x06period\x18\x02 \x01(\tH\x00R\x06period\x88\x01\x01\x42\t\n\x07_period\"V\n\x17GetCapitalGainsResponse\x12;\n\x04rows\x18\x01 \x03(\x0b\x32\'.yfinance_grpc.v1alpha1.CapitalGainsRowR\x04rows\"Y\n\x0f\x43\x61pitalGainsRow\x12.\n\x04\x64\x61te\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x04\x64\x61te\x12\x16\n\x06\x61mount\x18\x02 \x01(\x01R\x06\x61mount\"\xad\x01\n\x17GetSharesHistoryRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\x12\x35\n\x05start\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x00R\x05start\x88\x01\x01\x12\x31\n\x03\x65nd\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x01R\x03\x65nd\x88\x01\x01\x42\x08\n\x06_startB\x06\n\x04_end\"X\n\x18GetSharesHistoryResponse\x12<\n\x04rows\x18\x01 \x03(\x0b\x32(.yfinance_grpc.v1alpha1.SharesHistoryRowR\x04rows\"Z\n\x10SharesHistoryRow\x12.\n\x04\x64\x61te\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x04\x64\x61te\x12\x16\n\x06shares\x18\x02 \x01(\x03R\x06shares\"(\n\x0eGetIsinRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\"%\n\x0fGetIsinResponse\x12\x12\n\x04isin\x18\x01 \x01(\tR\x04isin\",\n\x12GetFastInfoRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\"K\n\x13GetFastInfoResponse\x12\x34\n\x04info\x18\x01 \x01(\x0b\x32 .yfinance_grpc.v1alpha1.FastInfoR\x04info\"\xf8\x06\n\x08\x46\x61stInfo\x12\x1a\n\x08\x63urrency\x18\x01 \x01(\tR\x08\x63urrency\x12\x1a\n\x08\x65xchange\x18\x02 \x01(\tR\x08\x65xchange\x12\x37\n\x18\x65xchange_data_delayed_by\x18\x03 \x01(\x05R\x15\x65xchangeDataDelayedBy\x12\x34\n\x16\x65xchange_timezone_name\x18\x04 \x01(\tR\x14\x65xchangeTimezoneName\x12\x1d\n\nlast_price\x18\x05 \x01(\x01R\tlastPrice\x12\x1f\n\x0blast_volume\x18\x06 \x01(\x03R\nlastVolume\x12\x1d\n\nmarket_cap\x18\x07 \x01(\x03R\tmarketCap\x12\x12\n\x04open\x18\x08 \x01(\x01R\x04open\x12%\n\x0eprevious_close\x18\t \x01(\x01R\rpreviousClose\x12\x1d\n\nquote_type\x18\n \x01(\tR\tquoteType\x12\x35\n\x17regular_market_day_high\x18\x0b \x01(\x01R\x14regularMarketDayHigh\x12\x33\n\x16regular_market_day_low\x18\x0c \x01(\x01R\x13regularMarketDayLow\x12\x41\n\x1dregular_market_previous_close\x18\r \x01(\x01R\x1aregularMarketPreviousClose\x12\x30\n\x14regular_market_price\x18\x0e \x01(\x01R\x12regularMarketPrice\x12\x16\n\x06shares\x18\x0f \x01(\x03R\x06shares\x12;\n\x1athree_month_average_volume\x18\x10 \x01(\x01R\x17threeMonthAverageVolume\x12\x1a\n\x08timezone\x18\x11 \x01(\tR\x08timezone\x12*\n\x11\x66ifty_day_average\x18\x12 \x01(\x01R\x0f\x66iftyDayAverage\x12\x35\n\x17two_hundred_day_average\x18\x13 \x01(\x01R\x14twoHundredDayAverage\x12\x1f\n\x0byear_change\x18\x14 \x01(\x01R\nyearChange\x12\x1b\n\tyear_high\x18\x15 \x01(\x01R\x08yearHigh\x12\x19\n\x08year_low\x18\x16 \x01(\x01R\x07yearLow\"V\n\x18GetSustainabilityRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\x12\"\n\rif_none_match\x18\x02 \x01(\tR\x0bifNoneMatch\"\x9c\x06\n\x19GetSustainabilityResponse\x12\x1b\n\ttotal_esg\x18\x01 \x01(\x01R\x08totalEsg\x12\'\n\x0f\x65sg_performance\x18\x02 \x01(\tR\x0e\x65sgPerformance\x12+\n\x11\x65nvironment_score\x18\x03 \x01(\x01R\x10\x65nvironmentScore\x12!\n\x0csocial_score\x18\x04 \x01(\x01R\x0bsocialScore\x12)\n\x10governance_score\x18\x05 \x01(\x01R\x0fgovernanceScore\x12\x1e\n\npercentile\x18\x06 \x01(\x01R\npercentile\x12\x1d\n\npeer_group\x18\x07 \x01(\tR\tpeerGroup\x12\x14\n\x05\x61\x64ult\x18\x14 \x01(\x08R\x05\x61\x64ult\x12\x1c\n\talcoholic\x18\x15 \x01(\x08R\talcoholic\x12%\n\x0e\x61nimal_testing\x18\x16 \x01(\x08R\ranimalTesting\x12\x1a\n\x08\x63\x61tholic\x18\x17 \x01(\x08R\x08\x63\x61tholic\x12\x33\n\x15\x63ontroversial_weapons\x18\x18 \x01(\x08R\x14\x63ontroversialWeapons\x12\x1d\n\nsmall_arms\x18\x19 \x01(\x08R\tsmallArms\x12\x1f\n\x0b\x66ur_leather\x18\x1a \x01(\x08R\nfurLeather\x12\x1a\n\x08gambling\x18\x1b \x01(\x08R\x08gambling\x12\x10\n\x03gmo\x18\x1c \x01(\x08R\x03gmo\x12+\n\x11military_contract\x18\x1d \x01(\x08R\x10militaryContract\x12\x18\n\x07nuclear\x18\x1e \x01(\x08R\x07nuclear\x12\x1e\n\npesticides\x18\x1f \x01(\x08R\npesticides\x12\x19\n\x08palm_oil\x18  \x01(\x08R\x07palmOil\x12\x12\n\x04\x63oal\x18! \x01(\x08R\x04\x63oal\x12\x18\n\x07tobacco\x18\" \x01(\x08R\x07tobacco\x12\x12\n\x04\x65tag\x18( \x01(\tR\x04\x65tag\x12!\n\x0cnot_modified\x18) \x01(\x08R\x0bnotModified\"4\n\x1aGetInsiderPurchasesRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\"d\n\x1bGetInsiderPurchasesResponse\x12\x45\n\x04rows\x18\x01 \x03(\x0b\x32\x31.yfinance_grpc.v1alpha1.InsiderPurchaseSummaryRowR\x04rows\"\xc3\x01\n\x19InsiderPurchaseSummaryRow\x12\x14\n\x05label\x18\x01 \x01(\tR\x05label\x12U\n\x06values\x18\x02 \x03(\x0b\x32=.yfinance_grpc.v1alpha1.InsiderPurchaseSummaryRow.ValuesEntryR\x06values\x1a\x39\n\x0bValuesEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n\x05value\x18\x02 \x01(\tR\x05value:\x02\x38\x01\"7\n\x1dGetInsiderTransactionsRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\"p\n\x1eGetInsiderTransactionsResponse\x12N\n\x0ctransactions\x18\x01 \x03(\x0b\x32*.yfinance_grpc.v1alpha1.InsiderTransactionR\x0ctransactions\"\xfb\x01\n\x12InsiderTransaction\x12\x39\n\nstart_date\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\tstartDate\x12\x18\n\x07insider\x18\x02 \x01(\tR\x07insider\x12\x1a\n\x08position\x18\x03 \x01(\tR\x08position\x12 \n\x0btransaction\x18\x04 \x01(\tR\x0btransaction\x12\x16\n\x06shares\x18\x05 \x01(\x03R\x06shares\x12\x14\n\x05value\x18\x06 \x01(\x01R\x05value\x12\x12\n\x04text\x18\x07 \x01(\tR\x04text\x12\x10\n\x03url\x18\x08 \x01(\tR\x03url\"8\n\x1eGetInsiderRosterHoldersRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\"h\n\x1fGetInsiderRosterHoldersResponse\x12\x45\n\x07holders\x18\x01 \x03(\x0b\x32+.yfinance_grpc.v1alpha1.InsiderRosterHolderR\x07holders\"\xe7\x01\n\x13InsiderRosterHolder\x12\x12\n\x04name\x18\x01 \x01(\tR\x04name\x12\x1a\n\x08position\x18\x02 \x01(\tR\x08position\x12\x10\n\x03url\x18\x03 \x01(\tR\x03url\x12R\n\x17most_recent_transaction\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x15mostRecentTransaction\x12:\n\x19latest_transaction_shares\x18\x05 \x01(\x03R\x17latestTransactionShares\"7\n\x1dGetAnalystPriceTargetsRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\"\x8c\x01\n\x1eGetAnalystPriceTargetsResponse\x12\x18\n\x07\x63urrent\x18\x01 \x01(\x01R\x07\x63urrent\x12\x10\n\x03low\x18\x02 \x01(\x01R\x03low\x12\x12\n\x04high\x18\x03 \x01(\x01R\x04high\x12\x12\n\x04mean\x18\x04 \x01(\x01R\x04mean\x12\x16\n\x06median\x18\x05 \x01(\x01R\x06median\":\n GetRecommendationsSummaryRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\"i\n!GetRecommendationsSummaryResponse\x12\x44\n\x04rows\x18\x01 \x03(\x0b\x32\x30.yfinance_grpc.v1alpha1.RecommendationSummaryRowR\x04rows\"\xac\x01\n\x18RecommendationSummaryRow\x12\x16\n\x06period\x18\x01 \x01(\tR\x06period\x12\x1d\n\nstrong_buy\x18\x02 \x01(\x05R\tstrongBuy\x12\x10\n\x03\x62uy\x18\x03 \x01(\x05R\x03\x62uy\x12\x12\n\x04hold\x18\x04 \x01(\x05R\x04hold\x12\x12\n\x04sell\x18\x05 \x01(\x05R\x04sell\x12\x1f\n\x0bstrong_sell\x18\x06 \x01(\x05R\nstrongSell\"4\n\x1aGetEarningsEstimateRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\"^\n\x1bGetEarningsEstimateResponse\x12?\n\x04rows\x18\x01 \x03(\x0b\x32+.yfinance_grpc.v1alpha1.EarningsEstimateRowR\x04rows\"\xcd\x01\n\x13\x45\x61rningsEstimateRow\x12\x16\n\x06period\x18\x01 \x01(\tR\x06period\x12,\n\x12number_of_analysts\x18\x02 \x01(\x05R\x10numberOfAnalysts\x12\x10\n\x03\x61vg\x18\x03 \x01(\x01R\x03\x61vg\x12\x10\n\x03low\x18\x04 \x01(\x01R\x03low\x12\x12\n\x04high\x18\x05 \x01(\x01R\x04high\x12 \n\x0cyear_ago_eps\x18\x06 \x01(\x01R\nyearAgoEps\x12\x16\n\x06growth\x18\x07 \x01(\x01R\x06growth\"3\n\x19GetRevenueEstimateRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\"\\\n\x1aGetRevenueEstimateResponse\x12>\n\x04rows\x18\x01 \x03(\x0b\x32*.yfinance_grpc.v1alpha1.RevenueEstimateRowR\x04rows\"\xd4\x01\n\x12RevenueEstimateRow\x12\x16\n\x06period\x18\x01 \x01(\tR\x06period\x12,\n\x12number_of_analysts\x18\x02 \x01(\x05R\x10numberOfAnalysts\x12\x10\n\x03\x61vg\x18\x03 \x01(\x01R\x03\x61vg\x12\x10\n\x03low\x18\x04 \x01(\x01R\x03low\x12\x12\n\x04high\x18\x05 \x01(\x01R\x04high\x12(\n\x10year_ago_revenue\x18\x06 \x01(\x01R\x0eyearAgoRevenue\x12\x16\n\x06growth\x18\x07 \x01(\x01R\x06growth\"3\n\x19GetEarningsHistoryRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\"\\\n\x1aGetEarningsHistoryResponse\x12>\n\x04rows\x18\x01 \x03(\x0b\x32*.yfinance_grpc.v1alpha1.EarningsHistoryRowR\x04rows\"\xd8\x01\n\x12\x45\x61rningsHistoryRow\x12.\n\x04\x64\x61te\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x04\x64\x61te\x12!\n\x0c\x65ps_estimate\x18\x02 \x01(\x01R\x0b\x65psEstimate\x12\x1d\n\neps_actual\x18\x03 \x01(\x01R\tepsActual\x12%\n\x0e\x65ps_difference\x18\x04 \x01(\x01R\repsDifference\x12)\n\x10surprise_percent\x18\x05 \x01(\x01R\x0fsurprisePercent\",\n\x12GetEpsTrendRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\"N\n\x13GetEpsTrendResponse\x12\x37\n\x04rows\x18\x01 \x03(\x0b\x32#.yfinance_grpc.v1alpha1.EpsTrendRowR\x04rows\"\xdb\x01\n\x0b\x45psTrendRow\x12\x16\n\x06period\x18\x01 \x01(\tR\x06period\x12\x18\n\x07\x63urrent\x18\x02 \x01(\x01R\x07\x63urrent\x12$\n\x0eseven_days_ago\x18\x03 \x01(\x01R\x0csevenDaysAgo\x12&\n\x0fthirty_days_ago\x18\x04 \x01(\x01R\rthirtyDaysAgo\x12$\n\x0esixty_days_ago\x18\x05 \x01(\x01R\x0csixtyDaysAgo\x12&\n\x0fninety_days_ago\x18\x06 \x01(\x01R\rninetyDaysAgo\"0\n\x16GetEpsRevisionsRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\"V\n\x17GetEpsRevisionsResponse\x12;\n\x04rows\x18\x01 \x03(\x0b\x32\'.yfinance_grpc.v1alpha1.EpsRevisionsRowR\x04rows\"\xc5\x01\n\x0f\x45psRevisionsRow\x12\x16\n\x06period\x18\x01 \x01(\tR\x06period\x12\"\n\rup_last_7days\x18\x02 \x01(\x05R\x0bupLast7days\x12$\n\x0eup_last_30days\x18\x03 \x01(\x05R\x0cupLast30days\x12&\n\x0f\x64own_last_7days\x18\x04 \x01(\x05R\rdownLast7days\x12(\n\x10\x64own_last_30days\x18\x05 \x01(\x05R\x0e\x64ownLast30days\"3\n\x19GetGrowthEstimatesRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\"\\\n\x1aGetGrowthEstimatesResponse\x12>\n\x04rows\x18\x01 \x03(\x0b\x32*.yfinance_grpc.v1alpha1.GrowthEstimatesRowR\x04rows\"\x8c\x01\n\x12GrowthEstimatesRow\x12\x16\n\x06period\x18\x01 \x01(\tR\x06period\x12\x14\n\x05stock\x18\x02 \x01(\x01R\x05stock\x12\x1a\n\x08industry\x18\x03 \x01(\x01R\x08industry\x12\x16\n\x06sector\x18\x04 \x01(\x01R\x06sector\x12\x14\n\x05index\x18\x05 \x01(\x01R\x05index\"V\n\x17GetEarningsDatesRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\x12\x19\n\x05limit\x18\x02 \x01(\x05H\x00R\x05limit\x88\x01\x01\x42\x08\n\x06_limit\"W\n\x18GetEarningsDatesResponse\x12;\n\x04rows\x18\x01 \x03(\x0b\x32\'.yfinance_grpc.v1alpha1.EarningsDateRowR\x04rows\"\xec\x01\n\x0f\x45\x61rningsDateRow\x12.\n\x04\x64\x61te\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x04\x64\x61te\x12&\n\x0c\x65ps_estimate\x18\x02 \x01(\x01H\x00R\x0b\x65psEstimate\x88\x01\x01\x12&\n\x0creported_eps\x18\x03 \x01(\x01H\x01R\x0breportedEps\x88\x01\x01\x12&\n\x0csurprise_pct\x18\x04 \x01(\x01H\x02R\x0bsurprisePct\x88\x01\x01\x42\x0f\n\r_eps_estimateB\x0f\n\r_reported_epsB\x0f\n\r_surprise_pct\"3\n\x19GetHistoryMetadataRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\"\xc1\x05\n\x1aGetHistoryMetadataResponse\x12\x1a\n\x08\x63urrency\x18\x01 \x01(\tR\x08\x63urrency\x12\x16\n\x06symbol\x18\x02 \x01(\tR\x06symbol\x12#\n\rexchange_name\x18\x03 \x01(\tR\x0c\x65xchangeName\x12,\n\x12\x66ull_exchange_name\x18\x04 \x01(\tR\x10\x66ullExchangeName\x12\'\n\x0finstrument_type\x18\x05 \x01(\tR\x0einstrumentType\x12(\n\x10\x66irst_trade_date\x18\x06 \x01(\x03R\x0e\x66irstTradeDate\x12.\n\x13regular_market_time\x18\x07 \x01(\x03R\x11regularMarketTime\x12\x36\n\x18has_pre_post_market_data\x18\x08 \x01(\x08R\x14hasPrePostMarketData\x12\x1d\n\ngmt_offset\x18\t \x01(\x05R\tgmtOffset\x12\x1a\n\x08timezone\x18\n \x01(\tR\x08timezone\x12\x34\n\x16\x65xchange_timezone_name\x18\x0b \x01(\tR\x14\x65xchangeTimezoneName\x12\x30\n\x14regular_market_price\x18\x0c \x01(\x01R\x12regularMarketPrice\x12-\n\x13\x66ifty_two_week_high\x18\r \x01(\x01R\x10\x66iftyTwoWeekHigh\x12+\n\x12\x66ifty_two_week_low\x18\x0e \x01(\x01R\x0f\x66iftyTwoWeekLow\x12)\n\x10\x64\x61ta_granularity\x18\x0f \x01(\tR\x0f\x64\x61taGranularity\x12\x14\n\x05range\x18\x10 \x01(\tR\x05range\x12!\n\x0cvalid_ranges\x18\x11 \x03(\tR\x0bvalidRanges\"R\n\x14GetSecFilingsRequest\x12\x16\n\x06ticker\x18\x01 \x01(\tR\x06ticker\x12\"\n\rif_none_match\x18\x02 \x01(\tR\x0bifNoneMatch\"\x8b\x01\n\x15GetSecFilingsResponse\x12;\n\x07\x66ilings\x18\x01 \x03(\x0b\x32!.yfinance_grpc.v1alpha1.SecFilingR\x07\x66ilings\x12\x12\n\x04\x65tag\x18\x02 \x01(\tR\x04\x65tag\x12!\n\x0cnot_modified\x18\x03 \x01(\x08R\x0bnotModified\"w\n\tSecFiling\x12.\n\x04\x64\x61te\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x04\x64\x61te\x12\x12\n\x04type\x18\x02 \x01(\tR\x04type\x12\x14\n\x05title\x18\x03 \x01(\tR\x05title\x12\x10\n\x03url\x18\x04 \x01(\tR\x03url\"2\n\x16SubscribeQuotesRequest\x12\x18\n\x07tickers\x18\x01 \x03(\tR\x07tickers\"\xea\x01\n\x05Quote\x12\x16\n\x06symbol\x18\x01 \x01(\tR\x06symbol\x12\x1d\n\nlast_price\x18\x02 \x01(\x01R\tlastPrice\x12%\n\x0eprevious_close\x18\x03 \x01(\x01R\rpreviousClose\x12\x12\n\x04open\x18\x04 \x01(\x01R\x04open\x12\x19\n\x08\x64\x61y_high\x18\x05 \x01(\x01R\x07\x64\x61yHigh\x12\x17\n\x07\x64\x61y_low\x18\x06 \x01(\x01R\x06\x64\x61yLow\x12\x1f\n\x0blast_volume\x18\x07 \x01(\x03R\nlastVolume\x12\x1a\n\x08\x63urrency\x18\x08 \x01(\tR\x08\x63urrency\"\x91\x01\n\x17SubscribeQuotesResponse\x12\x33\n\x05quote\x18\x01 \x01(\x0b\x32\x1d.yfinance_grpc.v1alpha1.QuoteR\x05quote\x12\x41\n\x0e\x63hanged_fields\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.FieldMaskR\rchangedFields\"\xae\x03\n\x0eSessionRequest\x12\x1d\n\nrequest_id\x18\x01 \x01(\tR\trequestId\x12<\n\x04info\x18\x02 \x01(\x0b\x32&.yfinance_grpc.v1alpha1.GetInfoRequestH\x00R\x04info\x12\x45\n\x07history\x18\x03 \x01(\x0b\x32).yfinance_grpc.v1alpha1.GetHistoryRequestH\x00R\x07history\x12R\n\x0coption_chain\x18\x04 \x01(\x0b\x32-.yfinance_grpc.v1alpha1.GetOptionChainRequestH\x00R\x0boptionChain\x12<\n\x04news\x18\x05 \x01(\x0b\x32&.yfinance_grpc.v1alpha1.GetNewsRequestH\x00R\x04news\x12?\n\x06\x63\x61ncel\x18\x06 \x01(\x0b\x32%.yfinance_grpc.v1alpha1.SessionCancelH\x00R\x06\x63\x61ncel\x12\x1a\n\x08priority\x18\x07 \x01(\x05R\x08priorityB\t\n\x07request\"\x0f\n\rSessionCancel\"\x95\x03\n\x0fSessionResponse\x12\x1d\n\nrequest_id\x18\x01 \x01(\tR\trequestId\x12=\n\x04info\x18\x02 \x01(\x0b\x32\'.yfinance_grpc.v1alpha1.GetInfoResponseH\x00R\x04info\x12\x46\n\x07history\x18\x03 \x01(\x0b\x32*.yfinance_grpc.v1alpha1.GetHistoryResponseH\x00R\x07history\x12S\n\x0coption_chain\x18\x04 \x01(\x0b\x32..yfinance_grpc.v1alpha1.GetOptionChainResponseH\x00R\x0boptionChain\x12=\n\x04news\x18\x05 \x01(\x0b\x32\'.yfinance_grpc.v1alpha1.GetNewsResponseH\x00R\x04news\x12<\n\x05\x65rror\x18\x06 \x01(\x0b\x32$.yfinance_grpc.v1alpha1.SessionErrorH\x00R\x05\x65rrorB\n\n\x08response\"<\n\x0cSessionError\x12\x12\n\x04\x63ode\x18\x01 \x01(\x05R\x04\x63ode\x12\x18\n\x07message\x18\x02 \x01(\tR\x07message*U\n\nInfoSource\x12\x1b\n\x17INFO_SOURCE_UNSPECIFIED\x10\x00\x12\x14\n\x10INFO_SOURCE_FULL\x10\x01\x12\x14\n\x10INFO_SOURCE_FAST\x10\x02*a\n\rInfoFreshness\x12\x1e\n\x1aINFO_FRESHNESS_UNSPECIFIED\x10\x00\x12\x17\n\x13INFO_FRESHNESS_FAST\x10\x01\x12\x17\n\x13INFO_FRESHNESS_FULL\x10\x02\x32\xa2$\n\rTickerService\x12Z\n\x07GetInfo\x12&.yfinance_grpc.v1alpha1.GetInfoRequest\x1a\'.yfinance_grpc.v1alpha1.GetInfoResponse\x12\x63\n\nGetHistory\x12).yfinance_grpc.v1alpha1.GetHistoryRequest\x1a*.yfinance_grpc.v1alpha1.GetHistoryResponse\x12i\n\x0cGetDividends\x12+.yfinance_grpc.v1alpha1.GetDividendsRequest\x1a,.yfinance_grpc.v1alpha1.GetDividendsResponse\x12`\n\tGetSplits\x12(.yfinance_grpc.v1alpha1.GetSplitsRequest\x1a).yfinance_grpc.v1alpha1.GetSplitsResponse\x12\x63\n\nGetActions\x12).yfinance_grpc.v1alpha1.GetActionsRequest\x1a*.yfinance_grpc.v1alpha1.GetActionsResponse\x12l\n\rGetFinancials\x12,.yfinance_grpc.v1alpha1.GetFinancialsRequest\x1a-.yfinance_grpc.v1alpha1.GetFinancialsResponse\x12r\n\x0fGetBalanceSheet\x12..yfinance_grpc.v1alpha1.GetBalanceSheetRequest\x1a/.yfinance_grpc.v1alpha1.GetBalanceSheetResponse\x12\x66\n\x0bGetCashFlow\x12*.yfinance_grpc.v1alpha1.GetCashFlowRequest\x1a+.yfinance_grpc.v1alpha1.GetCashFlowResponse\x12\x66\n\x0bGetEarnings\x12*.yfinance_grpc.v1alpha1.GetEarningsRequest\x1a+.yfinance_grpc.v1alpha1.GetEarningsResponse\x12{\n\x12GetRecommendations\x12\x31.yfinance_grpc.v1alpha1.GetRecommendationsRequest\x1a\x32.yfinance_grpc.v1alpha1.GetRecommendationsResponse\x12\x63\n\nGetOptions\x12).yfinance_grpc.v1alpha1.GetOptionsRequest\x1a*.yfinance_grpc.v1alpha1.GetOptionsResponse\x12o\n\x0eGetOptionChain\x12-.yfinance_grpc.v1alpha1.GetOptionChainRequest\x1a..yfinance_grpc.v1alpha1.GetOptionChainResponse\x12\x66\n\x0bGetCalendar\x12*.yfinance_grpc.v1alpha1.GetCalendarRequest\x1a+.yfinance_grpc.v1alpha1.GetCalendarResponse\x12Z\n\x07GetNews\x12&.yfinance_grpc.v1alpha1.GetNewsRequest\x1a\'.yfinance_grpc.v1alpha1.GetNewsResponse\x12r\n\x0fGetMajorHolders\x12..yfinance_grpc.v1alpha1.GetMajorHoldersRequest\x1a/.yfinance_grpc.v1alpha1.GetMajorHoldersResponse\x12\x8a\x01\n\x17GetInstitutionalHolders\x12\x36.yfinance_grpc.v1alpha1.GetInstitutionalHoldersRequest\x1a\x37.yfinance_grpc.v1alpha1.GetInstitutionalHoldersResponse\x12\x81\x01\n\x14GetMutualFundHolders\x12\x33.yfinance_grpc.v1alpha1.GetMutualFundHoldersRequest\x1a\x34.yfinance_grpc.v1alpha1.GetMutualFundHoldersResponse\x12r\n\x0fGetMultipleInfo\x12..yfinance_grpc.v1alpha1.GetMultipleInfoRequest\x1a/.yfinance_grpc.v1alpha1.GetMultipleInfoResponse\x12t\n\x0f\x44ownloadHistory\x12..yfinance_grpc.v1alpha1.DownloadHistoryRequest\x1a/.yfinance_grpc.v1alpha1.DownloadHistoryResponse0\x01\x12r\n\x0fGetCapitalGains\x12..yfinance_grpc.v1alpha1.GetCapitalGainsRequest\x1a/.yfinance_grpc.v1alpha1.GetCapitalGainsResponse\x12u\n\x10GetSharesHistory\x12/.yfinance_grpc.v1alpha1.GetSharesHistoryRequest\x1a\x30.yfinance_grpc.v1alpha1.GetSharesHistoryResponse\x12Z\n\x07GetIsin\x12&.yfinance_grpc.v1alpha1.GetIsinRequest\x1a\'.yfinance_grpc.v1alpha1.GetIsinResponse\x12\x66\n\x0bGetFastInfo\x12*.yfinance_grpc.v1alpha1.GetFastInfoRequest\x1a+.yfinance_grpc.v1alpha1.GetFastInfoResponse\x12x\n\x11GetSustainability\x12\x30.yfinance_grpc.v1alpha1.GetSustainabilityRequest\x1a\x31.yfinance_grpc.v1alpha1.GetSustainabilityResponse\x12~\n\x13GetInsiderPurchases\x12\x32.yfinance_grpc.v1alpha1.GetInsiderPurchasesRequest\x1a\x33.yfinance_grpc.v1alpha1.GetInsiderPurchasesResponse\x12\x87\x01\n\x16GetInsiderTransactions\x12\x35.yfinance_grpc.v1alpha1.GetInsiderTransactionsRequest\x1a\x36.yfinance_grpc.v1alpha1.GetInsiderTransactionsResponse\x12\x8a\x01\n\x17GetInsiderRosterHolders\x12\x36.yfinance_grpc.v1alpha1.GetInsiderRosterHoldersRequest\x1a\x37.yfinance_grpc.v1alpha1.GetInsiderRosterHoldersResponse\x12\x87\x01\n\x16GetAnalystPriceTargets\x12\x35.yfinance_grpc.v1alpha1.GetAnalystPriceTargetsRequest\x1a\x36.yfinance_grpc.v1alpha1.GetAnalystPriceTargetsResponse\x12\x90\x01\n\x19GetRecommendationsSummary\x12\x38.yfinance_grpc.v1alpha1.GetRecommendationsSummaryRequest\x1a\x39.yfinance_grpc.v1alpha1.GetRecommendationsSummaryResponse\x12~\n\x13GetEarningsEstimate\x12\x32.yfinance_grpc.v1alpha1.GetEarningsEstimateRequest\x1a\x33.yfinance_grpc.v1alpha1.GetEarningsEstimateResponse\x12{\n\x12GetRevenueEstimate\x12\x31.yfinance_grpc.v1alpha1.GetRevenueEstimateRequest\x1a\x32.yfinance_grpc.v1alpha1.GetRevenueEstimateResponse\x12{\n\x12GetEarningsHistory\x12\x31.yfinance_grpc.v1alpha1.GetEarningsHistoryRequest\x1a\x32.yfinance_grpc.v1alpha1.GetEarningsHistoryResponse\x12\x66\n\x0bGetEpsTrend\x12*.yfinance_grpc.v1alpha1.GetEpsTrendRequest\x1a+.yfinance_grpc.v1alpha1.GetEpsTrendResponse\x12r\n\x0fGetEpsRevisions\x12..yfinance_grpc.v1alpha1.GetEpsRevisionsRequest\x1a/.yfinance_grpc.v1alpha1.GetEpsRevisionsResponse\x12{\n\x12GetGrowthEstimates\x12\x31.yfinance_grpc.v1alpha1.GetGrowthEstimatesRequest\x1a\x32.yfinance_grpc.v1alpha1.GetGrowthEstimatesResponse\x12u\n\x10GetEarningsDates\x12/.yfinance_grpc.v1alpha1.GetEarningsDatesRequest\x1a\x30.yfinance_grpc.v1alpha1.GetEarningsDatesResponse\x12{\n\x12GetHistoryMetadata\x12\x31.yfinance_grpc.v1alpha1.GetHistoryMetadataRequest\x1a\x32.yfinance_grpc.v1alpha1.GetHistoryMetadataResponse\x12l\n\rGetSecFilings\x12,.yfinance_grpc.v1alpha1.GetSecFilingsRequest\x1a-.yfinance_grpc.v1alpha1.GetSecFilingsResponse\x12t\n\x0fSubscribeQuotes\x12..yfinance_grpc.v1alpha1.SubscribeQuotesRequest\x1a/.yfinance_grpc.v1alpha1.SubscribeQuotesResponse0\x01\x12^\n\x07Session\x12&.yfinance_grpc.v1alpha1.SessionRequest\x1a\'.yfinance_grpc.v1alpha1.SessionResponse(\x01\x30\x01\x42\xf6\x01\n\x1a\x63om.yfinance_grpc.v1alpha1B\x0bTickerProtoP\x01ZVgithub.com/idebeijer/yfinance-grpc/gen/go/yfinance_grpc/v1alpha1;yfinance_grpcv1alpha1\xa2\x02\x03YXX\xaa\x02\x15YfinanceGrpc.V1alpha1\xca\x02\x15YfinanceGrpc\\V1alpha1\xe2\x02!YfinanceGrpc\\V1alpha1\\GPBMetadata\xea\x02\x16YfinanceGrpc::V1alpha1b\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -45,234 +46,252 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_GETMULTIPLEINFORESPONSE_INFOENTRY']._serialized_options = b'8\001'
   _globals['_INSIDERPURCHASESUMMARYROW_VALUESENTRY']._loaded_options = None
   _globals['_INSIDERPURCHASESUMMARYROW_VALUESENTRY']._serialized_options = b'8\001'
-  _globals['_GETINFOREQUEST']._serialized_start=96
-  _globals['_GETINFOREQUEST']._serialized_end=136
-  _globals['_GETINFORESPONSE']._serialized_start=138
-  _globals['_GETINFORESPONSE']._serialized_end=211
-  _globals['_TICKERINFO']._serialized_start=214
-  _globals['_TICKERINFO']._serialized_end=2756
-  _globals['_GETHISTORYREQUEST']._serialized_start=2759
-  _globals['_GETHISTORYREQUEST']._serialized_end=3314
-  _globals['_GETHISTORYRESPONSE']._serialized_start=3316
-  _globals['_GETHISTORYRESPONSE']._serialized_end=3392
-  _globals['_HISTORYROW']._serialized_start=3395
-  _globals['_HISTORYROW']._serialized_end=3725
-  _globals['_GETDIVIDENDSREQUEST']._serialized_start=3727
-  _globals['_GETDIVIDENDSREQUEST']._serialized_end=3812
-  _globals['_GETDIVIDENDSRESPONSE']._serialized_start=3814
-  _globals['_GETDIVIDENDSRESPONSE']._serialized_end=3893
-  _globals['_DIVIDENDROW']._serialized_start=3895
-  _globals['_DIVIDENDROW']._serialized_end=3980
-  _globals['_GETSPLITSREQUEST']._serialized_start=3982
-  _globals['_GETSPLITSREQUEST']._serialized_end=4064
-  _globals['_GETSPLITSRESPONSE']._serialized_start=4066
-  _globals['_GETSPLITSRESPONSE']._serialized_end=4139
-  _globals['_SPLITROW']._serialized_start=4141
-  _globals['_SPLITROW']._serialized_end=4221
-  _globals['_GETACTIONSREQUEST']._serialized_start=4223
-  _globals['_GETACTIONSREQUEST']._serialized_end=4306
-  _globals['_GETACTIONSRESPONSE']._serialized_start=4308
-  _globals['_GETACTIONSRESPONSE']._serialized_end=4383
-  _globals['_ACTIONROW']._serialized_start=4386
-  _globals['_ACTIONROW']._serialized_end=4611
-  _globals['_GETFINANCIALSREQUEST']._serialized_start=4613
-  _globals['_GETFINANCIALSREQUEST']._serialized_end=4728
-  _globals['_GETFINANCIALSRESPONSE']._serialized_start=4730
-  _globals['_GETFINANCIALSRESPONSE']._serialized_end=4829
-  _globals['_FINANCIALSTATEMENT']._serialized_start=4832
-  _globals['_FINANCIALSTATEMENT']._serialized_end=5039
-  _globals['_FINANCIALSTATEMENT_VALUESENTRY']._serialized_start=4982
-  _globals['_FINANCIALSTATEMENT_VALUESENTRY']._serialized_end=5039
-  _globals['_GETBALANCESHEETREQUEST']._serialized_start=5041
-  _globals['_GETBALANCESHEETREQUEST']._serialized_end=5158
-  _globals['_GETBALANCESHEETRESPONSE']._serialized_start=5160
-  _globals['_GETBALANCESHEETRESPONSE']._serialized_end=5264
-  _globals['_BALANCESHEETSTATEMENT']._serialized_start=5267
-  _globals['_BALANCESHEETSTATEMENT']._serialized_end=5480
-  _globals['_BALANCESHEETSTATEMENT_VALUESENTRY']._serialized_start=4982
-  _globals['_BALANCESHEETSTATEMENT_VALUESENTRY']._serialized_end=5039
-  _globals['_GETCASHFLOWREQUEST']._serialized_start=5482
-  _globals['_GETCASHFLOWREQUEST']._serialized_end=5595
-  _globals['_GETCASHFLOWRESPONSE']._serialized_start=5597
-  _globals['_GETCASHFLOWRESPONSE']._serialized_end=5693
-  _globals['_CASHFLOWSTATEMENT']._serialized_start=5696
-  _globals['_CASHFLOWSTATEMENT']._serialized_end=5901
-  _globals['_CASHFLOWSTATEMENT_VALUESENTRY']._serialized_start=4982
-  _globals['_CASHFLOWSTATEMENT_VALUESENTRY']._serialized_end=5039
-  _globals['_GETEARNINGSREQUEST']._serialized_start=5903
-  _globals['_GETEARNINGSREQUEST']._serialized_end=5992
-  _globals['_GETEARNINGSRESPONSE']._serialized_start=5994
-  _globals['_GETEARNINGSRESPONSE']._serialized_end=6072
-  _globals['_EARNINGSROW']._serialized_start=6075
-  _globals['_EARNINGSROW']._serialized_end=6225
-  _globals['_GETRECOMMENDATIONSREQUEST']._serialized_start=6227
-  _globals['_GETRECOMMENDATIONSREQUEST']._serialized_end=6278
-  _globals['_GETRECOMMENDATIONSRESPONSE']._serialized_start=6280
-  _globals['_GETRECOMMENDATIONSRESPONSE']._serialized_end=6371
-  _globals['_RECOMMENDATIONROW']._serialized_start=6374
-  _globals['_RECOMMENDATIONROW']._serialized_end=6543
-  _globals['_GETOPTIONSREQUEST']._serialized_start=6545
-  _globals['_GETOPTIONSREQUEST']._serialized_end=6588
-  _globals['_GETOPTIONSRESPONSE']._serialized_start=6590
-  _globals['_GETOPTIONSRESPONSE']._serialized_end=6653
-  _globals['_GETOPTIONCHAINREQUEST']._serialized_start=6655
-  _globals['_GETOPTIONCHAINREQUEST']._serialized_end=6764
-  _globals['_GETOPTIONCHAINRESPONSE']._serialized_start=6767
-  _globals['_GETOPTIONCHAINRESPONSE']._serialized_end=6913
-  _globals['_OPTIONCONTRACT']._serialized_start=6916
-  _globals['_OPTIONCONTRACT']._serialized_end=7402
-  _globals['_GETCALENDARREQUEST']._serialized_start=7404
-  _globals['_GETCALENDARREQUEST']._serialized_end=7448
-  _globals['_GETCALENDARRESPONSE']._serialized_start=7451
-  _globals['_GETCALENDARRESPONSE']._serialized_end=7725
-  _globals['_EARNINGSDATE']._serialized_start=7728
-  _globals['_EARNINGSDATE']._serialized_end=7866
-  _globals['_DIVIDENDDATE']._serialized_start=7868
-  _globals['_DIVIDENDDATE']._serialized_end=7944
-  _globals['_CALENDAREVENT']._serialized_start=7947
-  _globals['_CALENDAREVENT']._serialized_end=8075
-  _globals['_GETNEWSREQUEST']._serialized_start=8077
-  _globals['_GETNEWSREQUEST']._serialized_end=8139
-  _globals['_GETNEWSRESPONSE']._serialized_start=8141
-  _globals['_GETNEWSRESPONSE']._serialized_end=8223
-  _globals['_NEWSARTICLE']._serialized_start=8226
-  _globals['_NEWSARTICLE']._serialized_end=8521
-  _globals['_GETMAJORHOLDERSREQUEST']._serialized_start=8523
-  _globals['_GETMAJORHOLDERSREQUEST']._serialized_end=8571
-  _globals['_GETMAJORHOLDERSRESPONSE']._serialized_start=8574
-  _globals['_GETMAJORHOLDERSRESPONSE']._serialized_end=8747
-  _globals['_GETMAJORHOLDERSRESPONSE_HOLDERSENTRY']._serialized_start=8689
-  _globals['_GETMAJORHOLDERSRESPONSE_HOLDERSENTRY']._serialized_end=8747
-  _globals['_GETINSTITUTIONALHOLDERSREQUEST']._serialized_start=8749
-  _globals['_GETINSTITUTIONALHOLDERSREQUEST']._serialized_end=8805
-  _globals['_GETINSTITUTIONALHOLDERSRESPONSE']._serialized_start=8807
-  _globals['_GETINSTITUTIONALHOLDERSRESPONSE']._serialized_end=8911
-  _globals['_INSTITUTIONALHOLDER']._serialized_start=8914
-  _globals['_INSTITUTIONALHOLDER']._serialized_end=9095
-  _globals['_GETMUTUALFUNDHOLDERSREQUEST']._serialized_start=9097
-  _globals['_GETMUTUALFUNDHOLDERSREQUEST']._serialized_end=9150
-  _globals['_GETMUTUALFUNDHOLDERSRESPONSE']._serialized_start=9152
-  _globals['_GETMUTUALFUNDHOLDERSRESPONSE']._serialized_end=9250
-  _globals['_MUTUALFUNDHOLDER']._serialized_start=9253
-  _globals['_MUTUALFUNDHOLDER']._serialized_end=9431
-  _globals['_GETMULTIPLEINFOREQUEST']._serialized_start=9433
-  _globals['_GETMULTIPLEINFOREQUEST']._serialized_end=9483
-  _globals['_GETMULTIPLEINFORESPONSE']._serialized_start=9486
-  _globals['_GETMULTIPLEINFORESPONSE']._serialized_end=9683
-  _globals['_GETMULTIPLEINFORESPONSE_INFOENTRY']._serialized_start=9592
-  _globals['_GETMULTIPLEINFORESPONSE_INFOENTRY']._serialized_end=9683
-  _globals['_DOWNLOADHISTORYREQUEST']._serialized_start=9686
-  _globals['_DOWNLOADHISTORYREQUEST']._serialized_end=10000
-  _globals['_DOWNLOADHISTORYRESPONSE']._serialized_start=10002
-  _globals['_DOWNLOADHISTORYRESPONSE']._serialized_end=10107
-  _globals['_GETCAPITALGAINSREQUEST']._serialized_start=10109
-  _globals['_GETCAPITALGAINSREQUEST']._serialized_end=10197
-  _globals['_GETCAPITALGAINSRESPONSE']._serialized_start=10199
-  _globals['_GETCAPITALGAINSRESPONSE']._serialized_end=10285
-  _globals['_CAPITALGAINSROW']._serialized_start=10287
-  _globals['_CAPITALGAINSROW']._serialized_end=10376
-  _globals['_GETSHARESHISTORYREQUEST']._serialized_start=10379
-  _globals['_GETSHARESHISTORYREQUEST']._serialized_end=10552
-  _globals['_GETSHARESHISTORYRESPONSE']._serialized_start=10554
-  _globals['_GETSHARESHISTORYRESPONSE']._serialized_end=10642
-  _globals['_SHARESHISTORYROW']._serialized_start=10644
-  _globals['_SHARESHISTORYROW']._serialized_end=10734
-  _globals['_GETISINREQUEST']._serialized_start=10736
-  _globals['_GETISINREQUEST']._serialized_end=10776
-  _globals['_GETISINRESPONSE']._serialized_start=10778
-  _globals['_GETISINRESPONSE']._serialized_end=10815
-  _globals['_GETFASTINFOREQUEST']._serialized_start=10817
-  _globals['_GETFASTINFOREQUEST']._serialized_end=10861
-  _globals['_GETFASTINFORESPONSE']._serialized_start=10863
-  _globals['_GETFASTINFORESPONSE']._serialized_end=10938
-  _globals['_FASTINFO']._serialized_start=10941
-  _globals['_FASTINFO']._serialized_end=11829
-  _globals['_GETSUSTAINABILITYREQUEST']._serialized_start=11831
-  _globals['_GETSUSTAINABILITYREQUEST']._serialized_end=11881
-  _globals['_GETSUSTAINABILITYRESPONSE']._serialized_start=11884
-  _globals['_GETSUSTAINABILITYRESPONSE']._serialized_end=12625
-  _globals['_GETINSIDERPURCHASESREQUEST']._serialized_start=12627
-  _globals['_GETINSIDERPURCHASESREQUEST']._serialized_end=12679
-  _globals['_GETINSIDERPURCHASESRESPONSE']._serialized_start=12681
-  _globals['_GETINSIDERPURCHASESRESPONSE']._serialized_end=12781
-  _globals['_INSIDERPURCHASESUMMARYROW']._serialized_start=12784
-  _globals['_INSIDERPURCHASESUMMARYROW']._serialized_end=12979
-  _globals['_INSIDERPURCHASESUMMARYROW_VALUESENTRY']._serialized_start=12922
-  _globals['_INSIDERPURCHASESUMMARYROW_VALUESENTRY']._serialized_end=12979
-  _globals['_GETINSIDERTRANSACTIONSREQUEST']._serialized_start=12981
-  _globals['_GETINSIDERTRANSACTIONSREQUEST']._serialized_end=13036
-  _globals['_GETINSIDERTRANSACTIONSRESPONSE']._serialized_start=13038
-  _globals['_GETINSIDERTRANSACTIONSRESPONSE']._serialized_end=13150
-  _globals['_INSIDERTRANSACTION']._serialized_start=13153
-  _globals['_INSIDERTRANSACTION']._serialized_end=13404
-  _globals['_GETINSIDERROSTERHOLDERSREQUEST']._serialized_start=13406
-  _globals['_GETINSIDERROSTERHOLDERSREQUEST']._serialized_end=13462
-  _globals['_GETINSIDERROSTERHOLDERSRESPONSE']._serialized_start=13464
-  _globals['_GETINSIDERROSTERHOLDERSRESPONSE']._serialized_end=13568
-  _globals['_INSIDERROSTERHOLDER']._serialized_start=13571
-  _globals['_INSIDERROSTERHOLDER']._serialized_end=13802
-  _globals['_GETANALYSTPRICETARGETSREQUEST']._serialized_start=13804
-  _globals['_GETANALYSTPRICETARGETSREQUEST']._serialized_end=13859
-  _globals['_GETANALYSTPRICETARGETSRESPONSE']._serialized_start=13862
-  _globals['_GETANALYSTPRICETARGETSRESPONSE']._serialized_end=14002
-  _globals['_GETRECOMMENDATIONSSUMMARYREQUEST']._serialized_start=14004
-  _globals['_GETRECOMMENDATIONSSUMMARYREQUEST']._serialized_end=14062
-  _globals['_GETRECOMMENDATIONSSUMMARYRESPONSE']._serialized_start=14064
-  _globals['_GETRECOMMENDATIONSSUMMARYRESPONSE']._serialized_end=14169
-  _globals['_RECOMMENDATIONSUMMARYROW']._serialized_start=14172
-  _globals['_RECOMMENDATIONSUMMARYROW']._serialized_end=14344
-  _globals['_GETEARNINGSESTIMATEREQUEST']._serialized_start=14346
-  _globals['_GETEARNINGSESTIMATEREQUEST']._serialized_end=14398
-  _globals['_GETEARNINGSESTIMATERESPONSE']._serialized_start=14400
-  _globals['_GETEARNINGSESTIMATERESPONSE']._serialized_end=14494
-  _globals['_EARNINGSESTIMATEROW']._serialized_start=14497
-  _globals['_EARNINGSESTIMATEROW']._serialized_end=14702
-  _globals['_GETREVENUEESTIMATEREQUEST']._serialized_start=14704
-  _globals['_GETREVENUEESTIMATEREQUEST']._serialized_end=14755
-  _globals['_GETREVENUEESTIMATERESPONSE']._serialized_start=14757
-  _globals['_GETREVENUEESTIMATERESPONSE']._serialized_end=14849
-  _globals['_REVENUEESTIMATEROW']._serialized_start=14852
-  _globals['_REVENUEESTIMATEROW']._serialized_end=15064
-  _globals['_GETEARNINGSHISTORYREQUEST']._serialized_start=15066
-  _globals['_GETEARNINGSHISTORYREQUEST']._serialized_end=15117
-  _globals['_GETEARNINGSHISTORYRESPONSE']._serialized_start=15119
-  _globals['_GETEARNINGSHISTORYRESPONSE']._serialized_end=15211
-  _globals['_EARNINGSHISTORYROW']._serialized_start=15214
-  _globals['_EARNINGSHISTORYROW']._serialized_end=15430
-  _globals['_GETEPSTRENDREQUEST']._serialized_start=15432
-  _globals['_GETEPSTRENDREQUEST']._serialized_end=15476
-  _globals['_GETEPSTRENDRESPONSE']._serialized_start=15478
-  _globals['_GETEPSTRENDRESPONSE']._serialized_end=15556
-  _globals['_EPSTRENDROW']._serialized_start=15559
-  _globals['_EPSTRENDROW']._serialized_end=15778
-  _globals['_GETEPSREVISIONSREQUEST']._serialized_start=15780
-  _globals['_GETEPSREVISIONSREQUEST']._serialized_end=15828
-  _globals['_GETEPSREVISIONSRESPONSE']._serialized_start=15830
-  _globals['_GETEPSREVISIONSRESPONSE']._serialized_end=15916
-  _globals['_EPSREVISIONSROW']._serialized_start=15919
-  _globals['_EPSREVISIONSROW']._serialized_end=16116
-  _globals['_GETGROWTHESTIMATESREQUEST']._serialized_start=16118
-  _globals['_GETGROWTHESTIMATESREQUEST']._serialized_end=16169
-  _globals['_GETGROWTHESTIMATESRESPONSE']._serialized_start=16171
-  _globals['_GETGROWTHESTIMATESRESPONSE']._serialized_end=16263
-  _globals['_GROWTHESTIMATESROW']._serialized_start=16266
-  _globals['_GROWTHESTIMATESROW']._serialized_end=16406
-  _globals['_GETEARNINGSDATESREQUEST']._serialized_start=16408
-  _globals['_GETEARNINGSDATESREQUEST']._serialized_end=16494
-  _globals['_GETEARNINGSDATESRESPONSE']._serialized_start=16496
-  _globals['_GETEARNINGSDATESRESPONSE']._serialized_end=16583
-  _globals['_EARNINGSDATEROW']._serialized_start=16586
-  _globals['_EARNINGSDATEROW']._serialized_end=16822
-  _globals['_GETHISTORYMETADATAREQUEST']._serialized_start=16824
-  _globals['_GETHISTORYMETADATAREQUEST']._serialized_end=16875
-  _globals['_GETHISTORYMETADATARESPONSE']._serialized_start=16878
-  _globals['_GETHISTORYMETADATARESPONSE']._serialized_end=17583
-  _globals['_GETSECFILINGSREQUEST']._serialized_start=17585
-  _globals['_GETSECFILINGSREQUEST']._serialized_end=17631
-  _globals['_GETSECFILINGSRESPONSE']._serialized_start=17633
-  _globals['_GETSECFILINGSRESPONSE']._serialized_end=17717
-  _globals['_SECFILING']._serialized_start=17719
-  _globals['_SECFILING']._serialized_end=17838
-  _globals['_TICKERSERVICE']._serialized_start=17841
-  _globals['_TICKERSERVICE']._serialized_end=22269
+  _globals['_INFOSOURCE']._serialized_start=19974
+  _globals['_INFOSOURCE']._serialized_end=20059
+  _globals['_INFOFRESHNESS']._serialized_start=20061
+  _globals['_INFOFRESHNESS']._serialized_end=20158
+  _globals['_GETINFOREQUEST']._serialized_start=131
+  _globals['_GETINFOREQUEST']._serialized_end=297
+  _globals['_GETINFORESPONSE']._serialized_start=300
+  _globals['_GETINFORESPONSE']._serialized_end=433
+  _globals['_TICKERINFO']._serialized_start=436
+  _globals['_TICKERINFO']._serialized_end=2978
+  _globals['_GETHISTORYREQUEST']._serialized_start=2981
+  _globals['_GETHISTORYREQUEST']._serialized_end=3536
+  _globals['_GETHISTORYRESPONSE']._serialized_start=3538
+  _globals['_GETHISTORYRESPONSE']._serialized_end=3614
+  _globals['_HISTORYROW']._serialized_start=3617
+  _globals['_HISTORYROW']._serialized_end=3947
+  _globals['_GETDIVIDENDSREQUEST']._serialized_start=3949
+  _globals['_GETDIVIDENDSREQUEST']._serialized_end=4034
+  _globals['_GETDIVIDENDSRESPONSE']._serialized_start=4036
+  _globals['_GETDIVIDENDSRESPONSE']._serialized_end=4115
+  _globals['_DIVIDENDROW']._serialized_start=4117
+  _globals['_DIVIDENDROW']._serialized_end=4202
+  _globals['_GETSPLITSREQUEST']._serialized_start=4204
+  _globals['_GETSPLITSREQUEST']._serialized_end=4286
+  _globals['_GETSPLITSRESPONSE']._serialized_start=4288
+  _globals['_GETSPLITSRESPONSE']._serialized_end=4361
+  _globals['_SPLITROW']._serialized_start=4363
+  _globals['_SPLITROW']._serialized_end=4443
+  _globals['_GETACTIONSREQUEST']._serialized_start=4445
+  _globals['_GETACTIONSREQUEST']._serialized_end=4528
+  _globals['_GETACTIONSRESPONSE']._serialized_start=4530
+  _globals['_GETACTIONSRESPONSE']._serialized_end=4605
+  _globals['_ACTIONROW']._serialized_start=4608
+  _globals['_ACTIONROW']._serialized_end=4833
+  _globals['_GETFINANCIALSREQUEST']._serialized_start=4836
+  _globals['_GETFINANCIALSREQUEST']._serialized_end=4987
+  _globals['_GETFINANCIALSRESPONSE']._serialized_start=4990
+  _globals['_GETFINANCIALSRESPONSE']._serialized_end=5144
+  _globals['_FINANCIALSTATEMENT']._serialized_start=5147
+  _globals['_FINANCIALSTATEMENT']._serialized_end=5354
+  _globals['_FINANCIALSTATEMENT_VALUESENTRY']._serialized_start=5297
+  _globals['_FINANCIALSTATEMENT_VALUESENTRY']._serialized_end=5354
+  _globals['_GETBALANCESHEETREQUEST']._serialized_start=5356
+  _globals['_GETBALANCESHEETREQUEST']._serialized_end=5473
+  _globals['_GETBALANCESHEETRESPONSE']._serialized_start=5475
+  _globals['_GETBALANCESHEETRESPONSE']._serialized_end=5579
+  _globals['_BALANCESHEETSTATEMENT']._serialized_start=5582
+  _globals['_BALANCESHEETSTATEMENT']._serialized_end=5795
+  _globals['_BALANCESHEETSTATEMENT_VALUESENTRY']._serialized_start=5297
+  _globals['_BALANCESHEETSTATEMENT_VALUESENTRY']._serialized_end=5354
+  _globals['_GETCASHFLOWREQUEST']._serialized_start=5797
+  _globals['_GETCASHFLOWREQUEST']._serialized_end=5910
+  _globals['_GETCASHFLOWRESPONSE']._serialized_start=5912
+  _globals['_GETCASHFLOWRESPONSE']._serialized_end=6008
+  _globals['_CASHFLOWSTATEMENT']._serialized_start=6011
+  _globals['_CASHFLOWSTATEMENT']._serialized_end=6216
+  _globals['_CASHFLOWSTATEMENT_VALUESENTRY']._serialized_start=5297
+  _globals['_CASHFLOWSTATEMENT_VALUESENTRY']._serialized_end=5354
+  _globals['_GETEARNINGSREQUEST']._serialized_start=6218
+  _globals['_GETEARNINGSREQUEST']._serialized_end=6307
+  _globals['_GETEARNINGSRESPONSE']._serialized_start=6309
+  _globals['_GETEARNINGSRESPONSE']._serialized_end=6387
+  _globals['_EARNINGSROW']._serialized_start=6390
+  _globals['_EARNINGSROW']._serialized_end=6540
+  _globals['_GETRECOMMENDATIONSREQUEST']._serialized_start=6542
+  _globals['_GETRECOMMENDATIONSREQUEST']._serialized_end=6593
+  _globals['_GETRECOMMENDATIONSRESPONSE']._serialized_start=6595
+  _globals['_GETRECOMMENDATIONSRESPONSE']._serialized_end=6686
+  _globals['_RECOMMENDATIONROW']._serialized_start=6689
+  _globals['_RECOMMENDATIONROW']._serialized_end=6858
+  _globals['_GETOPTIONSREQUEST']._serialized_start=6860
+  _globals['_GETOPTIONSREQUEST']._serialized_end=6903
+  _globals['_GETOPTIONSRESPONSE']._serialized_start=6905
+  _globals['_GETOPTIONSRESPONSE']._serialized_end=6968
+  _globals['_GETOPTIONCHAINREQUEST']._serialized_start=6970
+  _globals['_GETOPTIONCHAINREQUEST']._serialized_end=7079
+  _globals['_GETOPTIONCHAINRESPONSE']._serialized_start=7082
+  _globals['_GETOPTIONCHAINRESPONSE']._serialized_end=7228
+  _globals['_OPTIONCONTRACT']._serialized_start=7231
+  _globals['_OPTIONCONTRACT']._serialized_end=7717
+  _globals['_GETCALENDARREQUEST']._serialized_start=7719
+  _globals['_GETCALENDARREQUEST']._serialized_end=7763
+  _globals['_GETCALENDARRESPONSE']._serialized_start=7766
+  _globals['_GETCALENDARRESPONSE']._serialized_end=8040
+  _globals['_EARNINGSDATE']._serialized_start=8043
+  _globals['_EARNINGSDATE']._serialized_end=8181
+  _globals['_DIVIDENDDATE']._serialized_start=8183
+  _globals['_DIVIDENDDATE']._serialized_end=8259
+  _globals['_CALENDAREVENT']._serialized_start=8262
+  _globals['_CALENDAREVENT']._serialized_end=8390
+  _globals['_GETNEWSREQUEST']._serialized_start=8392
+  _globals['_GETNEWSREQUEST']._serialized_end=8454
+  _globals['_GETNEWSRESPONSE']._serialized_start=8456
+  _globals['_GETNEWSRESPONSE']._serialized_end=8538
+  _globals['_NEWSARTICLE']._serialized_start=8541
+  _globals['_NEWSARTICLE']._serialized_end=8836
+  _globals['_GETMAJORHOLDERSREQUEST']._serialized_start=8838
+  _globals['_GETMAJORHOLDERSREQUEST']._serialized_end=8886
+  _globals['_GETMAJORHOLDERSRESPONSE']._serialized_start=8889
+  _globals['_GETMAJORHOLDERSRESPONSE']._serialized_end=9062
+  _globals['_GETMAJORHOLDERSRESPONSE_HOLDERSENTRY']._serialized_start=9004
+  _globals['_GETMAJORHOLDERSRESPONSE_HOLDERSENTRY']._serialized_end=9062
+  _globals['_GETINSTITUTIONALHOLDERSREQUEST']._serialized_start=9064
+  _globals['_GETINSTITUTIONALHOLDERSREQUEST']._serialized_end=9156
+  _globals['_GETINSTITUTIONALHOLDERSRESPONSE']._serialized_start=9159
+  _globals['_GETINSTITUTIONALHOLDERSRESPONSE']._serialized_end=9318
+  _globals['_INSTITUTIONALHOLDER']._serialized_start=9321
+  _globals['_INSTITUTIONALHOLDER']._serialized_end=9502
+  _globals['_GETMUTUALFUNDHOLDERSREQUEST']._serialized_start=9504
+  _globals['_GETMUTUALFUNDHOLDERSREQUEST']._serialized_end=9557
+  _globals['_GETMUTUALFUNDHOLDERSRESPONSE']._serialized_start=9559
+  _globals['_GETMUTUALFUNDHOLDERSRESPONSE']._serialized_end=9657
+  _globals['_MUTUALFUNDHOLDER']._serialized_start=9660
+  _globals['_MUTUALFUNDHOLDER']._serialized_end=9838
+  _globals['_GETMULTIPLEINFOREQUEST']._serialized_start=9841
+  _globals['_GETMULTIPLEINFOREQUEST']._serialized_end=10017
+  _globals['_GETMULTIPLEINFORESPONSE']._serialized_start=10020
+  _globals['_GETMULTIPLEINFORESPONSE']._serialized_end=10277
+  _globals['_GETMULTIPLEINFORESPONSE_INFOENTRY']._serialized_start=10186
+  _globals['_GETMULTIPLEINFORESPONSE_INFOENTRY']._serialized_end=10277
+  _globals['_DOWNLOADHISTORYREQUEST']._serialized_start=10280
+  _globals['_DOWNLOADHISTORYREQUEST']._serialized_end=10594
+  _globals['_DOWNLOADHISTORYRESPONSE']._serialized_start=10596
+  _globals['_DOWNLOADHISTORYRESPONSE']._serialized_end=10701
+  _globals['_GETCAPITALGAINSREQUEST']._serialized_start=10703
+  _globals['_GETCAPITALGAINSREQUEST']._serialized_end=10791
+  _globals['_GETCAPITALGAINSRESPONSE']._serialized_start=10793
+  _globals['_GETCAPITALGAINSRESPONSE']._serialized_end=10879
+  _globals['_CAPITALGAINSROW']._serialized_start=10881
+  _globals['_CAPITALGAINSROW']._serialized_end=10970
+  _globals['_GETSHARESHISTORYREQUEST']._serialized_start=10973
+  _globals['_GETSHARESHISTORYREQUEST']._serialized_end=11146
+  _globals['_GETSHARESHISTORYRESPONSE']._serialized_start=11148
+  _globals['_GETSHARESHISTORYRESPONSE']._serialized_end=11236
+  _globals['_SHARESHISTORYROW']._serialized_start=11238
+  _globals['_SHARESHISTORYROW']._serialized_end=11328
+  _globals['_GETISINREQUEST']._serialized_start=11330
+  _globals['_GETISINREQUEST']._serialized_end=11370
+  _globals['_GETISINRESPONSE']._serialized_start=11372
+  _globals['_GETISINRESPONSE']._serialized_end=11409
+  _globals['_GETFASTINFOREQUEST']._serialized_start=11411
+  _globals['_GETFASTINFOREQUEST']._serialized_end=11455
+  _globals['_GETFASTINFORESPONSE']._serialized_start=11457
+  _globals['_GETFASTINFORESPONSE']._serialized_end=11532
+  _globals['_FASTINFO']._serialized_start=11535
+  _globals['_FASTINFO']._serialized_end=12423
+  _globals['_GETSUSTAINABILITYREQUEST']._serialized_start=12425
+  _globals['_GETSUSTAINABILITYREQUEST']._serialized_end=12511
+  _globals['_GETSUSTAINABILITYRESPONSE']._serialized_start=12514
+  _globals['_GETSUSTAINABILITYRESPONSE']._serialized_end=13310
+  _globals['_GETINSIDERPURCHASESREQUEST']._serialized_start=13312
+  _globals['_GETINSIDERPURCHASESREQUEST']._serialized_end=13364
+  _globals['_GETINSIDERPURCHASESRESPONSE']._serialized_start=13366
+  _globals['_GETINSIDERPURCHASESRESPONSE']._serialized_end=13466
+  _globals['_INSIDERPURCHASESUMMARYROW']._serialized_start=13469
+  _globals['_INSIDERPURCHASESUMMARYROW']._serialized_end=13664
+  _globals['_INSIDERPURCHASESUMMARYROW_VALUESENTRY']._serialized_start=13607
+  _globals['_INSIDERPURCHASESUMMARYROW_VALUESENTRY']._serialized_end=13664
+  _globals['_GETINSIDERTRANSACTIONSREQUEST']._serialized_start=13666
+  _globals['_GETINSIDERTRANSACTIONSREQUEST']._serialized_end=13721
+  _globals['_GETINSIDERTRANSACTIONSRESPONSE']._serialized_start=13723
+  _globals['_GETINSIDERTRANSACTIONSRESPONSE']._serialized_end=13835
+  _globals['_INSIDERTRANSACTION']._serialized_start=13838
+  _globals['_INSIDERTRANSACTION']._serialized_end=14089
+  _globals['_GETINSIDERROSTERHOLDERSREQUEST']._serialized_start=14091
+  _globals['_GETINSIDERROSTERHOLDERSREQUEST']._serialized_end=14147
+  _globals['_GETINSIDERROSTERHOLDERSRESPONSE']._serialized_start=14149
+  _globals['_GETINSIDERROSTERHOLDERSRESPONSE']._serialized_end=14253
+  _globals['_INSIDERROSTERHOLDER']._serialized_start=14256
+  _globals['_INSIDERROSTERHOLDER']._serialized_end=14487
+  _globals['_GETANALYSTPRICETARGETSREQUEST']._serialized_start=14489
+  _globals['_GETANALYSTPRICETARGETSREQUEST']._serialized_end=14544
+  _globals['_GETANALYSTPRICETARGETSRESPONSE']._serialized_start=14547
+  _globals['_GETANALYSTPRICETARGETSRESPONSE']._serialized_end=14687
+  _globals['_GETRECOMMENDATIONSSUMMARYREQUEST']._serialized_start=14689
+  _globals['_GETRECOMMENDATIONSSUMMARYREQUEST']._serialized_end=14747
+  _globals['_GETRECOMMENDATIONSSUMMARYRESPONSE']._serialized_start=14749
+  _globals['_GETRECOMMENDATIONSSUMMARYRESPONSE']._serialized_end=14854
+  _globals['_RECOMMENDATIONSUMMARYROW']._serialized_start=14857
+  _globals['_RECOMMENDATIONSUMMARYROW']._serialized_end=15029
+  _globals['_GETEARNINGSESTIMATEREQUEST']._serialized_start=15031
+  _globals['_GETEARNINGSESTIMATEREQUEST']._serialized_end=15083
+  _globals['_GETEARNINGSESTIMATERESPONSE']._serialized_start=15085
+  _globals['_GETEARNINGSESTIMATERESPONSE']._serialized_end=15179
+  _globals['_EARNINGSESTIMATEROW']._serialized_start=15182
+  _globals['_EARNINGSESTIMATEROW']._serialized_end=15387
+  _globals['_GETREVENUEESTIMATEREQUEST']._serialized_start=15389
+  _globals['_GETREVENUEESTIMATEREQUEST']._serialized_end=15440
+  _globals['_GETREVENUEESTIMATERESPONSE']._serialized_start=15442
+  _globals['_GETREVENUEESTIMATERESPONSE']._serialized_end=15534
+  _globals['_REVENUEESTIMATEROW']._serialized_start=15537
+  _globals['_REVENUEESTIMATEROW']._serialized_end=15749
+  _globals['_GETEARNINGSHISTORYREQUEST']._serialized_start=15751
+  _globals['_GETEARNINGSHISTORYREQUEST']._serialized_end=15802
+  _globals['_GETEARNINGSHISTORYRESPONSE']._serialized_start=15804
+  _globals['_GETEARNINGSHISTORYRESPONSE']._serialized_end=15896
+  _globals['_EARNINGSHISTORYROW']._serialized_start=15899
+  _globals['_EARNINGSHISTORYROW']._serialized_end=16115
+  _globals['_GETEPSTRENDREQUEST']._serialized_start=16117
+  _globals['_GETEPSTRENDREQUEST']._serialized_end=16161
+  _globals['_GETEPSTRENDRESPONSE']._serialized_start=16163
+  _globals['_GETEPSTRENDRESPONSE']._serialized_end=16241
+  _globals['_EPSTRENDROW']._serialized_start=16244
+  _globals['_EPSTRENDROW']._serialized_end=16463
+  _globals['_GETEPSREVISIONSREQUEST']._serialized_start=16465
+  _globals['_GETEPSREVISIONSREQUEST']._serialized_end=16513
+  _globals['_GETEPSREVISIONSRESPONSE']._serialized_start=16515
+  _globals['_GETEPSREVISIONSRESPONSE']._serialized_end=16601
+  _globals['_EPSREVISIONSROW']._serialized_start=16604
+  _globals['_EPSREVISIONSROW']._serialized_end=16801
+  _globals['_GETGROWTHESTIMATESREQUEST']._serialized_start=16803
+  _globals['_GETGROWTHESTIMATESREQUEST']._serialized_end=16854
+  _globals['_GETGROWTHESTIMATESRESPONSE']._serialized_start=16856
+  _globals['_GETGROWTHESTIMATESRESPONSE']._serialized_end=16948
+  _globals['_GROWTHESTIMATESROW']._serialized_start=16951
+  _globals['_GROWTHESTIMATESROW']._serialized_end=17091
+  _globals['_GETEARNINGSDATESREQUEST']._serialized_start=17093
+  _globals['_GETEARNINGSDATESREQUEST']._serialized_end=17179
+  _globals['_GETEARNINGSDATESRESPONSE']._serialized_start=17181
+  _globals['_GETEARNINGSDATESRESPONSE']._serialized_end=17268
+  _globals['_EARNINGSDATEROW']._serialized_start=17271
+  _globals['_EARNINGSDATEROW']._serialized_end=17507
+  _globals['_GETHISTORYMETADATAREQUEST']._serialized_start=17509
+  _globals['_GETHISTORYMETADATAREQUEST']._serialized_end=17560
+  _globals['_GETHISTORYMETADATARESPONSE']._serialized_start=17563
+  _globals['_GETHISTORYMETADATARESPONSE']._serialized_end=18268
+  _globals['_GETSECFILINGSREQUEST']._serialized_start=18270
+  _globals['_GETSECFILINGSREQUEST']._serialized_end=18352
+  _globals['_GETSECFILINGSRESPONSE']._serialized_start=18355
+  _globals['_GETSECFILINGSRESPONSE']._serialized_end=18494
+  _globals['_SECFILING']._serialized_start=18496
+  _globals['_SECFILING']._serialized_end=18615
+  _globals['_SUBSCRIBEQUOTESREQUEST']._serialized_start=18617
+  _globals['_SUBSCRIBEQUOTESREQUEST']._serialized_end=18667
+  _globals['_QUOTE']._serialized_start=18670
+  _globals['_QUOTE']._serialized_end=18904
+  _globals['_SUBSCRIBEQUOTESRESPONSE']._serialized_start=18907
+  _globals['_SUBSCRIBEQUOTESRESPONSE']._serialized_end=19052
+  _globals['_SESSIONREQUEST']._serialized_start=19055
+  _globals['_SESSIONREQUEST']._serialized_end=19485
+  _globals['_SESSIONCANCEL']._serialized_start=19487
+  _globals['_SESSIONCANCEL']._serialized_end=19502
+  _globals['_SESSIONRESPONSE']._serialized_start=19505
+  _globals['_SESSIONRESPONSE']._serialized_end=19910
+  _globals['_SESSIONERROR']._serialized_start=19912
+  _globals['_SESSIONERROR']._serialized_end=19972
+  _globals['_TICKERSERVICE']._serialized_start=20161
+  _globals['_TICKERSERVICE']._serialized_end=24803
 # @@protoc_insertion_point(module_scope)
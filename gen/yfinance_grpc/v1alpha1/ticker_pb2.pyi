@@ -1,7 +1,9 @@
 import datetime
 
+from google.protobuf import field_mask_pb2 as _field_mask_pb2
 from google.protobuf import timestamp_pb2 as _timestamp_pb2
 from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
 from collections.abc import Iterable as _Iterable, Mapping as _Mapping
@@ -9,17 +11,41 @@ from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
 
 DESCRIPTOR: _descriptor.FileDescriptor
 
+class InfoSource(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    INFO_SOURCE_UNSPECIFIED: _ClassVar[InfoSource]
+    INFO_SOURCE_FULL: _ClassVar[InfoSource]
+    INFO_SOURCE_FAST: _ClassVar[InfoSource]
+
+class InfoFreshness(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    INFO_FRESHNESS_UNSPECIFIED: _ClassVar[InfoFreshness]
+    INFO_FRESHNESS_FAST: _ClassVar[InfoFreshness]
+    INFO_FRESHNESS_FULL: _ClassVar[InfoFreshness]
+INFO_SOURCE_UNSPECIFIED: InfoSource
+INFO_SOURCE_FULL: InfoSource
+INFO_SOURCE_FAST: InfoSource
+INFO_FRESHNESS_UNSPECIFIED: InfoFreshness
+INFO_FRESHNESS_FAST: InfoFreshness
+INFO_FRESHNESS_FULL: InfoFreshness
+
 class GetInfoRequest(_message.Message):
     __slots__ = ()
     TICKER_FIELD_NUMBER: _ClassVar[int]
+    READ_MASK_FIELD_NUMBER: _ClassVar[int]
+    FRESHNESS_FIELD_NUMBER: _ClassVar[int]
     ticker: str
-    def __init__(self, ticker: _Optional[str] = ...) -> None: ...
+    read_mask: _field_mask_pb2.FieldMask
+    freshness: InfoFreshness
+    def __init__(self, ticker: _Optional[str] = ..., read_mask: _Optional[_Union[_field_mask_pb2.FieldMask, _Mapping]] = ..., freshness: _Optional[_Union[InfoFreshness, str]] = ...) -> None: ...
 
 class GetInfoResponse(_message.Message):
     __slots__ = ()
     INFO_FIELD_NUMBER: _ClassVar[int]
+    SOURCE_FIELD_NUMBER: _ClassVar[int]
     info: TickerInfo
-    def __init__(self, info: _Optional[_Union[TickerInfo, _Mapping]] = ...) -> None: ...
+    source: InfoSource
+    def __init__(self, info: _Optional[_Union[TickerInfo, _Mapping]] = ..., source: _Optional[_Union[InfoSource, str]] = ...) -> None: ...
 
 class TickerInfo(_message.Message):
     __slots__ = ()
@@ -287,17 +313,23 @@ class GetFinancialsRequest(_message.Message):
     FREQ_FIELD_NUMBER: _ClassVar[int]
     AS_DICT_FIELD_NUMBER: _ClassVar[int]
     PRETTY_FIELD_NUMBER: _ClassVar[int]
+    IF_NONE_MATCH_FIELD_NUMBER: _ClassVar[int]
     ticker: str
     freq: str
     as_dict: bool
     pretty: bool
-    def __init__(self, ticker: _Optional[str] = ..., freq: _Optional[str] = ..., as_dict: _Optional[bool] = ..., pretty: _Optional[bool] = ...) -> None: ...
+    if_none_match: str
+    def __init__(self, ticker: _Optional[str] = ..., freq: _Optional[str] = ..., as_dict: _Optional[bool] = ..., pretty: _Optional[bool] = ..., if_none_match: _Optional[str] = ...) -> None: ...
 
 class GetFinancialsResponse(_message.Message):
     __slots__ = ()
     STATEMENTS_FIELD_NUMBER: _ClassVar[int]
+    ETAG_FIELD_NUMBER: _ClassVar[int]
+    NOT_MODIFIED_FIELD_NUMBER: _ClassVar[int]
     statements: _containers.RepeatedCompositeFieldContainer[FinancialStatement]
-    def __init__(self, statements: _Optional[_Iterable[_Union[FinancialStatement, _Mapping]]] = ...) -> None: ...
+    etag: str
+    not_modified: bool
+    def __init__(self, statements: _Optional[_Iterable[_Union[FinancialStatement, _Mapping]]] = ..., etag: _Optional[str] = ..., not_modified: _Optional[bool] = ...) -> None: ...
 
 class FinancialStatement(_message.Message):
     __slots__ = ()
@@ -590,14 +622,20 @@ class GetMajorHoldersResponse(_message.Message):
 class GetInstitutionalHoldersRequest(_message.Message):
     __slots__ = ()
     TICKER_FIELD_NUMBER: _ClassVar[int]
+    IF_NONE_MATCH_FIELD_NUMBER: _ClassVar[int]
     ticker: str
-    def __init__(self, ticker: _Optional[str] = ...) -> None: ...
+    if_none_match: str
+    def __init__(self, ticker: _Optional[str] = ..., if_none_match: _Optional[str] = ...) -> None: ...
 
 class GetInstitutionalHoldersResponse(_message.Message):
     __slots__ = ()
     HOLDERS_FIELD_NUMBER: _ClassVar[int]
+    ETAG_FIELD_NUMBER: _ClassVar[int]
+    NOT_MODIFIED_FIELD_NUMBER: _ClassVar[int]
     holders: _containers.RepeatedCompositeFieldContainer[InstitutionalHolder]
-    def __init__(self, holders: _Optional[_Iterable[_Union[InstitutionalHolder, _Mapping]]] = ...) -> None: ...
+    etag: str
+    not_modified: bool
+    def __init__(self, holders: _Optional[_Iterable[_Union[InstitutionalHolder, _Mapping]]] = ..., etag: _Optional[str] = ..., not_modified: _Optional[bool] = ...) -> None: ...
 
 class InstitutionalHolder(_message.Message):
     __slots__ = ()
@@ -642,8 +680,12 @@ class MutualFundHolder(_message.Message):
 class GetMultipleInfoRequest(_message.Message):
     __slots__ = ()
     TICKERS_FIELD_NUMBER: _ClassVar[int]
+    READ_MASK_FIELD_NUMBER: _ClassVar[int]
+    FRESHNESS_FIELD_NUMBER: _ClassVar[int]
     tickers: _containers.RepeatedScalarFieldContainer[str]
-    def __init__(self, tickers: _Optional[_Iterable[str]] = ...) -> None: ...
+    read_mask: _field_mask_pb2.FieldMask
+    freshness: InfoFreshness
+    def __init__(self, tickers: _Optional[_Iterable[str]] = ..., read_mask: _Optional[_Union[_field_mask_pb2.FieldMask, _Mapping]] = ..., freshness: _Optional[_Union[InfoFreshness, str]] = ...) -> None: ...
 
 class GetMultipleInfoResponse(_message.Message):
     __slots__ = ()
@@ -655,8 +697,10 @@ class GetMultipleInfoResponse(_message.Message):
         value: TickerInfo
         def __init__(self, key: _Optional[str] = ..., value: _Optional[_Union[TickerInfo, _Mapping]] = ...) -> None: ...
     INFO_FIELD_NUMBER: _ClassVar[int]
+    SOURCE_FIELD_NUMBER: _ClassVar[int]
     info: _containers.MessageMap[str, TickerInfo]
-    def __init__(self, info: _Optional[_Mapping[str, TickerInfo]] = ...) -> None: ...
+    source: InfoSource
+    def __init__(self, info: _Optional[_Mapping[str, TickerInfo]] = ..., source: _Optional[_Union[InfoSource, str]] = ...) -> None: ...
 
 class DownloadHistoryRequest(_message.Message):
     __slots__ = ()
@@ -803,8 +847,10 @@ class FastInfo(_message.Message):
 class GetSustainabilityRequest(_message.Message):
     __slots__ = ()
     TICKER_FIELD_NUMBER: _ClassVar[int]
+    IF_NONE_MATCH_FIELD_NUMBER: _ClassVar[int]
     ticker: str
-    def __init__(self, ticker: _Optional[str] = ...) -> None: ...
+    if_none_match: str
+    def __init__(self, ticker: _Optional[str] = ..., if_none_match: _Optional[str] = ...) -> None: ...
 
 class GetSustainabilityResponse(_message.Message):
     __slots__ = ()
@@ -830,6 +876,8 @@ class GetSustainabilityResponse(_message.Message):
     PALM_OIL_FIELD_NUMBER: _ClassVar[int]
     COAL_FIELD_NUMBER: _ClassVar[int]
     TOBACCO_FIELD_NUMBER: _ClassVar[int]
+    ETAG_FIELD_NUMBER: _ClassVar[int]
+    NOT_MODIFIED_FIELD_NUMBER: _ClassVar[int]
     total_esg: float
     esg_performance: str
     environment_score: float
@@ -852,7 +900,9 @@ class GetSustainabilityResponse(_message.Message):
     palm_oil: bool
     coal: bool
     tobacco: bool
-    def __init__(self, total_esg: _Optional[float] = ..., esg_performance: _Optional[str] = ..., environment_score: _Optional[float] = ..., social_score: _Optional[float] = ..., governance_score: _Optional[float] = ..., percentile: _Optional[float] = ..., peer_group: _Optional[str] = ..., adult: _Optional[bool] = ..., alcoholic: _Optional[bool] = ..., animal_testing: _Optional[bool] = ..., catholic: _Optional[bool] = ..., controversial_weapons: _Optional[bool] = ..., small_arms: _Optional[bool] = ..., fur_leather: _Optional[bool] = ..., gambling: _Optional[bool] = ..., gmo: _Optional[bool] = ..., military_contract: _Optional[bool] = ..., nuclear: _Optional[bool] = ..., pesticides: _Optional[bool] = ..., palm_oil: _Optional[bool] = ..., coal: _Optional[bool] = ..., tobacco: _Optional[bool] = ...) -> None: ...
+    etag: str
+    not_modified: bool
+    def __init__(self, total_esg: _Optional[float] = ..., esg_performance: _Optional[str] = ..., environment_score: _Optional[float] = ..., social_score: _Optional[float] = ..., governance_score: _Optional[float] = ..., percentile: _Optional[float] = ..., peer_group: _Optional[str] = ..., adult: _Optional[bool] = ..., alcoholic: _Optional[bool] = ..., animal_testing: _Optional[bool] = ..., catholic: _Optional[bool] = ..., controversial_weapons: _Optional[bool] = ..., small_arms: _Optional[bool] = ..., fur_leather: _Optional[bool] = ..., gambling: _Optional[bool] = ..., gmo: _Optional[bool] = ..., military_contract: _Optional[bool] = ..., nuclear: _Optional[bool] = ..., pesticides: _Optional[bool] = ..., palm_oil: _Optional[bool] = ..., coal: _Optional[bool] = ..., tobacco: _Optional[bool] = ..., etag: _Optional[str] = ..., not_modified: _Optional[bool] = ...) -> None: ...
 
 class GetInsiderPurchasesRequest(_message.Message):
     __slots__ = ()
@@ -1226,14 +1276,20 @@ class GetHistoryMetadataResponse(_message.Message):
 class GetSecFilingsRequest(_message.Message):
     __slots__ = ()
     TICKER_FIELD_NUMBER: _ClassVar[int]
+    IF_NONE_MATCH_FIELD_NUMBER: _ClassVar[int]
     ticker: str
-    def __init__(self, ticker: _Optional[str] = ...) -> None: ...
+    if_none_match: str
+    def __init__(self, ticker: _Optional[str] = ..., if_none_match: _Optional[str] = ...) -> None: ...
 
 class GetSecFilingsResponse(_message.Message):
     __slots__ = ()
     FILINGS_FIELD_NUMBER: _ClassVar[int]
+    ETAG_FIELD_NUMBER: _ClassVar[int]
+    NOT_MODIFIED_FIELD_NUMBER: _ClassVar[int]
     filings: _containers.RepeatedCompositeFieldContainer[SecFiling]
-    def __init__(self, filings: _Optional[_Iterable[_Union[SecFiling, _Mapping]]] = ...) -> None: ...
+    etag: str
+    not_modified: bool
+    def __init__(self, filings: _Optional[_Iterable[_Union[SecFiling, _Mapping]]] = ..., etag: _Optional[str] = ..., not_modified: _Optional[bool] = ...) -> None: ...
 
 class SecFiling(_message.Message):
     __slots__ = ()
@@ -1246,3 +1302,83 @@ class SecFiling(_message.Message):
     title: str
     url: str
     def __init__(self, date: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., type: _Optional[str] = ..., title: _Optional[str] = ..., url: _Optional[str] = ...) -> None: ...
+
+class SubscribeQuotesRequest(_message.Message):
+    __slots__ = ()
+    TICKERS_FIELD_NUMBER: _ClassVar[int]
+    tickers: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, tickers: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class Quote(_message.Message):
+    __slots__ = ()
+    SYMBOL_FIELD_NUMBER: _ClassVar[int]
+    LAST_PRICE_FIELD_NUMBER: _ClassVar[int]
+    PREVIOUS_CLOSE_FIELD_NUMBER: _ClassVar[int]
+    OPEN_FIELD_NUMBER: _ClassVar[int]
+    DAY_HIGH_FIELD_NUMBER: _ClassVar[int]
+    DAY_LOW_FIELD_NUMBER: _ClassVar[int]
+    LAST_VOLUME_FIELD_NUMBER: _ClassVar[int]
+    CURRENCY_FIELD_NUMBER: _ClassVar[int]
+    symbol: str
+    last_price: float
+    previous_close: float
+    open: float
+    day_high: float
+    day_low: float
+    last_volume: int
+    currency: str
+    def __init__(self, symbol: _Optional[str] = ..., last_price: _Optional[float] = ..., previous_close: _Optional[float] = ..., open: _Optional[float] = ..., day_high: _Optional[float] = ..., day_low: _Optional[float] = ..., last_volume: _Optional[int] = ..., currency: _Optional[str] = ...) -> None: ...
+
+class SubscribeQuotesResponse(_message.Message):
+    __slots__ = ()
+    QUOTE_FIELD_NUMBER: _ClassVar[int]
+    CHANGED_FIELDS_FIELD_NUMBER: _ClassVar[int]
+    quote: Quote
+    changed_fields: _field_mask_pb2.FieldMask
+    def __init__(self, quote: _Optional[_Union[Quote, _Mapping]] = ..., changed_fields: _Optional[_Union[_field_mask_pb2.FieldMask, _Mapping]] = ...) -> None: ...
+
+class SessionRequest(_message.Message):
+    __slots__ = ()
+    REQUEST_ID_FIELD_NUMBER: _ClassVar[int]
+    INFO_FIELD_NUMBER: _ClassVar[int]
+    HISTORY_FIELD_NUMBER: _ClassVar[int]
+    OPTION_CHAIN_FIELD_NUMBER: _ClassVar[int]
+    NEWS_FIELD_NUMBER: _ClassVar[int]
+    CANCEL_FIELD_NUMBER: _ClassVar[int]
+    PRIORITY_FIELD_NUMBER: _ClassVar[int]
+    request_id: str
+    info: GetInfoRequest
+    history: GetHistoryRequest
+    option_chain: GetOptionChainRequest
+    news: GetNewsRequest
+    cancel: SessionCancel
+    priority: int
+    def __init__(self, request_id: _Optional[str] = ..., info: _Optional[_Union[GetInfoRequest, _Mapping]] = ..., history: _Optional[_Union[GetHistoryRequest, _Mapping]] = ..., option_chain: _Optional[_Union[GetOptionChainRequest, _Mapping]] = ..., news: _Optional[_Union[GetNewsRequest, _Mapping]] = ..., cancel: _Optional[_Union[SessionCancel, _Mapping]] = ..., priority: _Optional[int] = ...) -> None: ...
+
+class SessionCancel(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class SessionResponse(_message.Message):
+    __slots__ = ()
+    REQUEST_ID_FIELD_NUMBER: _ClassVar[int]
+    INFO_FIELD_NUMBER: _ClassVar[int]
+    HISTORY_FIELD_NUMBER: _ClassVar[int]
+    OPTION_CHAIN_FIELD_NUMBER: _ClassVar[int]
+    NEWS_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    request_id: str
+    info: GetInfoResponse
+    history: GetHistoryResponse
+    option_chain: GetOptionChainResponse
+    news: GetNewsResponse
+    error: SessionError
+    def __init__(self, request_id: _Optional[str] = ..., info: _Optional[_Union[GetInfoResponse, _Mapping]] = ..., history: _Optional[_Union[GetHistoryResponse, _Mapping]] = ..., option_chain: _Optional[_Union[GetOptionChainResponse, _Mapping]] = ..., news: _Optional[_Union[GetNewsResponse, _Mapping]] = ..., error: _Optional[_Union[SessionError, _Mapping]] = ...) -> None: ...
+
+class SessionError(_message.Message):
+    __slots__ = ()
+    CODE_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    code: int
+    message: str
+    def __init__(self, code: _Optional[int] = ..., message: _Optional[str] = ...) -> None: ...
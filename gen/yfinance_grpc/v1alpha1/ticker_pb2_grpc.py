@@ -205,6 +205,16 @@ class TickerServiceStub(object):
                 request_serializer=yfinance__grpc_dot_v1alpha1_dot_ticker__pb2.GetSecFilingsRequest.SerializeToString,
                 response_deserializer=yfinance__grpc_dot_v1alpha1_dot_ticker__pb2.GetSecFilingsResponse.FromString,
                 _registered_method=True)
+        self.SubscribeQuotes = channel.unary_stream(
+                '/yfinance_grpc.v1alpha1.TickerService/SubscribeQuotes',
+                request_serializer=yfinance__grpc_dot_v1alpha1_dot_ticker__pb2.SubscribeQuotesRequest.SerializeToString,
+                response_deserializer=yfinance__grpc_dot_v1alpha1_dot_ticker__pb2.SubscribeQuotesResponse.FromString,
+                _registered_method=True)
+        self.Session = channel.stream_stream(
+                '/yfinance_grpc.v1alpha1.TickerService/Session',
+                request_serializer=yfinance__grpc_dot_v1alpha1_dot_ticker__pb2.SessionRequest.SerializeToString,
+                response_deserializer=yfinance__grpc_dot_v1alpha1_dot_ticker__pb2.SessionResponse.FromString,
+                _registered_method=True)
 
 
 class TickerServiceServicer(object):
@@ -477,6 +487,21 @@ class TickerServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def SubscribeQuotes(self, request, context):
+        """SubscribeQuotes streams quote changes for a set of tickers from a shared server-side poller
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def Session(self, request_iterator, context):
+        """Session multiplexes info, history, option chain and news requests over one bidirectional stream.
+        Responses carry the request_id they answer and may arrive out of order.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_TickerServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -670,6 +695,16 @@ def add_TickerServiceServicer_to_server(servicer, server):
                     request_deserializer=yfinance__grpc_dot_v1alpha1_dot_ticker__pb2.GetSecFilingsRequest.FromString,
                     response_serializer=yfinance__grpc_dot_v1alpha1_dot_ticker__pb2.GetSecFilingsResponse.SerializeToString,
             ),
+            'SubscribeQuotes': grpc.unary_stream_rpc_method_handler(
+                    servicer.SubscribeQuotes,
+                    request_deserializer=yfinance__grpc_dot_v1alpha1_dot_ticker__pb2.SubscribeQuotesRequest.FromString,
+                    response_serializer=yfinance__grpc_dot_v1alpha1_dot_ticker__pb2.SubscribeQuotesResponse.SerializeToString,
+            ),
+            'Session': grpc.stream_stream_rpc_method_handler(
+                    servicer.Session,
+                    request_deserializer=yfinance__grpc_dot_v1alpha1_dot_ticker__pb2.SessionRequest.FromString,
+                    response_serializer=yfinance__grpc_dot_v1alpha1_dot_ticker__pb2.SessionResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'yfinance_grpc.v1alpha1.TickerService', rpc_method_handlers)
@@ -1707,3 +1742,57 @@ class TickerService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def SubscribeQuotes(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/yfinance_grpc.v1alpha1.TickerService/SubscribeQuotes',
+            yfinance__grpc_dot_v1alpha1_dot_ticker__pb2.SubscribeQuotesRequest.SerializeToString,
+            yfinance__grpc_dot_v1alpha1_dot_ticker__pb2.SubscribeQuotesResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def Session(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/yfinance_grpc.v1alpha1.TickerService/Session',
+            yfinance__grpc_dot_v1alpha1_dot_ticker__pb2.SessionRequest.SerializeToString,
+            yfinance__grpc_dot_v1alpha1_dot_ticker__pb2.SessionResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -0,0 +1,169 @@
+"""
+Adaptive admission control
+
+Each RPC belongs to a cost class with its own concurrency limit. A request
+that arrives while its class is at the limit is rejected immediately with
+RESOURCE_EXHAUSTED instead of queueing behind work it would only slow down.
+Limits adapt AIMD-style: a request that finishes within its class's latency
+target while the class is busy raises the limit by one, and a slow request
+cuts it multiplicatively, at most once per round trip: requests that were
+already running when the limit was last cut do not cut it again.
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, Optional
+
+import grpc
+
+logger = logging.getLogger(__name__)
+
+COST_CHEAP = 'cheap'
+COST_STANDARD = 'standard'
+COST_EXPENSIVE = 'expensive'
+
+_TICKER_SERVICE = '/yfinance_grpc.v1alpha1.TickerService/'
+_MARKET_SERVICE = '/yfinance_grpc.v1alpha1.MarketService/'
+
+# Full method name -> cost class; unlisted methods are COST_STANDARD
+METHOD_COSTS = {
+    _TICKER_SERVICE + 'DownloadHistory': COST_EXPENSIVE,
+    _TICKER_SERVICE + 'GetHistory': COST_EXPENSIVE,
+    _TICKER_SERVICE + 'GetMultipleInfo': COST_EXPENSIVE,
+    _TICKER_SERVICE + 'GetOptionChain': COST_EXPENSIVE,
+    _TICKER_SERVICE + 'GetSharesHistory': COST_EXPENSIVE,
+    _TICKER_SERVICE + 'GetIsin': COST_CHEAP,
+    _TICKER_SERVICE + 'GetFastInfo': COST_CHEAP,
+    _TICKER_SERVICE + 'GetOptions': COST_CHEAP,
+    _MARKET_SERVICE + 'GetMarketStatus': COST_CHEAP,
+    _MARKET_SERVICE + 'GetMarketSummary': COST_CHEAP,
+}
+
+# Long-lived streams hold a slot for their whole lifetime, so they bypass the limiters
+EXEMPT_METHODS = frozenset({
+    _TICKER_SERVICE + 'SubscribeQuotes',
+    _TICKER_SERVICE + 'Session',
+    _MARKET_SERVICE + 'WatchMarketStatus',
+})
+
+# Health checks must answer even while the server sheds load
+_HEALTH_SERVICE = '/grpc.health.v1.Health/'
+
+
+class AIMDLimiter:
+    """Concurrency limit with additive increase and multiplicative decrease on latency"""
+
+    def __init__(self, initial: int, min_limit: int, max_limit: int,
+                 latency_target: float, backoff: float = 0.75):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_target = latency_target
+        self.backoff = backoff
+        self._limit = float(initial)
+        self._inflight = 0
+        self._decreased_at = float('-inf')
+        self._lock = threading.Lock()
+        self.rejected = 0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def inflight(self) -> int:
+        return self._inflight
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            if self._inflight >= int(self._limit):
+                self.rejected += 1
+                return False
+            self._inflight += 1
+            return True
+
+    def release(self, latency: float):
+        now = time.monotonic()
+        with self._lock:
+            busy = self._inflight * 2 >= int(self._limit)
+            self._inflight -= 1
+            if latency > self.latency_target:
+                # A request that started before the last cut ran under the old limit; one cut per window
+                if now - latency >= self._decreased_at:
+                    self._limit = max(self.min_limit, self._limit * self.backoff)
+                    self._decreased_at = now
+            elif busy:
+                # Only grow while the limit is actually being exercised
+                self._limit = min(self.max_limit, self._limit + 1)
+
+
+def default_limiters() -> Dict[str, AIMDLimiter]:
+    return {
+        COST_CHEAP: AIMDLimiter(initial=32, min_limit=4, max_limit=128, latency_target=1.0),
+        COST_STANDARD: AIMDLimiter(initial=16, min_limit=2, max_limit=64, latency_target=5.0),
+        COST_EXPENSIVE: AIMDLimiter(initial=4, min_limit=1, max_limit=16, latency_target=20.0),
+    }
+
+
+class AdmissionControlInterceptor(grpc.ServerInterceptor):
+    """Reject requests with RESOURCE_EXHAUSTED once their cost class reaches its adaptive limit"""
+
+    def __init__(self, limiters: Optional[Dict[str, AIMDLimiter]] = None,
+                 costs: Optional[dict] = None):
+        self.limiters = default_limiters() if limiters is None else limiters
+        self.costs = METHOD_COSTS if costs is None else costs
+
+    def limiter_for(self, method: str) -> Optional[AIMDLimiter]:
+        if method in EXEMPT_METHODS or method.startswith(_HEALTH_SERVICE):
+            return None
+        return self.limiters.get(self.costs.get(method, COST_STANDARD))
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        method = handler_call_details.method
+        limiter = self.limiter_for(method) if handler is not None else None
+        if limiter is None:
+            return handler
+        if handler.unary_unary is not None:
+            return grpc.unary_unary_rpc_method_handler(
+                self._wrap_unary(method, limiter, handler.unary_unary),
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+        if handler.unary_stream is not None:
+            return grpc.unary_stream_rpc_method_handler(
+                self._wrap_stream(method, limiter, handler.unary_stream),
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+        return handler
+
+    @staticmethod
+    def _reject(method: str, limiter: AIMDLimiter, context):
+        logger.warning(f"Shedding {method}: {limiter.inflight} in flight at limit {limiter.limit}")
+        context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED,
+                      f"Server is at capacity for {method.rsplit('/', 1)[-1]}; retry with backoff")
+
+    def _wrap_unary(self, method, limiter, behavior):
+        def admitted_behavior(request, context):
+            if not limiter.try_acquire():
+                self._reject(method, limiter, context)
+            started = time.monotonic()
+            try:
+                return behavior(request, context)
+            finally:
+                limiter.release(time.monotonic() - started)
+
+        return admitted_behavior
+
+    def _wrap_stream(self, method, limiter, behavior):
+        def admitted_behavior(request, context):
+            if not limiter.try_acquire():
+                self._reject(method, limiter, context)
+            started = time.monotonic()
+            try:
+                yield from behavior(request, context)
+            finally:
+                limiter.release(time.monotonic() - started)
+
+        return admitted_behavior
@@ -0,0 +1,419 @@
+"""
+Memory-mapped archive of historical bars
+
+Backtests ask for years of daily and minute bars for thousands of symbols,
+and Yahoo only serves the last few weeks of intraday bars at all. With a
+BarArchive, the unadjusted bars of GetHistory and DownloadHistory results
+are kept on disk as one fixed-width column file per field for each (symbol,
+interval) series, and later requests for a range the archive holds are
+answered from it. Reads memory-map the column files and binary-search the
+sorted timestamp column, so a query touches only the pages of the range it
+returns, repeated queries are served from the page cache, and no series is
+ever loaded whole.
+
+Only closed bars are archived, and each series records the time ranges it
+holds completely, so a range is served only when every bar Yahoo would
+return for it is present. yfinance reads naive start/end times in the
+exchange's timezone, so each symbol's timezone is recorded as well.
+Adjusted prices change with every dividend, so adjusted bars are never
+archived. Unadjusted closes still change when a split is applied, so a
+write replaces the whole series unless it shows the archived bars are still
+current: closes it shares with them agree, it holds no corporate action
+after them, and, when it shares none, its actions run from them to the
+present.
+
+Layout under root: <SYMBOL>/timezone, and <SYMBOL>/<interval>-raw/
+holding meta.json (the covered ranges) and one little-endian column file per
+name in COLUMNS. Bars are appended in place; anything else rewrites the
+series into a new directory that is swapped in, so readers holding the old
+files are unaffected. Writers lock each series, across processes too.
+"""
+
+import json
+import logging
+import os
+import re
+import shutil
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from src.convert import NAT, datetime_ns
+from src.lazy import lazy_import
+
+try:
+    import fcntl
+except ImportError:
+    # Windows: series are then only locked against writers in the same process
+    fcntl = None
+
+np = lazy_import('numpy')
+pd = lazy_import('pandas')
+
+logger = logging.getLogger(__name__)
+
+# Column file -> dtype. 'date' is UTC epoch nanoseconds, sorted and unique; it is
+# written last, so its length is the number of complete bars.
+COLUMNS = {
+    'date': '<i8',
+    'open': '<f8',
+    'high': '<f8',
+    'low': '<f8',
+    'close': '<f8',
+    'volume': '<i8',
+    'dividends': '<f8',
+    'stock_splits': '<f8',
+    'capital_gains': '<f8',
+}
+ACTION_COLUMNS = ('dividends', 'stock_splits', 'capital_gains')
+
+# DataFrame column -> archive column
+_FRAME_COLUMNS = {
+    'Open': 'open',
+    'High': 'high',
+    'Low': 'low',
+    'Close': 'close',
+    'Volume': 'volume',
+    'Dividends': 'dividends',
+    'Stock Splits': 'stock_splits',
+    'Capital Gains': 'capital_gains',
+}
+
+# Longest time from a bar's timestamp to its close, per interval
+INTERVAL_SECONDS = {
+    '1m': 60,
+    '2m': 120,
+    '5m': 300,
+    '15m': 900,
+    '30m': 1800,
+    '60m': 3600,
+    '90m': 5400,
+    '1h': 3600,
+    '1d': 86400,
+    '5d': 7 * 86400,
+    '1wk': 7 * 86400,
+    '1mo': 31 * 86400,
+    '3mo': 92 * 86400,
+}
+
+_META = 'meta.json'
+_TIMEZONE = 'timezone'
+
+# Symbols become directory names; at least one letter or digit rules out '.' and '..'
+_SYMBOL = re.compile(r'^(?=.*[A-Z0-9])[A-Z0-9^=._-]{1,32}$')
+
+
+class Bars(NamedTuple):
+    """A range of archived bars; each field is a read-only view of its mapped column"""
+    date: 'np.ndarray'
+    open: 'np.ndarray'
+    high: 'np.ndarray'
+    low: 'np.ndarray'
+    close: 'np.ndarray'
+    volume: 'np.ndarray'
+    dividends: 'np.ndarray'
+    stock_splits: 'np.ndarray'
+    capital_gains: 'np.ndarray'
+
+
+def _add_range(ranges: List[List[int]], start: int, end: int) -> List[List[int]]:
+    merged = []
+    for lo, hi in sorted(ranges + [[start, end]]):
+        if merged and lo <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], hi)
+        else:
+            merged.append([lo, hi])
+    return merged
+
+
+def _covers(ranges: List[List[int]], start: int, end: int) -> bool:
+    # Ranges are merged, so a covered span lies within a single one
+    return any(lo <= start and end <= hi for lo, hi in ranges)
+
+
+def local_ns(value: datetime, tz: str) -> int:
+    """UTC nanoseconds for a request time; naive values are exchange-local, as yfinance reads them"""
+    stamp = pd.Timestamp(value)
+    stamp = stamp.tz_localize(tz) if stamp.tzinfo is None else stamp.tz_convert(tz)
+    return stamp.value
+
+
+def wall_ns(ns, tz: str) -> 'np.ndarray':
+    """Exchange-local wall-clock times of UTC nanoseconds, as naive nanoseconds"""
+    return pd.DatetimeIndex(np.asarray(ns, dtype='datetime64[ns]'), tz='UTC').tz_convert(tz).tz_localize(None).asi8
+
+
+def _frame_arrays(frame, tz: str) -> Tuple[Dict[str, 'np.ndarray'], bool]:
+    """Archive columns for an OHLCV frame, sorted by date, and whether it carried corporate actions"""
+    index = frame.index
+    if getattr(index, 'tz', None) is None:
+        # yf.download strips the timezone from daily bars, leaving exchange-local dates
+        index = pd.DatetimeIndex(index).tz_localize(tz)
+    dates = datetime_ns(index)
+    n = len(dates)
+    arrays = {'date': dates}
+    for column, name in _FRAME_COLUMNS.items():
+        if column in frame:
+            arrays[name] = frame[column].to_numpy(dtype=np.float64, na_value=np.nan)
+        else:
+            arrays[name] = np.zeros(n)
+    volume = arrays['volume']
+    arrays['volume'] = np.where(np.isfinite(volume), volume, 0).astype(np.int64)
+    # Last occurrence of each timestamp wins. NaT rows are dropped, and so are rows without
+    # prices, which yf.download adds where another ticker in the request has a bar.
+    order = np.argsort(dates, kind='stable')[::-1]
+    _, first = np.unique(dates[order], return_index=True)
+    keep = order[first]
+    priced = ~np.all([np.isnan(arrays[name][keep]) for name in ('open', 'high', 'low', 'close')], axis=0)
+    keep = keep[(dates[keep] != NAT) & priced]
+    return {name: array[keep] for name, array in arrays.items()}, 'Dividends' in frame
+
+
+def _read_json(path: str, dir_fd=None):
+    try:
+        fd = os.open(path, os.O_RDONLY, dir_fd=dir_fd)
+    except FileNotFoundError:
+        return None
+    with open(fd, 'rb') as f:
+        return json.load(f)
+
+
+def _write_text(path: str, text: str):
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'w') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def _write_json(path: str, value):
+    _write_text(path, json.dumps(value))
+
+
+def _map_columns(dir_fd) -> Dict[str, 'np.ndarray']:
+    """Read-only maps of a series' columns, cut to the length of its date column"""
+    n = os.stat('date', dir_fd=dir_fd).st_size // 8
+    columns = {}
+    for name, dtype in COLUMNS.items():
+        if n == 0:
+            columns[name] = np.empty(0, dtype=dtype)
+            continue
+        with open(os.open(name, os.O_RDONLY, dir_fd=dir_fd), 'rb') as f:
+            columns[name] = np.memmap(f, dtype=dtype, mode='r', shape=(n,))
+    return columns
+
+
+class BarArchive:
+    """On-disk, memory-mapped unadjusted OHLCV series, one per (symbol, interval)"""
+
+    def __init__(self, root: str, settle: float = 3600.0):
+        # settle: seconds a bar must have been closed for before it is archived, leaving
+        # time for Yahoo's late volume and price corrections
+        self.root = root
+        self.settle = settle
+        self._locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(root, exist_ok=True)
+
+    @staticmethod
+    def archivable(symbol: str, interval: str) -> bool:
+        return interval in INTERVAL_SECONDS and _SYMBOL.match(symbol.strip().upper()) is not None
+
+    def _series_path(self, symbol: str, interval: str) -> str:
+        return os.path.join(self.root, symbol, f"{interval}-raw")
+
+    def timezone(self, symbol: str) -> Optional[str]:
+        """Recorded exchange timezone of symbol, or None"""
+        symbol = symbol.strip().upper()
+        if _SYMBOL.match(symbol) is None:
+            return None
+        try:
+            with open(os.path.join(self.root, symbol, _TIMEZONE)) as f:
+                return f.read().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def read(self, symbol: str, interval: str, start: datetime, end: datetime,
+             actions: bool = True) -> Optional[Bars]:
+        """Unadjusted bars in [start, end) when the archive holds that whole range, else None
+
+        start and end are request times, read as yfinance reads them. With
+        actions, the range must also have been archived with its corporate
+        actions.
+        """
+        symbol = symbol.strip().upper()
+        tz = self.timezone(symbol) if self.archivable(symbol, interval) else None
+        bars = None if tz is None else self._read(symbol, interval, local_ns(start, tz), local_ns(end, tz), actions)
+        if bars is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return bars
+
+    def _read(self, symbol, interval, start: int, end: int, actions: bool) -> Optional[Bars]:
+        try:
+            dir_fd = os.open(self._series_path(symbol, interval), os.O_RDONLY)
+        except FileNotFoundError:
+            return None
+        try:
+            # Reading through the directory's descriptor keeps meta and columns from the
+            # same version of the series even if a writer swaps in a new one meanwhile
+            meta = _read_json(_META, dir_fd)
+            if meta is None or not _covers(meta['bars'], start, end):
+                return None
+            if actions and not _covers(meta['actions'], start, end):
+                return None
+            columns = _map_columns(dir_fd)
+        finally:
+            os.close(dir_fd)
+        lo, hi = np.searchsorted(columns['date'], [start, end])
+        return Bars(**{name: column[lo:hi] for name, column in columns.items()})
+
+    def write(self, symbol: str, interval: str, frame, start: Optional[datetime] = None,
+              end: Optional[datetime] = None, tz: Optional[str] = None) -> int:
+        """Archive the closed bars of an unadjusted history frame fetched for [start, end); returns how many
+
+        start and end are the request's, None for period requests and open
+        ends. tz is the exchange timezone; when None, the one already
+        recorded for symbol is used, and without either nothing is written.
+        Empty frames are not recorded, as yfinance also returns them for
+        failed fetches.
+        """
+        symbol = symbol.strip().upper()
+        tz = tz or self.timezone(symbol)
+        if tz is None or not self.archivable(symbol, interval) or frame.empty:
+            return 0
+        arrays, with_actions = _frame_arrays(frame, tz)
+        dates = arrays['date']
+        if not len(dates):
+            return 0
+        settled = time.time_ns() - int((INTERVAL_SECONDS[interval] + self.settle) * 1e9)
+        # A period request is complete from its first bar on
+        start_ns = int(dates[0]) if start is None else local_ns(start, tz)
+        end_ns = settled if end is None else min(local_ns(end, tz), settled)
+        current = end_ns == settled
+        if end_ns <= start_ns:
+            return 0
+        keep = (dates >= start_ns) & (dates < end_ns)
+        arrays = {name: array[keep] for name, array in arrays.items()}
+
+        path = self._series_path(symbol, interval)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._locked(path):
+            if self.timezone(symbol) != tz:
+                _write_text(os.path.join(self.root, symbol, _TIMEZONE), tz)
+            self._merge(path, arrays, with_actions, start_ns, end_ns, current)
+        return len(arrays['date'])
+
+    @contextmanager
+    def _locked(self, path: str):
+        with self._lock:
+            lock = self._locks.setdefault(path, threading.Lock())
+        with lock, open(f"{path}.lock", 'a') as f:
+            if fcntl is None:
+                yield
+                return
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _merge(self, path: str, new: Dict[str, 'np.ndarray'], with_actions: bool, start: int, end: int,
+               current: bool):
+        try:
+            dir_fd = os.open(path, os.O_RDONLY)
+        except FileNotFoundError:
+            meta, old = {'bars': [], 'actions': []}, None
+        else:
+            try:
+                meta = _read_json(_META, dir_fd) or {'bars': [], 'actions': []}
+                old = _map_columns(dir_fd)
+            finally:
+                os.close(dir_fd)
+
+        old_dates = None if old is None else old['date']
+        new_dates = new['date']
+        if old_dates is not None and len(old_dates) and len(new_dates) and \
+                _restated(old, meta, new, with_actions, start, current):
+            logger.info(f"Archived bars in {path} may have been restated upstream; replacing the series")
+            meta, old = {'bars': [], 'actions': []}, None
+        meta['bars'] = _add_range(meta['bars'], start, end)
+        if with_actions:
+            meta['actions'] = _add_range(meta['actions'], start, end)
+
+        if old is None or not len(old_dates):
+            self._rewrite(path, new, meta)
+        elif not len(new_dates) or new_dates[0] > old_dates[-1]:
+            self._append(path, new, len(old_dates), meta)
+        else:
+            self._rewrite(path, _combine(old, new, with_actions), meta)
+
+    @staticmethod
+    def _append(path: str, new: Dict[str, 'np.ndarray'], n_old: int, meta: dict):
+        for name, dtype in COLUMNS.items():
+            if name == 'date':
+                continue
+            column_path = os.path.join(path, name)
+            # Drop values left past the date column by an append that did not finish
+            if os.path.getsize(column_path) > n_old * 8:
+                os.truncate(column_path, n_old * 8)
+            with open(column_path, 'ab') as f:
+                new[name].astype(dtype).tofile(f)
+        with open(os.path.join(path, 'date'), 'ab') as f:
+            new['date'].astype(COLUMNS['date']).tofile(f)
+        _write_json(os.path.join(path, _META), meta)
+
+    @staticmethod
+    def _rewrite(path: str, arrays: Dict[str, 'np.ndarray'], meta: dict):
+        suffix = f"{os.getpid()}.{threading.get_ident()}"
+        tmp_path, old_path = f"{path}.{suffix}.tmp", f"{path}.{suffix}.old"
+        os.makedirs(tmp_path)
+        for name, dtype in COLUMNS.items():
+            arrays[name].astype(dtype).tofile(os.path.join(tmp_path, name))
+        _write_json(os.path.join(tmp_path, _META), meta)
+        if os.path.exists(path):
+            os.rename(path, old_path)
+        os.rename(tmp_path, path)
+        shutil.rmtree(old_path, ignore_errors=True)
+
+    def stats(self) -> dict:
+        return {'hits': self.hits, 'misses': self.misses}
+
+
+def _restated(old: Dict[str, 'np.ndarray'], meta: dict, new: Dict[str, 'np.ndarray'], with_actions: bool,
+              start: int, current: bool) -> bool:
+    """Whether a write [start, ...) shows, or cannot rule out, that upstream restated the archived bars
+
+    current: the write runs up to the last settled bar, so no corporate
+    action can lie beyond it.
+    """
+    last = old['date'][-1]
+    later = new['date'] > last
+    if with_actions and any(np.any(new[name][later] > 0) for name in ACTION_COLUMNS):
+        return True
+    _, old_at, new_at = np.intersect1d(old['date'], new['date'], assume_unique=True, return_indices=True)
+    if len(old_at):
+        return not np.allclose(old['close'][old_at], new['close'][new_at], rtol=1e-6, equal_nan=True)
+    # Nothing to compare: a split between the archived bars and the present would go unseen
+    # unless the write's actions cover that whole span
+    contiguous = any(lo <= last < hi and start <= hi for lo, hi in meta['bars'])
+    return not (with_actions and current and contiguous)
+
+
+def _combine(old: Dict[str, 'np.ndarray'], new: Dict[str, 'np.ndarray'], with_actions: bool) -> Dict[str, 'np.ndarray']:
+    """old and new bars merged by date; new bars win, keeping old corporate actions when new has none"""
+    if not with_actions:
+        new = dict(new)
+        _, old_at, new_at = np.intersect1d(old['date'], new['date'], assume_unique=True, return_indices=True)
+        for name in ACTION_COLUMNS:
+            values = np.zeros(len(new['date']))
+            values[new_at] = old[name][old_at]
+            new[name] = values
+    dates = np.concatenate([new['date'], old['date']])
+    # np.unique keeps the first occurrence, which is the new bar
+    _, keep = np.unique(dates, return_index=True)
+    return {name: np.concatenate([new[name], np.asarray(old[name])])[keep] for name in COLUMNS}
@@ -0,0 +1,281 @@
+"""
+Circuit breakers and negative caching for upstream failures
+
+While Yahoo is failing an endpoint, every call to the RPC behind it ties up
+a worker until the upstream request errors out. A CircuitBreaker per RPC
+counts consecutive failures and, once tripped, rejects calls immediately
+with UNAVAILABLE until a cool-down has passed and a single probe call
+succeeds. Only upstream errors count: a failure status set while handling a
+network error or timeout, or one of those escaping the handler. Bad
+requests and bad data fail the call without touching the breaker. Symbols Yahoo has confirmed do not exist are remembered in a
+NegativeCache for a few minutes and answered with NOT_FOUND without any
+upstream call.
+"""
+
+import logging
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+import grpc
+
+from src.admission import EXEMPT_METHODS
+from src.retry import is_retryable
+
+logger = logging.getLogger(__name__)
+
+STATE_CLOSED = 'closed'
+STATE_OPEN = 'open'
+STATE_HALF_OPEN = 'half_open'
+
+# Status codes that count against a breaker when set while handling an upstream error
+FAILURE_CODES = frozenset({
+    grpc.StatusCode.INTERNAL,
+    grpc.StatusCode.UNAVAILABLE,
+    grpc.StatusCode.DEADLINE_EXCEEDED,
+    grpc.StatusCode.UNKNOWN,
+})
+
+# Outcome of a call that never finished, e.g. a stream the client closed early
+_ABANDONED = object()
+
+
+class UnknownSymbolError(Exception):
+    """Yahoo confirmed that a symbol does not exist"""
+
+    def __init__(self, symbol: str):
+        super().__init__(f"Symbol '{symbol}' not found")
+        self.symbol = symbol
+
+
+class _UpstreamErrorContext:
+    """Servicer context that notes when a failure status is set while handling an upstream error
+
+    Handlers catch their exceptions and report INTERNAL whatever went wrong;
+    the exception being handled when set_code is called tells a network
+    failure apart from a bad request.
+    """
+
+    def __init__(self, context):
+        self._context = context
+        self.upstream_error = None
+
+    def __getattr__(self, name):
+        return getattr(self._context, name)
+
+    def set_code(self, code):
+        error = sys.exc_info()[1]
+        if code in FAILURE_CODES and error is not None and is_retryable(error):
+            self.upstream_error = error
+        self._context.set_code(code)
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker with a timed half-open probe"""
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = STATE_CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+        self.trips = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == STATE_OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                return STATE_HALF_OPEN
+            return self._state
+
+    def retry_after(self) -> float:
+        """Seconds until an open breaker lets a probe through"""
+        with self._lock:
+            if self._state != STATE_OPEN:
+                return 0.0
+            return max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+
+    def allow(self) -> bool:
+        """Whether a call may go upstream; an open breaker lets one probe through after reset_timeout"""
+        with self._lock:
+            if self._state == STATE_CLOSED:
+                return True
+            if self._state == STATE_OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self._state = STATE_HALF_OPEN
+                self._probing = False
+            if self._state == STATE_HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            if self._state != STATE_CLOSED:
+                logger.info(f"Circuit for {self.name} closed")
+            self._state = STATE_CLOSED
+            self._failures = 0
+            self._probing = False
+
+    def record_abandoned(self):
+        """A call ended without an upstream verdict (e.g. the client cancelled); free the probe slot"""
+        with self._lock:
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == STATE_HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != STATE_OPEN:
+                    self.trips += 1
+                    logger.warning(f"Circuit for {self.name} opened after {self._failures} failures")
+                self._state = STATE_OPEN
+                self._opened_at = time.monotonic()
+                self._probing = False
+
+    def stats(self) -> dict:
+        return {'state': self.state, 'trips': self.trips, 'rejected': self.rejected}
+
+
+class NegativeCache:
+    """Symbols known not to exist, each remembered for ttl seconds"""
+
+    def __init__(self, ttl: float = 300.0, max_entries: int = 10000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+
+    def add(self, symbol: str):
+        symbol = symbol.strip().upper()
+        with self._lock:
+            self._entries[symbol] = time.monotonic() + self.ttl
+            self._entries.move_to_end(symbol)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __contains__(self, symbol: str) -> bool:
+        symbol = symbol.strip().upper()
+        with self._lock:
+            expires_at = self._entries.get(symbol)
+            if expires_at is None:
+                return False
+            if expires_at <= time.monotonic():
+                del self._entries[symbol]
+                return False
+            self.hits += 1
+            return True
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+
+class CircuitBreakerInterceptor(grpc.ServerInterceptor):
+    """Fail fast on known-missing symbols and on RPCs whose upstream is failing"""
+
+    def __init__(self, negative_cache: Optional[NegativeCache] = None, failure_threshold: int = 5,
+                 reset_timeout: float = 30.0, exempt=EXEMPT_METHODS):
+        # Long-lived streams are exempt by default: their errors say little about upstream health
+        self.negative_cache = NegativeCache() if negative_cache is None else negative_cache
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.exempt = exempt
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def breaker_for(self, method: str) -> CircuitBreaker:
+        breaker = self.breakers.get(method)
+        if breaker is None:
+            with self._lock:
+                breaker = self.breakers.setdefault(
+                    method, CircuitBreaker(method.rsplit('/', 1)[-1], self.failure_threshold, self.reset_timeout)
+                )
+        return breaker
+
+    def stats(self) -> Dict[str, dict]:
+        """Per-RPC breaker state and counters, plus the negative cache size and hits"""
+        stats = {method: breaker.stats() for method, breaker in list(self.breakers.items())}
+        stats['negative_cache'] = {'size': len(self.negative_cache), 'hits': self.negative_cache.hits}
+        return stats
+
+    def upstream_problem(self, service: str) -> Optional[str]:
+        """Health check: a reason when every breaker used so far for service (a full name) is open"""
+        prefix = f'/{service}/'
+        breakers = [b for method, b in list(self.breakers.items()) if method.startswith(prefix)]
+        if breakers and all(b.state == STATE_OPEN for b in breakers):
+            return "upstream failing"
+        return None
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        method = handler_call_details.method
+        if handler is None or method in self.exempt or method.startswith('/grpc.'):
+            return handler
+        breaker = self.breaker_for(method)
+        kwargs = {
+            'request_deserializer': handler.request_deserializer,
+            'response_serializer': handler.response_serializer,
+        }
+        if handler.unary_unary is not None:
+            return grpc.unary_unary_rpc_method_handler(self._wrap_unary(breaker, handler.unary_unary), **kwargs)
+        if handler.unary_stream is not None:
+            return grpc.unary_stream_rpc_method_handler(self._wrap_stream(breaker, handler.unary_stream), **kwargs)
+        return handler
+
+    def _check(self, breaker: CircuitBreaker, request, context):
+        symbol = getattr(request, 'ticker', None)
+        if symbol and symbol in self.negative_cache:
+            context.abort(grpc.StatusCode.NOT_FOUND, f"Symbol '{symbol.strip().upper()}' not found")
+        if not breaker.allow():
+            context.abort(grpc.StatusCode.UNAVAILABLE,
+                          f"Upstream for {breaker.name} is failing; retry in {breaker.retry_after():.0f}s")
+
+    @staticmethod
+    def _record(breaker: CircuitBreaker, code, upstream_error):
+        if code is _ABANDONED or code == grpc.StatusCode.CANCELLED:
+            breaker.record_abandoned()
+        elif upstream_error:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+
+    def _wrap_unary(self, breaker, behavior):
+        def guarded_behavior(request, context):
+            self._check(breaker, request, context)
+            context = _UpstreamErrorContext(context)
+            code, upstream_error = _ABANDONED, False
+            try:
+                response = behavior(request, context)
+                code, upstream_error = context.code(), context.upstream_error is not None
+                return response
+            except Exception as e:
+                code, upstream_error = grpc.StatusCode.INTERNAL, is_retryable(e)
+                raise
+            finally:
+                self._record(breaker, code, upstream_error)
+
+        return guarded_behavior
+
+    def _wrap_stream(self, breaker, behavior):
+        def guarded_behavior(request, context):
+            self._check(breaker, request, context)
+            context = _UpstreamErrorContext(context)
+            code, upstream_error = _ABANDONED, False
+            try:
+                yield from behavior(request, context)
+                code, upstream_error = context.code(), context.upstream_error is not None
+            except Exception as e:
+                code, upstream_error = grpc.StatusCode.INTERNAL, is_retryable(e)
+                raise
+            finally:
+                self._record(breaker, code, upstream_error)
+
+        return guarded_behavior
@@ -0,0 +1,165 @@
+"""
+Bulkheads
+
+grpc.server runs every handler on one shared thread pool, so a burst of
+slow calls can occupy every worker. Each bulkhead caps how many of those
+workers one group of RPCs may hold at once and how many more of its
+requests may wait for a slot; anything beyond that is rejected with
+RESOURCE_EXHAUSTED. Sizing the server pool to the sum of all bulkhead
+capacities guarantees every group its share however busy the others are.
+"""
+
+import logging
+import threading
+from typing import Dict, NamedTuple, Optional
+
+import grpc
+
+from src.admission import COST_EXPENSIVE, EXEMPT_METHODS, METHOD_COSTS
+
+logger = logging.getLogger(__name__)
+
+
+class BulkheadConfig(NamedTuple):
+    max_concurrent: int
+    max_queue: int
+
+
+# Bulkhead name -> limits; see bulkhead_for() for how methods map onto them
+DEFAULT_BULKHEADS = {
+    'ticker': BulkheadConfig(max_concurrent=8, max_queue=16),
+    'ticker-expensive': BulkheadConfig(max_concurrent=4, max_queue=8),
+    'search': BulkheadConfig(max_concurrent=2, max_queue=8),
+    'market': BulkheadConfig(max_concurrent=2, max_queue=8),
+    'sector': BulkheadConfig(max_concurrent=2, max_queue=8),
+    'streams': BulkheadConfig(max_concurrent=16, max_queue=0),
+}
+
+
+def bulkhead_for(method: str) -> str:
+    """Bulkhead name for a full method name such as /yfinance_grpc.v1alpha1.TickerService/GetIsin"""
+    if method in EXEMPT_METHODS:
+        return 'streams'
+    service = method.rsplit('/', 2)[-2].rsplit('.', 1)[-1]
+    name = service[:-len('Service')].lower() if service.endswith('Service') else service.lower()
+    if name == 'ticker' and METHOD_COSTS.get(method) == COST_EXPENSIVE:
+        return 'ticker-expensive'
+    return name
+
+
+def total_capacity(configs: Dict[str, BulkheadConfig]) -> int:
+    """Server worker threads needed for every bulkhead to run and queue at its limits"""
+    return sum(config.max_concurrent + config.max_queue for config in configs.values())
+
+
+class Bulkhead:
+    """Bounded concurrency with a bounded wait queue"""
+
+    def __init__(self, name: str, max_concurrent: int, max_queue: int):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        self._lock = threading.Lock()
+        self._waiting = 0
+        self._inflight = 0
+        self.rejected = 0
+
+    @property
+    def inflight(self) -> int:
+        return self._inflight
+
+    @property
+    def waiting(self) -> int:
+        return self._waiting
+
+    @property
+    def saturated(self) -> bool:
+        """True when every slot is taken and the wait queue is full, so new requests are rejected"""
+        with self._lock:
+            return self._inflight >= self.max_concurrent and self._waiting >= self.max_queue
+
+    def acquire(self, timeout: Optional[float]) -> bool:
+        if self._slots.acquire(blocking=False):
+            with self._lock:
+                self._inflight += 1
+            return True
+        with self._lock:
+            if self._waiting >= self.max_queue:
+                self.rejected += 1
+                return False
+            self._waiting += 1
+        try:
+            acquired = self._slots.acquire(timeout=timeout)
+        finally:
+            with self._lock:
+                self._waiting -= 1
+        with self._lock:
+            if acquired:
+                self._inflight += 1
+            else:
+                self.rejected += 1
+        return acquired
+
+    def release(self):
+        with self._lock:
+            self._inflight -= 1
+        self._slots.release()
+
+
+class BulkheadInterceptor(grpc.ServerInterceptor):
+    """Run each RPC inside its bulkhead, rejecting it when the bulkhead and its queue are full"""
+
+    def __init__(self, configs: Optional[Dict[str, BulkheadConfig]] = None, max_wait: float = 10.0):
+        configs = DEFAULT_BULKHEADS if configs is None else configs
+        self.bulkheads = {name: Bulkhead(name, *config) for name, config in configs.items()}
+        self.max_wait = max_wait
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        if handler is None:
+            return handler
+        bulkhead = self.bulkheads.get(bulkhead_for(handler_call_details.method))
+        if bulkhead is None:
+            return handler
+        kwargs = {
+            'request_deserializer': handler.request_deserializer,
+            'response_serializer': handler.response_serializer,
+        }
+        if handler.unary_unary is not None:
+            return grpc.unary_unary_rpc_method_handler(self._wrap_unary(bulkhead, handler.unary_unary), **kwargs)
+        if handler.unary_stream is not None:
+            return grpc.unary_stream_rpc_method_handler(self._wrap_stream(bulkhead, handler.unary_stream), **kwargs)
+        if handler.stream_stream is not None:
+            return grpc.stream_stream_rpc_method_handler(self._wrap_stream(bulkhead, handler.stream_stream), **kwargs)
+        return handler
+
+    def _enter(self, bulkhead: Bulkhead, context):
+        timeout = self.max_wait
+        remaining = context.time_remaining()
+        if isinstance(remaining, (int, float)):
+            timeout = max(0.0, min(timeout, remaining))
+        if not bulkhead.acquire(timeout):
+            logger.warning(f"Bulkhead '{bulkhead.name}' is full; rejecting request")
+            context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED,
+                          f"Server is at capacity for {bulkhead.name} requests; retry with backoff")
+
+    def _wrap_unary(self, bulkhead, behavior):
+        def bulkheaded_behavior(request, context):
+            self._enter(bulkhead, context)
+            try:
+                return behavior(request, context)
+            finally:
+                bulkhead.release()
+
+        return bulkheaded_behavior
+
+    def _wrap_stream(self, bulkhead, behavior):
+        def bulkheaded_behavior(request, context):
+            self._enter(bulkhead, context)
+            try:
+                yield from behavior(request, context)
+            finally:
+                bulkhead.release()
+
+        return bulkheaded_behavior
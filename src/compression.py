@@ -0,0 +1,48 @@
+"""
+Per-RPC response compression
+
+The server-wide default suits neither extreme: large history payloads shrink
+well under gzip, while tiny quote responses only pay its CPU cost. The
+policy maps method names to an algorithm that overrides the default for
+those RPCs.
+"""
+
+from typing import Dict
+
+import grpc
+
+
+class CompressionPolicyInterceptor(grpc.ServerInterceptor):
+    """Set each listed RPC's response compression before its handler runs"""
+
+    def __init__(self, policy: Dict[str, grpc.Compression]):
+        # Keys may be short ("DownloadHistory") or full ("/pkg.Service/DownloadHistory") method names
+        self.policy = policy
+
+    def compression_for(self, method: str):
+        return self.policy.get(method, self.policy.get(method.rsplit('/', 1)[-1]))
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        algorithm = self.compression_for(handler_call_details.method) if handler is not None else None
+        if algorithm is None:
+            return handler
+        kwargs = {
+            'request_deserializer': handler.request_deserializer,
+            'response_serializer': handler.response_serializer,
+        }
+        if handler.unary_unary is not None:
+            return grpc.unary_unary_rpc_method_handler(self._wrap(algorithm, handler.unary_unary), **kwargs)
+        if handler.unary_stream is not None:
+            return grpc.unary_stream_rpc_method_handler(self._wrap(algorithm, handler.unary_stream), **kwargs)
+        if handler.stream_stream is not None:
+            return grpc.stream_stream_rpc_method_handler(self._wrap(algorithm, handler.stream_stream), **kwargs)
+        return handler
+
+    @staticmethod
+    def _wrap(algorithm, behavior):
+        def compressed_behavior(request, context):
+            context.set_compression(algorithm)
+            return behavior(request, context)
+
+        return compressed_behavior
@@ -0,0 +1,203 @@
+"""
+Server configuration
+
+Settings come from, in increasing precedence: the defaults below, a TOML file
+(path from --config or YFINANCE_GRPC_CONFIG) with the same keys at top level,
+YFINANCE_GRPC_<KEY> environment variables, and command-line flags.
+
+Example TOML:
+
+    max_workers = 128
+    max_receive_message_length = 16777216
+    keepalive_time_ms = 30000
+    compression = "none"
+
+    [compression_policy]
+    DownloadHistory = "gzip"
+    GetHistory = "gzip"
+
+    [bulkheads]
+    streams = { max_concurrent = 64, max_queue = 0 }
+    ticker-expensive = "8:16"
+"""
+
+import os
+import tomllib
+from typing import Dict, NamedTuple, Optional
+
+import grpc
+
+from src.bulkhead import DEFAULT_BULKHEADS, BulkheadConfig
+
+ENV_PREFIX = 'YFINANCE_GRPC_'
+
+COMPRESSION_ALGORITHMS = {
+    'none': grpc.Compression.NoCompression,
+    'gzip': grpc.Compression.Gzip,
+    'deflate': grpc.Compression.Deflate,
+}
+
+
+class ServerConfig(NamedTuple):
+    port: int = 50059
+    workers: int = 1  # server processes; 0 = one per CPU
+    max_workers: Optional[int] = None  # threads per process; unset fits the bulkheads, and lower values are raised
+    max_concurrent_streams: Optional[int] = None
+    max_send_message_length: Optional[int] = None
+    max_receive_message_length: Optional[int] = None
+    keepalive_time_ms: Optional[int] = None
+    keepalive_timeout_ms: Optional[int] = None
+    keepalive_permit_without_calls: Optional[bool] = None
+    http2_min_ping_interval_without_data_ms: Optional[int] = None
+    http2_max_pings_without_data: Optional[int] = None
+    http2_bdp_probe: Optional[bool] = None
+    http2_lookahead_bytes: Optional[int] = None
+    http2_max_frame_size: Optional[int] = None
+    compression: str = 'none'  # default response compression: none, gzip or deflate
+    compression_policy: Optional[Dict[str, str]] = None  # method name -> compression, overriding the default
+    shutdown_grace: float = 30.0  # seconds in-flight RPCs get to finish after SIGTERM
+    cache_file: Optional[str] = None  # warm caches are saved here on shutdown and loaded on startup
+    universe_file: Optional[str] = None  # symbols to keep prefetched, one or more per line
+    prefetch_rate: float = 2.0  # upstream requests per second each process may spend on prefetch
+    retry_attempts: int = 3  # attempts per idempotent upstream call, including the first; 1 disables retries
+    hedging: bool = False  # race a duplicate GetFastInfo/market status fetch once the first is slower than p95
+    bar_archive_dir: Optional[str] = None  # closed history bars are archived here and ranges it holds served from it
+    bulkheads: Optional[Dict[str, BulkheadConfig]] = None  # bulkhead name -> limits, overriding DEFAULT_BULKHEADS
+
+
+# ServerConfig field -> gRPC channel argument; unset (None) fields keep gRPC's default
+_GRPC_OPTIONS = {
+    'max_concurrent_streams': 'grpc.max_concurrent_streams',
+    'max_send_message_length': 'grpc.max_send_message_length',
+    'max_receive_message_length': 'grpc.max_receive_message_length',
+    'keepalive_time_ms': 'grpc.keepalive_time_ms',
+    'keepalive_timeout_ms': 'grpc.keepalive_timeout_ms',
+    'keepalive_permit_without_calls': 'grpc.keepalive_permit_without_calls',
+    'http2_min_ping_interval_without_data_ms': 'grpc.http2.min_ping_interval_without_data_ms',
+    'http2_max_pings_without_data': 'grpc.http2.max_pings_without_data',
+    'http2_bdp_probe': 'grpc.http2.bdp_probe',
+    'http2_lookahead_bytes': 'grpc.http2.lookahead_bytes',
+    'http2_max_frame_size': 'grpc.http2.max_frame_size',
+}
+
+_BOOL_FIELDS = frozenset({'keepalive_permit_without_calls', 'http2_bdp_probe', 'hedging'})
+_STR_FIELDS = frozenset({'compression'})
+_FLOAT_FIELDS = frozenset({'shutdown_grace', 'prefetch_rate'})
+_PATH_FIELDS = frozenset({'cache_file', 'universe_file', 'bar_archive_dir'})
+
+
+def _parse_bool(value) -> bool:
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in ('1', 'true', 'yes', 'on'):
+        return True
+    if text in ('0', 'false', 'no', 'off'):
+        return False
+    raise ValueError(f"Expected a boolean, got {value!r}")
+
+
+def _parse_policy(value) -> Dict[str, str]:
+    """Accept a TOML table or an env string such as 'DownloadHistory=gzip,GetIsin=none'"""
+    if isinstance(value, dict):
+        return {str(k): str(v) for k, v in value.items()}
+    policy = {}
+    for item in str(value).split(','):
+        if item.strip():
+            method, _, algorithm = item.partition('=')
+            policy[method.strip()] = algorithm.strip()
+    return policy
+
+
+def _parse_bulkheads(value) -> Dict[str, BulkheadConfig]:
+    """Accept a TOML table or an env string such as 'streams=64:0,ticker=16'
+
+    Each bulkhead takes 'CONCURRENT[:QUEUE]' or, in TOML, a table with
+    max_concurrent and/or max_queue; an omitted limit keeps its default.
+    """
+    if isinstance(value, dict):
+        items = value.items()
+    else:
+        items = [item.partition('=')[::2] for item in str(value).split(',') if item.strip()]
+    bulkheads = {}
+    for name, limits in items:
+        name = str(name).strip()
+        if name not in DEFAULT_BULKHEADS:
+            raise ValueError(f"Unknown bulkhead '{name}'; expected one of {', '.join(DEFAULT_BULKHEADS)}")
+        default = DEFAULT_BULKHEADS[name]
+        if isinstance(limits, dict):
+            unknown = sorted(set(limits) - set(BulkheadConfig._fields))
+            if unknown:
+                raise ValueError(f"Unknown limits for bulkhead '{name}': {', '.join(unknown)}")
+            config = default._replace(**{key: int(limit) for key, limit in limits.items()})
+        else:
+            concurrent, _, queue = str(limits).partition(':')
+            config = BulkheadConfig(int(concurrent), int(queue) if queue.strip() else default.max_queue)
+        if config.max_concurrent < 1 or config.max_queue < 0:
+            raise ValueError(f"Bulkhead '{name}' needs max_concurrent >= 1 and max_queue >= 0")
+        bulkheads[name] = config
+    return bulkheads
+
+
+def _coerce(field: str, value):
+    if value is None:
+        return None
+    if field == 'compression_policy':
+        return _parse_policy(value)
+    if field == 'bulkheads':
+        return _parse_bulkheads(value)
+    if field in _BOOL_FIELDS:
+        return _parse_bool(value)
+    if field in _STR_FIELDS:
+        return str(value).strip().lower()
+    if field in _FLOAT_FIELDS:
+        return float(value)
+    if field in _PATH_FIELDS:
+        return os.path.expanduser(str(value))
+    return int(value)
+
+
+def compression_algorithm(name: str) -> grpc.Compression:
+    try:
+        return COMPRESSION_ALGORITHMS[name.strip().lower()]
+    except KeyError:
+        raise ValueError(f"Unknown compression '{name}'; expected one of {', '.join(COMPRESSION_ALGORITHMS)}")
+
+
+def load_config(path: Optional[str] = None, environ=None, **overrides) -> ServerConfig:
+    """Build a ServerConfig from the TOML file, environment and non-None overrides"""
+    environ = os.environ if environ is None else environ
+    values = {}
+    path = path or environ.get(ENV_PREFIX + 'CONFIG')
+    if path:
+        with open(path, 'rb') as f:
+            values.update(tomllib.load(f))
+    for field in ServerConfig._fields:
+        if ENV_PREFIX + field.upper() in environ:
+            values[field] = environ[ENV_PREFIX + field.upper()]
+    values.update({k: v for k, v in overrides.items() if v is not None})
+
+    unknown = sorted(set(values) - set(ServerConfig._fields))
+    if unknown:
+        raise ValueError(f"Unknown config keys: {', '.join(unknown)}")
+    config = ServerConfig(**{field: _coerce(field, value) for field, value in values.items()})
+    # Fail at startup rather than on the first response
+    compression_algorithm(config.compression)
+    for algorithm in (config.compression_policy or {}).values():
+        compression_algorithm(algorithm)
+    return config
+
+
+def bulkhead_configs(config: ServerConfig) -> Dict[str, BulkheadConfig]:
+    """DEFAULT_BULKHEADS with the configured overrides applied"""
+    return {**DEFAULT_BULKHEADS, **(config.bulkheads or {})}
+
+
+def grpc_options(config: ServerConfig) -> list:
+    """gRPC channel arguments for grpc.server(options=...)"""
+    options = []
+    for field, option in _GRPC_OPTIONS.items():
+        value = getattr(config, field)
+        if value is not None:
+            options.append((option, int(value)))
+    return options
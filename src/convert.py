@@ -0,0 +1,180 @@
+"""
+Shared value conversions for building protobuf messages
+
+yfinance hands back Python scalars, NumPy scalars, pandas Timestamps and
+whole DataFrame columns, often with NaN or None for missing values. The
+scalar converters dispatch on the exact type first, so the common float,
+int and str cases cost a type check instead of a pd.isna call, and fall
+back to a general path that maps anything unconvertible to the default.
+The *_column versions convert a whole column with NumPy and return plain
+Python lists for message construction. Timestamps are built from integer
+nanoseconds through a small cache, since the same dates recur across
+symbols and requests; the cached messages are shared and must not be
+modified in place. Long timestamp columns (intraday histories) bypass the
+cache: their values rarely repeat, and a sequential scan larger than the
+cache would only evict the entries that do.
+"""
+
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import List, Optional
+
+from google.protobuf.timestamp_pb2 import Timestamp
+
+from src.lazy import lazy_import
+
+np = lazy_import('numpy')
+pd = lazy_import('pandas')
+
+# int64 value pandas uses for NaT
+NAT = -2 ** 63
+
+_NANOS_PER_SECOND = 1_000_000_000
+
+# Timestamp columns longer than this are built without the cache
+_CACHED_COLUMN_ROWS = 4096
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def safe_float(value, default: float = 0.0) -> float:
+    """value as a float; default for None, NaN and anything float() rejects"""
+    cls = type(value)
+    if cls is float:
+        return default if value != value else value
+    if cls is int:
+        return float(value)
+    if value is None:
+        return default
+    try:
+        result = float(value)
+    except (TypeError, ValueError):
+        return default
+    return default if result != result else result
+
+
+def safe_int(value, default: int = 0) -> int:
+    """value truncated to an int; default for None, NaN, infinity and anything int() rejects"""
+    cls = type(value)
+    if cls is int:
+        return value
+    if cls is float:
+        return default if value != value or value in (float('inf'), float('-inf')) else int(value)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except (TypeError, ValueError, OverflowError):
+        return default
+
+
+def safe_str(value, default: str = "") -> str:
+    """value as a str; default for None and float NaN"""
+    if type(value) is str:
+        return value
+    if value is None or (isinstance(value, float) and value != value):
+        return default
+    return str(value)
+
+
+@lru_cache(maxsize=65536)
+def timestamp_from_ns(ns: int) -> Timestamp:
+    """Shared, read-only Timestamp for nanoseconds since the epoch"""
+    seconds, nanos = divmod(ns, _NANOS_PER_SECOND)
+    return Timestamp(seconds=seconds, nanos=nanos)
+
+
+def timestamp_from_seconds(seconds) -> Timestamp:
+    """Shared, read-only Timestamp for whole seconds since the epoch"""
+    return timestamp_from_ns(int(seconds) * _NANOS_PER_SECOND)
+
+
+def datetime_to_timestamp(value) -> Optional[Timestamp]:
+    """Timestamp for a datetime or pd.Timestamp, to the microsecond; None for NaT and anything else
+
+    Naive values are taken as UTC, as Timestamp.FromDatetime does.
+    """
+    if not isinstance(value, datetime):
+        return None
+    if type(value) is not datetime:
+        # pd.Timestamp and NaT subclass datetime, so pandas is already loaded here
+        if value is pd.NaT:
+            return None
+        if isinstance(value, pd.Timestamp):
+            ns = value.value
+            return timestamp_from_ns(ns - ns % 1000)
+    delta = value - (_EPOCH if value.tzinfo is None else _EPOCH_UTC)
+    return timestamp_from_ns(((delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds) * 1000)
+
+
+def datetime_ns(values) -> np.ndarray:
+    """UTC nanoseconds since the epoch for datetime-like values; naive values are taken as UTC
+
+    This is the raw int64 epoch column for consumers that do not need
+    Timestamp messages. Exchange-local indexes (e.g. America/New_York bars)
+    are converted to UTC first, so DST shifts are accounted for; NaT stays NAT.
+    """
+    index = pd.DatetimeIndex(values)
+    if index.tz is not None:
+        index = index.tz_convert('UTC').tz_localize(None)
+    return index.as_unit('ns').asi8
+
+
+def _float_array(values) -> np.ndarray:
+    if hasattr(values, 'to_numpy'):
+        return values.to_numpy(dtype=np.float64, na_value=np.nan)
+    return np.asarray(values, dtype=np.float64)
+
+
+def float_column(values, default: float = 0.0) -> List[float]:
+    """safe_float over a column (Series, array or sequence) in one pass"""
+    try:
+        array = _float_array(values)
+    except (TypeError, ValueError):
+        return [safe_float(value, default) for value in values]
+    return np.where(np.isnan(array), default, array).tolist()
+
+
+def int_column(values, default: int = 0) -> List[int]:
+    """safe_int over a column in one pass"""
+    array = values.to_numpy() if hasattr(values, 'to_numpy') else np.asarray(values)
+    if array.dtype.kind in 'iu':
+        return array.tolist()
+    try:
+        array = _float_array(values)
+    except (TypeError, ValueError):
+        return [safe_int(value, default) for value in values]
+    finite = np.isfinite(array)
+    return np.where(finite, array, default).astype(np.int64).tolist()
+
+
+def str_column(values, default: str = "") -> List[str]:
+    """safe_str over a column"""
+    return [safe_str(value, default) for value in values]
+
+
+def timestamp_column(values) -> List[Optional[Timestamp]]:
+    """datetime_to_timestamp over a column or index, reading datetime64 values as int64 once
+
+    Anything without a datetime64 dtype (object columns of mixed or string
+    values) goes through datetime_to_timestamp value by value, so it is
+    never parsed and non-datetimes still map to None.
+    """
+    dtype = getattr(values, 'dtype', None)
+    if dtype is None or dtype.kind != 'M':
+        return [datetime_to_timestamp(value) for value in values]
+    return timestamps_from_ns(datetime_ns(values))
+
+
+def timestamps_from_ns(ns: np.ndarray) -> List[Optional[Timestamp]]:
+    """Timestamps, to the microsecond, for an array of epoch nanoseconds; None for NaT"""
+    missing = ns == NAT
+    ns = np.where(missing, 0, ns)
+    ns -= ns % 1000
+    if len(ns) <= _CACHED_COLUMN_ROWS:
+        return [None if gap else timestamp_from_ns(value) for value, gap in zip(ns.tolist(), missing.tolist())]
+    seconds, nanos = np.divmod(ns, _NANOS_PER_SECOND)
+    return [
+        None if gap else Timestamp(seconds=second, nanos=nano)
+        for second, nano, gap in zip(seconds.tolist(), nanos.tolist(), missing.tolist())
+    ]
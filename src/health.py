@@ -0,0 +1,127 @@
+"""
+Readiness reporting through the standard grpc.health.v1 service
+
+A ReadinessMonitor periodically recomputes the status of every service and
+publishes it on a grpc_health HealthServicer. A service is NOT_SERVING until
+the monitor is started and the warm-up steps (heavy imports, first upstream fetches) have finished,
+while every bulkhead it runs in is saturated, or while any check registered
+for it reports a problem. The overall "" status follows the same warm-up and
+is NOT_SERVING only when no service can take traffic.
+"""
+
+import logging
+import threading
+from typing import Callable, Dict, List, Optional, Sequence
+
+from grpc_health.v1 import health, health_pb2
+
+logger = logging.getLogger(__name__)
+
+SERVING = health_pb2.HealthCheckResponse.SERVING
+NOT_SERVING = health_pb2.HealthCheckResponse.NOT_SERVING
+
+# Overall server health, as queried by clients that send no service name
+OVERALL = ''
+
+# Service full name -> bulkheads its RPCs run in
+SERVICE_BULKHEADS = {
+    'yfinance_grpc.v1alpha1.TickerService': ('ticker', 'ticker-expensive'),
+    'yfinance_grpc.v1alpha1.SearchService': ('search',),
+    'yfinance_grpc.v1alpha1.MarketService': ('market',),
+    'yfinance_grpc.v1alpha1.SectorService': ('sector',),
+}
+
+
+class ReadinessMonitor:
+    """Keep a HealthServicer's per-service statuses in step with warm-up, load and registered checks"""
+
+    def __init__(self, servicer: health.HealthServicer, bulkheads: Optional[dict] = None,
+                 services: Optional[Dict[str, Sequence[str]]] = None, interval: float = 1.0):
+        self.servicer = servicer
+        self.bulkheads = {} if bulkheads is None else bulkheads
+        self.services = SERVICE_BULKHEADS if services is None else services
+        self.interval = interval
+        self._checks: Dict[Optional[str], List[Callable[[], Optional[str]]]] = {}
+        self._warmups: List[threading.Thread] = []
+        self._statuses: Dict[str, int] = {}
+        self._stop = threading.Event()
+        self._thread = None
+        self.update()
+
+    def add_check(self, check: Callable[[], Optional[str]], service: Optional[str] = None):
+        """Register check for service (or every service when None); it returns a reason when unhealthy"""
+        self._checks.setdefault(service, []).append(check)
+
+    def warm_up(self, *steps: Callable[[], object]) -> threading.Thread:
+        """Run steps in order on a background thread; services stay NOT_SERVING until it finishes"""
+        thread = threading.Thread(target=self._warm_up, args=(steps,), name="warm-up", daemon=True)
+        self._warmups.append(thread)
+        thread.start()
+        return thread
+
+    @staticmethod
+    def _warm_up(steps):
+        for step in steps:
+            try:
+                step()
+            except Exception as e:
+                # Failing to warm up is not fatal; upstream health checks report the outage itself
+                logger.warning(f"Warm-up step failed: {e}")
+
+    @property
+    def warm(self) -> bool:
+        # Nothing is ready before start(), so warm-up steps registered after construction still count
+        return self._thread is not None and not any(thread.is_alive() for thread in self._warmups)
+
+    def saturated(self, service: str) -> bool:
+        """True when every bulkhead serving service is full and its queue is full"""
+        bulkheads = [self.bulkheads[name] for name in self.services.get(service, ()) if name in self.bulkheads]
+        return bool(bulkheads) and all(bulkhead.saturated for bulkhead in bulkheads)
+
+    def problems(self, service: str) -> List[str]:
+        """Reasons service cannot take traffic right now; empty when it is ready"""
+        if not self.warm:
+            return ["warming up"]
+        problems = []
+        if self.saturated(service):
+            problems.append("at capacity")
+        for check in self._checks.get(None, []) + self._checks.get(service, []):
+            try:
+                problem = check()
+            except Exception as e:
+                problem = f"health check failed: {e}"
+            if problem:
+                problems.append(problem)
+        return problems
+
+    def update(self) -> Dict[str, int]:
+        """Recompute every status, publish changes to the servicer and return the new statuses"""
+        statuses = {}
+        for service in self.services:
+            problems = self.problems(service)
+            statuses[service] = NOT_SERVING if problems else SERVING
+            if statuses[service] != self._statuses.get(service):
+                logger.info(f"{service} is {'NOT_SERVING: ' + ', '.join(problems) if problems else 'SERVING'}")
+        ready = self.warm and any(status == SERVING for status in statuses.values())
+        statuses[OVERALL] = SERVING if ready else NOT_SERVING
+        for service, status in statuses.items():
+            if status != self._statuses.get(service):
+                self.servicer.set(service, status)
+        self._statuses = statuses
+        return statuses
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="readiness", daemon=True)
+            self._thread.start()
+            self.update()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.update()
+            except Exception as e:
+                logger.warning(f"Readiness update failed: {e}")
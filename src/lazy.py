@@ -0,0 +1,51 @@
+"""
+Deferred imports for heavy dependencies
+
+yfinance, pandas and numpy take most of the process's import time. Modules
+bind them through lazy_import() so importing the server costs little and the
+port is bound right away; the real import runs on first attribute access, or
+earlier when preload() warms them on a background thread after startup.
+"""
+
+import importlib
+import importlib.util
+import logging
+import sys
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Imported in this order by preload(); pandas and numpy come in with yfinance
+HEAVY_MODULES = ('yfinance', 'dateutil.parser')
+
+
+def lazy_import(name: str):
+    """Return module name, deferring its execution until an attribute is first used"""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+def _load(names):
+    for name in names:
+        started = time.perf_counter()
+        module = importlib.import_module(name)
+        # Touching an attribute runs a lazily bound module's body
+        module.__name__
+        logger.info(f"Preloaded {name} in {(time.perf_counter() - started) * 1000:.0f} ms")
+
+
+def preload(names=HEAVY_MODULES) -> threading.Thread:
+    """Import names on a daemon thread so the first requests do not pay for them"""
+    thread = threading.Thread(target=_load, args=(names,), name="preload", daemon=True)
+    thread.start()
+    return thread
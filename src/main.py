@@ -2,7 +2,103 @@
 yfinance gRPC Server Entry Point
 """
 
+import argparse
+import logging
+import multiprocessing
+import os
+import signal
+import sys
+import time
+from multiprocessing.connection import wait
+
+from src.config import ServerConfig, load_config
 from src.server import serve
 
+logger = logging.getLogger(__name__)
+
+# Seconds a worker must run before its death is treated as a crash to restart
+_MIN_WORKER_UPTIME = 10.0
+
+
+def run_workers(config: ServerConfig):
+    """Run one server process per worker, all bound to config.port via SO_REUSEPORT
+
+    A worker that dies is started again. One that dies within
+    _MIN_WORKER_UPTIME seconds of starting is failing to run at all, so the
+    rest are stopped and the launcher exits non-zero for its supervisor.
+    """
+    # Spawned children start with a fresh gRPC runtime; forking after gRPC has started is unsafe
+    ctx = multiprocessing.get_context('spawn')
+    started = [0.0] * config.workers
+    stopping = False
+
+    def start(i):
+        process = ctx.Process(
+            target=serve,
+            kwargs={'reuse_port': True, 'config': config},
+            name=f"yfinance-grpc-{i}",
+        )
+        process.start()
+        started[i] = time.monotonic()
+        return process
+
+    processes = [start(i) for i in range(config.workers)]
+    logger.info(f"Started {config.workers} server processes on port {config.port}")
+
+    def forward(signum, frame):
+        # Each process drains on SIGTERM; wait for them rather than exiting underneath them
+        nonlocal stopping
+        stopping = True
+        logger.info("Shutting down server processes...")
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(signum, forward)
+
+    failed = False
+    while True:
+        alive = [process for process in processes if process.exitcode is None]
+        if not alive:
+            break
+        ready = wait([process.sentinel for process in alive])
+        for i, process in enumerate(processes):
+            if process not in alive or process.sentinel not in ready:
+                continue
+            process.join()
+            if stopping:
+                continue
+            if time.monotonic() - started[i] < _MIN_WORKER_UPTIME:
+                logger.error(f"{process.name} exited with code {process.exitcode} right after starting")
+                failed = True
+                forward(None, None)
+                continue
+            logger.warning(f"{process.name} exited with code {process.exitcode}; restarting it")
+            processes[i] = start(i)
+    if failed:
+        sys.exit(1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="yfinance gRPC server")
+    parser.add_argument('--config', help="TOML config file (default: $YFINANCE_GRPC_CONFIG)")
+    parser.add_argument('--port', type=int)
+    parser.add_argument('--max-workers', type=int)
+    parser.add_argument('--workers', type=int,
+                        help="server processes sharing the port (0 = one per CPU)")
+    parser.add_argument('--bulkhead', action='append', metavar='NAME=CONCURRENT[:QUEUE]',
+                        help="override one bulkhead's limits; repeatable")
+    args = parser.parse_args(argv)
+
+    config = load_config(args.config, port=args.port, max_workers=args.max_workers, workers=args.workers,
+                         bulkheads=','.join(args.bulkhead) if args.bulkhead else None)
+    config = config._replace(workers=config.workers or os.cpu_count() or 1)
+    if config.workers == 1:
+        serve(config=config)
+    else:
+        run_workers(config)
+
+
 if __name__ == '__main__':
-    serve(port=50059, max_workers=10)
+    main()
@@ -0,0 +1,341 @@
+"""
+Market schedule cache
+
+Keeps the most recent yf.Market(...).status and summary per market and
+computes REGULAR/PRE/POST/CLOSED sessions locally from the cached open and
+close times. Once started, a background timer refreshes every tracked market
+so lookups are answered from memory and only a market's first lookup waits
+on Yahoo.
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import NamedTuple, Optional
+
+from src.lazy import lazy_import
+from src.retry import Upstream
+
+yf = lazy_import('yfinance')
+
+logger = logging.getLogger(__name__)
+
+# Yahoo symbol suffix -> market identifier, used until a symbol's info reports its market
+_SUFFIX_MARKETS = {
+    '': 'us_market',
+    'L': 'gb_market',
+    'IL': 'gb_market',
+    'DE': 'de_market',
+    'F': 'de_market',
+    'PA': 'fr_market',
+    'AS': 'nl_market',
+    'MI': 'it_market',
+    'MC': 'es_market',
+    'SW': 'ch_market',
+    'ST': 'se_market',
+    'OL': 'no_market',
+    'CO': 'dk_market',
+    'HE': 'fi_market',
+    'T': 'jp_market',
+    'HK': 'hk_market',
+    'SS': 'cn_market',
+    'SZ': 'cn_market',
+    'KS': 'kr_market',
+    'KQ': 'kr_market',
+    'TW': 'tw_market',
+    'SI': 'sg_market',
+    'AX': 'au_market',
+    'NZ': 'nz_market',
+    'NS': 'in_market',
+    'BO': 'in_market',
+    'TO': 'ca_market',
+    'V': 'ca_market',
+    'SA': 'br_market',
+    'MX': 'mx_market',
+}
+
+
+SESSION_UNKNOWN = 'UNKNOWN'
+SESSION_PRE = 'PRE'
+SESSION_REGULAR = 'REGULAR'
+SESSION_POST = 'POST'
+SESSION_CLOSED = 'CLOSED'
+
+# Market identifier -> (pre-market, post-market) extended-hours windows around the regular session
+_EXTENDED_HOURS = {
+    'us_market': (timedelta(hours=5, minutes=30), timedelta(hours=4)),
+}
+
+
+class _MarketEntry(NamedTuple):
+    fetched_at: float
+    status: Optional[dict]
+    summary: Optional[dict]
+
+
+def _as_utc(value) -> Optional[datetime]:
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class MarketSchedule:
+    """Per-market cache of status and summary with locally computed sessions"""
+
+    def __init__(self, max_age: float = 6 * 3600, retry_after: float = 900,
+                 summary_interval: float = 30, upstream: Optional[Upstream] = None):
+        # max_age bounds how long a status is trusted; retry_after throttles refetches
+        # once the cached session has ended or a fetch has failed. summary_interval is
+        # the in-session summary refresh period.
+        self.max_age = max_age
+        self.retry_after = retry_after
+        self.summary_interval = summary_interval
+        self.upstream = upstream if upstream is not None else Upstream()
+        self._markets = {}
+        self._symbol_markets = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        # Session transitions bump _version and wake watchers waiting on _changed
+        self._changed = threading.Condition()
+        self._version = 0
+        self._sessions = {}
+
+    def start(self):
+        """Refresh tracked markets on a background timer so lookups never wait on Yahoo"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="market-schedule", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self.wake()
+
+    @property
+    def stopped(self) -> bool:
+        return self._stop.is_set()
+
+    def _run(self):
+        while not self._stop.wait(self._next_wakeup()):
+            with self._lock:
+                entries = list(self._markets.items())
+            for market, entry in entries:
+                if self._expired(entry) or self._summary_stale(entry):
+                    try:
+                        self._refresh(market)
+                    except Exception as e:
+                        logger.warning(f"Background refresh failed for market '{market}': {e}")
+            self._check_transitions()
+
+    def _next_wakeup(self) -> float:
+        """Seconds until the next refresh or the earliest cached session transition"""
+        timeout = self.summary_interval
+        now = _now()
+        with self._lock:
+            entries = list(self._markets.items())
+        for market, entry in entries:
+            next_transition = self._session(entry.status, now, market)[1]
+            if next_transition is not None:
+                timeout = min(timeout, (next_transition - now).total_seconds())
+        return max(timeout, 0.05)
+
+    def _check_transitions(self):
+        now = _now()
+        with self._lock:
+            entries = list(self._markets.items())
+        changed = False
+        for market, entry in entries:
+            current = self._session(entry.status, now, market)
+            if self._sessions.get(market) != current:
+                self._sessions[market] = current
+                changed = True
+        if changed:
+            with self._changed:
+                self._version += 1
+                self._changed.notify_all()
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def wait_for_transition(self, version: int, timeout: Optional[float] = None, is_active=None) -> int:
+        """Block until a session transition after version, is_active() turns false, stop(), or timeout"""
+        with self._changed:
+            self._changed.wait_for(
+                lambda: (self._version != version or self._stop.is_set()
+                         or (is_active is not None and not is_active())),
+                timeout,
+            )
+            return self._version
+
+    def wake(self):
+        """Wake watchers so they re-check their stream state"""
+        with self._changed:
+            self._changed.notify_all()
+
+    def _refresh(self, market: str) -> _MarketEntry:
+        fetched_at = time.monotonic()
+        with self._lock:
+            previous = self._markets.get(market)
+        try:
+            # A market's first fetch blocks GetMarketStatus, so it may be hedged
+            status, summary = self.upstream.call(None, lambda: self._fetch(market), name='market', hedge=True)
+        except Exception:
+            if previous is None:
+                raise
+            entry = _MarketEntry(fetched_at, previous.status, previous.summary)
+        else:
+            entry = _MarketEntry(fetched_at, status, summary)
+        with self._lock:
+            self._markets[market] = entry
+        return entry
+
+    @staticmethod
+    def _fetch(market: str):
+        # yf.Market fetches status and summary together on first access
+        ticker_market = yf.Market(market)
+        return ticker_market.status or None, ticker_market.summary or None
+
+    def _entry(self, market: str, need_summary: bool = False) -> _MarketEntry:
+        with self._lock:
+            entry = self._markets.get(market)
+        if entry is None:
+            return self._refresh(market)
+        stale = self._expired(entry) or (need_summary and self._summary_stale(entry))
+        if stale and self._thread is None:
+            return self._refresh(market)
+        return entry
+
+    def _expired(self, entry: _MarketEntry) -> bool:
+        age = time.monotonic() - entry.fetched_at
+        if age >= self.max_age:
+            return True
+        if not entry.status:
+            return age >= self.retry_after
+        close = _as_utc(entry.status.get('close'))
+        return close is not None and _now() >= close and age >= self.retry_after
+
+    def _summary_stale(self, entry: _MarketEntry) -> bool:
+        age = time.monotonic() - entry.fetched_at
+        session = self._session(entry.status, _now())[0]
+        interval = self.summary_interval if session != SESSION_CLOSED else self.retry_after
+        return age >= interval
+
+    def status(self, market: str) -> Optional[dict]:
+        """Cached yf.Market(market).status; raises only when nothing is cached and the fetch fails"""
+        return self._entry(market).status
+
+    def summary(self, market: str) -> Optional[dict]:
+        """Cached yf.Market(market).summary; raises only when nothing is cached and the fetch fails"""
+        return self._entry(market, need_summary=True).summary
+
+    def session(self, market: str, now: Optional[datetime] = None):
+        """Return (session, next_transition) for market computed from the cached open/close times"""
+        status = self.status(market)
+        return self._session(status, now or _now(), market)
+
+    @staticmethod
+    def _session(status, now: datetime, market: Optional[str] = None):
+        open_ = _as_utc(status.get('open')) if status else None
+        close = _as_utc(status.get('close')) if status else None
+        if open_ is None or close is None:
+            return SESSION_UNKNOWN, None
+        pre, post = _EXTENDED_HOURS.get(market, (timedelta(0), timedelta(0)))
+        if now < open_ - pre:
+            return SESSION_CLOSED, open_ - pre
+        if now < open_:
+            return SESSION_PRE, open_
+        if now < close:
+            return SESSION_REGULAR, close
+        if now < close + post:
+            return SESSION_POST, close + post
+        # The next session is unknown until Yahoo publishes it
+        return SESSION_CLOSED, None
+
+    def is_open(self, market: str, now: Optional[datetime] = None) -> Optional[bool]:
+        """Whether market is inside its regular session; None when unknown"""
+        try:
+            session = self.session(market, now)[0]
+        except Exception as e:
+            logger.warning(f"Failed to fetch market status for '{market}': {e}")
+            return None
+        if session == SESSION_UNKNOWN:
+            return None
+        return session == SESSION_REGULAR
+
+    def ttl(self, market: str, open_ttl: float, closed_ttl: float, now: Optional[datetime] = None,
+            extended: bool = False) -> float:
+        """Cache TTL for market-sensitive data: open_ttl in session, until the next open outside it
+
+        With extended, the pre- and post-market windows count as in session,
+        for data such as extended-hours bars that keeps changing during them.
+        """
+        try:
+            status = self.status(market)
+        except Exception as e:
+            logger.warning(f"Failed to fetch market status for '{market}': {e}")
+            return open_ttl
+        open_ = _as_utc(status.get('open')) if status else None
+        close = _as_utc(status.get('close')) if status else None
+        if open_ is None or close is None:
+            return open_ttl
+        if extended:
+            pre, post = _EXTENDED_HOURS.get(market, (timedelta(0), timedelta(0)))
+            open_, close = open_ - pre, close + post
+        now = now or _now()
+        if now < open_:
+            return max(open_ttl, (open_ - now).total_seconds())
+        if now < close:
+            return open_ttl
+        # Session over but Yahoo has not rolled to the next one yet
+        return max(open_ttl, closed_ttl)
+
+    def snapshot(self) -> dict:
+        """Cached markets and symbol markets, with fetch times as wall-clock timestamps"""
+        offset = time.time() - time.monotonic()
+        with self._lock:
+            return {
+                'markets': {market: (entry.fetched_at + offset, entry.status, entry.summary)
+                            for market, entry in self._markets.items()},
+                'symbol_markets': dict(self._symbol_markets),
+            }
+
+    def restore(self, snapshot: dict) -> int:
+        """Load a snapshot() without overwriting fresher entries; returns the number of markets loaded"""
+        offset = time.time() - time.monotonic()
+        loaded = 0
+        with self._lock:
+            for market, (fetched_at, status, summary) in snapshot.get('markets', {}).items():
+                if market not in self._markets:
+                    # Entries past max_age are refetched on first use like any other
+                    self._markets[market] = _MarketEntry(fetched_at - offset, status, summary)
+                    loaded += 1
+            for symbol, market in snapshot.get('symbol_markets', {}).items():
+                self._symbol_markets.setdefault(symbol, market)
+        return loaded
+
+    def remember_market(self, symbol: str, market: Optional[str]):
+        """Record the market reported for symbol (e.g. info['market'])"""
+        if symbol and market:
+            with self._lock:
+                self._symbol_markets[symbol.upper()] = market
+
+    def market_for_symbol(self, symbol: str) -> Optional[str]:
+        """Yahoo market identifier for symbol, from reported info or its exchange suffix"""
+        symbol = symbol.strip().upper()
+        with self._lock:
+            market = self._symbol_markets.get(symbol)
+        if market:
+            return market
+        if symbol.startswith('^') or '=' in symbol or symbol.endswith('-USD'):
+            # Indices, currencies, futures and crypto trade outside a single exchange session
+            return None
+        suffix = symbol.rsplit('.', 1)[1] if '.' in symbol else ''
+        return _SUFFIX_MARKETS.get(suffix)
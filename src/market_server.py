@@ -9,78 +9,71 @@ sys.path.insert(0, str(project_root / "gen"))
 
 import grpc
 import logging
-from datetime import datetime
+from typing import Optional
 
-import yfinance as yf
-import pandas as pd
+from src.lazy import lazy_import
+
+yf = lazy_import('yfinance')
 
 from yfinance_grpc.v1alpha1 import market_pb2, market_pb2_grpc
-from google.protobuf.timestamp_pb2 import Timestamp
+from src.convert import datetime_to_timestamp, safe_float, safe_int, safe_str
+from src.market_schedule import (
+    MarketSchedule, SESSION_PRE, SESSION_REGULAR, SESSION_POST, SESSION_CLOSED,
+)
 
 logger = logging.getLogger(__name__)
 
 
-def safe_float(val, default: float = 0.0) -> float:
-    try:
-        if val is None or (isinstance(val, float) and pd.isna(val)):
-            return default
-        return float(val)
-    except (TypeError, ValueError):
-        return default
-
-
-def safe_int(val, default: int = 0) -> int:
-    try:
-        if val is None or (isinstance(val, float) and pd.isna(val)):
-            return default
-        return int(val)
-    except (TypeError, ValueError):
-        return default
+_SESSIONS = {
+    SESSION_PRE: market_pb2.MARKET_SESSION_PRE,
+    SESSION_REGULAR: market_pb2.MARKET_SESSION_REGULAR,
+    SESSION_POST: market_pb2.MARKET_SESSION_POST,
+    SESSION_CLOSED: market_pb2.MARKET_SESSION_CLOSED,
+}
 
 
-def safe_str(val, default: str = "") -> str:
-    if val is None or (isinstance(val, float) and pd.isna(val)):
-        return default
-    return str(val)
+def _status_message(status: dict, session: str, next_transition) -> market_pb2.MarketStatus:
+    tz = status.get("timezone") if isinstance(status.get("timezone"), dict) else {}
+    msg = market_pb2.MarketStatus(
+        market_type=safe_str(status.get("type")),
+        timezone_short=safe_str(tz.get("short")),
+        timezone_gmtoffset=safe_int(tz.get("gmtoffset")),
+        session=_SESSIONS.get(session, market_pb2.MARKET_SESSION_UNSPECIFIED),
+    )
+    for field, value in (("open", status.get("open")), ("close", status.get("close")),
+                         ("next_transition", next_transition)):
+        ts = datetime_to_timestamp(value)
+        if ts:
+            getattr(msg, field).CopyFrom(ts)
+    return msg
 
 
-def _dt_to_ts(dt) -> Timestamp | None:
-    if dt is None:
-        return None
-    if isinstance(dt, pd.Timestamp):
-        dt = dt.to_pydatetime()
-    if isinstance(dt, datetime):
-        ts = Timestamp()
-        ts.FromDatetime(dt)
-        return ts
-    return None
+# Upper bound on how long an idle watcher sleeps before re-checking its stream
+_WATCH_IDLE_TIMEOUT = 300.0
 
 
 class MarketServiceServicer(market_pb2_grpc.MarketServiceServicer):
+    def __init__(self, schedule: Optional[MarketSchedule] = None):
+        # Status and summary are served from the shared schedule cache; only a
+        # market's first request reaches Yahoo once the schedule is started.
+        self.schedule = schedule if schedule is not None else MarketSchedule()
+
     def GetMarketStatus(self, request, context):
         if not request.market:
             context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
             context.set_details("market must not be empty")
             return market_pb2.GetMarketStatusResponse()
         try:
-            status = yf.Market(request.market).status
+            status = self.schedule.status(request.market)
             if not status:
                 context.set_code(grpc.StatusCode.NOT_FOUND)
                 context.set_details(f"No status data for market '{request.market}'")
                 return market_pb2.GetMarketStatusResponse()
 
-            tz = status.get("timezone") if isinstance(status.get("timezone"), dict) else {}
-            msg = market_pb2.MarketStatus(
-                market_type=safe_str(status.get("type")),
-                timezone_short=safe_str(tz.get("short")),
-                timezone_gmtoffset=safe_int(tz.get("gmtoffset")),
+            session, next_transition = self.schedule.session(request.market)
+            return market_pb2.GetMarketStatusResponse(
+                status=_status_message(status, session, next_transition)
             )
-            for field, attr in (("open", "open"), ("close", "close")):
-                ts = _dt_to_ts(status.get(attr))
-                if ts:
-                    getattr(msg, field).CopyFrom(ts)
-
-            return market_pb2.GetMarketStatusResponse(status=msg)
         except Exception as e:
             logger.error(f"Error in GetMarketStatus for '{request.market}': {e}")
             context.set_code(grpc.StatusCode.INTERNAL)
@@ -93,7 +86,7 @@ class MarketServiceServicer(market_pb2_grpc.MarketServiceServicer):
             context.set_details("market must not be empty")
             return market_pb2.GetMarketSummaryResponse()
         try:
-            summary = yf.Market(request.market).summary
+            summary = self.schedule.summary(request.market)
             # yfinance returns {'finance': {'result': None, 'error': ...}} when
             # the market identifier is not valid for the summary endpoint.
             if not summary or "finance" in summary:
@@ -114,3 +107,45 @@ class MarketServiceServicer(market_pb2_grpc.MarketServiceServicer):
             context.set_code(grpc.StatusCode.INTERNAL)
             context.set_details(f"Error fetching market summary: {e}")
             return market_pb2.GetMarketSummaryResponse()
+
+    def WatchMarketStatus(self, request, context):
+        markets = list(dict.fromkeys(m for m in request.markets if m))
+        if not markets:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details("markets must not be empty")
+            return
+        try:
+            for market in markets:
+                if not self.schedule.status(market):
+                    context.set_code(grpc.StatusCode.NOT_FOUND)
+                    context.set_details(f"No status data for market '{market}'")
+                    return
+
+            # Every watcher shares the schedule's transition timer; a stream only
+            # wakes when some market changes session or the client goes away.
+            # It still holds its server thread while it sleeps, which is why the
+            # 'streams' bulkhead bounds how many watchers can be open at once.
+            context.add_callback(self.schedule.wake)
+            sent = {}
+            version = self.schedule.version
+            while context.is_active() and not self.schedule.stopped:
+                for market in markets:
+                    session, next_transition = self.schedule.session(market)
+                    if sent.get(market) == (session, next_transition):
+                        continue
+                    sent[market] = (session, next_transition)
+                    status = self.schedule.status(market) or {}
+                    yield market_pb2.WatchMarketStatusResponse(
+                        market=market,
+                        status=_status_message(status, session, next_transition),
+                    )
+                version = self.schedule.wait_for_transition(
+                    version, timeout=_WATCH_IDLE_TIMEOUT, is_active=context.is_active
+                )
+            if self.schedule.stopped and context.is_active():
+                context.set_code(grpc.StatusCode.UNAVAILABLE)
+                context.set_details("Server is shutting down; watch again")
+        except Exception as e:
+            logger.error(f"Error in WatchMarketStatus for {markets}: {e}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(f"Error watching market status: {e}")
@@ -0,0 +1,264 @@
+"""
+Process-pool offload for large DataFrame conversions
+
+Building protobuf messages row by row holds the GIL for the whole loop, so a
+single huge DownloadHistory or GetOptionChain conversion stalls every other
+request in the process. Frames of at least OFFLOAD_ROW_THRESHOLD rows are
+instead copied column by column into shared memory and converted in a worker
+process, which sends back encoded messages. Smaller frames stay in-thread,
+where the hand-off would cost more than it saves. The handlers pass those
+encoded messages straight to gRPC, whose serializer for these methods sends
+bytes as they are. A handler stops waiting for its conversion once the client
+cancels or the deadline passes; the worker finishes it and the result is dropped.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import threading
+from concurrent import futures
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional
+
+import grpc
+
+from src.convert import NAT, datetime_ns, float_column, int_column, str_column, timestamps_from_ns
+from src.lazy import lazy_import
+from yfinance_grpc.v1alpha1 import ticker_pb2
+
+np = lazy_import('numpy')
+pd = lazy_import('pandas')
+
+logger = logging.getLogger(__name__)
+
+# Frames with at least this many rows are converted in the process pool
+OFFLOAD_ROW_THRESHOLD = 10000
+
+# Methods whose handlers may return responses the pool has already encoded
+ENCODED_METHODS = frozenset({
+    '/yfinance_grpc.v1alpha1.TickerService/DownloadHistory',
+    '/yfinance_grpc.v1alpha1.TickerService/GetOptionChain',
+})
+
+# DataFrame column -> default when absent, for the numeric HistoryRow fields
+_HISTORY_COLUMNS = {'Open': 0.0, 'High': 0.0, 'Low': 0.0, 'Close': 0.0, 'Volume': 0.0}
+
+_OPTION_FLOAT_COLUMNS = ('strike', 'lastPrice', 'bid', 'ask', 'change', 'percentChange', 'impliedVolatility')
+_OPTION_INT_COLUMNS = ('volume', 'openInterest')
+
+# How often a handler waiting on a conversion re-checks whether its client still wants it
+_POLL_INTERVAL = 0.25
+
+
+class SharedColumns:
+    """Columns of a frame packed for a worker: numeric arrays in one shared-memory block, the rest inline"""
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        numeric = {name: np.ascontiguousarray(a) for name, a in arrays.items() if a.dtype.kind in 'biuf'}
+        self.objects = {name: list(a) for name, a in arrays.items() if name not in numeric}
+        self.layout = []
+        self._shm = shared_memory.SharedMemory(create=True, size=max(1, sum(a.nbytes for a in numeric.values())))
+        offset = 0
+        for name, array in numeric.items():
+            view = np.ndarray(array.shape, dtype=array.dtype, buffer=self._shm.buf, offset=offset)
+            view[:] = array
+            del view
+            self.layout.append((name, array.dtype.str, offset, len(array)))
+            offset += array.nbytes
+
+    @property
+    def descriptor(self):
+        return self._shm.name, self.layout, self.objects
+
+    def close(self):
+        self._shm.close()
+        self._shm.unlink()
+
+
+@contextmanager
+def _attached(descriptor):
+    """Map a SharedColumns descriptor back to {name: array} inside a worker"""
+    name, layout, objects = descriptor
+    shm = shared_memory.SharedMemory(name=name, track=False)
+    columns = dict(objects)
+    try:
+        for column, dtype, offset, length in layout:
+            columns[column] = np.ndarray((length,), dtype=np.dtype(dtype), buffer=shm.buf, offset=offset)
+        yield columns
+    finally:
+        columns.clear()
+        try:
+            shm.close()
+        except BufferError:
+            # A view outlived the conversion (e.g. after an error); the mapping goes with it
+            pass
+
+
+def _convert_history(descriptor, ticker: str, batch_size: int) -> List[bytes]:
+    """Worker: encode DownloadHistoryResponse batches for one ticker's frame"""
+    batches = []
+    with _attached(descriptor) as columns:
+        dates = timestamps_from_ns(columns['date'])
+        opens, highs, lows, closes = (float_column(columns[name]) for name in ('Open', 'High', 'Low', 'Close'))
+        volumes = int_column(columns['Volume'])
+        for start in range(0, len(dates), batch_size):
+            rows = [
+                ticker_pb2.HistoryRow(
+                    date=dates[i],
+                    open=opens[i],
+                    high=highs[i],
+                    low=lows[i],
+                    close=closes[i],
+                    volume=volumes[i],
+                )
+                for i in range(start, min(start + batch_size, len(dates)))
+            ]
+            batches.append(ticker_pb2.DownloadHistoryResponse(ticker=ticker, rows=rows).SerializeToString())
+    return batches
+
+
+def _contracts(columns) -> list:
+    floats = {name: float_column(columns[name]) for name in _OPTION_FLOAT_COLUMNS}
+    ints = {name: int_column(columns[name]) for name in _OPTION_INT_COLUMNS}
+    strs = {name: str_column(columns[name]) for name in ('contractSymbol', 'currency', 'contractSize')}
+    in_the_money = [bool(value) for value in columns['inTheMoney']]
+    last_trade_dates = timestamps_from_ns(columns['lastTradeDate'])
+    return [
+        ticker_pb2.OptionContract(
+            contract_symbol=strs['contractSymbol'][i],
+            strike=floats['strike'][i],
+            currency=strs['currency'][i],
+            last_price=floats['lastPrice'][i],
+            bid=floats['bid'][i],
+            ask=floats['ask'][i],
+            change=floats['change'][i],
+            percent_change=floats['percentChange'][i],
+            volume=ints['volume'][i],
+            open_interest=ints['openInterest'][i],
+            implied_volatility=floats['impliedVolatility'][i],
+            in_the_money=in_the_money[i],
+            contract_size=strs['contractSize'][i],
+            last_trade_date=last_trade_dates[i],
+        )
+        for i in range(len(last_trade_dates))
+    ]
+
+
+def _convert_option_chain(calls_descriptor, puts_descriptor) -> bytes:
+    """Worker: encode a GetOptionChainResponse"""
+    with _attached(calls_descriptor) as calls, _attached(puts_descriptor) as puts:
+        response = ticker_pb2.GetOptionChainResponse(calls=_contracts(calls), puts=_contracts(puts))
+    return response.SerializeToString()
+
+
+def history_arrays(frame: pd.DataFrame) -> Dict[str, np.ndarray]:
+    arrays = {'date': datetime_ns(frame.index)}
+    for column, default in _HISTORY_COLUMNS.items():
+        if column in frame:
+            arrays[column] = frame[column].to_numpy(dtype=np.float64, na_value=np.nan)
+        else:
+            arrays[column] = np.full(len(frame), default)
+    return arrays
+
+
+def option_arrays(frame: pd.DataFrame) -> Dict[str, np.ndarray]:
+    n = len(frame)
+    arrays = {}
+    for column in _OPTION_FLOAT_COLUMNS + _OPTION_INT_COLUMNS:
+        if column in frame:
+            arrays[column] = frame[column].to_numpy(dtype=np.float64, na_value=np.nan)
+        else:
+            arrays[column] = np.zeros(n)
+    for column, default in (('contractSymbol', ''), ('currency', ''), ('contractSize', 'REGULAR')):
+        arrays[column] = frame[column].to_numpy(dtype=object) if column in frame else np.full(n, default, dtype=object)
+    arrays['inTheMoney'] = (frame['inTheMoney'].to_numpy(dtype=object) if 'inTheMoney' in frame
+                            else np.zeros(n, dtype=bool))
+    arrays['lastTradeDate'] = datetime_ns(frame['lastTradeDate']) if 'lastTradeDate' in frame else np.full(n, NAT)
+    return arrays
+
+
+class ConversionPool:
+    """Lazily started process pool that converts large frames into encoded responses"""
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _pool(self) -> futures.Executor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = futures.ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                )
+            return self._executor
+
+    def _run(self, context, fn, packed: List[SharedColumns], *args):
+        """fn's result, or None once context is cancelled or past its deadline"""
+        try:
+            future = self._pool().submit(fn, *[p.descriptor for p in packed], *args)
+            while True:
+                remaining = context.time_remaining()
+                # time_remaining() is None when the client set no deadline
+                if not context.is_active() or (remaining is not None and remaining <= 0):
+                    future.cancel()
+                    return None
+                timeout = _POLL_INTERVAL if remaining is None else min(_POLL_INTERVAL, remaining)
+                try:
+                    return future.result(timeout)
+                except futures.TimeoutError:
+                    continue
+        finally:
+            # A worker still converting keeps its own mapping; unlinking only removes the name
+            for p in packed:
+                p.close()
+
+    def history_batches(self, ticker: str, frame: pd.DataFrame, batch_size: int, context) -> Optional[List[bytes]]:
+        """Encoded DownloadHistoryResponse batches for frame, converted in a worker; None if abandoned"""
+        return self._run(context, _convert_history, [SharedColumns(history_arrays(frame))], ticker, batch_size)
+
+    def option_chain(self, calls: pd.DataFrame, puts: pd.DataFrame, context) -> Optional[bytes]:
+        """Encoded GetOptionChainResponse for calls and puts, converted in a worker; None if abandoned"""
+        packed = [SharedColumns(option_arrays(calls))]
+        try:
+            packed.append(SharedColumns(option_arrays(puts)))
+        except Exception:
+            packed[0].close()
+            raise
+        return self._run(context, _convert_option_chain, packed)
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(cancel_futures=True)
+                self._executor = None
+
+
+def encode_response(response) -> bytes:
+    """Response serializer that sends already encoded responses as they are"""
+    return response if isinstance(response, bytes) else response.SerializeToString()
+
+
+class EncodedResponseInterceptor(grpc.ServerInterceptor):
+    """Let ENCODED_METHODS handlers return pool-encoded bytes without a parse and re-encode"""
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        if handler is None or handler_call_details.method not in ENCODED_METHODS:
+            return handler
+        if handler.unary_unary is not None:
+            return grpc.unary_unary_rpc_method_handler(
+                handler.unary_unary,
+                request_deserializer=handler.request_deserializer,
+                response_serializer=encode_response,
+            )
+        if handler.unary_stream is not None:
+            return grpc.unary_stream_rpc_method_handler(
+                handler.unary_stream,
+                request_deserializer=handler.request_deserializer,
+                response_serializer=encode_response,
+            )
+        return handler
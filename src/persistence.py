@@ -0,0 +1,101 @@
+"""
+Cache persistence across restarts
+
+On shutdown the server writes a snapshot of its warm caches to a file and
+loads it again on startup, so a restarted or redeployed instance answers
+from memory instead of sending every first request to Yahoo. A cache is any
+object with snapshot() and restore(); entries that expired while the server
+was down are dropped on restore.
+
+The file is JSON with a format name and version, so loading it never runs
+code from it. Snapshot values JSON cannot hold natively (bytes, tuples and
+datetimes) are written as single-key objects tagged with their type, bytes
+as base64. A file of another format or version, or one that fails to parse,
+is ignored and every cache starts empty.
+"""
+
+import base64
+import json
+import logging
+import os
+from datetime import datetime
+from typing import Dict
+
+logger = logging.getLogger(__name__)
+
+FORMAT = 'yfinance-grpc-caches'
+VERSION = 1
+
+_BYTES = '$bytes'
+_TUPLE = '$tuple'
+_DATETIME = '$datetime'
+
+
+def _encode(value):
+    """value with its bytes, tuples and datetimes replaced by tagged objects"""
+    if isinstance(value, bytes):
+        return {_BYTES: base64.b64encode(value).decode('ascii')}
+    if isinstance(value, tuple):
+        return {_TUPLE: [_encode(item) for item in value]}
+    if isinstance(value, datetime):
+        return {_DATETIME: value.isoformat()}
+    if isinstance(value, list):
+        return [_encode(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _encode(item) for key, item in value.items()}
+    return value
+
+
+def _decode(obj: dict):
+    """json object_hook reversing _encode for one object"""
+    if len(obj) == 1:
+        (tag, value), = obj.items()
+        if tag == _BYTES:
+            return base64.b64decode(value, validate=True)
+        if tag == _TUPLE:
+            return tuple(value)
+        if tag == _DATETIME:
+            return datetime.fromisoformat(value)
+    return obj
+
+
+def save_caches(path: str, caches: Dict[str, object]):
+    """Write snapshot() of each named cache to path, replacing the file atomically"""
+    snapshot = {name: _encode(cache.snapshot()) for name, cache in caches.items()}
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'format': FORMAT, 'version': VERSION, 'caches': snapshot}, f, separators=(',', ':'))
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError) as e:
+        # TypeError or ValueError: a snapshot held a value the format cannot represent
+        logger.warning(f"Failed to save caches to {path}: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return
+    logger.info(f"Saved caches to {path}")
+
+
+def load_caches(path: str, caches: Dict[str, object]):
+    """Restore each named cache from a file written by save_caches(); a missing or bad file is skipped"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            document = json.load(f, object_hook=_decode)
+        if document.get('format') != FORMAT or document.get('version') != VERSION:
+            raise ValueError(f"not a version {VERSION} {FORMAT} file")
+        snapshot = document['caches']
+    except FileNotFoundError:
+        return
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable cache file {path}: {e}")
+        return
+    for name, cache in caches.items():
+        if name in snapshot:
+            try:
+                loaded = cache.restore(snapshot[name])
+            except Exception as e:
+                logger.warning(f"Failed to restore {name} cache from {path}: {e}")
+                continue
+            logger.info(f"Restored {loaded} {name} cache entries from {path}")
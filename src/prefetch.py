@@ -0,0 +1,294 @@
+"""
+Scheduled prefetch for a configured symbol universe
+
+Most traffic is for a known set of symbols, yet every cache starts empty
+after a deploy. The PrefetchScheduler keeps the response cache warm for a
+universe file's symbols in the background: each pass it collects the
+prefetched requests that are missing or expire before the next pass, orders
+them by how often their symbol has recently been requested, and refreshes
+them through the servicer at no more than the token bucket's rate, so
+prefetching never takes more than its share of Yahoo's rate limit. Symbols
+in the negative cache are skipped until their entry expires, so an unknown
+symbol in the universe costs one upstream call per negative-cache TTL rather
+than one per request per pass.
+
+A rate of r requests per second can keep at most r * t entries with a TTL of
+t seconds fresh, and an entry whose TTL is shorter than a pass has gone stale
+long before the next one. Each pass therefore only considers the longest-lived
+entries the rate can sustain: during market hours that leaves out the 5s
+quote methods entirely, while after the close, when quote TTLs stretch to
+the next open, the whole universe usually fits.
+"""
+
+import logging
+import threading
+import time
+from collections import Counter
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import grpc
+
+from src.breaker import NegativeCache
+from src.response_cache import ResponseCacheInterceptor
+from yfinance_grpc.v1alpha1 import ticker_pb2
+
+logger = logging.getLogger(__name__)
+
+_TICKER_SERVICE = '/yfinance_grpc.v1alpha1.TickerService/'
+
+# Full method name -> request prefetched for a symbol; these are the plain
+# requests clients send, so their cache keys match live traffic
+PREFETCH_REQUESTS: Dict[str, Callable[[str], object]] = {
+    _TICKER_SERVICE + 'GetInfo': lambda symbol: ticker_pb2.GetInfoRequest(ticker=symbol),
+    _TICKER_SERVICE + 'GetFastInfo': lambda symbol: ticker_pb2.GetFastInfoRequest(ticker=symbol),
+    # No period or interval: daily bars over yfinance's default period
+    _TICKER_SERVICE + 'GetHistory': lambda symbol: ticker_pb2.GetHistoryRequest(ticker=symbol),
+    _TICKER_SERVICE + 'GetCalendar': lambda symbol: ticker_pb2.GetCalendarRequest(ticker=symbol),
+}
+
+
+def load_universe(path: str) -> List[str]:
+    """Symbols from a universe file: whitespace or comma separated, '#' starts a comment"""
+    symbols = []
+    with open(path) as f:
+        for line in f:
+            for symbol in line.split('#', 1)[0].replace(',', ' ').split():
+                symbols.append(symbol.upper())
+    return list(dict.fromkeys(symbols))
+
+
+class TokenBucket:
+    """Allow rate acquisitions per second on average, with bursts of up to burst"""
+
+    def __init__(self, rate: float, burst: float = 1.0):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _wait_time(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self, stop: Optional[threading.Event] = None) -> bool:
+        """Block until a token is available; False if stop is set first"""
+        while True:
+            delay = self._wait_time()
+            if delay == 0:
+                return True
+            if stop is not None:
+                if stop.wait(delay):
+                    return False
+            else:
+                time.sleep(delay)
+
+
+class _PrefetchContext:
+    """Minimal ServicerContext for calling servicer methods outside an RPC"""
+
+    def __init__(self):
+        self._code = None
+        self._details = ""
+
+    def is_active(self) -> bool:
+        return True
+
+    def time_remaining(self) -> Optional[float]:
+        return None
+
+    def invocation_metadata(self):
+        return ()
+
+    def add_callback(self, callback) -> bool:
+        return False
+
+    def set_code(self, code):
+        self._code = code
+
+    def set_details(self, details):
+        self._details = details
+
+    def code(self):
+        return self._code
+
+    def details(self) -> str:
+        return self._details
+
+
+class PrefetchScheduler:
+    """Keep cached responses for a symbol universe fresh, hottest symbols first"""
+
+    def __init__(self, servicer, cache_interceptor: ResponseCacheInterceptor, symbols: Iterable[str],
+                 rate: float = 2.0, interval: float = 30.0, decay_interval: float = 600.0,
+                 requests: Optional[Dict[str, Callable[[str], object]]] = None,
+                 negative_cache: Optional[NegativeCache] = None):
+        # rate bounds upstream calls per second; interval is how often priorities are
+        # recomputed, and anything expiring within it is refreshed; request counts
+        # halve every decay_interval so priority follows recent traffic.
+        self.servicer = servicer
+        self.cache_interceptor = cache_interceptor
+        self.symbols = list(dict.fromkeys(s.upper() for s in symbols))
+        self.bucket = TokenBucket(rate)
+        self.interval = interval
+        self.decay_interval = decay_interval
+        self.requests = PREFETCH_REQUESTS if requests is None else requests
+        self.negative_cache = negative_cache
+        self._rank = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self._counts = Counter()
+        self._refreshed_at: Dict[Tuple[str, str], float] = {}
+        self._lock = threading.Lock()
+        self._decayed_at = time.monotonic()
+        self._stop = threading.Event()
+        self._thread = None
+        self.refreshed = 0
+        self.failed = 0
+        self.covered = 0  # entries the last pass could keep fresh
+        # Set once the first pass has ended, so readiness can wait for a warm cache
+        self.first_pass = threading.Event()
+
+    def record(self, symbol: str):
+        """Count a request for symbol; only universe symbols are tracked"""
+        symbol = symbol.strip().upper()
+        if symbol in self._rank:
+            with self._lock:
+                self._counts[symbol] += 1
+
+    def _known_missing(self, symbol: str) -> bool:
+        return self.negative_cache is not None and symbol in self.negative_cache
+
+    def _decay(self):
+        now = time.monotonic()
+        if now - self._decayed_at < self.decay_interval:
+            return
+        self._decayed_at = now
+        with self._lock:
+            self._counts = Counter({s: c // 2 for s, c in self._counts.items() if c > 1})
+
+    def due(self) -> List[Tuple[str, str]]:
+        """(method, symbol) pairs missing from the cache or expiring within interval, by priority
+
+        Only the entries the rate can keep fresh are considered; see covered.
+        """
+        interceptor = self.cache_interceptor
+        with self._lock:
+            counts = dict(self._counts)
+        candidates = []
+        for symbol in self.symbols:
+            if self._known_missing(symbol):
+                continue
+            for order, (method, build) in enumerate(self.requests.items()):
+                request = build(symbol)
+                ttl = interceptor.ttl_for(method, request)
+                if ttl > self.interval:
+                    priority = (-counts.get(symbol, 0), self._rank[symbol], order)
+                    candidates.append((-ttl, priority, method, symbol, request))
+        # The n-th longest-lived entry stays fresh only if its TTL outlasts a sweep over n entries
+        candidates.sort(key=lambda candidate: candidate[:2])
+        covered = 0
+        for n, (negative_ttl, *_) in enumerate(candidates, 1):
+            if -negative_ttl * self.bucket.rate < n:
+                break
+            covered = n
+        self.covered = covered
+
+        recent = time.monotonic() - self.interval
+        pending = []
+        for _, priority, method, symbol, request in candidates[:covered]:
+            remaining = interceptor.cache.expires_in(interceptor.key_for(method, request))
+            if remaining is None or remaining < self.interval:
+                # Entries refreshed last pass go to the back so they cannot starve the rest
+                refreshed_recently = self._refreshed_at.get((method, symbol), recent) > recent
+                pending.append((refreshed_recently, priority, method, symbol))
+        pending.sort()
+        return [(method, symbol) for *_, method, symbol in pending]
+
+    def refresh(self, method: str, symbol: str) -> bool:
+        """Fetch one response through the servicer and cache it; False when it failed"""
+        request = self.requests[method](symbol)
+        context = _PrefetchContext()
+        self._refreshed_at[(method, symbol)] = time.monotonic()
+        try:
+            response = getattr(self.servicer, method.rsplit('/', 1)[1])(request, context)
+        except Exception as e:
+            logger.debug(f"Prefetch of {method} for {symbol} failed: {e}")
+            self.failed += 1
+            return False
+        if context.code() not in (None, grpc.StatusCode.OK):
+            logger.debug(f"Prefetch of {method} for {symbol} failed: {context.details()}")
+            self.failed += 1
+            return False
+        interceptor = self.cache_interceptor
+        interceptor.cache.put(interceptor.key_for(method, request), response.SerializeToString(),
+                              interceptor.ttl_for(method, request))
+        self.refreshed += 1
+        return True
+
+    def run_pass(self):
+        """Refresh due entries in priority order until done or interval elapses"""
+        self._decay()
+        started = time.monotonic()
+        for method, symbol in self.due():
+            if self._known_missing(symbol):
+                # Found missing earlier in this pass
+                continue
+            if not self.bucket.acquire(self._stop):
+                return
+            self.refresh(method, symbol)
+            if time.monotonic() - started >= self.interval:
+                # Re-prioritize so newly hot symbols do not wait for a full sweep
+                return
+
+    def start(self):
+        if self._thread is None and self.symbols:
+            logger.info(f"Prefetching {len(self.symbols)} symbols at up to {self.bucket.rate:g} requests/s")
+            self._thread = threading.Thread(target=self._run, name="prefetch", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            started = time.monotonic()
+            try:
+                self.run_pass()
+            except Exception as e:
+                logger.warning(f"Prefetch pass failed: {e}")
+            self.first_pass.set()
+            # Sleep out the rest of the interval when everything was fresh
+            self._stop.wait(max(0.0, self.interval - (time.monotonic() - started)))
+
+
+class RequestFrequencyInterceptor(grpc.ServerInterceptor):
+    """Record the symbols of incoming unary requests so prefetch can favour hot ones"""
+
+    def __init__(self, scheduler: PrefetchScheduler):
+        self.scheduler = scheduler
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        if handler is None or handler.unary_unary is None:
+            return handler
+        behavior = handler.unary_unary
+        record = self.scheduler.record
+
+        def recorded_behavior(request, context):
+            ticker = getattr(request, 'ticker', None)
+            if ticker:
+                record(ticker)
+            for symbol in getattr(request, 'tickers', ()):
+                record(symbol)
+            return behavior(request, context)
+
+        return grpc.unary_unary_rpc_method_handler(
+            recorded_behavior,
+            request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer,
+        )
@@ -0,0 +1,192 @@
+"""
+Shared quote polling for SubscribeQuotes
+
+A single QuoteHub polls each subscribed symbol once per interval, no matter
+how many streams watch it, diffs the result against the previous poll and
+fans the changed fields out to every subscription. Subscriptions coalesce
+pending changes per symbol, so a slow consumer never grows an unbounded
+backlog.
+"""
+
+import logging
+import threading
+import time
+from collections import Counter
+from concurrent import futures
+from typing import Callable, Dict, Iterable, Optional
+
+from src.convert import safe_float, safe_int, safe_str
+from src.lazy import lazy_import
+
+yf = lazy_import('yfinance')
+
+logger = logging.getLogger(__name__)
+
+
+# Quote field -> (fast_info attribute, converter)
+QUOTE_FIELDS = {
+    'last_price': ('last_price', safe_float),
+    'previous_close': ('previous_close', safe_float),
+    'open': ('open', safe_float),
+    'day_high': ('day_high', safe_float),
+    'day_low': ('day_low', safe_float),
+    'last_volume': ('last_volume', safe_int),
+    'currency': ('currency', safe_str),
+}
+
+
+def fetch_quote(symbol: str) -> dict:
+    """Fetch the current quote fields for symbol from fast_info"""
+    fast_info = yf.Ticker(symbol).get_fast_info()
+    quote = {}
+    for field, (attr, convert) in QUOTE_FIELDS.items():
+        try:
+            quote[field] = convert(getattr(fast_info, attr, None))
+        except Exception as e:
+            logger.debug(f"Quote field {field} unavailable for {symbol}: {e}")
+    return quote
+
+
+class QuoteSubscription:
+    """One stream's view of the hub: pending changed fields per symbol"""
+
+    def __init__(self, symbols: Iterable[str]):
+        self.symbols = frozenset(symbols)
+        self.closed = False
+        self._pending: Dict[str, dict] = {}
+        self._cond = threading.Condition()
+
+    def publish(self, symbol: str, fields: dict):
+        with self._cond:
+            self._pending.setdefault(symbol, {}).update(fields)
+            self._cond.notify_all()
+
+    def next_updates(self, timeout: Optional[float] = None) -> Dict[str, dict]:
+        """Block until changes are pending, the subscription closes, or timeout; then drain"""
+        with self._cond:
+            self._cond.wait_for(lambda: self._pending or self.closed, timeout)
+            pending, self._pending = self._pending, {}
+            return pending
+
+    def close(self):
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+
+
+class QuoteHub:
+    """Deduplicated upstream polling shared by every quote subscription"""
+
+    def __init__(self, interval: float = 5.0, max_workers: int = 8,
+                 fetch: Callable[[str], dict] = fetch_quote):
+        self.interval = interval
+        self.max_workers = max_workers
+        self._fetch = fetch
+        self._lock = threading.Lock()
+        self._refcounts = Counter()
+        self._subscriptions = set()
+        self._latest: Dict[str, dict] = {}
+        self._fresh = set()  # symbols added since the last poll that have no quote yet
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def symbols(self) -> frozenset:
+        with self._lock:
+            return frozenset(self._refcounts)
+
+    def subscribe(self, symbols: Iterable[str]) -> QuoteSubscription:
+        subscription = QuoteSubscription(symbols)
+        with self._lock:
+            new_symbols = [s for s in subscription.symbols if s not in self._refcounts]
+            self._fresh.update(new_symbols)
+            self._refcounts.update(subscription.symbols)
+            self._subscriptions.add(subscription)
+            if self._stop.is_set():
+                # Shutting down; the stream ends straight away
+                subscription.close()
+            # Symbols someone else already watches start from the last full snapshot
+            for symbol in subscription.symbols:
+                if symbol in self._latest:
+                    subscription.publish(symbol, dict(self._latest[symbol]))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="quote-hub", daemon=True)
+                self._thread.start()
+        if new_symbols:
+            self._wake.set()
+        return subscription
+
+    def unsubscribe(self, subscription: QuoteSubscription):
+        subscription.close()
+        with self._lock:
+            if subscription not in self._subscriptions:
+                return
+            self._subscriptions.discard(subscription)
+            self._refcounts.subtract(subscription.symbols)
+            for symbol in subscription.symbols:
+                if self._refcounts[symbol] <= 0:
+                    del self._refcounts[symbol]
+                    self._latest.pop(symbol, None)
+
+    def stop(self):
+        """Stop polling and close every subscription so their streams end"""
+        self._stop.set()
+        self._wake.set()
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            subscription.close()
+
+    @property
+    def stopped(self) -> bool:
+        return self._stop.is_set()
+
+    def _run(self):
+        with futures.ThreadPoolExecutor(max_workers=self.max_workers,
+                                        thread_name_prefix="quote-poll") as pool:
+            next_poll = 0.0
+            while not self._stop.is_set():
+                with self._lock:
+                    fresh, self._fresh = self._fresh & set(self._refcounts), set()
+                if time.monotonic() >= next_poll:
+                    symbols = self.symbols
+                    if symbols:
+                        self.poll(symbols, pool)
+                    next_poll = time.monotonic() + self.interval
+                elif fresh:
+                    # A new subscriber gets its first quote now; everything else waits for the interval
+                    self.poll(fresh, pool)
+                self._wake.wait(max(0.0, next_poll - time.monotonic()))
+                self._wake.clear()
+
+    def poll(self, symbols: Iterable[str], pool: Optional[futures.Executor] = None):
+        """Fetch every symbol once and fan changed fields out to subscribers"""
+        symbols = list(symbols)
+        if pool is None:
+            results = [self._safe_fetch(symbol) for symbol in symbols]
+        else:
+            results = list(pool.map(self._safe_fetch, symbols))
+        for symbol, quote in zip(symbols, results):
+            if quote is not None:
+                self._publish(symbol, quote)
+
+    def _safe_fetch(self, symbol: str) -> Optional[dict]:
+        try:
+            return self._fetch(symbol)
+        except Exception as e:
+            logger.warning(f"Quote poll failed for {symbol}: {e}")
+            return None
+
+    def _publish(self, symbol: str, quote: dict):
+        with self._lock:
+            if symbol not in self._refcounts:
+                return
+            previous = self._latest.get(symbol, {})
+            changed = {k: v for k, v in quote.items() if k not in previous or previous[k] != v}
+            if not changed:
+                return
+            self._latest[symbol] = {**previous, **quote}
+            subscribers = [s for s in self._subscriptions if symbol in s.symbols]
+        for subscription in subscribers:
+            subscription.publish(symbol, changed)
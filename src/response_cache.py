@@ -0,0 +1,196 @@
+"""
+Pre-serialized response cache
+
+Caches the encoded protobuf bytes of unary responses so a hot request is
+answered by writing stored bytes straight to the wire, skipping message
+construction and serialization on every hit.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+import grpc
+
+logger = logging.getLogger(__name__)
+
+_TICKER_SERVICE = '/yfinance_grpc.v1alpha1.TickerService/'
+_SECTOR_SERVICE = '/yfinance_grpc.v1alpha1.SectorService/'
+
+# Full method name -> cache TTL in seconds (in-session TTL for MARKET_HOURS_METHODS)
+DEFAULT_TTLS = {
+    _TICKER_SERVICE + 'GetInfo': 5.0,
+    _TICKER_SERVICE + 'GetFastInfo': 5.0,
+    _TICKER_SERVICE + 'GetMultipleInfo': 5.0,
+    _TICKER_SERVICE + 'GetHistory': 60.0,
+    _TICKER_SERVICE + 'GetCalendar': 3600.0,
+    _TICKER_SERVICE + 'GetFinancials': 3600.0,
+    _TICKER_SERVICE + 'GetBalanceSheet': 3600.0,
+    _TICKER_SERVICE + 'GetCashFlow': 3600.0,
+    _TICKER_SERVICE + 'GetInstitutionalHolders': 3600.0,
+    _TICKER_SERVICE + 'GetSustainability': 3600.0,
+    _TICKER_SERVICE + 'GetSecFilings': 3600.0,
+    _SECTOR_SERVICE + 'GetSector': 3600.0,
+    _SECTOR_SERVICE + 'GetIndustry': 3600.0,
+}
+
+# Quote-bearing methods whose TTL stretches to the next open while the market is closed
+MARKET_HOURS_METHODS = frozenset({
+    _TICKER_SERVICE + 'GetInfo',
+    _TICKER_SERVICE + 'GetFastInfo',
+    _TICKER_SERVICE + 'GetMultipleInfo',
+    _TICKER_SERVICE + 'GetHistory',
+})
+
+# TTL used once a session has closed but the next one is not yet published
+CLOSED_TTL = 900.0
+
+
+def _passthrough(data: bytes) -> bytes:
+    """Response serializer for handlers that already return encoded bytes"""
+    return data
+
+
+def normalize_request(request):
+    """Return a copy of request with case-insensitive identifiers normalized"""
+    fields = request.DESCRIPTOR.fields_by_name
+    if 'ticker' not in fields and 'key' not in fields:
+        return request
+    normalized = type(request)()
+    normalized.CopyFrom(request)
+    if 'ticker' in fields:
+        normalized.ticker = normalized.ticker.strip().upper()
+    if 'key' in fields:
+        normalized.key = normalized.key.strip().lower()
+    return normalized
+
+
+DEFAULT_MAX_ENTRIES = 10000
+
+
+class ResponseCache:
+    """Thread-safe LRU cache of serialized responses with per-entry expiry"""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, data = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def put(self, key, data: bytes, ttl: float):
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def expires_in(self, key) -> Optional[float]:
+        """Seconds until key expires, or None when it is not cached; does not count as a hit"""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return None
+        remaining = entry[0] - time.monotonic()
+        return remaining if remaining > 0 else None
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def snapshot(self) -> list:
+        """Unexpired entries as (key, wall-clock expiry, data), least recently used first"""
+        now, wall = time.monotonic(), time.time()
+        with self._lock:
+            return [(key, wall + expires_at - now, data)
+                    for key, (expires_at, data) in self._entries.items() if expires_at > now]
+
+    def restore(self, entries: list) -> int:
+        """Load entries from snapshot(), skipping any that have since expired; returns the count loaded"""
+        wall = time.time()
+        loaded = 0
+        for key, expires_at, data in entries:
+            if expires_at > wall:
+                self.put(key, data, expires_at - wall)
+                loaded += 1
+        return loaded
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+
+class ResponseCacheInterceptor(grpc.ServerInterceptor):
+    """Serve cacheable unary RPCs from ResponseCache as pre-encoded bytes"""
+
+    def __init__(self, cache: ResponseCache, ttls: Optional[dict] = None, schedule=None):
+        self.cache = cache
+        self.ttls = DEFAULT_TTLS if ttls is None else ttls
+        self.schedule = schedule
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        method = handler_call_details.method
+        if handler is None or method not in self.ttls or handler.unary_unary is None:
+            return handler
+        return grpc.unary_unary_rpc_method_handler(
+            self._wrap(method, handler),
+            request_deserializer=handler.request_deserializer,
+            response_serializer=_passthrough,
+        )
+
+    @staticmethod
+    def key_for(method: str, request):
+        return method, normalize_request(request).SerializeToString(deterministic=True)
+
+    def ttl_for(self, method: str, request) -> float:
+        """TTL in seconds for a freshly computed response"""
+        ttl = self.ttls[method]
+        if self.schedule is None or method not in MARKET_HOURS_METHODS:
+            return ttl
+        symbols = request.tickers if method.endswith('/GetMultipleInfo') else [request.ticker]
+        # Pre- and post-market bars keep arriving outside the regular session
+        extended = method.endswith('/GetHistory') and request.prepost
+        ttls = []
+        for symbol in symbols:
+            market = self.schedule.market_for_symbol(symbol)
+            if market is None:
+                return ttl
+            ttls.append(self.schedule.ttl(market, open_ttl=ttl, closed_ttl=CLOSED_TTL, extended=extended))
+        return min(ttls, default=ttl)
+
+    def _wrap(self, method, handler):
+        behavior = handler.unary_unary
+        serializer = handler.response_serializer
+
+        def cached_behavior(request, context):
+            key = self.key_for(method, request)
+            data = self.cache.get(key)
+            if data is not None:
+                return data
+            response = behavior(request, context)
+            data = serializer(response) if serializer else response.SerializeToString()
+            if context.code() in (None, grpc.StatusCode.OK):
+                self.cache.put(key, data, self.ttl_for(method, request))
+            return data
+
+        return cached_behavior
@@ -0,0 +1,216 @@
+"""
+Retries and hedging for idempotent upstream calls
+
+Every Yahoo request is a read, so a failed or slow one can safely be sent
+again. Upstream.call retries transient failures (network errors, which
+surface as OSError from both requests and curl_cffi) with full-jitter
+exponential backoff, never sleeping past the caller's deadline. Hedged
+calls send a duplicate request once the first has been outstanding longer
+than the call's recent p95 latency and return whichever answers first.
+Hedged attempts run on a small shared pool; a call that finds every worker
+busy runs unhedged on its own thread rather than queueing behind them.
+Retries and hedges each spend from a RetryBudget that only refills as
+first attempts are made, so during an outage the extra load stays a small
+fraction of normal traffic instead of multiplying it.
+"""
+
+import logging
+import random
+import threading
+import time
+from collections import deque
+from concurrent import futures
+from typing import Callable, Dict, NamedTuple, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class RetryPolicy(NamedTuple):
+    max_attempts: int = 3  # including the first
+    base_delay: float = 0.1  # seconds; the backoff cap doubles from here per attempt
+    max_delay: float = 2.0
+
+
+def backoff_delay(policy: RetryPolicy, attempt: int) -> float:
+    """Full-jitter delay before retry number attempt (1 for the first retry)"""
+    return random.uniform(0, min(policy.max_delay, policy.base_delay * 2 ** (attempt - 1)))
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Network failures and timeouts; rate limits and bad data are not worth repeating"""
+    return isinstance(exc, OSError)
+
+
+class RetryBudget:
+    """Extra attempts allowed as a fraction of first attempts, plus a small reserve"""
+
+    def __init__(self, ratio: float = 0.1, reserve: float = 10.0):
+        self.ratio = ratio
+        self.reserve = reserve
+        self._tokens = reserve
+        self._lock = threading.Lock()
+        self.spent = 0
+        self.denied = 0
+
+    def deposit(self):
+        """Credit one first attempt"""
+        with self._lock:
+            self._tokens = min(self.reserve, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Spend one extra attempt; False when the budget is exhausted"""
+        with self._lock:
+            if self._tokens >= 1:
+                self._tokens -= 1
+                self.spent += 1
+                return True
+            self.denied += 1
+            return False
+
+
+class LatencyTracker:
+    """Recent successful latencies of one kind of call"""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.min_samples = min_samples
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """The q-quantile of the window, or None until min_samples have been seen"""
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return None
+            samples = sorted(self._samples)
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+
+def _time_remaining(context) -> Optional[float]:
+    return None if context is None else context.time_remaining()
+
+
+class Upstream:
+    """Retry and hedging policy shared by the servicers' upstream calls"""
+
+    def __init__(self, policy: RetryPolicy = RetryPolicy(), retry_budget: Optional[RetryBudget] = None,
+                 hedge_budget: Optional[RetryBudget] = None, hedging: bool = False,
+                 hedge_quantile: float = 0.95, hedge_delay: float = 0.5, max_hedge_workers: int = 16):
+        # hedge_delay is used until a call has enough latency samples for its quantile
+        self.policy = policy
+        self.retry_budget = RetryBudget() if retry_budget is None else retry_budget
+        self.hedge_budget = RetryBudget(ratio=0.05) if hedge_budget is None else hedge_budget
+        self.hedging = hedging
+        self.hedge_quantile = hedge_quantile
+        self.hedge_delay = hedge_delay
+        self.max_hedge_workers = max_hedge_workers
+        self._trackers: Dict[str, LatencyTracker] = {}
+        self._executor = None
+        self._busy = 0  # hedged attempts submitted and not yet finished
+        self._lock = threading.Lock()
+
+    def call(self, context, fn: Callable[[], T], name: Optional[str] = None, hedge: bool = False) -> T:
+        """Run fn, retrying transient failures within context's deadline; hedge it when enabled
+
+        context may be None for calls made outside an RPC. name identifies the
+        call's latency history for hedging.
+        """
+        attempt = 1
+        self.retry_budget.deposit()
+        hedged = hedge and self.hedging
+        if hedged:
+            self.hedge_budget.deposit()
+        while True:
+            try:
+                if hedged:
+                    return self._hedged(context, fn, name or getattr(fn, '__name__', 'call'))
+                return fn()
+            except Exception as e:
+                if not is_retryable(e) or attempt >= self.policy.max_attempts:
+                    raise
+                delay = backoff_delay(self.policy, attempt)
+                remaining = _time_remaining(context)
+                if remaining is not None and remaining <= delay:
+                    raise
+                if context is not None and not context.is_active():
+                    raise
+                if not self.retry_budget.withdraw():
+                    logger.debug(f"Retry budget exhausted; not retrying {name or fn}: {e}")
+                    raise
+                logger.info(f"Retrying {name or 'upstream call'} in {delay:.2f}s after: {e}")
+                time.sleep(delay)
+                attempt += 1
+
+    def tracker(self, name: str) -> LatencyTracker:
+        tracker = self._trackers.get(name)
+        if tracker is None:
+            with self._lock:
+                tracker = self._trackers.setdefault(name, LatencyTracker())
+        return tracker
+
+    def _pool(self) -> futures.Executor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = futures.ThreadPoolExecutor(max_workers=self.max_hedge_workers,
+                                                            thread_name_prefix="hedge")
+            return self._executor
+
+    def _submit(self, tracker: LatencyTracker, fn, budget: Optional[RetryBudget] = None) -> Optional[futures.Future]:
+        """Start fn on an idle hedge worker, spending from budget if given; None when none is idle or affordable"""
+        with self._lock:
+            if self._busy >= self.max_hedge_workers or (budget is not None and not budget.withdraw()):
+                return None
+            self._busy += 1
+        future = self._pool().submit(self._timed, tracker, fn)
+        future.add_done_callback(self._release)
+        return future
+
+    def _release(self, future: futures.Future):
+        with self._lock:
+            self._busy -= 1
+
+    @staticmethod
+    def _timed(tracker: LatencyTracker, fn):
+        started = time.monotonic()
+        result = fn()
+        tracker.record(time.monotonic() - started)
+        return result
+
+    def _hedged(self, context, fn, name: str):
+        tracker = self.tracker(name)
+        delay = tracker.percentile(self.hedge_quantile) or self.hedge_delay
+        remaining = _time_remaining(context)
+        deadline = None if remaining is None else time.monotonic() + remaining
+        primary = self._submit(tracker, fn)
+        if primary is None:
+            # Every worker is busy with other calls; waiting for one would only add latency
+            return self._timed(tracker, fn)
+        pending = {primary}
+        done, _ = futures.wait(pending, timeout=delay if remaining is None else min(delay, remaining))
+        hedge = None if done else self._submit(tracker, fn, self.hedge_budget)
+        if hedge is not None:
+            logger.debug(f"Hedging {name} after {delay:.3f}s")
+            pending.add(hedge)
+        error = None
+        while pending:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            done, pending = futures.wait(pending, timeout=timeout, return_when=futures.FIRST_COMPLETED)
+            if not done:
+                # The losers finish in the background; their latency still counts
+                raise TimeoutError(f"{name} did not answer before the deadline")
+            for future in done:
+                if future.exception() is None:
+                    return future.result()
+                error = future.exception()
+        raise error
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
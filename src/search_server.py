@@ -10,30 +10,16 @@ sys.path.insert(0, str(project_root / "gen"))
 import grpc
 import logging
 
-import yfinance as yf
-import pandas as pd
+from src.lazy import lazy_import
+
+yf = lazy_import('yfinance')
 
 from yfinance_grpc.v1alpha1 import search_pb2, search_pb2_grpc
-from google.protobuf.timestamp_pb2 import Timestamp
+from src.convert import safe_float, safe_str, timestamp_from_seconds
 
 logger = logging.getLogger(__name__)
 
 
-def safe_float(val, default: float = 0.0) -> float:
-    try:
-        if val is None or (isinstance(val, float) and pd.isna(val)):
-            return default
-        return float(val)
-    except (TypeError, ValueError):
-        return default
-
-
-def safe_str(val, default: str = "") -> str:
-    if val is None or (isinstance(val, float) and pd.isna(val)):
-        return default
-    return str(val)
-
-
 _LOOKUP_TYPE_STR = {
     search_pb2.LOOKUP_TYPE_UNSPECIFIED: "all",
     search_pb2.LOOKUP_TYPE_ALL: "all",
@@ -89,9 +75,7 @@ class SearchServiceServicer(search_pb2_grpc.SearchServiceServicer):
                 )
                 pub_time = n.get("providerPublishTime")
                 if pub_time:
-                    ts = Timestamp()
-                    ts.FromSeconds(int(pub_time))
-                    item.provider_publish_time.CopyFrom(ts)
+                    item.provider_publish_time.CopyFrom(timestamp_from_seconds(pub_time))
                 news.append(item)
 
             return search_pb2.SearchResponse(quotes=quotes, news=news)
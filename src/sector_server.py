@@ -10,38 +10,16 @@ sys.path.insert(0, str(project_root / "gen"))
 import grpc
 import logging
 
-import yfinance as yf
-import pandas as pd
+from src.lazy import lazy_import
+
+yf = lazy_import('yfinance')
 
 from yfinance_grpc.v1alpha1 import sector_pb2, sector_pb2_grpc
+from src.convert import safe_float, safe_int, safe_str
 
 logger = logging.getLogger(__name__)
 
 
-def safe_float(val, default: float = 0.0) -> float:
-    try:
-        if val is None or (isinstance(val, float) and pd.isna(val)):
-            return default
-        return float(val)
-    except (TypeError, ValueError):
-        return default
-
-
-def safe_int(val, default: int = 0) -> int:
-    try:
-        if val is None or (isinstance(val, float) and pd.isna(val)):
-            return default
-        return int(val)
-    except (TypeError, ValueError):
-        return default
-
-
-def safe_str(val, default: str = "") -> str:
-    if val is None or (isinstance(val, float) and pd.isna(val)):
-        return default
-    return str(val)
-
-
 def _parse_overview(overview: dict) -> sector_pb2.DomainOverview:
     if not overview:
         return sector_pb2.DomainOverview()
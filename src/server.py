@@ -15,24 +15,57 @@ sys.path.insert(0, str(project_root / "gen"))
 
 import grpc
 from concurrent import futures
+import hashlib
 import logging
-from datetime import datetime
+import os
+import signal
+import threading
 from typing import Optional
-from dateutil import parser as date_parser
 from grpc_reflection.v1alpha import reflection
+from grpc_health.v1 import health, health_pb2_grpc
 
-import yfinance as yf
-import pandas as pd
+from src.lazy import lazy_import, preload
+
+# Heavy dependencies load on first use, or from preload() once the port is bound
+yf = lazy_import('yfinance')
+pd = lazy_import('pandas')
+date_parser = lazy_import('dateutil.parser')
 
 # Import generated protobuf and gRPC modules
 from yfinance_grpc.v1alpha1 import ticker_pb2, ticker_pb2_grpc
 from yfinance_grpc.v1alpha1 import search_pb2, search_pb2_grpc
 from yfinance_grpc.v1alpha1 import market_pb2, market_pb2_grpc
 from yfinance_grpc.v1alpha1 import sector_pb2, sector_pb2_grpc
-from google.protobuf.timestamp_pb2 import Timestamp
+from google.protobuf.field_mask_pb2 import FieldMask
+from src.convert import (
+    datetime_to_timestamp,
+    float_column,
+    int_column,
+    safe_float,
+    safe_int,
+    safe_str,
+    timestamp_column,
+    timestamps_from_ns,
+)
+from src.ticker_info import FAST_INFO_FIELDS, TICKER_INFO_FIELDS, create_ticker_info, create_ticker_info_from_fast_info
 from src.search_server import SearchServiceServicer
 from src.market_server import MarketServiceServicer
 from src.sector_server import SectorServiceServicer
+from src.response_cache import DEFAULT_MAX_ENTRIES, ResponseCache, ResponseCacheInterceptor
+from src.admission import AdmissionControlInterceptor
+from src.bulkhead import BulkheadInterceptor, total_capacity
+from src.market_schedule import MarketSchedule
+from src.quotes import QuoteHub
+from src.session import SessionMultiplexer, session_handlers
+from src.offload import OFFLOAD_ROW_THRESHOLD, ConversionPool, EncodedResponseInterceptor
+from src.config import ServerConfig, bulkhead_configs, compression_algorithm, grpc_options
+from src.compression import CompressionPolicyInterceptor
+from src.bar_archive import ACTION_COLUMNS, BarArchive, Bars, wall_ns
+from src.breaker import CircuitBreakerInterceptor, NegativeCache, UnknownSymbolError
+from src.retry import RetryPolicy, Upstream
+from src.health import ReadinessMonitor
+from src.persistence import load_caches, save_caches
+from src.prefetch import PREFETCH_REQUESTS, PrefetchScheduler, RequestFrequencyInterceptor, load_universe
 
 # Configure logging
 logging.basicConfig(
@@ -43,136 +76,285 @@ logger = logging.getLogger(__name__)
 
 _STREAM_BATCH_SIZE = 500
 
+# Server threads kept free of bulkheads for health checks and reflection
+_CONTROL_WORKERS = 4
+
+# Upper bound on how long an idle quote stream sleeps before re-checking its context
+_QUOTE_IDLE_TIMEOUT = 60.0
+
+
+def _is_unknown_symbol(info: dict) -> bool:
+    """True for the info yfinance returns when Yahoo has no quote for a symbol"""
+    # trailingPegRatio comes from a separate request that answers even for unknown symbols
+    return not any(value is not None for key, value in info.items() if key != 'trailingPegRatio')
+
+
+def _plan_info_source(fields, freshness) -> int:
+    """Pick the upstream path for a TickerInfo request"""
+    if freshness == ticker_pb2.INFO_FRESHNESS_FULL:
+        return ticker_pb2.INFO_SOURCE_FULL
+    if freshness == ticker_pb2.INFO_FRESHNESS_FAST:
+        return ticker_pb2.INFO_SOURCE_FAST
+    if fields and all(name in FAST_INFO_FIELDS for name in fields):
+        return ticker_pb2.INFO_SOURCE_FAST
+    return ticker_pb2.INFO_SOURCE_FULL
 
-def datetime_to_timestamp(dt) -> Timestamp:
-    """Convert datetime or pandas Timestamp to protobuf Timestamp"""
-    if pd.isna(dt):
+
+def _read_mask_fields(read_mask) -> Optional[list]:
+    """Resolve a TickerInfo read mask to field names; None means all fields"""
+    if not read_mask.paths:
         return None
-    if isinstance(dt, pd.Timestamp):
-        dt = dt.to_pydatetime()
-    if isinstance(dt, datetime):
-        ts = Timestamp()
-        ts.FromDatetime(dt)
-        return ts
-    return None
-
-
-def safe_float(value) -> float:
-    """Safely convert value to float, handling NaN and None"""
-    if pd.isna(value) or value is None:
-        return 0.0
-    return float(value)
-
-
-def safe_int(value) -> int:
-    """Safely convert value to int, handling NaN and None"""
-    if pd.isna(value) or value is None:
-        return 0
-    return int(value)
-
-
-def safe_str(value) -> str:
-    """Safely convert value to string, handling None"""
-    if value is None or (isinstance(value, float) and pd.isna(value)):
-        return ""
-    return str(value)
-
-
-def create_ticker_info(info: dict, symbol: str) -> ticker_pb2.TickerInfo:
-    """Create a TickerInfo message from info dict"""
-    return ticker_pb2.TickerInfo(
-        symbol=safe_str(info.get('symbol', symbol)),
-        short_name=safe_str(info.get('shortName')),
-        long_name=safe_str(info.get('longName')),
-        industry=safe_str(info.get('industry')),
-        sector=safe_str(info.get('sector')),
-        country=safe_str(info.get('country')),
-        city=safe_str(info.get('city')),
-        state=safe_str(info.get('state')),
-        zip=safe_str(info.get('zip')),
-        website=safe_str(info.get('website')),
-        long_business_summary=safe_str(info.get('longBusinessSummary')),
-        
-        previous_close=safe_float(info.get('previousClose')),
-        open=safe_float(info.get('open')),
-        day_low=safe_float(info.get('dayLow')),
-        day_high=safe_float(info.get('dayHigh')),
-        regular_market_previous_close=safe_float(info.get('regularMarketPreviousClose')),
-        regular_market_open=safe_float(info.get('regularMarketOpen')),
-        regular_market_day_low=safe_float(info.get('regularMarketDayLow')),
-        regular_market_day_high=safe_float(info.get('regularMarketDayHigh')),
-        current_price=safe_float(info.get('currentPrice')),
-        
-        volume=safe_int(info.get('volume')),
-        regular_market_volume=safe_int(info.get('regularMarketVolume')),
-        average_volume=safe_int(info.get('averageVolume')),
-        average_volume_10days=safe_int(info.get('averageVolume10days')),
-        shares_outstanding=safe_int(info.get('sharesOutstanding')),
-        float_shares=safe_int(info.get('floatShares')),
-        
-        market_cap=safe_int(info.get('marketCap')),
-        enterprise_value=safe_float(info.get('enterpriseValue')),
-        trailing_pe=safe_float(info.get('trailingPE')),
-        forward_pe=safe_float(info.get('forwardPE')),
-        price_to_book=safe_float(info.get('priceToBook')),
-        price_to_sales_trailing_12months=safe_float(info.get('priceToSalesTrailing12Months')),
-        enterprise_to_revenue=safe_float(info.get('enterpriseToRevenue')),
-        enterprise_to_ebitda=safe_float(info.get('enterpriseToEbitda')),
-        
-        dividend_rate=safe_float(info.get('dividendRate')),
-        dividend_yield=safe_float(info.get('dividendYield')),
-        ex_dividend_date=safe_int(info.get('exDividendDate', 0)),
-        payout_ratio=safe_float(info.get('payoutRatio')),
-        five_year_avg_dividend_yield=safe_float(info.get('fiveYearAvgDividendYield')),
-        
-        beta=safe_float(info.get('beta')),
-        trailing_eps=safe_float(info.get('trailingEps')),
-        forward_eps=safe_float(info.get('forwardEps')),
-        book_value=safe_float(info.get('bookValue')),
-        profit_margins=safe_float(info.get('profitMargins')),
-        revenue_per_share=safe_float(info.get('revenuePerShare')),
-        return_on_assets=safe_float(info.get('returnOnAssets')),
-        return_on_equity=safe_float(info.get('returnOnEquity')),
-        revenue_growth=safe_float(info.get('revenueGrowth')),
-        earnings_growth=safe_float(info.get('earningsGrowth')),
-        operating_margins=safe_float(info.get('operatingMargins')),
-        ebitda_margins=safe_float(info.get('ebitdaMargins')),
-        
-        fifty_two_week_low=safe_float(info.get('fiftyTwoWeekLow')),
-        fifty_two_week_high=safe_float(info.get('fiftyTwoWeekHigh')),
-        fifty_day_average=safe_float(info.get('fiftyDayAverage')),
-        two_hundred_day_average=safe_float(info.get('twoHundredDayAverage')),
-        
-        target_high_price=safe_float(info.get('targetHighPrice')),
-        target_low_price=safe_float(info.get('targetLowPrice')),
-        target_mean_price=safe_float(info.get('targetMeanPrice')),
-        target_median_price=safe_float(info.get('targetMedianPrice')),
-        number_of_analyst_opinions=safe_int(info.get('numberOfAnalystOpinions')),
-        
-        currency=safe_str(info.get('currency')),
-        exchange=safe_str(info.get('exchange')),
-        quote_type=safe_str(info.get('quoteType')),
-        financial_currency=safe_str(info.get('financialCurrency')),
-        price_hint=safe_int(info.get('priceHint', 2)),
+    return list(dict.fromkeys(read_mask.paths))
+
+
+def _invalid_read_mask_paths(read_mask) -> list:
+    """Return read mask paths that do not name a TickerInfo field"""
+    return [path for path in read_mask.paths if path not in TICKER_INFO_FIELDS]
+
+
+def _apply_etag(response, if_none_match: str):
+    """Stamp response with its content hash, or return an empty not_modified response on match"""
+    etag = hashlib.sha256(response.SerializeToString(deterministic=True)).hexdigest()
+    if if_none_match and if_none_match == etag:
+        return type(response)(etag=etag, not_modified=True)
+    response.etag = etag
+    return response
+
+
+def _abandoned(context, method: str) -> bool:
+    """Finish the call with CANCELLED or DEADLINE_EXCEEDED once the client can no longer use the result"""
+    if not context.is_active():
+        code = grpc.StatusCode.CANCELLED
+    else:
+        remaining = context.time_remaining()
+        # time_remaining() is None when the client set no deadline
+        if remaining is None or remaining > 0:
+            return False
+        code = grpc.StatusCode.DEADLINE_EXCEEDED
+    logger.info(f"{method} abandoned: {code.name}")
+    context.set_code(code)
+    context.set_details(f"{method} abandoned: client cancelled or deadline exceeded")
+    return True
+
+
+def _is_unknown_history(ticker, frame) -> bool:
+    """True when a history call returned no bars because Yahoo has no chart for the symbol"""
+    # An unknown symbol's chart comes back without metadata; a known one's empty range still has it
+    return frame.empty and not ticker.get_history_metadata()
+
+
+def _fetch_fast_info(symbol: str) -> ticker_pb2.FastInfo:
+    """FastInfo for symbol; fast_info loads lazily, so every attribute is read here inside the retried call"""
+    ticker = yf.Ticker(symbol)
+    fi = ticker.get_fast_info()
+    try:
+        return _fast_info_message(fi)
+    except KeyError:
+        # fast_info reads the chart metadata, which is empty for symbols Yahoo does not know
+        if not ticker.get_history_metadata():
+            raise UnknownSymbolError(symbol)
+        raise
+
+
+def _fast_info_message(fi) -> ticker_pb2.FastInfo:
+    return ticker_pb2.FastInfo(
+        currency=safe_str(getattr(fi, 'currency', None)),
+        exchange=safe_str(getattr(fi, 'exchange', None)),
+        exchange_data_delayed_by=safe_int(getattr(fi, 'exchange_data_delayed_by', 0)),
+        exchange_timezone_name=safe_str(getattr(fi, 'exchange_timezone_name', None)),
+        last_price=safe_float(getattr(fi, 'last_price', 0)),
+        last_volume=safe_int(getattr(fi, 'last_volume', 0)),
+        market_cap=safe_int(getattr(fi, 'market_cap', 0)),
+        open=safe_float(getattr(fi, 'open', 0)),
+        previous_close=safe_float(getattr(fi, 'previous_close', 0)),
+        quote_type=safe_str(getattr(fi, 'quote_type', None)),
+        regular_market_day_high=safe_float(getattr(fi, 'regular_market_day_high', 0)),
+        regular_market_day_low=safe_float(getattr(fi, 'regular_market_day_low', 0)),
+        regular_market_previous_close=safe_float(getattr(fi, 'regular_market_previous_close', 0)),
+        regular_market_price=safe_float(getattr(fi, 'regular_market_price', 0)),
+        shares=safe_int(getattr(fi, 'shares', 0)),
+        three_month_average_volume=safe_float(getattr(fi, 'three_month_average_volume', 0)),
+        timezone=safe_str(getattr(fi, 'timezone', None)),
+        fifty_day_average=safe_float(getattr(fi, 'fifty_day_average', 0)),
+        two_hundred_day_average=safe_float(getattr(fi, 'two_hundred_day_average', 0)),
+        year_change=safe_float(getattr(fi, 'year_change', 0)),
+        year_high=safe_float(getattr(fi, 'year_high', 0)),
+        year_low=safe_float(getattr(fi, 'year_low', 0)),
     )
 
 
+# GetHistory options whose bars differ from the ones the bar archive keeps
+_UNARCHIVED_HISTORY_OPTIONS = ('prepost', 'back_adjust', 'repair', 'keepna', 'rounding')
+
+# Corporate action columns and the row fields they fill where positive
+_ACTION_COLUMNS = (('Dividends', 'dividends'), ('Stock Splits', 'stock_splits'), ('Capital Gains', 'capital_gains'))
+
+
+def _ohlcv_rows(dates, opens, highs, lows, closes, volumes) -> list:
+    """HistoryRows from a column of date Timestamps and the OHLCV columns, each converted in one pass"""
+    opens, highs, lows, closes = (float_column(column) for column in (opens, highs, lows, closes))
+    volumes = int_column(volumes)
+    return [
+        ticker_pb2.HistoryRow(
+            date=dates[i],
+            open=opens[i],
+            high=highs[i],
+            low=lows[i],
+            close=closes[i],
+            volume=volumes[i],
+        )
+        for i in range(len(dates))
+    ]
+
+
+def _history_rows(frame) -> list:
+    """HistoryRows for an OHLCV frame, converted a column at a time"""
+    n = len(frame)
+    opens, highs, lows, closes = (
+        frame[column] if column in frame else [0.0] * n
+        for column in ('Open', 'High', 'Low', 'Close')
+    )
+    volumes = frame['Volume'] if 'Volume' in frame else [0] * n
+    return _ohlcv_rows(timestamp_column(frame.index), opens, highs, lows, closes, volumes)
+
+
+def _bar_rows(bars: Bars, actions: bool, dates=None) -> list:
+    """HistoryRows for archived bars; dates (epoch nanoseconds) replaces their timestamps"""
+    stamps = timestamps_from_ns(bars.date if dates is None else dates)
+    rows = _ohlcv_rows(stamps, bars.open, bars.high, bars.low, bars.close, bars.volume)
+    if actions:
+        for field in ACTION_COLUMNS:
+            for i, value in enumerate(float_column(getattr(bars, field))):
+                if value > 0:
+                    setattr(rows[i], field, value)
+    return rows
+
+
+def _history_batches(frame, size: int, actions: bool = False):
+    """_history_rows of each size-row slice of frame, converted as it is consumed"""
+    for start in range(0, len(frame), size):
+        chunk = frame.iloc[start:start + size]
+        rows = _history_rows(chunk)
+        if actions:
+            _set_actions(rows, chunk)
+        yield rows
+
+
+def _bar_batches(bars: Bars, size: int, actions: bool, dates=None):
+    """_bar_rows of each size-bar slice of bars, so only the slice being sent is read and converted"""
+    for start in range(0, len(bars.date), size):
+        stop = start + size
+        chunk = bars._make(column[start:stop] for column in bars)
+        yield _bar_rows(chunk, actions, None if dates is None else dates[start:stop])
+
+
+def _collect_rows(batches, context) -> Optional[list]:
+    """Rows of every GetHistory batch, or None once the call is abandoned between two of them"""
+    rows = []
+    for batch in batches:
+        rows.extend(batch)
+        if _abandoned(context, "GetHistory"):
+            return None
+    return rows
+
+
+def _cached_exchange_timezone(symbol: str) -> Optional[str]:
+    """Exchange timezone yfinance cached for symbol, e.g. while downloading it; None if unknown"""
+    try:
+        return yf.cache.get_tz_cache().lookup(symbol)
+    except Exception:
+        return None
+
+
+def _date_column(frame, column: str) -> list:
+    """timestamp_column of frame[column], or None for every row when the column is missing"""
+    return timestamp_column(frame[column]) if column in frame else [None] * len(frame)
+
+
+def _set_actions(rows: list, frame):
+    """Set each row's corporate action fields from frame where the value is positive"""
+    for column, field in _ACTION_COLUMNS:
+        if column in frame:
+            for i, value in enumerate(float_column(frame[column])):
+                if value > 0:
+                    setattr(rows[i], field, value)
+
+
 class TickerServiceServicer(ticker_pb2_grpc.TickerServiceServicer):
     """Implementation of the TickerService gRPC service"""
 
+    def __init__(self, market_schedule: Optional[MarketSchedule] = None,
+                 quote_hub: Optional[QuoteHub] = None,
+                 conversion_pool: Optional[ConversionPool] = None,
+                 negative_cache: Optional[NegativeCache] = None, upstream: Optional[Upstream] = None,
+                 bar_archive: Optional[BarArchive] = None):
+        self.market_schedule = market_schedule
+        self.quote_hub = quote_hub if quote_hub is not None else QuoteHub()
+        self.conversion_pool = conversion_pool if conversion_pool is not None else ConversionPool()
+        self.negative_cache = negative_cache if negative_cache is not None else NegativeCache()
+        self.upstream = upstream if upstream is not None else Upstream()
+        self.bar_archive = bar_archive
+        # Session requests go through these, the server's interceptors, once serve() sets them
+        self.session_handlers = None
+        self._draining = threading.Event()
+
+    def drain(self):
+        """Stop taking new Session requests and end each session once its in-flight requests finish"""
+        self._draining.set()
+
+    def _archived_bars(self, symbol: str, interval: str, start, end, actions: bool):
+        """Bars for [start, end) from the bar archive, or None when it does not hold the whole range"""
+        try:
+            return self.bar_archive.read(symbol, interval, start, end, actions)
+        except Exception as e:
+            logger.warning(f"Failed to read archived {interval} bars for {symbol}: {e}")
+            return None
+
+    def _archive_bars(self, symbol: str, interval: str, frame, start, end, tz: Optional[str]):
+        """Record a history frame's closed bars in the bar archive; failures only cost the archive"""
+        try:
+            self.bar_archive.write(symbol, interval, frame, start, end, tz)
+        except Exception as e:
+            logger.warning(f"Failed to archive {interval} bars for {symbol}: {e}")
+
+    def _build_ticker_info(self, ticker, symbol: str, fields, source, context=None) -> ticker_pb2.TickerInfo:
+        """Build a TickerInfo for `ticker` from the planned upstream source"""
+        if source == ticker_pb2.INFO_SOURCE_FAST:
+            return create_ticker_info_from_fast_info(ticker.get_fast_info(), symbol, fields)
+        info = self.upstream.call(context, lambda: ticker.info, name='info')
+        if _is_unknown_symbol(info):
+            self.negative_cache.add(symbol)
+            raise UnknownSymbolError(symbol)
+        if self.market_schedule is not None:
+            self.market_schedule.remember_market(symbol, info.get('market'))
+        return create_ticker_info(info, symbol, fields)
+
     def GetInfo(self, request, context):
         """Get general information about a ticker"""
+        invalid_paths = _invalid_read_mask_paths(request.read_mask)
+        if invalid_paths:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(f"Unknown read_mask paths: {', '.join(invalid_paths)}")
+            return ticker_pb2.GetInfoResponse()
+
         try:
             logger.info(f"GetInfo called for ticker: {request.ticker}")
             ticker = yf.Ticker(request.ticker)
-            info = ticker.info
+            fields = _read_mask_fields(request.read_mask)
+            source = _plan_info_source(fields, request.freshness)
             
             response = ticker_pb2.GetInfoResponse(
-                info=create_ticker_info(info, request.ticker)
+                info=self._build_ticker_info(ticker, request.ticker, fields, source, context),
+                source=source,
             )
             
             return response
-            
+
+        except UnknownSymbolError as e:
+            logger.warning(f"GetInfo for unknown symbol {request.ticker}")
+            context.set_code(grpc.StatusCode.NOT_FOUND)
+            context.set_details(str(e))
+            return ticker_pb2.GetInfoResponse()
         except Exception as e:
             logger.error(f"Error in GetInfo for {request.ticker}: {str(e)}")
             context.set_code(grpc.StatusCode.INTERNAL)
@@ -235,33 +417,43 @@ class TickerServiceServicer(ticker_pb2_grpc.TickerServiceServicer):
                 kwargs['rounding'] = request.rounding
             # default is False, which matches yfinance
             
+            # Unadjusted bars of requests without special options are archived; explicit
+            # ranges the archive already holds are served from it
+            archived = self.bar_archive is not None and not kwargs['auto_adjust'] and not any(
+                getattr(request, option) for option in _UNARCHIVED_HISTORY_OPTIONS
+            )
+            if archived and 'start' in kwargs and 'end' in kwargs:
+                bars = self._archived_bars(request.ticker, kwargs['interval'], kwargs['start'], kwargs['end'],
+                                           kwargs['actions'])
+                if bars is not None:
+                    rows = _collect_rows(_bar_batches(bars, _STREAM_BATCH_SIZE, kwargs['actions']), context)
+                    return ticker_pb2.GetHistoryResponse() if rows is None else ticker_pb2.GetHistoryResponse(rows=rows)
+
             # Get history
-            hist = ticker.history(**kwargs)
-            
-            # Convert to response
-            rows = []
-            for idx, row in hist.iterrows():
-                history_row = ticker_pb2.HistoryRow(
-                    date=datetime_to_timestamp(idx),
-                    open=safe_float(row.get('Open', 0)),
-                    high=safe_float(row.get('High', 0)),
-                    low=safe_float(row.get('Low', 0)),
-                    close=safe_float(row.get('Close', 0)),
-                    volume=safe_int(row.get('Volume', 0)),
-                )
-                
-                # Optional fields
-                if 'Dividends' in row and row['Dividends'] > 0:
-                    history_row.dividends = safe_float(row['Dividends'])
-                if 'Stock Splits' in row and row['Stock Splits'] > 0:
-                    history_row.stock_splits = safe_float(row['Stock Splits'])
-                if 'Capital Gains' in row and row['Capital Gains'] > 0:
-                    history_row.capital_gains = safe_float(row['Capital Gains'])
-                
-                rows.append(history_row)
-            
+            hist = self.upstream.call(context, lambda: ticker.history(**kwargs), name='history')
+            if _abandoned(context, "GetHistory"):
+                return ticker_pb2.GetHistoryResponse()
+            if _is_unknown_history(ticker, hist):
+                self.negative_cache.add(request.ticker)
+                raise UnknownSymbolError(request.ticker)
+            
+            # Convert to response, a column at a time; corporate actions only where positive
+            rows = _collect_rows(_history_batches(hist, _STREAM_BATCH_SIZE, actions=True), context)
+            if rows is None:
+                return ticker_pb2.GetHistoryResponse()
+
+            if archived:
+                tz = getattr(hist.index, 'tz', None)
+                self._archive_bars(request.ticker, kwargs['interval'], hist, kwargs.get('start'), kwargs.get('end'),
+                                   None if tz is None else str(tz))
+
             return ticker_pb2.GetHistoryResponse(rows=rows)
             
+        except UnknownSymbolError as e:
+            logger.warning(f"GetHistory for unknown symbol {request.ticker}")
+            context.set_code(grpc.StatusCode.NOT_FOUND)
+            context.set_details(str(e))
+            return ticker_pb2.GetHistoryResponse()
         except Exception as e:
             logger.error(f"Error in GetHistory for {request.ticker}: {str(e)}")
             context.set_code(grpc.StatusCode.INTERNAL)
@@ -277,12 +469,10 @@ class TickerServiceServicer(ticker_pb2_grpc.TickerServiceServicer):
             period = request.period if request.HasField('period') else 'max'
             dividends = ticker.get_dividends(period=period)
             
-            rows = []
-            for idx, value in dividends.items():
-                rows.append(ticker_pb2.DividendRow(
-                    date=datetime_to_timestamp(idx),
-                    amount=safe_float(value)
-                ))
+            rows = [
+                ticker_pb2.DividendRow(date=date, amount=amount)
+                for date, amount in zip(timestamp_column(dividends.index), float_column(dividends))
+            ]
             
             return ticker_pb2.GetDividendsResponse(rows=rows)
             
@@ -301,12 +491,10 @@ class TickerServiceServicer(ticker_pb2_grpc.TickerServiceServicer):
             period = request.period if request.HasField('period') else 'max'
             splits = ticker.get_splits(period=period)
             
-            rows = []
-            for idx, value in splits.items():
-                rows.append(ticker_pb2.SplitRow(
-                    date=datetime_to_timestamp(idx),
-                    ratio=safe_float(value)
-                ))
+            rows = [
+                ticker_pb2.SplitRow(date=date, ratio=ratio)
+                for date, ratio in zip(timestamp_column(splits.index), float_column(splits))
+            ]
             
             return ticker_pb2.GetSplitsResponse(rows=rows)
             
@@ -325,20 +513,8 @@ class TickerServiceServicer(ticker_pb2_grpc.TickerServiceServicer):
             period = request.period if request.HasField('period') else 'max'
             actions = ticker.get_actions(period=period)
             
-            rows = []
-            for idx, row in actions.iterrows():
-                action_row = ticker_pb2.ActionRow(
-                    date=datetime_to_timestamp(idx)
-                )
-                
-                if 'Dividends' in row and not pd.isna(row['Dividends']) and row['Dividends'] > 0:
-                    action_row.dividends = safe_float(row['Dividends'])
-                if 'Stock Splits' in row and not pd.isna(row['Stock Splits']) and row['Stock Splits'] > 0:
-                    action_row.stock_splits = safe_float(row['Stock Splits'])
-                if 'Capital Gains' in row and not pd.isna(row['Capital Gains']) and row['Capital Gains'] > 0:
-                    action_row.capital_gains = safe_float(row['Capital Gains'])
-                
-                rows.append(action_row)
+            rows = [ticker_pb2.ActionRow(date=date) for date in timestamp_column(actions.index)]
+            _set_actions(rows, actions)
             
             return ticker_pb2.GetActionsResponse(rows=rows)
             
@@ -370,7 +546,9 @@ class TickerServiceServicer(ticker_pb2_grpc.TickerServiceServicer):
                     values=values
                 ))
             
-            return ticker_pb2.GetFinancialsResponse(statements=statements)
+            return _apply_etag(
+                ticker_pb2.GetFinancialsResponse(statements=statements), request.if_none_match
+            )
             
         except Exception as e:
             logger.error(f"Error in GetFinancials for {request.ticker}: {str(e)}")
@@ -449,9 +627,9 @@ class TickerServiceServicer(ticker_pb2_grpc.TickerServiceServicer):
             
             rows = []
             if earnings is not None and not earnings.empty:
-                for idx, row in earnings.iterrows():
+                for date, (_, row) in zip(timestamp_column(earnings.index), earnings.iterrows()):
                     earnings_row = ticker_pb2.EarningsRow(
-                        date=datetime_to_timestamp(idx)
+                        date=date
                     )
                     
                     if 'Revenue' in row:
@@ -483,9 +661,9 @@ class TickerServiceServicer(ticker_pb2_grpc.TickerServiceServicer):
                 # Sort by date descending (most recent first)
                 recommendations = recommendations.sort_index(ascending=False)
                 
-                for idx, row in recommendations.iterrows():
+                for date, (_, row) in zip(timestamp_column(recommendations.index), recommendations.iterrows()):
                     rows.append(ticker_pb2.RecommendationRow(
-                        date=datetime_to_timestamp(idx),
+                        date=date,
                         firm=safe_str(row.get('Firm', '')),
                         to_grade=safe_str(row.get('ToGrade', '')),
                         from_grade=safe_str(row.get('FromGrade', '')),
@@ -526,10 +704,21 @@ class TickerServiceServicer(ticker_pb2_grpc.TickerServiceServicer):
             tz = request.tz if request.HasField('tz') else None
             
             option_chain = ticker.option_chain(date=date, tz=tz)
+            if _abandoned(context, "GetOptionChain"):
+                return ticker_pb2.GetOptionChainResponse()
+
+            if len(option_chain.calls) + len(option_chain.puts) >= OFFLOAD_ROW_THRESHOLD:
+                # Already encoded; sent as is by the method's serializer
+                encoded = self.conversion_pool.option_chain(option_chain.calls, option_chain.puts, context)
+                if encoded is None:
+                    _abandoned(context, "GetOptionChain")
+                    return ticker_pb2.GetOptionChainResponse()
+                return encoded
             
             # Convert calls
             calls = []
-            for _, row in option_chain.calls.iterrows():
+            for last_trade_date, (_, row) in zip(_date_column(option_chain.calls, 'lastTradeDate'),
+                                                 option_chain.calls.iterrows()):
                 calls.append(ticker_pb2.OptionContract(
                     contract_symbol=safe_str(row.get('contractSymbol', '')),
                     strike=safe_float(row.get('strike', 0)),
@@ -544,12 +733,13 @@ class TickerServiceServicer(ticker_pb2_grpc.TickerServiceServicer):
                     implied_volatility=safe_float(row.get('impliedVolatility', 0)),
                     in_the_money=bool(row.get('inTheMoney', False)),
                     contract_size=safe_str(row.get('contractSize', 'REGULAR')),
-                    last_trade_date=datetime_to_timestamp(row.get('lastTradeDate'))
+                    last_trade_date=last_trade_date
                 ))
             
             # Convert puts
             puts = []
-            for _, row in option_chain.puts.iterrows():
+            for last_trade_date, (_, row) in zip(_date_column(option_chain.puts, 'lastTradeDate'),
+                                                 option_chain.puts.iterrows()):
                 puts.append(ticker_pb2.OptionContract(
                     contract_symbol=safe_str(row.get('contractSymbol', '')),
                     strike=safe_float(row.get('strike', 0)),
@@ -564,7 +754,7 @@ class TickerServiceServicer(ticker_pb2_grpc.TickerServiceServicer):
                     implied_volatility=safe_float(row.get('impliedVolatility', 0)),
                     in_the_money=bool(row.get('inTheMoney', False)),
                     contract_size=safe_str(row.get('contractSize', 'REGULAR')),
-                    last_trade_date=datetime_to_timestamp(row.get('lastTradeDate'))
+                    last_trade_date=last_trade_date
                 ))
             
             return ticker_pb2.GetOptionChainResponse(calls=calls, puts=puts)
@@ -637,7 +827,7 @@ class TickerServiceServicer(ticker_pb2_grpc.TickerServiceServicer):
                 if 'pubDate' in article:
                     try:
                         dt = date_parser.isoparse(article['pubDate'])
-                        news_article.provider_publish_time.FromDatetime(dt)
+                        news_article.provider_publish_time.CopyFrom(datetime_to_timestamp(dt))
                     except Exception as e:
                         logger.warning(f"Failed to parse pubDate '{article['pubDate']}': {e}")
                 
@@ -690,16 +880,19 @@ class TickerServiceServicer(ticker_pb2_grpc.TickerServiceServicer):
             
             holders = []
             if institutional_holders is not None and not institutional_holders.empty:
-                for _, row in institutional_holders.iterrows():
+                for date_reported, (_, row) in zip(_date_column(institutional_holders, 'Date Reported'),
+                                                   institutional_holders.iterrows()):
                     holders.append(ticker_pb2.InstitutionalHolder(
                         holder=safe_str(row.get('Holder', '')),
                         shares=safe_int(row.get('Shares', 0)),
-                        date_reported=datetime_to_timestamp(row.get('Date Reported')),
+                        date_reported=date_reported,
                         pct_out=safe_float(row.get('% Out', 0)),
                         value=safe_float(row.get('Value', 0))
                     ))
             
-            return ticker_pb2.GetInstitutionalHoldersResponse(holders=holders)
+            return _apply_etag(
+                ticker_pb2.GetInstitutionalHoldersResponse(holders=holders), request.if_none_match
+            )
             
         except Exception as e:
             logger.error(f"Error in GetInstitutionalHolders for {request.ticker}: {str(e)}")
@@ -717,11 +910,12 @@ class TickerServiceServicer(ticker_pb2_grpc.TickerServiceServicer):
             
             holders = []
             if mutualfund_holders is not None and not mutualfund_holders.empty:
-                for _, row in mutualfund_holders.iterrows():
+                for date_reported, (_, row) in zip(_date_column(mutualfund_holders, 'Date Reported'),
+                                                   mutualfund_holders.iterrows()):
                     holders.append(ticker_pb2.MutualFundHolder(
                         holder=safe_str(row.get('Holder', '')),
                         shares=safe_int(row.get('Shares', 0)),
-                        date_reported=datetime_to_timestamp(row.get('Date Reported')),
+                        date_reported=date_reported,
                         pct_out=safe_float(row.get('% Out', 0)),
                         value=safe_float(row.get('Value', 0))
                     ))
@@ -741,24 +935,36 @@ class TickerServiceServicer(ticker_pb2_grpc.TickerServiceServicer):
             context.set_details("Tickers list cannot be empty")
             return ticker_pb2.GetMultipleInfoResponse()
 
+        invalid_paths = _invalid_read_mask_paths(request.read_mask)
+        if invalid_paths:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(f"Unknown read_mask paths: {', '.join(invalid_paths)}")
+            return ticker_pb2.GetMultipleInfoResponse()
+
         try:
             tickers_str = ' '.join(request.tickers)
             logger.info(f"GetMultipleInfo called for tickers: {tickers_str}")
             
             tickers_obj = yf.Tickers(tickers_str)
+            fields = _read_mask_fields(request.read_mask)
+            source = _plan_info_source(fields, request.freshness)
             info_map = {}
             
             for symbol, ticker in tickers_obj.tickers.items():
+                # Each ticker is a separate upstream fetch; stop once nobody is waiting
+                if _abandoned(context, "GetMultipleInfo"):
+                    return ticker_pb2.GetMultipleInfoResponse()
+                if symbol in self.negative_cache:
+                    continue
                 try:
-                    info = ticker.info
-                    info_map[symbol] = create_ticker_info(info, symbol)
+                    info_map[symbol] = self._build_ticker_info(ticker, symbol, fields, source, context)
                     
                 except Exception as e:
                     logger.error(f"Error fetching info for {symbol}: {str(e)}")
                     # Continue with other tickers even if one fails
                     continue
             
-            return ticker_pb2.GetMultipleInfoResponse(info=info_map)
+            return ticker_pb2.GetMultipleInfoResponse(info=info_map, source=source)
             
         except Exception as e:
             logger.error(f"Error in GetMultipleInfo: {str(e)}")
@@ -795,9 +1001,24 @@ class TickerServiceServicer(ticker_pb2_grpc.TickerServiceServicer):
             
             if request.HasField('interval'):
                 kwargs['interval'] = request.interval
-            
+            interval = kwargs.get('interval', '1d')
+
+            # Serve explicit ranges from the bar archive when it holds them for every ticker
+            if self._archives_download(kwargs) and 'start' in kwargs and 'end' in kwargs:
+                archived = [
+                    self._archived_bars(ticker, interval, kwargs['start'], kwargs['end'], False)
+                    for ticker in request.tickers
+                ]
+                if all(bars is not None for bars in archived):
+                    yield from self._stream_archived(request.tickers, interval, archived, context)
+                    return
+
             # Download data
+            if _abandoned(context, "DownloadHistory"):
+                return
             data = yf.download(tickers_str, **kwargs)
+            if _abandoned(context, "DownloadHistory"):
+                return
 
             # Handle empty data
             if data.empty:
@@ -808,64 +1029,26 @@ class TickerServiceServicer(ticker_pb2_grpc.TickerServiceServicer):
             
             is_multi = isinstance(data.columns, pd.MultiIndex)
 
-            # Handle single ticker vs multiple tickers
+            # Handle single ticker vs multiple tickers; frames are archived once they
+            # have all been streamed, so archive writes never delay a batch
+            streamed = []
             if len(request.tickers) == 1:
                 ticker = request.tickers[0]
-                batch = []
-
-                for idx, row in data.iterrows():
-                    # For single ticker with group_by='ticker', columns may be MultiIndex (ticker, price_type)
-                    if is_multi:
-                        open_val = safe_float(row.get((ticker, 'Open'), 0))
-                        high_val = safe_float(row.get((ticker, 'High'), 0))
-                        low_val = safe_float(row.get((ticker, 'Low'), 0))
-                        close_val = safe_float(row.get((ticker, 'Close'), 0))
-                        volume_val = safe_int(row.get((ticker, 'Volume'), 0))
-                    else:
-                        open_val = safe_float(row.get('Open', 0))
-                        high_val = safe_float(row.get('High', 0))
-                        low_val = safe_float(row.get('Low', 0))
-                        close_val = safe_float(row.get('Close', 0))
-                        volume_val = safe_int(row.get('Volume', 0))
-
-                    batch.append(ticker_pb2.HistoryRow(
-                        date=datetime_to_timestamp(idx),
-                        open=open_val,
-                        high=high_val,
-                        low=low_val,
-                        close=close_val,
-                        volume=volume_val
-                    ))
-
-                    if len(batch) >= _STREAM_BATCH_SIZE:
-                        yield ticker_pb2.DownloadHistoryResponse(ticker=ticker, rows=batch)
-                        batch = []
-
-                if batch:
-                    yield ticker_pb2.DownloadHistoryResponse(ticker=ticker, rows=batch)
+                # For single ticker with group_by='ticker', columns may be MultiIndex (ticker, price_type)
+                frame = data[ticker] if is_multi else data
+                if not (yield from self._stream_frame(ticker, frame, context)):
+                    return
+                streamed.append((ticker, frame))
             else:
                 # Multiple tickers - group by ticker and stream each
                 for ticker in request.tickers:
+                    if _abandoned(context, "DownloadHistory"):
+                        return
                     try:
                         ticker_data = data[ticker]
-                        batch = []
-
-                        for idx, row in ticker_data.iterrows():
-                            batch.append(ticker_pb2.HistoryRow(
-                                date=datetime_to_timestamp(idx),
-                                open=safe_float(row.get('Open', 0)),
-                                high=safe_float(row.get('High', 0)),
-                                low=safe_float(row.get('Low', 0)),
-                                close=safe_float(row.get('Close', 0)),
-                                volume=safe_int(row.get('Volume', 0))
-                            ))
-
-                            if len(batch) >= _STREAM_BATCH_SIZE:
-                                yield ticker_pb2.DownloadHistoryResponse(ticker=ticker, rows=batch)
-                                batch = []
-
-                        if batch:
-                            yield ticker_pb2.DownloadHistoryResponse(ticker=ticker, rows=batch)
+                        if not (yield from self._stream_frame(ticker, ticker_data, context)):
+                            return
+                        streamed.append((ticker, ticker_data))
 
                     except KeyError:
                         logger.error(f"Ticker '{ticker}' not found in data. Check ticker symbol is correct.")
@@ -873,6 +1056,9 @@ class TickerServiceServicer(ticker_pb2_grpc.TickerServiceServicer):
                     except Exception as e:
                         logger.error(f"Error processing data for {ticker}: {str(e)}")
                         continue
+
+            for ticker, frame in streamed:
+                self._archive_download(ticker, interval, kwargs, frame)
             
         except Exception as e:
             logger.error(f"Error in DownloadHistory: {str(e)}")
@@ -880,6 +1066,44 @@ class TickerServiceServicer(ticker_pb2_grpc.TickerServiceServicer):
             context.set_details(f"Error downloading history: {str(e)}")
 
 
+    def _archives_download(self, kwargs: dict) -> bool:
+        """Whether a download's bars are served from and recorded in the bar archive; only unadjusted ones are"""
+        return self.bar_archive is not None and not kwargs['auto_adjust']
+
+    def _archive_download(self, ticker: str, interval: str, kwargs: dict, frame):
+        if self._archives_download(kwargs):
+            tz = self.bar_archive.timezone(ticker) or _cached_exchange_timezone(ticker)
+            self._archive_bars(ticker, interval, frame, kwargs.get('start'), kwargs.get('end'), tz)
+
+    def _stream_frame(self, ticker: str, frame, context):
+        """Stream a downloaded frame as DownloadHistoryResponse batches; False once the call is abandoned"""
+        if len(frame) >= OFFLOAD_ROW_THRESHOLD:
+            # Already encoded; sent as is by the method's serializer
+            batches = self.conversion_pool.history_batches(ticker, frame, _STREAM_BATCH_SIZE, context)
+            if batches is None:
+                _abandoned(context, "DownloadHistory")
+                return False
+        else:
+            batches = (ticker_pb2.DownloadHistoryResponse(ticker=ticker, rows=rows)
+                       for rows in _history_batches(frame, _STREAM_BATCH_SIZE))
+        for batch in batches:
+            yield batch
+            if _abandoned(context, "DownloadHistory"):
+                return False
+        return True
+
+    def _stream_archived(self, tickers, interval: str, archived, context):
+        """DownloadHistoryResponse batches for archived bars, shaped as yf.download returns them"""
+        for ticker, bars in zip(tickers, archived):
+            if _abandoned(context, "DownloadHistory"):
+                return
+            # yf.download drops the timezone of daily and longer bars, leaving exchange-local dates
+            dates = None if interval[-1] in 'mh' else wall_ns(bars.date, self.bar_archive.timezone(ticker))
+            for rows in _bar_batches(bars, _STREAM_BATCH_SIZE, False, dates):
+                yield ticker_pb2.DownloadHistoryResponse(ticker=ticker, rows=rows)
+                if _abandoned(context, "DownloadHistory"):
+                    return
+
     def GetCapitalGains(self, request, context):
         """Get capital gains distributions for a ticker"""
         try:
@@ -887,12 +1111,10 @@ class TickerServiceServicer(ticker_pb2_grpc.TickerServiceServicer):
             ticker = yf.Ticker(request.ticker)
             period = request.period if request.HasField('period') else 'max'
             gains = ticker.get_capital_gains(period=period)
-            rows = []
-            for idx, value in gains.items():
-                rows.append(ticker_pb2.CapitalGainsRow(
-                    date=datetime_to_timestamp(idx),
-                    amount=safe_float(value)
-                ))
+            rows = [
+                ticker_pb2.CapitalGainsRow(date=date, amount=amount)
+                for date, amount in zip(timestamp_column(gains.index), float_column(gains))
+            ]
             return ticker_pb2.GetCapitalGainsResponse(rows=rows)
         except Exception as e:
             logger.error(f"Error in GetCapitalGains for {request.ticker}: {str(e)}")
@@ -913,11 +1135,10 @@ class TickerServiceServicer(ticker_pb2_grpc.TickerServiceServicer):
             shares = ticker.get_shares_full(**kwargs)
             rows = []
             if shares is not None:
-                for idx, value in shares.items():
-                    rows.append(ticker_pb2.SharesHistoryRow(
-                        date=datetime_to_timestamp(idx),
-                        shares=safe_int(value)
-                    ))
+                rows = [
+                    ticker_pb2.SharesHistoryRow(date=date, shares=count)
+                    for date, count in zip(timestamp_column(shares.index), int_column(shares))
+                ]
             return ticker_pb2.GetSharesHistoryResponse(rows=rows)
         except Exception as e:
             logger.error(f"Error in GetSharesHistory for {request.ticker}: {str(e)}")
@@ -942,33 +1163,16 @@ class TickerServiceServicer(ticker_pb2_grpc.TickerServiceServicer):
         """Get a lightweight snapshot of key price/market data"""
         try:
             logger.info(f"GetFastInfo called for ticker: {request.ticker}")
-            ticker = yf.Ticker(request.ticker)
-            fi = ticker.get_fast_info()
-            info = ticker_pb2.FastInfo(
-                currency=safe_str(getattr(fi, 'currency', None)),
-                exchange=safe_str(getattr(fi, 'exchange', None)),
-                exchange_data_delayed_by=safe_int(getattr(fi, 'exchange_data_delayed_by', 0)),
-                exchange_timezone_name=safe_str(getattr(fi, 'exchange_timezone_name', None)),
-                last_price=safe_float(getattr(fi, 'last_price', 0)),
-                last_volume=safe_int(getattr(fi, 'last_volume', 0)),
-                market_cap=safe_int(getattr(fi, 'market_cap', 0)),
-                open=safe_float(getattr(fi, 'open', 0)),
-                previous_close=safe_float(getattr(fi, 'previous_close', 0)),
-                quote_type=safe_str(getattr(fi, 'quote_type', None)),
-                regular_market_day_high=safe_float(getattr(fi, 'regular_market_day_high', 0)),
-                regular_market_day_low=safe_float(getattr(fi, 'regular_market_day_low', 0)),
-                regular_market_previous_close=safe_float(getattr(fi, 'regular_market_previous_close', 0)),
-                regular_market_price=safe_float(getattr(fi, 'regular_market_price', 0)),
-                shares=safe_int(getattr(fi, 'shares', 0)),
-                three_month_average_volume=safe_float(getattr(fi, 'three_month_average_volume', 0)),
-                timezone=safe_str(getattr(fi, 'timezone', None)),
-                fifty_day_average=safe_float(getattr(fi, 'fifty_day_average', 0)),
-                two_hundred_day_average=safe_float(getattr(fi, 'two_hundred_day_average', 0)),
-                year_change=safe_float(getattr(fi, 'year_change', 0)),
-                year_high=safe_float(getattr(fi, 'year_high', 0)),
-                year_low=safe_float(getattr(fi, 'year_low', 0)),
-            )
+            # Latency-critical, so a slow upstream reply may be raced by a hedged duplicate
+            info = self.upstream.call(context, lambda: _fetch_fast_info(request.ticker), name='GetFastInfo',
+                                      hedge=True)
             return ticker_pb2.GetFastInfoResponse(info=info)
+        except UnknownSymbolError as e:
+            logger.warning(f"GetFastInfo for unknown symbol {request.ticker}")
+            self.negative_cache.add(request.ticker)
+            context.set_code(grpc.StatusCode.NOT_FOUND)
+            context.set_details(str(e))
+            return ticker_pb2.GetFastInfoResponse()
         except Exception as e:
             logger.error(f"Error in GetFastInfo for {request.ticker}: {str(e)}")
             context.set_code(grpc.StatusCode.INTERNAL)
@@ -982,8 +1186,8 @@ class TickerServiceServicer(ticker_pb2_grpc.TickerServiceServicer):
             ticker = yf.Ticker(request.ticker)
             data = ticker.get_sustainability(as_dict=True)
             if not data:
-                return ticker_pb2.GetSustainabilityResponse()
-            return ticker_pb2.GetSustainabilityResponse(
+                return _apply_etag(ticker_pb2.GetSustainabilityResponse(), request.if_none_match)
+            response = ticker_pb2.GetSustainabilityResponse(
                 total_esg=safe_float(data.get('totalEsg', 0)),
                 esg_performance=safe_str(data.get('esgPerformance')),
                 environment_score=safe_float(data.get('environmentScore', 0)),
@@ -1007,6 +1211,7 @@ class TickerServiceServicer(ticker_pb2_grpc.TickerServiceServicer):
                 coal=bool(data.get('coal', False)),
                 tobacco=bool(data.get('tobacco', False)),
             )
+            return _apply_etag(response, request.if_none_match)
         except Exception as e:
             logger.error(f"Error in GetSustainability for {request.ticker}: {str(e)}")
             context.set_code(grpc.StatusCode.INTERNAL)
@@ -1041,9 +1246,10 @@ class TickerServiceServicer(ticker_pb2_grpc.TickerServiceServicer):
             data = ticker.get_insider_transactions(as_dict=False)
             transactions = []
             if data is not None and not data.empty:
-                for idx, row in data.iterrows():
+                start_dates = timestamp_column(data['Start Date'] if 'Start Date' in data else data.index)
+                for start_date, (_, row) in zip(start_dates, data.iterrows()):
                     transactions.append(ticker_pb2.InsiderTransaction(
-                        start_date=datetime_to_timestamp(row.get('Start Date', idx)),
+                        start_date=start_date,
                         insider=safe_str(row.get('Insider', '')),
                         position=safe_str(row.get('Position', '')),
                         transaction=safe_str(row.get('Transaction', '')),
@@ -1067,12 +1273,12 @@ class TickerServiceServicer(ticker_pb2_grpc.TickerServiceServicer):
             data = ticker.get_insider_roster_holders(as_dict=False)
             holders = []
             if data is not None and not data.empty:
-                for _, row in data.iterrows():
+                for most_recent, (_, row) in zip(_date_column(data, 'Most Recent Transaction'), data.iterrows()):
                     holders.append(ticker_pb2.InsiderRosterHolder(
                         name=safe_str(row.get('Name', '')),
                         position=safe_str(row.get('Position', '')),
                         url=safe_str(row.get('URL', '')),
-                        most_recent_transaction=datetime_to_timestamp(row.get('Most Recent Transaction')),
+                        most_recent_transaction=most_recent,
                         latest_transaction_shares=safe_int(row.get('Latest Transaction Shares', 0)),
                     ))
             return ticker_pb2.GetInsiderRosterHoldersResponse(holders=holders)
@@ -1183,9 +1389,9 @@ class TickerServiceServicer(ticker_pb2_grpc.TickerServiceServicer):
             data = ticker.get_earnings_history(as_dict=False)
             rows = []
             if data is not None and not data.empty:
-                for idx, row in data.iterrows():
+                for date, (_, row) in zip(timestamp_column(data.index), data.iterrows()):
                     rows.append(ticker_pb2.EarningsHistoryRow(
-                        date=datetime_to_timestamp(idx),
+                        date=date,
                         eps_estimate=safe_float(row.get('epsEstimate', 0)),
                         eps_actual=safe_float(row.get('epsActual', 0)),
                         eps_difference=safe_float(row.get('epsDifference', 0)),
@@ -1277,9 +1483,9 @@ class TickerServiceServicer(ticker_pb2_grpc.TickerServiceServicer):
             data = ticker.get_earnings_dates(limit=limit)
             rows = []
             if data is not None and not data.empty:
-                for idx, row in data.iterrows():
+                for date, (_, row) in zip(timestamp_column(data.index), data.iterrows()):
                     earnings_row = ticker_pb2.EarningsDateRow(
-                        date=datetime_to_timestamp(idx),
+                        date=date,
                     )
                     eps_est = row.get('EPS Estimate')
                     if eps_est is not None and not pd.isna(eps_est):
@@ -1343,8 +1549,7 @@ class TickerServiceServicer(ticker_pb2_grpc.TickerServiceServicer):
                     if date_val:
                         try:
                             dt = date_parser.isoparse(str(date_val))
-                            ts = Timestamp()
-                            ts.FromDatetime(dt)
+                            ts = datetime_to_timestamp(dt)
                         except Exception as e:
                             logger.warning(f"Failed to parse SEC filing date '{date_val}': {e}")
                     sec_filing = ticker_pb2.SecFiling(
@@ -1355,43 +1560,183 @@ class TickerServiceServicer(ticker_pb2_grpc.TickerServiceServicer):
                     if ts:
                         sec_filing.date.CopyFrom(ts)
                     filings.append(sec_filing)
-            return ticker_pb2.GetSecFilingsResponse(filings=filings)
+            return _apply_etag(ticker_pb2.GetSecFilingsResponse(filings=filings), request.if_none_match)
         except Exception as e:
             logger.error(f"Error in GetSecFilings for {request.ticker}: {str(e)}")
             context.set_code(grpc.StatusCode.INTERNAL)
             context.set_details(f"Error fetching SEC filings: {str(e)}")
             return ticker_pb2.GetSecFilingsResponse()
 
+    def SubscribeQuotes(self, request, context):
+        """Stream changed quote fields for the requested tickers from the shared poller"""
+        symbols = list(dict.fromkeys(t.strip().upper() for t in request.tickers if t.strip()))
+        if not symbols:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details("Tickers list cannot be empty")
+            return
 
-def serve(port: int = 50051, max_workers: int = 10):
-    """Start the gRPC server with reflection enabled"""
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=max_workers))
-    ticker_pb2_grpc.add_TickerServiceServicer_to_server(
-        TickerServiceServicer(), server
+        logger.info(f"SubscribeQuotes called for tickers: {' '.join(symbols)}")
+        subscription = self.quote_hub.subscribe(symbols)
+        context.add_callback(subscription.close)
+        try:
+            while context.is_active() and not subscription.closed:
+                updates = subscription.next_updates(timeout=_QUOTE_IDLE_TIMEOUT)
+                for symbol, fields in updates.items():
+                    yield ticker_pb2.SubscribeQuotesResponse(
+                        quote=ticker_pb2.Quote(symbol=symbol, **fields),
+                        changed_fields=FieldMask(paths=sorted(fields)),
+                    )
+            if self.quote_hub.stopped and context.is_active():
+                context.set_code(grpc.StatusCode.UNAVAILABLE)
+                context.set_details("Server is shutting down; resubscribe")
+        except Exception as e:
+            logger.error(f"Error in SubscribeQuotes: {str(e)}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(f"Error streaming quotes: {str(e)}")
+        finally:
+            self.quote_hub.unsubscribe(subscription)
+
+    def Session(self, request_iterator, context):
+        """Serve multiplexed info, history, option chain and news requests over one bidirectional stream"""
+        logger.info("Session opened")
+        multiplexer = SessionMultiplexer(self, context, draining=self._draining, handlers=self.session_handlers)
+        yield from multiplexer.run(request_iterator)
+        logger.info("Session closed")
+
+
+def _server_workers(max_workers: Optional[int], bulkheads: dict) -> int:
+    """Server threads for max_workers, raised so every bulkhead can fill its slots and queue at once"""
+    # Health checks and reflection sit outside the bulkheads
+    needed = total_capacity(bulkheads) + _CONTROL_WORKERS
+    if max_workers is None:
+        return needed
+    if max_workers < needed:
+        logger.warning(f"max_workers={max_workers} is too few for the bulkheads; using {needed} threads")
+    return max(max_workers, needed)
+
+
+def serve(port: Optional[int] = None, max_workers: Optional[int] = None, bulkheads: Optional[dict] = None,
+          reuse_port: bool = False, config: Optional[ServerConfig] = None):
+    """Start the gRPC server with reflection enabled
+
+    config supplies channel options and compression; port and max_workers
+    default to its values. With reuse_port, several server processes can bind
+    the same port and the kernel spreads incoming connections across them.
+    Runs until SIGTERM or SIGINT, then drains in-flight RPCs for up to
+    config.shutdown_grace seconds and saves caches to config.cache_file.
+    """
+    config = ServerConfig() if config is None else config
+    port = config.port if port is None else port
+    max_workers = config.max_workers if max_workers is None else max_workers
+    upstream = Upstream(RetryPolicy(max_attempts=config.retry_attempts), hedging=config.hedging)
+    market_schedule = MarketSchedule(upstream=upstream)
+    quote_hub = QuoteHub()
+    conversion_pool = ConversionPool()
+    universe = load_universe(config.universe_file) if config.universe_file else []
+    # Room for every prefetched response on top of the usual working set
+    response_cache = ResponseCache(max_entries=DEFAULT_MAX_ENTRIES + len(universe) * len(PREFETCH_REQUESTS))
+    bulkheads = bulkhead_configs(config) if bulkheads is None else bulkheads
+    caches = {'response': response_cache, 'market_schedule': market_schedule}
+    if config.cache_file:
+        load_caches(config.cache_file, caches)
+
+    negative_cache = NegativeCache()
+    bar_archive = BarArchive(config.bar_archive_dir) if config.bar_archive_dir else None
+    ticker_servicer = TickerServiceServicer(market_schedule, quote_hub, conversion_pool, negative_cache, upstream,
+                                            bar_archive)
+    cache_interceptor = ResponseCacheInterceptor(response_cache, schedule=market_schedule)
+    prefetcher = PrefetchScheduler(ticker_servicer, cache_interceptor, universe, rate=config.prefetch_rate,
+                                   negative_cache=negative_cache)
+
+    interceptors = []
+    if config.compression_policy:
+        interceptors.append(CompressionPolicyInterceptor({
+            method: compression_algorithm(name) for method, name in config.compression_policy.items()
+        }))
+    if universe:
+        # Counts cache hits too, so it sits in front of the cache
+        interceptors.append(RequestFrequencyInterceptor(prefetcher))
+    bulkhead_interceptor = BulkheadInterceptor(bulkheads)
+    breaker_interceptor = CircuitBreakerInterceptor(negative_cache)
+    # Cache hits are answered before bulkheads and admission control so they never take a slot;
+    # breakers come last so requests shed for load are not counted as upstream failures
+    interceptors += [
+        cache_interceptor,
+        bulkhead_interceptor,
+        AdmissionControlInterceptor(),
+        breaker_interceptor,
+        EncodedResponseInterceptor(),
+    ]
+    ticker_servicer.session_handlers = session_handlers(ticker_servicer, interceptors)
+    options = grpc_options(config)
+    if reuse_port:
+        options.append(('grpc.so_reuseport', 1))
+    workers = _server_workers(max_workers, bulkheads)
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=workers),
+        interceptors=interceptors,
+        options=options,
+        compression=compression_algorithm(config.compression),
+        # Beyond one RPC per worker gRPC answers RESOURCE_EXHAUSTED instead of queueing unboundedly
+        maximum_concurrent_rpcs=workers,
     )
+    ticker_pb2_grpc.add_TickerServiceServicer_to_server(ticker_servicer, server)
     search_pb2_grpc.add_SearchServiceServicer_to_server(SearchServiceServicer(), server)
-    market_pb2_grpc.add_MarketServiceServicer_to_server(MarketServiceServicer(), server)
+    market_pb2_grpc.add_MarketServiceServicer_to_server(MarketServiceServicer(market_schedule), server)
     sector_pb2_grpc.add_SectorServiceServicer_to_server(SectorServiceServicer(), server)
 
+    # Every service reports NOT_SERVING until warm-up finishes, then tracks load
+    health_servicer = health.HealthServicer()
+    readiness = ReadinessMonitor(health_servicer, bulkhead_interceptor.bulkheads)
+    for service in readiness.services:
+        readiness.add_check(lambda service=service: breaker_interceptor.upstream_problem(service), service)
+    health_pb2_grpc.add_HealthServicer_to_server(health_servicer, server)
+
     # Enable reflection for grpcurl and other tools
     SERVICE_NAMES = (
         ticker_pb2.DESCRIPTOR.services_by_name['TickerService'].full_name,
         search_pb2.DESCRIPTOR.services_by_name['SearchService'].full_name,
         market_pb2.DESCRIPTOR.services_by_name['MarketService'].full_name,
         sector_pb2.DESCRIPTOR.services_by_name['SectorService'].full_name,
+        health.SERVICE_NAME,
         reflection.SERVICE_NAME,
     )
     reflection.enable_server_reflection(SERVICE_NAMES, server)
     
     server.add_insecure_port(f'0.0.0.0:{port}')
     server.start()
-    logger.info(f"Server started on port {port} with reflection enabled")
-    
-    try:
-        server.wait_for_termination()
-    except KeyboardInterrupt:
-        logger.info("Shutting down server...")
-        server.stop(0)
+    market_schedule.start()
+    # Readiness waits for the heavy imports and a first upstream round trip
+    readiness.warm_up(preload().join, lambda: market_schedule.status('us_market'))
+    if universe:
+        # ...and for the universe's first prefetch pass, so a new replica starts with a warm cache
+        readiness.warm_up(prefetcher.first_pass.wait)
+    readiness.start()
+    prefetcher.start()
+    logger.info(f"Server started on port {port} with reflection enabled (pid {os.getpid()})")
+
+    stop_requested = threading.Event()
+    if threading.current_thread() is threading.main_thread():
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, lambda signum, frame: stop_requested.set())
+    stop_requested.wait()
+
+    logger.info(f"Shutting down server; draining in-flight RPCs for up to {config.shutdown_grace:g}s...")
+    readiness.stop()
+    prefetcher.stop()
+    health_servicer.enter_graceful_shutdown()
+    # New RPCs are rejected from here on; in-flight ones run until they finish or the grace period ends
+    stopped = server.stop(config.shutdown_grace)
+    # Open-ended streams never finish on their own, so end them and let clients reconnect elsewhere
+    ticker_servicer.drain()
+    quote_hub.stop()
+    market_schedule.stop()
+    stopped.wait()
+    if config.cache_file:
+        save_caches(config.cache_file, caches)
+    conversion_pool.shutdown()
+    upstream.shutdown()
+    logger.info("Server stopped")
 
 
 if __name__ == '__main__':
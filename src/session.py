@@ -0,0 +1,257 @@
+"""
+Multiplexed request sessions
+
+Runs the typed requests of one bidirectional Session stream concurrently on a
+small per-session pool, highest priority first once the pool is busy. Each
+request passes through the server's interceptors as if it were its own RPC, so
+it is answered from the response cache and counted against bulkheads, admission
+limits and circuit breakers. Every response is tagged with the request_id it
+answers, so results are written as soon as they are ready rather than in
+request order, and a client can cancel requests that are queued or in flight.
+"""
+
+import heapq
+import itertools
+import logging
+import queue
+import threading
+from concurrent import futures
+from typing import NamedTuple, Optional, Sequence
+
+import grpc
+
+from yfinance_grpc.v1alpha1 import ticker_pb2
+
+logger = logging.getLogger(__name__)
+
+# SessionRequest oneof field -> TickerService method that serves it
+SESSION_METHODS = {
+    'info': 'GetInfo',
+    'history': 'GetHistory',
+    'option_chain': 'GetOptionChain',
+    'news': 'GetNews',
+}
+
+# SessionResponse oneof field -> its message type, for responses returned encoded
+_RESPONSE_TYPES = {
+    'info': ticker_pb2.GetInfoResponse,
+    'history': ticker_pb2.GetHistoryResponse,
+    'option_chain': ticker_pb2.GetOptionChainResponse,
+    'news': ticker_pb2.GetNewsResponse,
+}
+
+# How often the response loop re-checks whether the client is still connected
+_POLL_INTERVAL = 1.0
+
+_DONE = object()
+
+_TICKER_SERVICE = '/' + ticker_pb2.DESCRIPTOR.services_by_name['TickerService'].full_name + '/'
+
+
+class _Aborted(Exception):
+    """Raised by SessionCallContext.abort, as grpc raises from ServicerContext.abort"""
+
+
+class _CallDetails(NamedTuple):
+    """grpc.HandlerCallDetails for a session request"""
+    method: str
+    invocation_metadata: tuple
+
+
+def session_handlers(servicer, interceptors: Sequence[grpc.ServerInterceptor] = ()):
+    """Unary behaviors per SessionRequest kind, wrapped by interceptors in server order"""
+    handlers = {}
+    for kind, name in SESSION_METHODS.items():
+        handler = grpc.unary_unary_rpc_method_handler(
+            getattr(servicer, name),
+            response_serializer=_RESPONSE_TYPES[kind].SerializeToString,
+        )
+        details = _CallDetails(_TICKER_SERVICE + name, ())
+        continuation = lambda _, handler=handler: handler
+        for interceptor in reversed(interceptors):
+            continuation = (lambda call_details, interceptor=interceptor, inner=continuation:
+                            interceptor.intercept_service(inner, call_details))
+        handlers[kind] = continuation(details).unary_unary
+    return handlers
+
+
+def session_error(request_id: str, code: grpc.StatusCode, message: str) -> ticker_pb2.SessionResponse:
+    return ticker_pb2.SessionResponse(
+        request_id=request_id,
+        error=ticker_pb2.SessionError(code=code.value[0], message=message),
+    )
+
+
+class SessionCallContext:
+    """ServicerContext stand-in for one request inside a session"""
+
+    def __init__(self, parent, cancelled: threading.Event):
+        self._parent = parent
+        self._cancelled = cancelled
+        self._code = None
+        self._details = ""
+
+    def is_active(self) -> bool:
+        return not self._cancelled.is_set() and self._parent.is_active()
+
+    def time_remaining(self) -> Optional[float]:
+        return self._parent.time_remaining()
+
+    def invocation_metadata(self):
+        return self._parent.invocation_metadata()
+
+    def add_callback(self, callback) -> bool:
+        return False
+
+    def abort(self, code, details):
+        self._code = code
+        self._details = details
+        raise _Aborted(details)
+
+    def set_compression(self, compression):
+        # The session stream is compressed as a whole
+        pass
+
+    def set_code(self, code):
+        self._code = code
+
+    def set_details(self, details):
+        self._details = details
+
+    def code(self):
+        return self._code
+
+    def details(self) -> str:
+        return self._details
+
+
+class SessionMultiplexer:
+    """Dispatch SessionRequests to a servicer concurrently and stream tagged responses"""
+
+    def __init__(self, servicer, context, max_workers: int = 4, draining: Optional[threading.Event] = None,
+                 handlers=None):
+        # Without handlers from the server's interceptors, requests go straight to the servicer
+        self._handlers = session_handlers(servicer) if handlers is None else handlers
+        self._context = context
+        # Once set, new requests are refused and the stream ends when in-flight ones finish
+        self._draining = draining if draining is not None else threading.Event()
+        self._pool = futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="session")
+        self._responses = queue.Queue()
+        self._inflight = {}
+        # Requests waiting for a worker as (-priority, arrival, ...); each pool task runs the first
+        self._pending = []
+        self._arrivals = itertools.count()
+        self._lock = threading.Lock()
+
+    def run(self, request_iterator):
+        """Yield SessionResponses until the client half-closes and all requests finish, or it disconnects"""
+        reader = threading.Thread(target=self._read, args=(request_iterator,), name="session-reader", daemon=True)
+        reader.start()
+        try:
+            while True:
+                try:
+                    response = self._responses.get(timeout=_POLL_INTERVAL)
+                except queue.Empty:
+                    if not self._context.is_active() or (self._draining.is_set() and self._idle()):
+                        return
+                    continue
+                if response is _DONE:
+                    return
+                yield response
+        finally:
+            self._cancel_all()
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _read(self, request_iterator):
+        try:
+            for request in request_iterator:
+                self.handle(request)
+        except Exception as e:
+            # The request iterator raises when the client cancels the call
+            logger.debug(f"Session request stream ended: {e}")
+        finally:
+            self._pool.shutdown(wait=True)
+            self._responses.put(_DONE)
+
+    def handle(self, request: ticker_pb2.SessionRequest):
+        request_id = request.request_id
+        kind = request.WhichOneof('request')
+        if kind == 'cancel':
+            self.cancel(request_id)
+            return
+        if kind is None:
+            self._responses.put(session_error(request_id, grpc.StatusCode.INVALID_ARGUMENT,
+                                              "SessionRequest has no request set"))
+            return
+        if self._draining.is_set():
+            self._responses.put(session_error(request_id, grpc.StatusCode.UNAVAILABLE,
+                                              "Server is shutting down; retry on a new session"))
+            return
+        with self._lock:
+            if request_id in self._inflight:
+                self._responses.put(session_error(request_id, grpc.StatusCode.INVALID_ARGUMENT,
+                                                  f"request_id '{request_id}' is already in flight"))
+                return
+            cancelled = threading.Event()
+            heapq.heappush(self._pending, (-request.priority, next(self._arrivals),
+                                           request_id, kind, getattr(request, kind), cancelled))
+            self._pool.submit(self._call_next)
+            self._inflight[request_id] = cancelled
+
+    def cancel(self, request_id: str):
+        """Cancel a queued or running request; its only response is a CANCELLED error"""
+        with self._lock:
+            cancelled = self._inflight.pop(request_id, None)
+        if cancelled is None:
+            return
+        cancelled.set()
+        self._responses.put(session_error(request_id, grpc.StatusCode.CANCELLED, "Request cancelled by client"))
+
+    def _idle(self) -> bool:
+        with self._lock:
+            return not self._inflight and self._responses.empty()
+
+    def _cancel_all(self):
+        with self._lock:
+            entries, self._inflight = list(self._inflight.values()), {}
+        for cancelled in entries:
+            cancelled.set()
+
+    def _forget(self, request_id: str, cancelled: threading.Event):
+        with self._lock:
+            if self._inflight.get(request_id) is cancelled:
+                del self._inflight[request_id]
+
+    def _call_next(self):
+        with self._lock:
+            _, _, request_id, kind, message, cancelled = heapq.heappop(self._pending)
+        self._call(request_id, kind, message, cancelled)
+
+    def _call(self, request_id: str, kind: str, message, cancelled: threading.Event):
+        call_context = SessionCallContext(self._context, cancelled)
+        if not call_context.is_active():
+            # Cancelled or disconnected while queued; skip the upstream work entirely
+            self._forget(request_id, cancelled)
+            return
+        try:
+            result = self._handlers[kind](message, call_context)
+        except _Aborted:
+            # An interceptor rejected the request; the context holds its status
+            result = None
+        except Exception as e:
+            logger.error(f"Error in Session request '{request_id}': {str(e)}")
+            call_context.set_code(grpc.StatusCode.INTERNAL)
+            call_context.set_details(str(e))
+            result = None
+        self._forget(request_id, cancelled)
+        if cancelled.is_set():
+            # cancel() has already answered this request_id
+            return
+        code = call_context.code()
+        if code not in (None, grpc.StatusCode.OK):
+            self._responses.put(session_error(request_id, code, call_context.details()))
+        else:
+            if isinstance(result, bytes):
+                # Encoded for a direct RPC by the cache or conversion pool; a session embeds the message
+                result = _RESPONSE_TYPES[kind].FromString(result)
+            self._responses.put(ticker_pb2.SessionResponse(request_id=request_id, **{kind: result}))
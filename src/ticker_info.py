@@ -0,0 +1,193 @@
+"""
+TickerInfo construction from yfinance info
+
+TICKER_INFO_FIELDS declares how each TickerInfo field is read from
+ticker.info. Rather than interpreting that table on every call, builder()
+compiles it into a Python function per field selection, with the keys,
+defaults and converter fast paths inlined and a single constructor call
+with literal keyword arguments, and caches the result; full, masked and
+batch builds all reuse the same compiled functions.
+"""
+
+from functools import lru_cache
+from typing import Callable, Iterable, Optional
+
+from src.convert import safe_float, safe_int, safe_str
+from yfinance_grpc.v1alpha1 import ticker_pb2
+
+# TickerInfo field -> (info key, converter, default). Compiled into the builders
+# behind create_ticker_info, and the set of paths accepted in read masks.
+TICKER_INFO_FIELDS = {
+    'symbol': ('symbol', safe_str, None),
+    'short_name': ('shortName', safe_str, None),
+    'long_name': ('longName', safe_str, None),
+    'industry': ('industry', safe_str, None),
+    'sector': ('sector', safe_str, None),
+    'country': ('country', safe_str, None),
+    'city': ('city', safe_str, None),
+    'state': ('state', safe_str, None),
+    'zip': ('zip', safe_str, None),
+    'website': ('website', safe_str, None),
+    'long_business_summary': ('longBusinessSummary', safe_str, None),
+
+    'previous_close': ('previousClose', safe_float, None),
+    'open': ('open', safe_float, None),
+    'day_low': ('dayLow', safe_float, None),
+    'day_high': ('dayHigh', safe_float, None),
+    'regular_market_previous_close': ('regularMarketPreviousClose', safe_float, None),
+    'regular_market_open': ('regularMarketOpen', safe_float, None),
+    'regular_market_day_low': ('regularMarketDayLow', safe_float, None),
+    'regular_market_day_high': ('regularMarketDayHigh', safe_float, None),
+    'current_price': ('currentPrice', safe_float, None),
+
+    'volume': ('volume', safe_int, None),
+    'regular_market_volume': ('regularMarketVolume', safe_int, None),
+    'average_volume': ('averageVolume', safe_int, None),
+    'average_volume_10days': ('averageVolume10days', safe_int, None),
+    'shares_outstanding': ('sharesOutstanding', safe_int, None),
+    'float_shares': ('floatShares', safe_int, None),
+
+    'market_cap': ('marketCap', safe_int, None),
+    'enterprise_value': ('enterpriseValue', safe_float, None),
+    'trailing_pe': ('trailingPE', safe_float, None),
+    'forward_pe': ('forwardPE', safe_float, None),
+    'price_to_book': ('priceToBook', safe_float, None),
+    'price_to_sales_trailing_12months': ('priceToSalesTrailing12Months', safe_float, None),
+    'enterprise_to_revenue': ('enterpriseToRevenue', safe_float, None),
+    'enterprise_to_ebitda': ('enterpriseToEbitda', safe_float, None),
+
+    'dividend_rate': ('dividendRate', safe_float, None),
+    'dividend_yield': ('dividendYield', safe_float, None),
+    'ex_dividend_date': ('exDividendDate', safe_int, 0),
+    'payout_ratio': ('payoutRatio', safe_float, None),
+    'five_year_avg_dividend_yield': ('fiveYearAvgDividendYield', safe_float, None),
+
+    'beta': ('beta', safe_float, None),
+    'trailing_eps': ('trailingEps', safe_float, None),
+    'forward_eps': ('forwardEps', safe_float, None),
+    'book_value': ('bookValue', safe_float, None),
+    'profit_margins': ('profitMargins', safe_float, None),
+    'revenue_per_share': ('revenuePerShare', safe_float, None),
+    'return_on_assets': ('returnOnAssets', safe_float, None),
+    'return_on_equity': ('returnOnEquity', safe_float, None),
+    'revenue_growth': ('revenueGrowth', safe_float, None),
+    'earnings_growth': ('earningsGrowth', safe_float, None),
+    'operating_margins': ('operatingMargins', safe_float, None),
+    'ebitda_margins': ('ebitdaMargins', safe_float, None),
+
+    'fifty_two_week_low': ('fiftyTwoWeekLow', safe_float, None),
+    'fifty_two_week_high': ('fiftyTwoWeekHigh', safe_float, None),
+    'fifty_day_average': ('fiftyDayAverage', safe_float, None),
+    'two_hundred_day_average': ('twoHundredDayAverage', safe_float, None),
+
+    'target_high_price': ('targetHighPrice', safe_float, None),
+    'target_low_price': ('targetLowPrice', safe_float, None),
+    'target_mean_price': ('targetMeanPrice', safe_float, None),
+    'target_median_price': ('targetMedianPrice', safe_float, None),
+    'number_of_analyst_opinions': ('numberOfAnalystOpinions', safe_int, None),
+
+    'currency': ('currency', safe_str, None),
+    'exchange': ('exchange', safe_str, None),
+    'quote_type': ('quoteType', safe_str, None),
+    'financial_currency': ('financialCurrency', safe_str, None),
+    'price_hint': ('priceHint', safe_int, 2),
+}
+
+
+# TickerInfo field -> fast_info attribute, for fields the lightweight chart data
+# can supply without the full quoteSummary call behind ticker.info.
+FAST_INFO_FIELDS = {
+    'symbol': None,
+    'previous_close': 'previous_close',
+    'open': 'open',
+    'day_low': 'day_low',
+    'day_high': 'day_high',
+    'regular_market_previous_close': 'regular_market_previous_close',
+    'regular_market_open': 'open',
+    'regular_market_day_low': 'day_low',
+    'regular_market_day_high': 'day_high',
+    'current_price': 'last_price',
+    'volume': 'last_volume',
+    'regular_market_volume': 'last_volume',
+    'average_volume': 'three_month_average_volume',
+    'average_volume_10days': 'ten_day_average_volume',
+    'shares_outstanding': 'shares',
+    'market_cap': 'market_cap',
+    'fifty_two_week_low': 'year_low',
+    'fifty_two_week_high': 'year_high',
+    'fifty_day_average': 'fifty_day_average',
+    'two_hundred_day_average': 'two_hundred_day_average',
+    'currency': 'currency',
+    'exchange': 'exchange',
+    'quote_type': 'quote_type',
+}
+
+
+_TYPES = {safe_str: 'str', safe_float: 'float', safe_int: 'int'}
+
+
+def _field_source(i: int, name: str) -> str:
+    key, convert, default = TICKER_INFO_FIELDS[name]
+    kind = _TYPES[convert]
+    if name == 'symbol':
+        lookup = f"get({key!r}, symbol)"
+    elif default is not None:
+        lookup = f"get({key!r}, {default!r})"
+    else:
+        lookup = f"get({key!r})"
+    # Values already of the field's type skip the converter; NaN is a float, so it is checked too
+    check = f"type(v{i}) is not float or v{i} != v{i}" if kind == 'float' else f"type(v{i}) is not {kind}"
+    return (
+        f"    v{i} = {lookup}\n"
+        f"    if {check}:\n"
+        f"        v{i} = safe_{kind}(v{i})\n"
+    )
+
+
+@lru_cache(maxsize=256)
+def _compile(fields: tuple) -> Callable[[dict, str], ticker_pb2.TickerInfo]:
+    # One local per field and a single constructor call with literal keywords
+    source = (
+        "def build_ticker_info(info, symbol):\n"
+        "    get = info.get\n"
+        + "".join(_field_source(i, name) for i, name in enumerate(fields))
+        + "    return TickerInfo(" + ", ".join(f"{name}=v{i}" for i, name in enumerate(fields)) + ")\n"
+    )
+    namespace = {
+        'TickerInfo': ticker_pb2.TickerInfo,
+        'safe_str': safe_str,
+        'safe_float': safe_float,
+        'safe_int': safe_int,
+    }
+    exec(compile(source, f"<TickerInfo builder {len(fields)} fields>", 'exec'), namespace)
+    return namespace['build_ticker_info']
+
+
+# The unmasked builder is the common case; compile it at import
+_build_all = _compile(tuple(TICKER_INFO_FIELDS))
+
+
+def builder(fields: Optional[Iterable[str]] = None) -> Callable[[dict, str], ticker_pb2.TickerInfo]:
+    """Compiled build(info, symbol) for fields (all when None); reuse it across symbols for batches"""
+    if fields is None:
+        return _build_all
+    # Key the cache on table order so masks listing the same fields in any order share a builder
+    selected = set(fields)
+    return _compile(tuple(name for name in TICKER_INFO_FIELDS if name in selected))
+
+
+def create_ticker_info(info: dict, symbol: str, fields=None) -> ticker_pb2.TickerInfo:
+    """Create a TickerInfo message from info dict, limited to `fields` when given"""
+    return builder(fields)(info, symbol)
+
+
+def create_ticker_info_from_fast_info(fast_info, symbol: str, fields=None) -> ticker_pb2.TickerInfo:
+    """Create a TickerInfo message from fast_info, limited to the fields it can supply"""
+    kwargs = {}
+    for name in (FAST_INFO_FIELDS if fields is None else fields):
+        attr = FAST_INFO_FIELDS.get(name, '')
+        if attr == '':
+            continue
+        convert = TICKER_INFO_FIELDS[name][1]
+        kwargs[name] = convert(symbol if attr is None else getattr(fast_info, attr, None))
+    return ticker_pb2.TickerInfo(**kwargs)
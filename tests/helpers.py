@@ -0,0 +1,10 @@
+"""
+Shared test helpers
+"""
+
+from unittest.mock import Mock
+
+
+def servicer_context(remaining=None, active=True):
+    """Mock ServicerContext with a fixed time_remaining() and is_active()"""
+    return Mock(time_remaining=Mock(return_value=remaining), is_active=Mock(return_value=active))
@@ -0,0 +1,138 @@
+"""
+Tests for adaptive admission control
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import grpc
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "gen"))
+
+from src.admission import AIMDLimiter, AdmissionControlInterceptor, COST_CHEAP, COST_EXPENSIVE, COST_STANDARD
+from yfinance_grpc.v1alpha1 import ticker_pb2
+
+DOWNLOAD_HISTORY = '/yfinance_grpc.v1alpha1.TickerService/DownloadHistory'
+GET_ISIN = '/yfinance_grpc.v1alpha1.TickerService/GetIsin'
+
+
+class _Aborted(Exception):
+    pass
+
+
+def _context():
+    context = Mock()
+    context.abort.side_effect = _Aborted
+    return context
+
+
+def _intercept(interceptor, method, handler):
+    return interceptor.intercept_service(lambda details: handler, Mock(method=method))
+
+
+class TestAIMDLimiter:
+    def test_rejects_at_limit(self):
+        limiter = AIMDLimiter(initial=2, min_limit=1, max_limit=4, latency_target=1.0)
+
+        assert limiter.try_acquire()
+        assert limiter.try_acquire()
+        assert not limiter.try_acquire()
+        assert limiter.rejected == 1
+
+    def test_fast_requests_grow_busy_limit(self):
+        limiter = AIMDLimiter(initial=2, min_limit=1, max_limit=4, latency_target=1.0)
+        limiter.try_acquire()
+        limiter.try_acquire()
+
+        limiter.release(0.1)
+
+        assert limiter.limit == 3
+
+    @patch('src.admission.time.monotonic')
+    def test_slow_requests_shrink_limit(self, mock_monotonic):
+        limiter = AIMDLimiter(initial=8, min_limit=2, max_limit=16, latency_target=1.0, backoff=0.5)
+        for now in (100.0, 200.0, 300.0):
+            mock_monotonic.return_value = now
+            limiter.try_acquire()
+            limiter.release(5.0)
+
+        assert limiter.limit == 2
+
+    @patch('src.admission.time.monotonic', return_value=100.0)
+    def test_slow_requests_in_one_window_shrink_limit_once(self, mock_monotonic):
+        limiter = AIMDLimiter(initial=8, min_limit=1, max_limit=16, latency_target=1.0, backoff=0.5)
+        for _ in range(4):
+            limiter.try_acquire()
+        for _ in range(4):
+            limiter.release(5.0)
+
+        assert limiter.limit == 4
+
+
+class TestAdmissionControlInterceptor:
+    def _interceptor(self, expensive_limit=1):
+        return AdmissionControlInterceptor(limiters={
+            COST_CHEAP: AIMDLimiter(initial=8, min_limit=1, max_limit=8, latency_target=1.0),
+            COST_STANDARD: AIMDLimiter(initial=8, min_limit=1, max_limit=8, latency_target=1.0),
+            COST_EXPENSIVE: AIMDLimiter(initial=expensive_limit, min_limit=1, max_limit=8, latency_target=60.0),
+        })
+
+    def test_expensive_stream_over_limit_is_rejected(self):
+        interceptor = self._interceptor()
+        handler = _intercept(interceptor, DOWNLOAD_HISTORY, grpc.unary_stream_rpc_method_handler(
+            lambda request, context: iter([ticker_pb2.DownloadHistoryResponse(ticker="AAPL")])
+        ))
+        first = handler.unary_stream(ticker_pb2.DownloadHistoryRequest(), _context())
+        next(first)
+
+        context = _context()
+        with pytest.raises(_Aborted):
+            list(handler.unary_stream(ticker_pb2.DownloadHistoryRequest(), context))
+
+        context.abort.assert_called_once()
+        assert context.abort.call_args[0][0] == grpc.StatusCode.RESOURCE_EXHAUSTED
+
+    def test_cheap_methods_keep_their_own_limit(self):
+        interceptor = self._interceptor()
+        stream_handler = _intercept(interceptor, DOWNLOAD_HISTORY, grpc.unary_stream_rpc_method_handler(
+            lambda request, context: iter([ticker_pb2.DownloadHistoryResponse()])
+        ))
+        next(stream_handler.unary_stream(ticker_pb2.DownloadHistoryRequest(), _context()))
+
+        behavior = Mock(return_value=ticker_pb2.GetIsinResponse(isin="US0378331005"))
+        handler = _intercept(interceptor, GET_ISIN, grpc.unary_unary_rpc_method_handler(behavior))
+
+        response = handler.unary_unary(ticker_pb2.GetIsinRequest(ticker="AAPL"), _context())
+
+        assert response.isin == "US0378331005"
+        assert interceptor.limiters[COST_CHEAP].inflight == 0
+
+    def test_slot_is_released_when_handler_raises(self):
+        interceptor = self._interceptor()
+        handler = _intercept(interceptor, GET_ISIN, grpc.unary_unary_rpc_method_handler(
+            Mock(side_effect=RuntimeError("boom"))
+        ))
+
+        with pytest.raises(RuntimeError):
+            handler.unary_unary(ticker_pb2.GetIsinRequest(), _context())
+
+        assert interceptor.limiters[COST_CHEAP].inflight == 0
+
+    def test_long_lived_streams_are_exempt(self):
+        handler = grpc.unary_stream_rpc_method_handler(Mock())
+
+        intercepted = _intercept(self._interceptor(), '/yfinance_grpc.v1alpha1.TickerService/SubscribeQuotes', handler)
+
+        assert intercepted is handler
+
+    def test_health_checks_are_exempt(self):
+        handler = grpc.unary_unary_rpc_method_handler(Mock())
+
+        intercepted = _intercept(self._interceptor(), '/grpc.health.v1.Health/Check', handler)
+
+        assert intercepted is handler
@@ -0,0 +1,171 @@
+"""
+Tests for the memory-mapped bar archive
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "gen"))
+
+from src.bar_archive import BarArchive, wall_ns
+from src.convert import datetime_ns
+
+TZ = 'America/New_York'
+
+
+def _bars(start, periods: int, freq: str = 'D', tz=TZ, actions: bool = True) -> pd.DataFrame:
+    index = pd.date_range(start, periods=periods, freq=freq, tz=tz)
+    prices = np.arange(periods, dtype=float) + 100
+    frame = pd.DataFrame({
+        'Open': prices, 'High': prices + 1, 'Low': prices - 1, 'Close': prices + 0.5,
+        'Volume': np.arange(periods) * 1000,
+    }, index=index)
+    if actions:
+        frame['Dividends'] = 0.0
+        frame['Stock Splits'] = 0.0
+    return frame
+
+
+class TestBarArchive:
+    def test_round_trip_serves_mapped_range(self, tmp_path):
+        archive = BarArchive(str(tmp_path), settle=0)
+        frame = _bars('2024-01-02', 10)
+        frame.loc[frame.index[3], 'Dividends'] = 0.24
+
+        assert archive.write('aapl', '1d', frame, datetime(2024, 1, 2), datetime(2024, 1, 12), TZ) == 10
+        bars = archive.read('AAPL', '1d', datetime(2024, 1, 4), datetime(2024, 1, 8))
+
+        assert isinstance(bars.date, np.memmap)
+        assert list(bars.date) == list(datetime_ns(frame.index[2:6]))
+        assert list(bars.close) == list(frame['Close'].iloc[2:6])
+        assert list(bars.volume) == list(frame['Volume'].iloc[2:6])
+        assert bars.dividends[1] == 0.24
+        assert archive.timezone('AAPL') == TZ
+
+    def test_ranges_not_fully_archived_are_misses(self, tmp_path):
+        archive = BarArchive(str(tmp_path), settle=0)
+        archive.write('AAPL', '1d', _bars('2024-01-02', 5), datetime(2024, 1, 2), datetime(2024, 1, 7), TZ)
+
+        assert archive.read('AAPL', '1d', datetime(2024, 1, 1), datetime(2024, 1, 5)) is None
+        assert archive.read('AAPL', '1d', datetime(2024, 1, 3), datetime(2024, 1, 8)) is None
+        assert archive.read('AAPL', '1h', datetime(2024, 1, 3), datetime(2024, 1, 5)) is None
+        assert archive.read('MSFT', '1d', datetime(2024, 1, 3), datetime(2024, 1, 5)) is None
+        assert archive.stats() == {'hits': 0, 'misses': 4}
+
+    def test_bars_that_have_not_closed_are_not_archived(self, tmp_path):
+        archive = BarArchive(str(tmp_path))
+        now = pd.Timestamp.now(tz=TZ).floor('min')
+        frame = _bars(now - pd.Timedelta(minutes=180), 180, freq='min')
+
+        written = archive.write('AAPL', '1m', frame, tz=TZ)
+
+        # The last hour (the settle time) and the still-open minute stay out
+        assert 115 <= written <= 120
+        start = (now - pd.Timedelta(minutes=170)).tz_localize(None).to_pydatetime()
+        assert archive.read('AAPL', '1m', start, now.tz_localize(None).to_pydatetime()) is None
+        assert archive.read('AAPL', '1m', start, start + pd.Timedelta(minutes=30)) is not None
+
+    def test_appends_and_overlapping_writes_merge(self, tmp_path):
+        archive = BarArchive(str(tmp_path), settle=0)
+        frame = _bars('2024-01-02', 10)
+        archive.write('AAPL', '1d', frame.iloc[:5], datetime(2024, 1, 2), datetime(2024, 1, 7), TZ)
+        # Runs up to the present with its corporate actions, so none can have restated the first bars
+        archive.write('AAPL', '1d', frame.iloc[5:], datetime(2024, 1, 7), tz=TZ)
+        revised = frame.iloc[3:7].copy()
+        revised['Volume'] = 7
+        archive.write('AAPL', '1d', revised, datetime(2024, 1, 5), datetime(2024, 1, 9), TZ)
+
+        bars = archive.read('AAPL', '1d', datetime(2024, 1, 2), datetime(2024, 1, 12))
+
+        assert list(bars.date) == list(datetime_ns(frame.index))
+        assert list(bars.volume) == [0, 1000, 2000, 7, 7, 7, 7, 7000, 8000, 9000]
+
+    def test_append_across_ex_dividend_date_replaces_the_series(self, tmp_path):
+        archive = BarArchive(str(tmp_path), settle=0)
+        frame = _bars('2024-01-02', 10)
+        frame.loc[frame.index[6], 'Dividends'] = 0.24
+        archive.write('AAPL', '1d', frame.iloc[:5], datetime(2024, 1, 2), datetime(2024, 1, 7), TZ)
+
+        archive.write('AAPL', '1d', frame.iloc[5:], datetime(2024, 1, 7), tz=TZ)
+
+        assert archive.read('AAPL', '1d', datetime(2024, 1, 2), datetime(2024, 1, 12)) is None
+        bars = archive.read('AAPL', '1d', datetime(2024, 1, 7), datetime(2024, 1, 12))
+        assert list(bars.date) == list(datetime_ns(frame.index[5:]))
+        assert list(bars.dividends) == [0, 0.24, 0, 0, 0]
+
+    def test_disjoint_writes_replace_the_series(self, tmp_path):
+        archive = BarArchive(str(tmp_path), settle=0)
+        frame = _bars('2024-01-02', 10)
+        archive.write('AAPL', '1d', frame.iloc[:3], datetime(2024, 1, 2), datetime(2024, 1, 5), TZ)
+
+        # A split after Jan 11 would have restated the first bars without showing in these
+        archive.write('AAPL', '1d', frame.iloc[3:], datetime(2024, 1, 5), datetime(2024, 1, 12), TZ)
+
+        assert archive.read('AAPL', '1d', datetime(2024, 1, 2), datetime(2024, 1, 12)) is None
+        assert archive.read('AAPL', '1d', datetime(2024, 1, 2), datetime(2024, 1, 5)) is None
+        assert len(archive.read('AAPL', '1d', datetime(2024, 1, 5), datetime(2024, 1, 12)).date) == 7
+
+    def test_restated_closes_replace_the_series(self, tmp_path):
+        archive = BarArchive(str(tmp_path), settle=0)
+        frame = _bars('2024-01-02', 10)
+        archive.write('AAPL', '1d', frame, datetime(2024, 1, 2), datetime(2024, 1, 12), TZ)
+        readjusted = frame.iloc[6:].copy()
+        readjusted['Close'] *= 0.99
+
+        archive.write('AAPL', '1d', readjusted, datetime(2024, 1, 8), datetime(2024, 1, 12), TZ)
+
+        assert archive.read('AAPL', '1d', datetime(2024, 1, 2), datetime(2024, 1, 12)) is None
+        bars = archive.read('AAPL', '1d', datetime(2024, 1, 8), datetime(2024, 1, 12))
+        assert list(bars.close) == list(readjusted['Close'])
+
+    def test_bars_without_actions_keep_archived_actions(self, tmp_path):
+        archive = BarArchive(str(tmp_path), settle=0)
+        frame = _bars('2024-01-02', 10)
+        frame.loc[frame.index[4], 'Dividends'] = 0.24
+        archive.write('AAPL', '1d', frame.iloc[:6], datetime(2024, 1, 2), datetime(2024, 1, 8), TZ)
+
+        download = _bars('2024-01-02', 10, actions=False)
+        archive.write('AAPL', '1d', download, datetime(2024, 1, 2), datetime(2024, 1, 12), TZ)
+
+        assert archive.read('AAPL', '1d', datetime(2024, 1, 2), datetime(2024, 1, 12)) is None
+        bars = archive.read('AAPL', '1d', datetime(2024, 1, 2), datetime(2024, 1, 8))
+        assert list(bars.dividends) == [0, 0, 0, 0, 0.24, 0]
+        bars = archive.read('AAPL', '1d', datetime(2024, 1, 2), datetime(2024, 1, 12), actions=False)
+        assert len(bars.date) == 10
+
+    def test_naive_daily_frames_are_exchange_local(self, tmp_path):
+        archive = BarArchive(str(tmp_path), settle=0)
+        frame = _bars('2024-03-07', 6)
+        download = _bars('2024-03-07', 6, tz=None, actions=False)
+        download.iloc[2] = np.nan  # a date another ticker in the download traded on
+
+        archive.write('AAPL', '1d', download, datetime(2024, 3, 7), datetime(2024, 3, 13), TZ)
+        bars = archive.read('AAPL', '1d', datetime(2024, 3, 7), datetime(2024, 3, 13), actions=False)
+
+        expected = frame.drop(frame.index[2]).index
+        assert list(bars.date) == list(datetime_ns(expected))
+        assert list(wall_ns(bars.date, TZ)) == list(datetime_ns(expected.tz_localize(None)))
+
+    def test_unknown_timezone_or_unsafe_symbol_is_not_archived(self, tmp_path):
+        archive = BarArchive(str(tmp_path), settle=0)
+        frame = _bars('2024-01-02', 3)
+
+        assert archive.write('AAPL', '1d', frame.tz_localize(None), datetime(2024, 1, 2)) == 0
+        assert archive.write('..', '1d', frame, datetime(2024, 1, 2), tz=TZ) == 0
+        assert archive.write('A/B', '1d', frame, datetime(2024, 1, 2), tz=TZ) == 0
+        assert archive.write('AAPL', '1d', frame.iloc[:0], datetime(2024, 1, 2), tz=TZ) == 0
+        assert list(tmp_path.iterdir()) == []
+
+    def test_archive_survives_reopening(self, tmp_path):
+        BarArchive(str(tmp_path), settle=0).write('AAPL', '1d', _bars('2024-01-02', 5), datetime(2024, 1, 2), datetime(2024, 1, 7), TZ)
+
+        bars = BarArchive(str(tmp_path)).read('AAPL', '1d', datetime(2024, 1, 2), datetime(2024, 1, 7))
+
+        assert len(bars.date) == 5
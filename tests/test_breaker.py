@@ -0,0 +1,232 @@
+"""
+Tests for circuit breakers and the negative symbol cache
+"""
+
+import sys
+import time
+from pathlib import Path
+from unittest.mock import Mock
+
+import grpc
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "gen"))
+
+from src.breaker import (
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitBreaker,
+    CircuitBreakerInterceptor,
+    NegativeCache,
+)
+from yfinance_grpc.v1alpha1 import ticker_pb2
+
+_TICKER = '/yfinance_grpc.v1alpha1.TickerService/'
+
+
+class _Aborted(Exception):
+    pass
+
+
+def _context(code=None):
+    context = Mock()
+    context.abort.side_effect = _Aborted
+    context.code.return_value = code
+    return context
+
+
+def _failing(error, code=grpc.StatusCode.INTERNAL):
+    """A behavior that handles error the way the servicers do"""
+    def behavior(request, context):
+        try:
+            raise error
+        except Exception:
+            context.set_code(code)
+            return ticker_pb2.GetInfoResponse()
+
+    return behavior
+
+
+def _intercept(interceptor, method, behavior, streaming=False):
+    if streaming:
+        handler = grpc.unary_stream_rpc_method_handler(behavior)
+    else:
+        handler = grpc.unary_unary_rpc_method_handler(behavior)
+    return interceptor.intercept_service(lambda details: handler, Mock(method=method))
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures(self):
+        breaker = CircuitBreaker('GetInfo', failure_threshold=3, reset_timeout=30)
+
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == STATE_CLOSED
+        breaker.record_failure()
+
+        assert breaker.state == STATE_OPEN
+        assert not breaker.allow()
+        assert breaker.stats() == {'state': STATE_OPEN, 'trips': 1, 'rejected': 1}
+
+    def test_half_open_lets_one_probe_through(self):
+        breaker = CircuitBreaker('GetInfo', failure_threshold=1, reset_timeout=0.01)
+        breaker.record_failure()
+        time.sleep(0.02)
+
+        assert breaker.state == STATE_HALF_OPEN
+        assert breaker.allow()
+        assert not breaker.allow()
+        breaker.record_success()
+
+        assert breaker.state == STATE_CLOSED
+        assert breaker.allow()
+
+    def test_failed_probe_reopens(self):
+        breaker = CircuitBreaker('GetInfo', failure_threshold=1, reset_timeout=0.01)
+        breaker.record_failure()
+        time.sleep(0.02)
+        assert breaker.allow()
+
+        breaker.record_failure()
+
+        assert breaker.state == STATE_OPEN
+        assert breaker.retry_after() > 0
+
+    def test_abandoned_probe_frees_the_slot(self):
+        breaker = CircuitBreaker('GetInfo', failure_threshold=1, reset_timeout=0.01)
+        breaker.record_failure()
+        time.sleep(0.02)
+        assert breaker.allow()
+
+        breaker.record_abandoned()
+
+        assert breaker.allow()
+
+
+class TestNegativeCache:
+    def test_remembers_symbols_until_ttl(self):
+        cache = NegativeCache(ttl=0.05)
+        cache.add('nosuch')
+
+        assert 'NOSUCH' in cache
+        assert ' nosuch ' in cache
+        assert 'AAPL' not in cache
+        time.sleep(0.06)
+        assert 'NOSUCH' not in cache
+        assert len(cache) == 0
+
+    def test_evicts_oldest_over_max_entries(self):
+        cache = NegativeCache(max_entries=2)
+        for symbol in ('A', 'B', 'C'):
+            cache.add(symbol)
+
+        assert 'A' not in cache
+        assert 'B' in cache and 'C' in cache
+
+
+class TestCircuitBreakerInterceptor:
+    def test_trips_and_fails_fast(self):
+        interceptor = CircuitBreakerInterceptor(failure_threshold=2, reset_timeout=30)
+        behavior = Mock(side_effect=_failing(ConnectionError("reset by peer")))
+        handler = _intercept(interceptor, _TICKER + 'GetInfo', behavior)
+        request = ticker_pb2.GetInfoRequest(ticker='AAPL')
+
+        handler.unary_unary(request, _context(grpc.StatusCode.INTERNAL))
+        handler.unary_unary(request, _context(grpc.StatusCode.INTERNAL))
+        context = _context()
+        with pytest.raises(_Aborted):
+            handler.unary_unary(request, context)
+
+        assert behavior.call_count == 2
+        assert context.abort.call_args[0][0] == grpc.StatusCode.UNAVAILABLE
+        assert interceptor.stats()[_TICKER + 'GetInfo']['state'] == STATE_OPEN
+
+    def test_client_errors_do_not_count(self):
+        interceptor = CircuitBreakerInterceptor(failure_threshold=1)
+        handler = _intercept(interceptor, _TICKER + 'GetInfo', Mock(return_value=ticker_pb2.GetInfoResponse()))
+
+        for code in (grpc.StatusCode.INVALID_ARGUMENT, grpc.StatusCode.NOT_FOUND, grpc.StatusCode.CANCELLED):
+            handler.unary_unary(ticker_pb2.GetInfoRequest(ticker='AAPL'), _context(code))
+
+        assert interceptor.breaker_for(_TICKER + 'GetInfo').state == STATE_CLOSED
+
+    def test_internal_errors_without_upstream_failure_do_not_count(self):
+        interceptor = CircuitBreakerInterceptor(failure_threshold=1)
+        request = ticker_pb2.GetInfoRequest(ticker='AAPL')
+
+        # A bad symbol or period surfaces as KeyError or ValueError, reported INTERNAL
+        for error in (KeyError('currency'), ValueError("Invalid period")):
+            handler = _intercept(interceptor, _TICKER + 'GetInfo', _failing(error))
+            handler.unary_unary(request, _context(grpc.StatusCode.INTERNAL))
+        handler = _intercept(interceptor, _TICKER + 'GetInfo', Mock(side_effect=RuntimeError("boom")))
+        with pytest.raises(RuntimeError):
+            handler.unary_unary(request, _context())
+
+        assert interceptor.breaker_for(_TICKER + 'GetInfo').state == STATE_CLOSED
+
+    def test_upstream_exception_counts_as_failure(self):
+        interceptor = CircuitBreakerInterceptor(failure_threshold=1)
+        handler = _intercept(interceptor, _TICKER + 'GetInfo', Mock(side_effect=TimeoutError("read timed out")))
+
+        with pytest.raises(TimeoutError):
+            handler.unary_unary(ticker_pb2.GetInfoRequest(ticker='AAPL'), _context())
+
+        assert interceptor.breaker_for(_TICKER + 'GetInfo').state == STATE_OPEN
+
+    def test_negative_cached_symbol_is_not_found(self):
+        negative_cache = NegativeCache()
+        negative_cache.add('NOSUCH')
+        interceptor = CircuitBreakerInterceptor(negative_cache)
+        behavior = Mock()
+        handler = _intercept(interceptor, _TICKER + 'GetHistory', behavior)
+        context = _context()
+
+        with pytest.raises(_Aborted):
+            handler.unary_unary(ticker_pb2.GetHistoryRequest(ticker='nosuch'), context)
+
+        behavior.assert_not_called()
+        assert context.abort.call_args[0][0] == grpc.StatusCode.NOT_FOUND
+
+    def test_stream_failure_is_recorded_when_exhausted(self):
+        interceptor = CircuitBreakerInterceptor(failure_threshold=1)
+        def behavior(request, context):
+            yield ticker_pb2.DownloadHistoryResponse()
+            try:
+                raise ConnectionError("connection refused")
+            except ConnectionError:
+                context.set_code(grpc.StatusCode.INTERNAL)
+
+        handler = _intercept(interceptor, _TICKER + 'DownloadHistory', behavior, streaming=True)
+
+        list(handler.unary_stream(ticker_pb2.DownloadHistoryRequest(), _context(grpc.StatusCode.INTERNAL)))
+
+        assert interceptor.breaker_for(_TICKER + 'DownloadHistory').state == STATE_OPEN
+
+    def test_exempt_and_health_methods_pass_through(self):
+        interceptor = CircuitBreakerInterceptor()
+        handler = grpc.unary_stream_rpc_method_handler(Mock())
+
+        for method in (_TICKER + 'SubscribeQuotes', '/grpc.health.v1.Health/Watch'):
+            assert interceptor.intercept_service(lambda details: handler, Mock(method=method)) is handler
+        assert interceptor.breakers == {}
+
+    def test_upstream_problem_when_every_breaker_is_open(self):
+        interceptor = CircuitBreakerInterceptor(failure_threshold=1)
+        service = 'yfinance_grpc.v1alpha1.TickerService'
+        assert interceptor.upstream_problem(service) is None
+
+        interceptor.breaker_for(_TICKER + 'GetInfo').record_failure()
+        interceptor.breaker_for(_TICKER + 'GetNews')
+        assert interceptor.upstream_problem(service) is None
+
+        interceptor.breaker_for(_TICKER + 'GetNews').record_failure()
+        assert interceptor.upstream_problem(service) == "upstream failing"
+        assert interceptor.upstream_problem('yfinance_grpc.v1alpha1.SearchService') is None
+
@@ -0,0 +1,116 @@
+"""
+Tests for per-service bulkheads
+"""
+
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import Mock
+
+import grpc
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "gen"))
+
+from src.bulkhead import Bulkhead, BulkheadConfig, BulkheadInterceptor, bulkhead_for, total_capacity
+from yfinance_grpc.v1alpha1 import ticker_pb2
+
+_TICKER = '/yfinance_grpc.v1alpha1.TickerService/'
+
+
+class _Aborted(Exception):
+    pass
+
+
+def _context():
+    context = Mock()
+    context.abort.side_effect = _Aborted
+    context.time_remaining.return_value = None
+    return context
+
+
+class TestBulkheadFor:
+    def test_methods_map_to_service_and_cost_class(self):
+        assert bulkhead_for(_TICKER + 'GetIsin') == 'ticker'
+        assert bulkhead_for(_TICKER + 'DownloadHistory') == 'ticker-expensive'
+        assert bulkhead_for(_TICKER + 'SubscribeQuotes') == 'streams'
+        assert bulkhead_for('/yfinance_grpc.v1alpha1.MarketService/GetMarketStatus') == 'market'
+        assert bulkhead_for('/yfinance_grpc.v1alpha1.SearchService/Search') == 'search'
+
+    def test_total_capacity_counts_slots_and_queue(self):
+        assert total_capacity({'a': BulkheadConfig(2, 3), 'b': BulkheadConfig(1, 0)}) == 6
+
+
+class TestBulkhead:
+    def test_rejects_once_slots_and_queue_are_full(self):
+        bulkhead = Bulkhead('ticker', max_concurrent=1, max_queue=0)
+
+        assert bulkhead.acquire(timeout=0)
+        assert not bulkhead.acquire(timeout=0)
+        bulkhead.release()
+        assert bulkhead.acquire(timeout=0)
+
+    def test_queued_request_runs_when_slot_frees(self):
+        bulkhead = Bulkhead('ticker', max_concurrent=1, max_queue=1)
+        bulkhead.acquire(timeout=0)
+        acquired = []
+        waiter = threading.Thread(target=lambda: acquired.append(bulkhead.acquire(timeout=5)))
+        waiter.start()
+
+        bulkhead.release()
+        waiter.join(timeout=5)
+
+        assert acquired == [True]
+
+    def test_saturated_only_when_slots_and_queue_are_full(self):
+        bulkhead = Bulkhead('ticker', max_concurrent=1, max_queue=0)
+        assert not bulkhead.saturated
+
+        bulkhead.acquire(timeout=0)
+        assert bulkhead.saturated and bulkhead.inflight == 1
+
+        bulkhead.release()
+        assert not bulkhead.saturated and bulkhead.inflight == 0
+
+
+class TestBulkheadInterceptor:
+    def test_full_expensive_bulkhead_does_not_block_cheap_calls(self):
+        interceptor = BulkheadInterceptor({
+            'ticker': BulkheadConfig(max_concurrent=1, max_queue=0),
+            'ticker-expensive': BulkheadConfig(max_concurrent=1, max_queue=0),
+        })
+        download = interceptor.intercept_service(
+            lambda details: grpc.unary_stream_rpc_method_handler(
+                lambda request, context: iter([ticker_pb2.DownloadHistoryResponse()])
+            ),
+            Mock(method=_TICKER + 'DownloadHistory'),
+        )
+        isin = interceptor.intercept_service(
+            lambda details: grpc.unary_unary_rpc_method_handler(
+                lambda request, context: ticker_pb2.GetIsinResponse(isin="US0378331005")
+            ),
+            Mock(method=_TICKER + 'GetIsin'),
+        )
+        running = download.unary_stream(ticker_pb2.DownloadHistoryRequest(), _context())
+        next(running)
+
+        context = _context()
+        with pytest.raises(_Aborted):
+            next(download.unary_stream(ticker_pb2.DownloadHistoryRequest(), context))
+        assert context.abort.call_args[0][0] == grpc.StatusCode.RESOURCE_EXHAUSTED
+        assert isin.unary_unary(ticker_pb2.GetIsinRequest(), _context()).isin == "US0378331005"
+
+    def test_slot_is_released_after_stream_finishes(self):
+        interceptor = BulkheadInterceptor({'ticker-expensive': BulkheadConfig(max_concurrent=1, max_queue=0)})
+        download = interceptor.intercept_service(
+            lambda details: grpc.unary_stream_rpc_method_handler(
+                lambda request, context: iter([ticker_pb2.DownloadHistoryResponse()])
+            ),
+            Mock(method=_TICKER + 'DownloadHistory'),
+        )
+
+        list(download.unary_stream(ticker_pb2.DownloadHistoryRequest(), _context()))
+        list(download.unary_stream(ticker_pb2.DownloadHistoryRequest(), _context()))
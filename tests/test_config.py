@@ -0,0 +1,150 @@
+"""
+Tests for server configuration and per-RPC compression
+"""
+
+import os
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+import grpc
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "gen"))
+
+from src.bulkhead import DEFAULT_BULKHEADS, BulkheadConfig
+from src.compression import CompressionPolicyInterceptor
+from src.config import ServerConfig, bulkhead_configs, grpc_options, load_config
+
+
+class TestLoadConfig:
+    def test_defaults(self):
+        assert load_config(environ={}) == ServerConfig()
+
+    def test_file_then_env_then_overrides(self, tmp_path):
+        path = tmp_path / "server.toml"
+        path.write_text(
+            'port = 6000\n'
+            'max_workers = 32\n'
+            'keepalive_permit_without_calls = true\n'
+            '[compression_policy]\n'
+            'DownloadHistory = "gzip"\n'
+        )
+        environ = {
+            'YFINANCE_GRPC_MAX_WORKERS': '64',
+            'YFINANCE_GRPC_COMPRESSION': 'Deflate',
+        }
+
+        config = load_config(str(path), environ=environ, port=7000, workers=None)
+
+        assert config.port == 7000
+        assert config.max_workers == 64
+        assert config.keepalive_permit_without_calls is True
+        assert config.compression == 'deflate'
+        assert config.compression_policy == {'DownloadHistory': 'gzip'}
+
+    def test_shutdown_settings_from_env(self):
+        config = load_config(environ={
+            'YFINANCE_GRPC_SHUTDOWN_GRACE': '12.5',
+            'YFINANCE_GRPC_CACHE_FILE': '/var/cache/yfinance-grpc.cache',
+        })
+
+        assert config.shutdown_grace == 12.5
+        assert config.cache_file == '/var/cache/yfinance-grpc.cache'
+
+    def test_prefetch_settings_from_file(self, tmp_path):
+        path = tmp_path / "server.toml"
+        path.write_text('universe_file = "universe.txt"\nprefetch_rate = 5\n')
+
+        config = load_config(str(path), environ={})
+
+        assert config.universe_file == 'universe.txt'
+        assert config.prefetch_rate == 5.0
+
+    def test_retry_settings_from_env(self):
+        config = load_config(environ={'YFINANCE_GRPC_RETRY_ATTEMPTS': '1', 'YFINANCE_GRPC_HEDGING': 'on'})
+
+        assert config.retry_attempts == 1
+        assert config.hedging is True
+
+    def test_bar_archive_dir_from_env(self):
+        config = load_config(environ={'YFINANCE_GRPC_BAR_ARCHIVE_DIR': '~/bars'})
+
+        assert config.bar_archive_dir == os.path.expanduser('~/bars')
+
+    def test_bulkheads_from_file_and_env(self, tmp_path):
+        path = tmp_path / "server.toml"
+        path.write_text('[bulkheads]\nstreams = { max_concurrent = 64 }\nticker-expensive = "8:16"\n')
+
+        config = load_config(str(path), environ={})
+
+        assert config.bulkheads == {
+            'streams': BulkheadConfig(max_concurrent=64, max_queue=0),
+            'ticker-expensive': BulkheadConfig(max_concurrent=8, max_queue=16),
+        }
+        config = load_config(environ={'YFINANCE_GRPC_BULKHEADS': 'streams=32:4, search=3'})
+        assert bulkhead_configs(config) == {
+            **DEFAULT_BULKHEADS,
+            'streams': BulkheadConfig(max_concurrent=32, max_queue=4),
+            'search': BulkheadConfig(max_concurrent=3, max_queue=8),
+        }
+
+    def test_unknown_bulkheads_are_rejected(self):
+        with pytest.raises(ValueError, match="quotes"):
+            load_config(environ={'YFINANCE_GRPC_BULKHEADS': 'quotes=64'})
+        with pytest.raises(ValueError, match="max_concurrent"):
+            load_config(environ={'YFINANCE_GRPC_BULKHEADS': 'streams=0'})
+
+    def test_config_path_from_env(self, tmp_path):
+        path = tmp_path / "server.toml"
+        path.write_text('max_receive_message_length = 16777216\n')
+
+        config = load_config(environ={'YFINANCE_GRPC_CONFIG': str(path)})
+
+        assert config.max_receive_message_length == 16777216
+
+    def test_env_compression_policy(self):
+        config = load_config(environ={'YFINANCE_GRPC_COMPRESSION_POLICY': 'DownloadHistory=gzip, GetIsin=none'})
+
+        assert config.compression_policy == {'DownloadHistory': 'gzip', 'GetIsin': 'none'}
+
+    def test_unknown_keys_and_algorithms_are_rejected(self, tmp_path):
+        path = tmp_path / "server.toml"
+        path.write_text('max_wrokers = 4\n')
+        with pytest.raises(ValueError, match="max_wrokers"):
+            load_config(str(path), environ={})
+        with pytest.raises(ValueError, match="brotli"):
+            load_config(environ={'YFINANCE_GRPC_COMPRESSION': 'brotli'})
+
+    def test_grpc_options_skip_unset_fields(self):
+        config = ServerConfig(max_send_message_length=1024, http2_bdp_probe=False)
+
+        assert grpc_options(config) == [
+            ('grpc.max_send_message_length', 1024),
+            ('grpc.http2.bdp_probe', 0),
+        ]
+
+
+class TestCompressionPolicyInterceptor:
+    def test_listed_method_sets_compression(self):
+        behavior = Mock(return_value='response')
+        interceptor = CompressionPolicyInterceptor({'DownloadHistory': grpc.Compression.Gzip})
+        handler = interceptor.intercept_service(
+            lambda details: grpc.unary_stream_rpc_method_handler(behavior),
+            Mock(method='/yfinance_grpc.v1alpha1.TickerService/DownloadHistory'),
+        )
+        context = Mock()
+
+        assert handler.unary_stream('request', context) == 'response'
+        context.set_compression.assert_called_once_with(grpc.Compression.Gzip)
+
+    def test_unlisted_method_is_untouched(self):
+        handler = grpc.unary_unary_rpc_method_handler(Mock())
+        interceptor = CompressionPolicyInterceptor({'DownloadHistory': grpc.Compression.Gzip})
+
+        assert interceptor.intercept_service(
+            lambda details: handler, Mock(method='/yfinance_grpc.v1alpha1.TickerService/GetIsin')
+        ) is handler
@@ -0,0 +1,135 @@
+"""
+Tests for the shared protobuf value conversions
+"""
+
+import sys
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from google.protobuf.timestamp_pb2 import Timestamp
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "gen"))
+
+from src.convert import (
+    datetime_to_timestamp,
+    float_column,
+    int_column,
+    safe_float,
+    safe_int,
+    safe_str,
+    str_column,
+    timestamp_column,
+    timestamp_from_ns,
+    timestamp_from_seconds,
+)
+
+
+def _from_datetime(dt) -> Timestamp:
+    ts = Timestamp()
+    ts.FromDatetime(dt)
+    return ts
+
+
+class TestScalars:
+    def test_safe_float_accepts_python_and_numpy_numbers(self):
+        assert safe_float(1.5) == 1.5
+        assert safe_float(2) == 2.0
+        assert safe_float(np.float32(0.5)) == 0.5
+        assert safe_float(np.int64(7)) == 7.0
+        assert safe_float(Decimal('1.25')) == 1.25
+        assert type(safe_float(np.float64(3.0))) is float
+
+    def test_safe_float_missing_and_invalid_use_default(self):
+        for value in (None, float('nan'), np.float64('nan'), pd.NA, pd.NaT, 'abc', [1]):
+            assert safe_float(value) == 0.0
+        assert safe_float(None, default=-1.0) == -1.0
+
+    def test_safe_int(self):
+        assert safe_int(42.9) == 42
+        assert safe_int(np.int64(2 ** 40)) == 2 ** 40
+        assert safe_int('17') == 17
+        for value in (None, float('nan'), float('inf'), np.float64('-inf'), pd.NA, '1.5'):
+            assert safe_int(value) == 0
+        assert safe_int(None, default=-1) == -1
+
+    def test_safe_str(self):
+        assert safe_str('AAPL') == 'AAPL'
+        assert safe_str(12) == '12'
+        assert safe_str(np.float64('nan')) == ''
+        assert safe_str(None, default='n/a') == 'n/a'
+
+
+class TestTimestamps:
+    def test_matches_from_datetime(self):
+        for dt in (
+            datetime(2025, 1, 15, 12, 30, 45, 123456),
+            datetime(1960, 5, 1, 9, 30, tzinfo=timezone(timedelta(hours=-5))),
+            datetime(2024, 3, 10, 9, 30, tzinfo=timezone.utc),
+        ):
+            assert datetime_to_timestamp(dt) == _from_datetime(dt)
+
+    def test_pandas_timestamps_truncate_to_microseconds(self):
+        aware = pd.Timestamp('2024-03-11 09:30:00.123456789', tz='America/New_York')
+
+        assert datetime_to_timestamp(aware) == _from_datetime(aware.to_pydatetime(warn=False))
+        assert datetime_to_timestamp(pd.Timestamp('1955-01-01 00:00:00.5')).nanos == 500_000_000
+
+    def test_missing_values(self):
+        for value in (None, pd.NaT, float('nan'), '2024-01-01'):
+            assert datetime_to_timestamp(value) is None
+
+    def test_from_seconds(self):
+        assert timestamp_from_seconds(1700000000.9) == Timestamp(seconds=1700000000)
+
+
+class TestColumns:
+    def test_float_column(self):
+        assert float_column(pd.Series([1.5, None, np.nan, 2])) == [1.5, 0.0, 0.0, 2.0]
+        assert float_column(pd.Series([1.0, pd.NA], dtype='Float64')) == [1.0, 0.0]
+        assert float_column(['1.5', 'x', None]) == [1.5, 0.0, 0.0]
+
+    def test_int_column(self):
+        assert int_column(pd.Series([1, 2], dtype='int64')) == [1, 2]
+        assert int_column(pd.Series([1.9, np.nan, np.inf])) == [1, 0, 0]
+        assert int_column(['3', 'x']) == [3, 0]
+
+    def test_str_column(self):
+        assert str_column(pd.Series(['a', None, np.nan, 1])) == ['a', '', '', '1']
+
+    def test_timestamp_column_matches_scalar_path(self):
+        index = pd.DatetimeIndex(['2024-01-02 09:30:00.0000015', None, '1960-01-01'], tz='America/New_York')
+
+        assert timestamp_column(index) == [datetime_to_timestamp(value) for value in index]
+        assert timestamp_column(index)[1] is None
+
+    def test_long_timestamp_column_bypasses_the_cache(self):
+        index = pd.date_range('1960-01-04 09:30', periods=5000, freq='min', tz='America/New_York').as_unit('ns')
+        index = index.insert(3, pd.NaT).insert(0, pd.Timestamp('2024-01-02 09:30:00.0000015', tz='America/New_York'))
+        timestamp_from_ns.cache_clear()
+
+        stamps = timestamp_column(index)
+
+        assert timestamp_from_ns.cache_info().currsize == 0
+        assert stamps == [datetime_to_timestamp(value) for value in index]
+        assert stamps[4] is None
+
+    def test_timestamp_column_converts_exchange_local_time_across_dst(self):
+        # 16:00 New York is 21:00 UTC in winter and 20:00 UTC in summer
+        index = pd.DatetimeIndex(['2024-03-08 16:00', '2024-03-11 16:00'], tz='America/New_York')
+
+        assert timestamp_column(index) == [
+            _from_datetime(datetime(2024, 3, 8, 21, tzinfo=timezone.utc)),
+            _from_datetime(datetime(2024, 3, 11, 20, tzinfo=timezone.utc)),
+        ]
+        assert timestamp_column(pd.Series(index)) == timestamp_column(index)
+
+    def test_timestamp_column_without_datetime_dtype_is_not_parsed(self):
+        values = pd.Series([pd.Timestamp('2024-01-02', tz='UTC'), '2024-01-03', None], dtype=object)
+
+        assert timestamp_column(values) == [_from_datetime(datetime(2024, 1, 2, tzinfo=timezone.utc)), None, None]
@@ -0,0 +1,110 @@
+"""
+Tests for health checking and readiness
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+from grpc_health.v1 import health, health_pb2
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "gen"))
+
+from src.bulkhead import Bulkhead
+from src.health import NOT_SERVING, OVERALL, SERVING, ReadinessMonitor
+
+_TICKER = 'yfinance_grpc.v1alpha1.TickerService'
+_SEARCH = 'yfinance_grpc.v1alpha1.SearchService'
+_SERVICES = {_TICKER: ('ticker', 'ticker-expensive'), _SEARCH: ('search',)}
+
+
+def _status(servicer, service):
+    return servicer.Check(health_pb2.HealthCheckRequest(service=service), None).status
+
+
+def _monitor(bulkheads=None):
+    servicer = health.HealthServicer()
+    bulkheads = {
+        'ticker': Bulkhead('ticker', max_concurrent=1, max_queue=0),
+        'ticker-expensive': Bulkhead('ticker-expensive', max_concurrent=1, max_queue=0),
+        'search': Bulkhead('search', max_concurrent=1, max_queue=0),
+    } if bulkheads is None else bulkheads
+    monitor = ReadinessMonitor(servicer, bulkheads, services=_SERVICES, interval=60)
+    monitor.start()
+    return servicer, monitor
+
+
+class TestReadinessMonitor:
+    def test_not_serving_until_started(self):
+        servicer = health.HealthServicer()
+        monitor = ReadinessMonitor(servicer, services=_SERVICES, interval=60)
+        assert _status(servicer, OVERALL) == NOT_SERVING
+        assert _status(servicer, _TICKER) == NOT_SERVING
+
+        monitor.start()
+        monitor.stop()
+
+        assert _status(servicer, OVERALL) == SERVING
+        assert _status(servicer, _TICKER) == SERVING
+
+    def test_not_serving_until_warm_up_finishes(self):
+        servicer, monitor = _monitor()
+        release = threading.Event()
+
+        thread = monitor.warm_up(release.wait)
+        monitor.update()
+        assert _status(servicer, OVERALL) == NOT_SERVING
+        assert _status(servicer, _SEARCH) == NOT_SERVING
+
+        release.set()
+        thread.join(timeout=5)
+        monitor.update()
+        assert _status(servicer, OVERALL) == SERVING
+        assert _status(servicer, _SEARCH) == SERVING
+
+    def test_failed_warm_up_step_does_not_block_readiness(self):
+        servicer, monitor = _monitor()
+
+        def fail():
+            raise RuntimeError("Yahoo unreachable")
+
+        monitor.warm_up(fail).join(timeout=5)
+
+        assert monitor.update()[OVERALL] == SERVING
+
+    def test_service_is_not_serving_only_when_all_its_bulkheads_are_saturated(self):
+        servicer, monitor = _monitor()
+        monitor.bulkheads['ticker-expensive'].acquire(timeout=0)
+        assert monitor.update()[_TICKER] == SERVING
+
+        monitor.bulkheads['ticker'].acquire(timeout=0)
+        monitor.update()
+        assert _status(servicer, _TICKER) == NOT_SERVING
+        assert _status(servicer, _SEARCH) == SERVING
+        assert _status(servicer, OVERALL) == SERVING
+
+        monitor.bulkheads['ticker'].release()
+        assert monitor.update()[_TICKER] == SERVING
+
+    def test_failing_check_marks_its_service_not_serving(self):
+        servicer, monitor = _monitor()
+        problem = ["upstream unavailable"]
+        monitor.add_check(lambda: problem[0], service=_SEARCH)
+
+        monitor.update()
+        assert _status(servicer, _SEARCH) == NOT_SERVING
+        assert _status(servicer, _TICKER) == SERVING
+
+        problem[0] = None
+        assert monitor.update()[_SEARCH] == SERVING
+
+    def test_overall_not_serving_when_every_service_is_down(self):
+        servicer, monitor = _monitor()
+        monitor.add_check(lambda: "down")
+
+        monitor.update()
+
+        assert _status(servicer, OVERALL) == NOT_SERVING
@@ -0,0 +1,45 @@
+"""
+Tests for deferred imports
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "gen"))
+
+from src.lazy import lazy_import, preload
+
+
+def _module(tmp_path, monkeypatch, name):
+    (tmp_path / f"{name}.py").write_text("import builtins\nbuiltins.LOADED.append(__name__)\nVALUE = 42\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr("builtins.LOADED", [], raising=False)
+    monkeypatch.delitem(sys.modules, name, raising=False)
+    import builtins
+    return builtins.LOADED
+
+
+class TestLazyImport:
+    def test_module_body_runs_on_first_attribute_access(self, tmp_path, monkeypatch):
+        loaded = _module(tmp_path, monkeypatch, "lazy_probe_a")
+
+        module = lazy_import("lazy_probe_a")
+        assert loaded == []
+
+        assert module.VALUE == 42
+        assert loaded == ["lazy_probe_a"]
+
+    def test_already_imported_module_is_returned(self):
+        import json
+        assert lazy_import("json") is json
+
+    def test_preload_runs_module_body(self, tmp_path, monkeypatch):
+        loaded = _module(tmp_path, monkeypatch, "lazy_probe_b")
+        lazy_import("lazy_probe_b")
+
+        preload(["lazy_probe_b"]).join(timeout=5)
+
+        assert loaded == ["lazy_probe_b"]
@@ -0,0 +1,128 @@
+"""
+Tests for the server entry point
+"""
+
+import itertools
+import signal
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "gen"))
+
+from src.bulkhead import BulkheadConfig
+from src.config import ServerConfig
+from src.main import main, run_workers
+
+_sentinels = itertools.count(1000)
+
+
+class _Process:
+    """Stands in for a spawned server process"""
+    started = []
+
+    def __init__(self, target, kwargs, name):
+        self.name = name
+        self.sentinel = next(_sentinels)
+        self.exitcode = None
+
+    def start(self):
+        self.started.append(self)
+
+    def is_alive(self):
+        return self.exitcode is None
+
+    def terminate(self):
+        self.exitcode = -signal.SIGTERM
+
+    def join(self):
+        pass
+
+
+def _run_workers(workers, events, clock):
+    """run_workers on fake processes; each wait runs the next event, which returns the processes it ended"""
+    _Process.started = []
+    handlers = {}
+    events = iter(events)
+
+    def wait(sentinels):
+        ended = next(events)(_Process.started, handlers)
+        return [process.sentinel for process in ended]
+
+    with patch('src.main.multiprocessing.get_context') as get_context, \
+            patch('src.main.wait', side_effect=wait), \
+            patch('src.main.time.monotonic', side_effect=clock), \
+            patch('src.main.signal.signal', side_effect=handlers.__setitem__):
+        get_context.return_value.Process = _Process
+        run_workers(ServerConfig(workers=workers))
+    return _Process.started
+
+
+def _crash(index):
+    def event(started, handlers):
+        started[index].exitcode = 1
+        return [started[index]]
+    return event
+
+
+def _sigterm(started, handlers):
+    handlers[signal.SIGTERM](signal.SIGTERM, None)
+    return [process for process in started if process.exitcode is not None]
+
+
+class TestRunWorkers:
+    def test_dead_worker_is_restarted(self):
+        # Started at 0s, the first worker dies at 60s
+        started = _run_workers(2, [_crash(0), _sigterm], itertools.chain([0.0, 0.0], itertools.repeat(60.0)))
+
+        assert [process.name for process in started] == ['yfinance-grpc-0', 'yfinance-grpc-1', 'yfinance-grpc-0']
+        assert all(process.exitcode == -signal.SIGTERM for process in started[1:])
+
+    def test_worker_dying_right_after_start_stops_the_launcher(self):
+        with pytest.raises(SystemExit) as exited:
+            _run_workers(2, [_crash(1)], itertools.repeat(0.0))
+
+        assert exited.value.code == 1
+        assert [process.name for process in _Process.started] == ['yfinance-grpc-0', 'yfinance-grpc-1']
+        assert _Process.started[0].exitcode == -signal.SIGTERM
+
+
+@patch.dict('os.environ', {}, clear=True)
+class TestMain:
+    @patch('src.main.run_workers')
+    @patch('src.main.serve')
+    def test_single_worker_serves_in_process(self, mock_serve, mock_run_workers):
+        main(['--port', '50100'])
+
+        mock_serve.assert_called_once_with(config=ServerConfig(port=50100))
+        mock_run_workers.assert_not_called()
+
+    @patch('src.main.run_workers')
+    @patch('src.main.serve')
+    def test_multiple_workers_use_launcher(self, mock_serve, mock_run_workers):
+        main(['--workers', '4'])
+
+        mock_run_workers.assert_called_once_with(ServerConfig(workers=4))
+        mock_serve.assert_not_called()
+
+    @patch('src.main.os.cpu_count', return_value=8)
+    @patch('src.main.run_workers')
+    def test_zero_workers_means_one_per_cpu(self, mock_run_workers, mock_cpu_count):
+        main(['--workers', '0'])
+
+        mock_run_workers.assert_called_once_with(ServerConfig(workers=8))
+
+    @patch('src.main.run_workers')
+    @patch('src.main.serve')
+    def test_bulkhead_flags_override_limits(self, mock_serve, mock_run_workers):
+        main(['--bulkhead', 'streams=64:0', '--bulkhead', 'ticker=12'])
+
+        mock_serve.assert_called_once_with(config=ServerConfig(bulkheads={
+            'streams': BulkheadConfig(max_concurrent=64, max_queue=0),
+            'ticker': BulkheadConfig(max_concurrent=12, max_queue=16),
+        }))
@@ -0,0 +1,283 @@
+"""
+Tests for the market schedule cache and market-hours-aware cache TTLs
+"""
+
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import Mock, patch
+from datetime import datetime, timedelta, timezone
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "gen"))
+
+from src.market_schedule import MarketSchedule, SESSION_PRE, SESSION_REGULAR, SESSION_POST, SESSION_CLOSED
+from src.response_cache import ResponseCache, ResponseCacheInterceptor, CLOSED_TTL
+from yfinance_grpc.v1alpha1 import ticker_pb2
+
+OPEN = datetime(2025, 1, 15, 14, 30, tzinfo=timezone.utc)
+CLOSE = datetime(2025, 1, 15, 21, 0, tzinfo=timezone.utc)
+
+
+def _status(open_=OPEN, close=CLOSE):
+    return {
+        "type": "REGULAR",
+        "open": open_,
+        "close": close,
+        "timezone": {"short": "EST", "gmtoffset": -18000000},
+    }
+
+
+class TestMarketSchedule:
+    @patch("src.market_schedule.yf.Market")
+    def test_status_is_fetched_once(self, mock_market_cls):
+        mock_market_cls.return_value = Mock(status=_status())
+        schedule = MarketSchedule()
+
+        schedule.is_open("us_market", now=OPEN + timedelta(hours=1))
+        schedule.is_open("us_market", now=OPEN + timedelta(hours=2))
+
+        mock_market_cls.assert_called_once_with("us_market")
+
+    @patch("src.market_schedule.yf.Market")
+    def test_is_open(self, mock_market_cls):
+        mock_market_cls.return_value = Mock(status=_status())
+        schedule = MarketSchedule()
+
+        assert schedule.is_open("us_market", now=OPEN + timedelta(hours=1)) is True
+        assert schedule.is_open("us_market", now=OPEN - timedelta(minutes=1)) is False
+        assert schedule.is_open("us_market", now=CLOSE) is False
+
+    @patch("src.market_schedule.yf.Market")
+    def test_ttl_short_in_session(self, mock_market_cls):
+        mock_market_cls.return_value = Mock(status=_status())
+        schedule = MarketSchedule()
+
+        assert schedule.ttl("us_market", 5, 900, now=OPEN + timedelta(hours=1)) == 5
+
+    @patch("src.market_schedule.yf.Market")
+    def test_ttl_lasts_until_next_open(self, mock_market_cls):
+        mock_market_cls.return_value = Mock(status=_status())
+        schedule = MarketSchedule()
+
+        ttl = schedule.ttl("us_market", 5, 900, now=OPEN - timedelta(hours=10))
+
+        assert ttl == timedelta(hours=10).total_seconds()
+
+    @patch("src.market_schedule.yf.Market")
+    def test_ttl_after_close_uses_closed_ttl(self, mock_market_cls):
+        mock_market_cls.return_value = Mock(status=_status())
+        schedule = MarketSchedule()
+
+        assert schedule.ttl("us_market", 5, 900, now=CLOSE + timedelta(hours=1)) == 900
+
+    @patch("src.market_schedule.yf.Market")
+    def test_extended_ttl_is_short_in_pre_market(self, mock_market_cls):
+        mock_market_cls.return_value = Mock(status=_status())
+        schedule = MarketSchedule()
+
+        assert schedule.ttl("us_market", 60, 900, now=OPEN - timedelta(hours=1), extended=True) == 60
+        # Before pre-market opens, until it does
+        ttl = schedule.ttl("us_market", 60, 900, now=OPEN - timedelta(hours=10), extended=True)
+        assert ttl == timedelta(hours=4, minutes=30).total_seconds()
+
+    @patch("src.market_schedule.yf.Market")
+    def test_extended_ttl_is_short_in_post_market(self, mock_market_cls):
+        mock_market_cls.return_value = Mock(status=_status())
+        schedule = MarketSchedule()
+
+        assert schedule.ttl("us_market", 60, 900, now=CLOSE + timedelta(hours=1), extended=True) == 60
+        assert schedule.ttl("us_market", 60, 900, now=CLOSE + timedelta(hours=5), extended=True) == 900
+
+    @patch("src.market_schedule.yf.Market")
+    def test_ttl_falls_back_when_status_unavailable(self, mock_market_cls):
+        mock_market_cls.side_effect = Exception("API error")
+        schedule = MarketSchedule()
+
+        assert schedule.ttl("us_market", 5, 900) == 5
+
+    @patch("src.market_schedule.yf.Market")
+    def test_us_session_transitions(self, mock_market_cls):
+        mock_market_cls.return_value = Mock(status=_status())
+        schedule = MarketSchedule()
+
+        assert schedule.session("us_market", now=OPEN - timedelta(hours=6)) == (
+            SESSION_CLOSED, OPEN - timedelta(hours=5, minutes=30))
+        assert schedule.session("us_market", now=OPEN - timedelta(hours=1)) == (SESSION_PRE, OPEN)
+        assert schedule.session("us_market", now=OPEN) == (SESSION_REGULAR, CLOSE)
+        assert schedule.session("us_market", now=CLOSE + timedelta(hours=1)) == (
+            SESSION_POST, CLOSE + timedelta(hours=4))
+        assert schedule.session("us_market", now=CLOSE + timedelta(hours=5)) == (SESSION_CLOSED, None)
+
+    @patch("src.market_schedule.yf.Market")
+    def test_markets_without_extended_hours_skip_pre_and_post(self, mock_market_cls):
+        mock_market_cls.return_value = Mock(status=_status())
+        schedule = MarketSchedule()
+
+        assert schedule.session("gb_market", now=OPEN - timedelta(hours=1)) == (SESSION_CLOSED, OPEN)
+        assert schedule.session("gb_market", now=CLOSE + timedelta(hours=1)) == (SESSION_CLOSED, None)
+
+    @patch("src.market_schedule.yf.Market")
+    def test_started_schedule_serves_stale_data_without_blocking(self, mock_market_cls):
+        mock_market_cls.return_value = Mock(status=_status(), summary={"^GSPC": {}})
+        schedule = MarketSchedule(summary_interval=3600)
+        schedule.summary("us_market")
+        schedule.start()
+        try:
+            with patch("src.market_schedule.time.monotonic", return_value=10 ** 9):
+                assert schedule.summary("us_market") == {"^GSPC": {}}
+        finally:
+            schedule.stop()
+
+        mock_market_cls.assert_called_once_with("us_market")
+
+    @patch("src.market_schedule.yf.Market")
+    def test_stale_summary_is_refetched_when_not_started(self, mock_market_cls):
+        mock_market_cls.return_value = Mock(status=_status(), summary={"^GSPC": {}})
+        schedule = MarketSchedule(summary_interval=30)
+        schedule.summary("us_market")
+        with patch("src.market_schedule.time.monotonic", return_value=10 ** 9):
+            schedule.summary("us_market")
+
+        assert mock_market_cls.call_count == 2
+
+    def test_market_for_symbol(self):
+        schedule = MarketSchedule()
+
+        assert schedule.market_for_symbol("AAPL") == "us_market"
+        assert schedule.market_for_symbol("VOD.L") == "gb_market"
+        assert schedule.market_for_symbol("7203.T") == "jp_market"
+        assert schedule.market_for_symbol("EURUSD=X") is None
+        assert schedule.market_for_symbol("BTC-USD") is None
+
+    def test_remembered_market_wins_over_suffix(self):
+        schedule = MarketSchedule()
+        schedule.remember_market("shop.to", "us_market")
+
+        assert schedule.market_for_symbol("SHOP.TO") == "us_market"
+
+    @patch("src.market_schedule.yf.Market")
+    def test_snapshot_restores_without_refetching(self, mock_market_cls):
+        mock_market_cls.return_value = Mock(status=_status())
+        schedule = MarketSchedule()
+        schedule.status("us_market")
+        schedule.remember_market("SHEL", "gb_market")
+
+        restored = MarketSchedule()
+        assert restored.restore(schedule.snapshot()) == 1
+
+        assert restored.status("us_market") == _status()
+        assert restored.market_for_symbol("SHEL") == "gb_market"
+        mock_market_cls.assert_called_once_with("us_market")
+
+class TestMarketHoursCacheTTL:
+    def test_quote_methods_use_schedule(self):
+        schedule = Mock()
+        schedule.market_for_symbol.return_value = "us_market"
+        schedule.ttl.return_value = 3600.0
+        interceptor = ResponseCacheInterceptor(ResponseCache(), schedule=schedule)
+
+        ttl = interceptor.ttl_for(
+            '/yfinance_grpc.v1alpha1.TickerService/GetInfo',
+            ticker_pb2.GetInfoRequest(ticker="AAPL"),
+        )
+
+        assert ttl == 3600.0
+        schedule.ttl.assert_called_once_with("us_market", open_ttl=5.0, closed_ttl=CLOSED_TTL, extended=False)
+
+    def test_prepost_history_counts_extended_hours_as_in_session(self):
+        schedule = Mock()
+        schedule.market_for_symbol.return_value = "us_market"
+        schedule.ttl.return_value = 60.0
+        interceptor = ResponseCacheInterceptor(ResponseCache(), schedule=schedule)
+
+        interceptor.ttl_for(
+            '/yfinance_grpc.v1alpha1.TickerService/GetHistory',
+            ticker_pb2.GetHistoryRequest(ticker="AAPL", interval="1m", prepost=True),
+        )
+
+        schedule.ttl.assert_called_once_with("us_market", open_ttl=60.0, closed_ttl=CLOSED_TTL, extended=True)
+
+    def test_statement_methods_keep_fixed_ttl(self):
+        schedule = Mock()
+        interceptor = ResponseCacheInterceptor(ResponseCache(), schedule=schedule)
+
+        ttl = interceptor.ttl_for(
+            '/yfinance_grpc.v1alpha1.TickerService/GetFinancials',
+            ticker_pb2.GetFinancialsRequest(ticker="AAPL"),
+        )
+
+        assert ttl == 3600.0
+        schedule.ttl.assert_not_called()
+
+    def test_multiple_info_uses_shortest_ttl(self):
+        schedule = Mock()
+        schedule.market_for_symbol.side_effect = lambda symbol: {"AAPL": "us_market", "VOD.L": "gb_market"}[symbol]
+        schedule.ttl.side_effect = lambda market, **kwargs: {"us_market": 3600.0, "gb_market": 5.0}[market]
+        interceptor = ResponseCacheInterceptor(ResponseCache(), schedule=schedule)
+
+        ttl = interceptor.ttl_for(
+            '/yfinance_grpc.v1alpha1.TickerService/GetMultipleInfo',
+            ticker_pb2.GetMultipleInfoRequest(tickers=["AAPL", "VOD.L"]),
+        )
+
+        assert ttl == 5.0
+
+
+class TestMarketScheduleTransitions:
+    @patch("src.market_schedule.yf.Market")
+    def test_transition_wakes_waiting_watchers(self, mock_market_cls):
+        mock_market_cls.return_value = Mock(status=_status())
+        schedule = MarketSchedule()
+        schedule.status("us_market")
+        woken = []
+
+        def watcher():
+            woken.append(schedule.wait_for_transition(schedule.version, timeout=5))
+
+        with patch("src.market_schedule._now", return_value=OPEN + timedelta(hours=1)):
+            thread = threading.Thread(target=watcher)
+            thread.start()
+            schedule._check_transitions()
+            thread.join(timeout=5)
+
+        assert woken == [1]
+
+    @patch("src.market_schedule.yf.Market")
+    def test_unchanged_session_does_not_bump_version(self, mock_market_cls):
+        mock_market_cls.return_value = Mock(status=_status())
+        schedule = MarketSchedule()
+        schedule.status("us_market")
+
+        with patch("src.market_schedule._now", return_value=OPEN + timedelta(hours=1)):
+            schedule._check_transitions()
+        with patch("src.market_schedule._now", return_value=OPEN + timedelta(hours=2)):
+            schedule._check_transitions()
+
+        assert schedule.version == 1
+
+    @patch("src.market_schedule.yf.Market")
+    def test_timer_wakes_at_next_transition(self, mock_market_cls):
+        mock_market_cls.return_value = Mock(status=_status())
+        schedule = MarketSchedule(summary_interval=30)
+        schedule.status("us_market")
+
+        with patch("src.market_schedule._now", return_value=CLOSE - timedelta(seconds=10)):
+            assert schedule._next_wakeup() == 10
+
+    def test_stop_wakes_waiting_watchers(self):
+        schedule = MarketSchedule()
+        woken = threading.Event()
+
+        def watcher():
+            schedule.wait_for_transition(schedule.version, timeout=5)
+            woken.set()
+
+        thread = threading.Thread(target=watcher)
+        thread.start()
+        schedule.stop()
+        thread.join(timeout=5)
+
+        assert woken.is_set()
@@ -1,9 +1,10 @@
 """Unit tests for MarketService (GetMarketStatus and GetMarketSummary RPCs)."""
 
+import itertools
 import sys
 from pathlib import Path
 from unittest.mock import Mock, patch
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 import pytest
 import grpc
@@ -58,6 +59,26 @@ class TestMarketServiceGetMarketStatus:
         )
         context.set_code.assert_called_once_with(grpc.StatusCode.NOT_FOUND)
 
+    @patch("src.market_server.yf.Market")
+    def test_get_market_status_computes_session_locally(self, mock_market_cls):
+        now = datetime.now(timezone.utc)
+        mock_market = Mock()
+        mock_market_cls.return_value = mock_market
+        mock_market.status = {
+            "open": now - timedelta(hours=1),
+            "close": now + timedelta(hours=1),
+            "timezone": {"short": "GMT", "gmtoffset": 0},
+        }
+
+        servicer = MarketServiceServicer()
+        first = servicer.GetMarketStatus(market_pb2.GetMarketStatusRequest(market="gb_market"), Mock())
+        second = servicer.GetMarketStatus(market_pb2.GetMarketStatusRequest(market="gb_market"), Mock())
+
+        mock_market_cls.assert_called_once_with("gb_market")
+        assert first.status.session == market_pb2.MARKET_SESSION_REGULAR
+        assert first.status.next_transition == first.status.close
+        assert second.status == first.status
+
     @patch("src.market_server.yf.Market")
     def test_get_market_status_exception_returns_internal_error(self, mock_market_cls):
         mock_market_cls.side_effect = Exception("API error")
@@ -132,6 +153,20 @@ class TestMarketServiceGetMarketSummary:
 
         assert len(response.summary) == 0
 
+    @patch("src.market_server.yf.Market")
+    def test_status_and_summary_share_one_fetch(self, mock_market_cls):
+        mock_market = Mock()
+        mock_market_cls.return_value = mock_market
+        mock_market.status = {"type": "REGULAR", "timezone": {"short": "EST", "gmtoffset": -18000000}}
+        mock_market.summary = {"^GSPC": {"shortName": "S&P 500", "regularMarketPrice": 4800.0}}
+
+        servicer = MarketServiceServicer()
+        servicer.GetMarketStatus(market_pb2.GetMarketStatusRequest(market="us_market"), Mock())
+        response = servicer.GetMarketSummary(market_pb2.GetMarketSummaryRequest(market="us_market"), Mock())
+
+        mock_market_cls.assert_called_once_with("us_market")
+        assert response.summary["^GSPC"].regular_market_price == 4800.0
+
     @patch("src.market_server.yf.Market")
     def test_get_market_summary_exception_returns_internal_error(self, mock_market_cls):
         mock_market_cls.side_effect = Exception("API error")
@@ -140,3 +175,88 @@ class TestMarketServiceGetMarketSummary:
             market_pb2.GetMarketSummaryRequest(market="us_market"), context
         )
         context.set_code.assert_called_once_with(grpc.StatusCode.INTERNAL)
+
+
+class TestMarketServiceWatchMarketStatus:
+    def test_watch_market_status_empty_markets_returns_invalid_argument(self):
+        context = Mock()
+        responses = list(MarketServiceServicer().WatchMarketStatus(
+            market_pb2.WatchMarketStatusRequest(markets=[]), context
+        ))
+        assert responses == []
+        context.set_code.assert_called_once_with(grpc.StatusCode.INVALID_ARGUMENT)
+
+    @patch("src.market_server.yf.Market")
+    def test_watch_market_status_unknown_market_returns_not_found(self, mock_market_cls):
+        mock_market_cls.return_value = Mock(status=None)
+        context = Mock()
+        responses = list(MarketServiceServicer().WatchMarketStatus(
+            market_pb2.WatchMarketStatusRequest(markets=["xx_market"]), context
+        ))
+        assert responses == []
+        context.set_code.assert_called_once_with(grpc.StatusCode.NOT_FOUND)
+
+    @patch("src.market_server.yf.Market")
+    def test_watch_market_status_sends_initial_snapshot(self, mock_market_cls):
+        now = datetime.now(timezone.utc)
+        mock_market_cls.return_value = Mock(status={
+            "open": now - timedelta(hours=1),
+            "close": now + timedelta(hours=1),
+            "timezone": {"short": "GMT", "gmtoffset": 0},
+        })
+        context = Mock()
+        context.is_active.side_effect = itertools.chain([True], itertools.repeat(False))
+
+        responses = list(MarketServiceServicer().WatchMarketStatus(
+            market_pb2.WatchMarketStatusRequest(markets=["gb_market", "gb_market"]), context
+        ))
+
+        assert len(responses) == 1
+        assert responses[0].market == "gb_market"
+        assert responses[0].status.session == market_pb2.MARKET_SESSION_REGULAR
+        context.set_code.assert_not_called()
+
+    def test_watch_market_status_pushes_only_transitions(self):
+        now = datetime.now(timezone.utc)
+        schedule = Mock(stopped=False)
+        schedule.status.return_value = {"open": now, "close": now + timedelta(hours=6)}
+        schedule.version = 0
+        schedule.session.side_effect = [
+            ("REGULAR", now + timedelta(hours=6)),
+            ("REGULAR", now + timedelta(hours=6)),
+            ("POST", now + timedelta(hours=10)),
+        ]
+        schedule.wait_for_transition.side_effect = [1, 2, 3]
+        context = Mock()
+        context.is_active.side_effect = itertools.chain([True, True, True], itertools.repeat(False))
+
+        responses = list(MarketServiceServicer(schedule).WatchMarketStatus(
+            market_pb2.WatchMarketStatusRequest(markets=["us_market"]), context
+        ))
+
+        assert [r.status.session for r in responses] == [
+            market_pb2.MARKET_SESSION_REGULAR,
+            market_pb2.MARKET_SESSION_POST,
+        ]
+        context.add_callback.assert_called_once_with(schedule.wake)
+
+    def test_watch_market_status_ends_unavailable_on_shutdown(self):
+        now = datetime.now(timezone.utc)
+        schedule = Mock(version=0, stopped=False)
+        schedule.status.return_value = {"open": now, "close": now + timedelta(hours=6)}
+        schedule.session.return_value = ("REGULAR", now + timedelta(hours=6))
+
+        def stop(*args, **kwargs):
+            schedule.stopped = True
+            return 0
+
+        schedule.wait_for_transition.side_effect = stop
+        context = Mock()
+        context.is_active.return_value = True
+
+        responses = list(MarketServiceServicer(schedule).WatchMarketStatus(
+            market_pb2.WatchMarketStatusRequest(markets=["us_market"]), context
+        ))
+
+        assert len(responses) == 1
+        context.set_code.assert_called_once_with(grpc.StatusCode.UNAVAILABLE)
@@ -0,0 +1,178 @@
+"""
+Tests for process-pool DataFrame conversion offload
+"""
+
+import sys
+import threading
+import time
+from concurrent import futures
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import grpc
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "gen"))
+
+from src.offload import ConversionPool, EncodedResponseInterceptor
+from src.server import TickerServiceServicer
+from yfinance_grpc.v1alpha1 import ticker_pb2
+from tests.helpers import servicer_context
+
+
+def _history_frame(periods=1200):
+    dates = pd.date_range('2020-01-01', periods=periods, freq='D', tz='America/New_York')
+    frame = pd.DataFrame({
+        'Open': np.arange(periods, dtype=float),
+        'High': np.arange(periods, dtype=float) + 1,
+        'Low': np.arange(periods, dtype=float) - 1,
+        'Close': np.arange(periods, dtype=float) + 0.5,
+        'Volume': np.arange(periods, dtype=float) * 100,
+    }, index=dates)
+    frame.iloc[3, 0] = np.nan
+    return frame
+
+
+def _option_frame():
+    return pd.DataFrame({
+        'contractSymbol': ['AAPL250117C00100000', 'AAPL250117C00105000'],
+        'strike': [100.0, 105.0],
+        'currency': ['USD', None],
+        'lastPrice': [12.5, np.nan],
+        'bid': [12.0, 7.0],
+        'ask': [13.0, 7.5],
+        'change': [0.5, -0.2],
+        'percentChange': [4.0, -2.5],
+        'volume': [10.0, np.nan],
+        'openInterest': [100.0, 50.0],
+        'impliedVolatility': [0.3, 0.28],
+        'inTheMoney': [True, False],
+        'contractSize': ['REGULAR', 'REGULAR'],
+        'lastTradeDate': pd.to_datetime(['2025-01-10 15:30:00', None], utc=True),
+    })
+
+
+@pytest.fixture(scope="module")
+def pool():
+    pool = ConversionPool(max_workers=1)
+    yield pool
+    pool.shutdown()
+
+
+class TestConversionOffload:
+    @patch('src.server.yf.download')
+    def test_offloaded_history_matches_in_thread_conversion(self, mock_download, pool):
+        mock_download.return_value = _history_frame()
+        request = ticker_pb2.DownloadHistoryRequest(tickers=["AAPL"], period="5y")
+        servicer = TickerServiceServicer(quote_hub=Mock(), conversion_pool=pool)
+
+        in_thread = list(servicer.DownloadHistory(request, servicer_context()))
+        with patch('src.server.OFFLOAD_ROW_THRESHOLD', 1):
+            offloaded = list(servicer.DownloadHistory(request, servicer_context()))
+
+        # Offloaded batches arrive encoded and are sent without re-parsing
+        assert all(isinstance(payload, bytes) for payload in offloaded)
+        assert [ticker_pb2.DownloadHistoryResponse.FromString(payload) for payload in offloaded] == in_thread
+        assert len(offloaded) == 3
+
+    @patch('src.server.yf.download')
+    def test_offloaded_multi_ticker_history_matches_in_thread_conversion(self, mock_download, pool):
+        mock_download.return_value = pd.concat({"AAPL": _history_frame(), "MSFT": _history_frame(600)}, axis=1)
+        request = ticker_pb2.DownloadHistoryRequest(tickers=["AAPL", "MSFT"], period="5y")
+        servicer = TickerServiceServicer(quote_hub=Mock(), conversion_pool=pool)
+
+        in_thread = list(servicer.DownloadHistory(request, servicer_context()))
+        with patch('src.server.OFFLOAD_ROW_THRESHOLD', 1):
+            offloaded = [ticker_pb2.DownloadHistoryResponse.FromString(payload)
+                         for payload in servicer.DownloadHistory(request, servicer_context())]
+
+        assert [r.ticker for r in offloaded] == ["AAPL"] * 3 + ["MSFT"] * 3
+        assert offloaded == in_thread
+
+    @patch('src.server.yf.Ticker')
+    def test_offloaded_option_chain_matches_in_thread_conversion(self, mock_ticker_class, pool):
+        mock_ticker = Mock()
+        mock_ticker.option_chain.return_value = Mock(calls=_option_frame(), puts=_option_frame().iloc[:1])
+        mock_ticker_class.return_value = mock_ticker
+        request = ticker_pb2.GetOptionChainRequest(ticker="AAPL")
+        servicer = TickerServiceServicer(quote_hub=Mock(), conversion_pool=pool)
+
+        in_thread = servicer.GetOptionChain(request, servicer_context())
+        with patch('src.server.OFFLOAD_ROW_THRESHOLD', 1):
+            offloaded = ticker_pb2.GetOptionChainResponse.FromString(
+                servicer.GetOptionChain(request, servicer_context()))
+
+        assert len(offloaded.calls) == 2
+        assert offloaded == in_thread
+
+    @patch('src.server.yf.download')
+    def test_small_frames_stay_in_thread(self, mock_download):
+        mock_download.return_value = _history_frame(periods=10)
+        pool = Mock()
+        servicer = TickerServiceServicer(quote_hub=Mock(), conversion_pool=pool)
+
+        list(servicer.DownloadHistory(ticker_pb2.DownloadHistoryRequest(tickers=["AAPL"]), servicer_context()))
+
+        pool.history_batches.assert_not_called()
+
+    @pytest.mark.parametrize('deadline', [False, True])
+    def test_wait_ends_when_the_client_goes_away(self, deadline):
+        context = servicer_context(active=deadline)
+        if deadline:
+            expires_at = time.monotonic() + 0.2
+            context.time_remaining.side_effect = lambda: expires_at - time.monotonic()
+        pool = ConversionPool()
+        executor = futures.ThreadPoolExecutor(max_workers=1)
+        pool._pool = lambda: executor
+        release = threading.Event()
+
+        started = time.monotonic()
+        assert pool._run(context, release.wait, [], 5) is None
+        assert time.monotonic() - started < 2
+        release.set()
+        executor.shutdown()
+
+    @patch('src.server.yf.Ticker')
+    def test_abandoned_option_chain_conversion_ends_the_call(self, mock_ticker_class):
+        mock_ticker = Mock()
+        mock_ticker.option_chain.return_value = Mock(calls=_option_frame(), puts=_option_frame())
+        mock_ticker_class.return_value = mock_ticker
+        context = servicer_context()
+
+        def cancel_during_conversion(calls, puts, context):
+            context.is_active.return_value = False
+            return None
+
+        pool = Mock()
+        pool.option_chain.side_effect = cancel_during_conversion
+        servicer = TickerServiceServicer(quote_hub=Mock(), conversion_pool=pool)
+
+        with patch('src.server.OFFLOAD_ROW_THRESHOLD', 1):
+            response = servicer.GetOptionChain(ticker_pb2.GetOptionChainRequest(ticker="AAPL"), context)
+
+        assert response == ticker_pb2.GetOptionChainResponse()
+        context.set_code.assert_called_once_with(grpc.StatusCode.CANCELLED)
+
+
+class TestEncodedResponseInterceptor:
+    def test_encoded_responses_pass_through_and_messages_are_serialized(self):
+        handler = grpc.unary_stream_rpc_method_handler(
+            Mock(), response_serializer=ticker_pb2.DownloadHistoryResponse.SerializeToString)
+        details = Mock(method='/yfinance_grpc.v1alpha1.TickerService/DownloadHistory')
+
+        serializer = EncodedResponseInterceptor().intercept_service(lambda d: handler, details).response_serializer
+
+        message = ticker_pb2.DownloadHistoryResponse(ticker="AAPL")
+        assert serializer(b'\n\x04AAPL') == b'\n\x04AAPL'
+        assert serializer(message) == message.SerializeToString()
+
+    def test_other_methods_are_untouched(self):
+        handler = grpc.unary_unary_rpc_method_handler(Mock())
+        details = Mock(method='/yfinance_grpc.v1alpha1.TickerService/GetInfo')
+
+        assert EncodedResponseInterceptor().intercept_service(lambda d: handler, details) is handler
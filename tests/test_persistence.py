@@ -0,0 +1,77 @@
+"""
+Tests for cache persistence across restarts
+"""
+
+import json
+import pickle
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "gen"))
+
+from src.market_schedule import MarketSchedule
+from src.persistence import load_caches, save_caches
+from src.response_cache import ResponseCache
+
+
+class TestCachePersistence:
+    def test_round_trip(self, tmp_path):
+        path = str(tmp_path / "caches")
+        cache = ResponseCache()
+        cache.put(('/svc/GetInfo', b'\n\x04AAPL'), b'data', ttl=60)
+
+        save_caches(path, {'response': cache})
+        restored = ResponseCache()
+        load_caches(path, {'response': restored, 'unknown': ResponseCache()})
+
+        assert restored.get(('/svc/GetInfo', b'\n\x04AAPL')) == b'data'
+        assert list(tmp_path.iterdir()) == [tmp_path / "caches"]
+
+    def test_missing_or_corrupt_file_is_ignored(self, tmp_path):
+        cache = ResponseCache()
+
+        load_caches(str(tmp_path / "missing"), {'response': cache})
+        (tmp_path / "corrupt").write_bytes(b'{"format": "yfinance-grpc-caches", "vers')
+        load_caches(str(tmp_path / "corrupt"), {'response': cache})
+
+        assert len(cache) == 0
+
+    def test_other_formats_and_versions_are_ignored(self, tmp_path):
+        path = tmp_path / "caches"
+        cache = ResponseCache()
+        cache.put(('/svc/GetInfo', b'AAPL'), b'data', ttl=60)
+        save_caches(str(path), {'response': cache})
+        document = json.loads(path.read_text())
+        restored = ResponseCache()
+
+        path.write_text(json.dumps(dict(document, version=2)))
+        load_caches(str(path), {'response': restored})
+        path.write_bytes(pickle.dumps({'response': cache.snapshot()}))
+        load_caches(str(path), {'response': restored})
+
+        assert len(restored) == 0
+
+    @patch('src.market_schedule.yf.Market')
+    def test_market_statuses_round_trip(self, mock_market_cls, tmp_path):
+        status = {
+            'type': 'REGULAR',
+            'open': datetime(2025, 1, 15, 14, 30, tzinfo=timezone.utc),
+            'close': datetime(2025, 1, 15, 21, 0, tzinfo=timezone.utc),
+        }
+        mock_market_cls.return_value = Mock(status=status, summary={'^GSPC': {'regularMarketPrice': 5900.0}})
+        schedule = MarketSchedule()
+        schedule.summary('us_market')
+        path = str(tmp_path / "caches")
+
+        save_caches(path, {'market_schedule': schedule})
+        restored = MarketSchedule()
+        load_caches(path, {'market_schedule': restored})
+
+        assert restored.status('us_market') == status
+        assert restored.summary('us_market') == {'^GSPC': {'regularMarketPrice': 5900.0}}
+        mock_market_cls.assert_called_once_with('us_market')
@@ -0,0 +1,194 @@
+"""
+Tests for universe prefetching
+"""
+
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import Mock
+
+import grpc
+from grpc_health.v1 import health, health_pb2
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "gen"))
+
+from src.breaker import NegativeCache
+from src.health import NOT_SERVING, OVERALL, SERVING, ReadinessMonitor
+from src.prefetch import PrefetchScheduler, RequestFrequencyInterceptor, TokenBucket, load_universe
+from src.response_cache import ResponseCache, ResponseCacheInterceptor
+from yfinance_grpc.v1alpha1 import ticker_pb2
+
+_GET_INFO = '/yfinance_grpc.v1alpha1.TickerService/GetInfo'
+_GET_CALENDAR = '/yfinance_grpc.v1alpha1.TickerService/GetCalendar'
+_REQUESTS = {
+    _GET_INFO: lambda symbol: ticker_pb2.GetInfoRequest(ticker=symbol),
+    _GET_CALENDAR: lambda symbol: ticker_pb2.GetCalendarRequest(ticker=symbol),
+}
+
+
+class _Servicer:
+    def __init__(self):
+        self.calls = []
+        self.negative_cache = NegativeCache()
+
+    def GetInfo(self, request, context):
+        self.calls.append(('GetInfo', request.ticker))
+        if request.ticker == 'BAD':
+            self.negative_cache.add(request.ticker)
+            context.set_code(grpc.StatusCode.NOT_FOUND)
+            context.set_details("No data")
+            return ticker_pb2.GetInfoResponse()
+        return ticker_pb2.GetInfoResponse(info=ticker_pb2.TickerInfo(symbol=request.ticker))
+
+    def GetCalendar(self, request, context):
+        self.calls.append(('GetCalendar', request.ticker))
+        return ticker_pb2.GetCalendarResponse()
+
+
+def _scheduler(symbols, rate=1000.0):
+    interceptor = ResponseCacheInterceptor(ResponseCache())
+    # GetInfo's 5s TTL outlasts the 1s interval, so fresh entries are not due
+    servicer = _Servicer()
+    return PrefetchScheduler(servicer, interceptor, symbols, rate=rate, interval=1.0, requests=_REQUESTS,
+                             negative_cache=servicer.negative_cache)
+
+
+class TestLoadUniverse:
+    def test_parses_symbols_comments_and_duplicates(self, tmp_path):
+        path = tmp_path / "universe.txt"
+        path.write_text("# mega caps\naapl, MSFT\n\nnvda  # chips\nAAPL\n")
+
+        assert load_universe(str(path)) == ["AAPL", "MSFT", "NVDA"]
+
+
+class TestTokenBucket:
+    def test_burst_then_waits(self):
+        bucket = TokenBucket(rate=0.001, burst=2)
+        stop = threading.Event()
+        stop.set()
+
+        assert bucket.acquire(stop)
+        assert bucket.acquire(stop)
+        assert not bucket.acquire(stop)
+
+
+class TestPrefetchScheduler:
+    def test_due_orders_by_request_frequency_then_universe_order(self):
+        scheduler = _scheduler(["AAPL", "MSFT", "NVDA"])
+        scheduler.record("nvda")
+        scheduler.record("NVDA")
+        scheduler.record("MSFT")
+        scheduler.record("TSLA")
+
+        due = scheduler.due()
+
+        assert [symbol for _, symbol in due] == ["NVDA", "NVDA", "MSFT", "MSFT", "AAPL", "AAPL"]
+        assert due[0] == (_GET_INFO, "NVDA")
+
+    def test_refresh_caches_under_the_live_request_key(self):
+        scheduler = _scheduler(["AAPL"])
+
+        assert scheduler.refresh(_GET_INFO, "AAPL")
+
+        interceptor = scheduler.cache_interceptor
+        key = interceptor.key_for(_GET_INFO, ticker_pb2.GetInfoRequest(ticker=" aapl "))
+        cached = ticker_pb2.GetInfoResponse.FromString(interceptor.cache.get(key))
+        assert cached.info.symbol == "AAPL"
+        assert (_GET_INFO, "AAPL") not in scheduler.due()
+
+    def test_failed_refresh_is_not_cached(self):
+        scheduler = _scheduler(["BAD"])
+
+        assert not scheduler.refresh(_GET_INFO, "BAD")
+
+        assert len(scheduler.cache_interceptor.cache) == 0
+        assert scheduler.failed == 1
+
+    def test_run_pass_refreshes_everything_due(self):
+        scheduler = _scheduler(["AAPL", "MSFT"])
+        scheduler.record("MSFT")
+
+        scheduler.run_pass()
+
+        assert scheduler.servicer.calls == [
+            ('GetInfo', 'MSFT'), ('GetCalendar', 'MSFT'), ('GetInfo', 'AAPL'), ('GetCalendar', 'AAPL'),
+        ]
+        assert scheduler.due() == []
+
+    def test_unknown_symbols_are_skipped_while_negatively_cached(self):
+        scheduler = _scheduler(["BAD", "AAPL"])
+
+        scheduler.run_pass()
+        scheduler.run_pass()
+
+        assert scheduler.servicer.calls == [('GetInfo', 'BAD'), ('GetInfo', 'AAPL'), ('GetCalendar', 'AAPL')]
+        assert scheduler.failed == 1
+        assert scheduler.due() == []
+
+    def test_readiness_waits_for_the_first_pass(self):
+        scheduler = _scheduler(["AAPL"])
+        servicer = health.HealthServicer()
+        monitor = ReadinessMonitor(servicer, services={'yfinance_grpc.v1alpha1.TickerService': ()}, interval=60)
+        warm_up = monitor.warm_up(scheduler.first_pass.wait)
+        monitor.start()
+        check = health_pb2.HealthCheckRequest(service=OVERALL)
+        assert servicer.Check(check, None).status == NOT_SERVING
+
+        scheduler.start()
+        warm_up.join(timeout=5)
+        scheduler.stop()
+        monitor.update()
+        monitor.stop()
+
+        assert servicer.Check(check, None).status == SERVING
+        assert scheduler.servicer.calls == [('GetInfo', 'AAPL'), ('GetCalendar', 'AAPL')]
+
+    def test_recently_refreshed_entries_yield_to_the_rest(self):
+        scheduler = _scheduler(["AAPL", "MSFT"])
+        scheduler.record("AAPL")
+        scheduler.refresh(_GET_INFO, "AAPL")
+        # Expiring before the next pass, as a refresh from late in the last pass would be
+        interceptor = scheduler.cache_interceptor
+        key = interceptor.key_for(_GET_INFO, ticker_pb2.GetInfoRequest(ticker="AAPL"))
+        interceptor.cache.put(key, interceptor.cache.get(key), 0.5)
+
+        due = scheduler.due()
+
+        assert due[0] == (_GET_CALENDAR, "AAPL")
+        assert due[-1] == (_GET_INFO, "AAPL")
+
+
+    def test_entries_shorter_lived_than_a_pass_are_not_prefetched(self):
+        scheduler = _scheduler(["AAPL", "MSFT"])
+        scheduler.interval = 30.0
+
+        assert scheduler.due() == [(_GET_CALENDAR, "AAPL"), (_GET_CALENDAR, "MSFT")]
+
+    def test_coverage_is_bounded_by_rate_times_ttl(self):
+        # One request every 1800s keeps two hour-long calendars fresh, not three
+        scheduler = _scheduler(["AAPL", "MSFT", "NVDA"], rate=1 / 1800)
+        scheduler.interval = 30.0
+        scheduler.record("NVDA")
+
+        assert scheduler.due() == [(_GET_CALENDAR, "NVDA"), (_GET_CALENDAR, "AAPL")]
+        assert scheduler.covered == 2
+
+
+class TestRequestFrequencyInterceptor:
+    def test_records_ticker_and_tickers(self):
+        scheduler = _scheduler(["AAPL", "MSFT"])
+        behavior = Mock(return_value=b'')
+        handler = grpc.unary_unary_rpc_method_handler(behavior)
+        interceptor = RequestFrequencyInterceptor(scheduler)
+
+        wrapped = interceptor.intercept_service(lambda details: handler, Mock(method=_GET_INFO))
+        wrapped.unary_unary(ticker_pb2.GetInfoRequest(ticker="AAPL"), Mock())
+        wrapped.unary_unary(ticker_pb2.GetMultipleInfoRequest(tickers=["AAPL", "MSFT"]), Mock())
+        wrapped.unary_unary(ticker_pb2.GetFastInfoRequest(ticker="TSLA"), Mock())
+
+        assert behavior.call_count == 3
+        assert [symbol for _, symbol in scheduler.due()[::2]] == ["AAPL", "MSFT"]
+        assert scheduler._counts == {"AAPL": 2, "MSFT": 1}
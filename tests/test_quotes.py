@@ -0,0 +1,119 @@
+"""
+Tests for the shared quote poller behind SubscribeQuotes
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "gen"))
+
+from src.quotes import QuoteHub, fetch_quote
+
+
+def _hub(quotes):
+    fetch = Mock(side_effect=lambda symbol: dict(quotes[symbol]))
+    hub = QuoteHub(fetch=fetch)
+    # Keep the poller thread out of the tests; polls are driven explicitly
+    hub._thread = Mock()
+    return hub, fetch
+
+
+class TestQuoteHub:
+    def test_shared_symbol_is_fetched_once_per_poll(self):
+        hub, fetch = _hub({"AAPL": {"last_price": 100.0}})
+        first = hub.subscribe(["AAPL"])
+        second = hub.subscribe(["AAPL"])
+
+        hub.poll(hub.symbols)
+
+        fetch.assert_called_once_with("AAPL")
+        assert first.next_updates(timeout=0) == {"AAPL": {"last_price": 100.0}}
+        assert second.next_updates(timeout=0) == {"AAPL": {"last_price": 100.0}}
+
+    def test_only_changed_fields_are_published(self):
+        quotes = {"AAPL": {"last_price": 100.0, "currency": "USD"}}
+        hub, _ = _hub(quotes)
+        subscription = hub.subscribe(["AAPL"])
+        hub.poll(hub.symbols)
+        subscription.next_updates(timeout=0)
+
+        quotes["AAPL"]["last_price"] = 101.0
+        hub.poll(hub.symbols)
+        hub.poll(hub.symbols)
+
+        assert subscription.next_updates(timeout=0) == {"AAPL": {"last_price": 101.0}}
+        assert subscription.next_updates(timeout=0) == {}
+
+    def test_late_subscriber_receives_snapshot(self):
+        hub, _ = _hub({"AAPL": {"last_price": 100.0, "currency": "USD"}})
+        hub.subscribe(["AAPL"])
+        hub.poll(hub.symbols)
+
+        late = hub.subscribe(["AAPL"])
+
+        assert late.next_updates(timeout=0) == {"AAPL": {"last_price": 100.0, "currency": "USD"}}
+
+    def test_new_symbol_is_polled_without_repolling_the_rest(self):
+        fetch = Mock(side_effect=lambda symbol: {"last_price": 100.0})
+        hub = QuoteHub(interval=60, fetch=fetch)
+        try:
+            first = hub.subscribe(["AAPL"])
+            assert first.next_updates(timeout=5) == {"AAPL": {"last_price": 100.0}}
+
+            second = hub.subscribe(["MSFT"])
+            assert second.next_updates(timeout=5) == {"MSFT": {"last_price": 100.0}}
+            hub.subscribe(["AAPL"])
+        finally:
+            hub.stop()
+            hub._thread.join(timeout=5)
+
+        assert [c.args[0] for c in fetch.call_args_list] == ["AAPL", "MSFT"]
+
+    def test_unsubscribe_drops_unwatched_symbols(self):
+        hub, _ = _hub({"AAPL": {}, "MSFT": {}})
+        first = hub.subscribe(["AAPL", "MSFT"])
+        second = hub.subscribe(["AAPL"])
+
+        hub.unsubscribe(first)
+
+        assert hub.symbols == frozenset({"AAPL"})
+        assert first.closed
+        hub.unsubscribe(second)
+        assert hub.symbols == frozenset()
+
+    def test_failed_fetch_publishes_nothing(self):
+        hub = QuoteHub(fetch=Mock(side_effect=Exception("API error")))
+        hub._thread = Mock()
+        subscription = hub.subscribe(["AAPL"])
+
+        hub.poll(hub.symbols)
+
+        assert subscription.next_updates(timeout=0) == {}
+
+    def test_stop_closes_subscriptions(self):
+        hub, _ = _hub({"AAPL": {"last_price": 100.0}})
+        subscription = hub.subscribe(["AAPL"])
+
+        hub.stop()
+
+        assert hub.stopped
+        assert subscription.closed
+        assert subscription.next_updates(timeout=0) == {}
+
+class TestFetchQuote:
+    def test_fetch_quote_converts_fast_info(self, monkeypatch):
+        fast_info = Mock(last_price=101.5, previous_close=100.0, open=100.5, day_high=102.0,
+                         day_low=99.5, last_volume=1234.0, currency="USD")
+        ticker = Mock()
+        ticker.get_fast_info.return_value = fast_info
+        monkeypatch.setattr("src.quotes.yf.Ticker", Mock(return_value=ticker))
+
+        quote = fetch_quote("AAPL")
+
+        assert quote["last_price"] == 101.5
+        assert quote["last_volume"] == 1234
+        assert quote["currency"] == "USD"
@@ -0,0 +1,104 @@
+"""
+Tests for the pre-serialized response cache
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import grpc
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "gen"))
+
+from src.response_cache import ResponseCache, ResponseCacheInterceptor
+from yfinance_grpc.v1alpha1 import ticker_pb2
+
+GET_INFO = '/yfinance_grpc.v1alpha1.TickerService/GetInfo'
+
+
+def _intercept(interceptor, method, behavior):
+    handler = grpc.unary_unary_rpc_method_handler(
+        behavior,
+        request_deserializer=ticker_pb2.GetInfoRequest.FromString,
+        response_serializer=ticker_pb2.GetInfoResponse.SerializeToString,
+    )
+    return interceptor.intercept_service(lambda details: handler, Mock(method=method))
+
+
+def _ok_context():
+    context = Mock()
+    context.code.return_value = None
+    return context
+
+
+class TestResponseCache:
+    def test_get_returns_stored_bytes(self):
+        cache = ResponseCache()
+        cache.put('k', b'data', ttl=60)
+        assert cache.get('k') == b'data'
+        assert cache.hits == 1
+
+    def test_expired_entries_are_misses(self):
+        cache = ResponseCache()
+        with patch('src.response_cache.time.monotonic', return_value=100.0):
+            cache.put('k', b'data', ttl=10)
+        with patch('src.response_cache.time.monotonic', return_value=111.0):
+            assert cache.get('k') is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        cache = ResponseCache(max_entries=2)
+        cache.put('a', b'1', ttl=60)
+        cache.put('b', b'2', ttl=60)
+        cache.get('a')
+        cache.put('c', b'3', ttl=60)
+        assert cache.get('b') is None
+        assert cache.get('a') == b'1'
+
+    def test_snapshot_round_trip_drops_expired_entries(self):
+        cache = ResponseCache()
+        cache.put('fresh', b'1', ttl=60)
+        cache.put('stale', b'2', ttl=1)
+        snapshot = cache.snapshot()
+
+        restored = ResponseCache()
+        with patch('src.response_cache.time.time', side_effect=lambda: snapshot[0][1] - 30):
+            assert restored.restore(snapshot) == 1
+        assert restored.get('fresh') == b'1'
+        assert restored.get('stale') is None
+
+class TestResponseCacheInterceptor:
+    def test_hit_returns_cached_bytes_without_calling_servicer(self):
+        behavior = Mock(return_value=ticker_pb2.GetInfoResponse(info=ticker_pb2.TickerInfo(symbol='AAPL')))
+        handler = _intercept(ResponseCacheInterceptor(ResponseCache()), GET_INFO, behavior)
+
+        first = handler.unary_unary(ticker_pb2.GetInfoRequest(ticker='AAPL'), _ok_context())
+        second = handler.unary_unary(ticker_pb2.GetInfoRequest(ticker=' aapl '), _ok_context())
+
+        assert behavior.call_count == 1
+        assert first == second
+        assert handler.response_serializer(second) is second
+        assert ticker_pb2.GetInfoResponse.FromString(second).info.symbol == 'AAPL'
+
+    def test_error_responses_are_not_cached(self):
+        behavior = Mock(return_value=ticker_pb2.GetInfoResponse())
+        handler = _intercept(ResponseCacheInterceptor(ResponseCache()), GET_INFO, behavior)
+        context = Mock()
+        context.code.return_value = grpc.StatusCode.INTERNAL
+
+        handler.unary_unary(ticker_pb2.GetInfoRequest(ticker='AAPL'), context)
+        handler.unary_unary(ticker_pb2.GetInfoRequest(ticker='AAPL'), context)
+
+        assert behavior.call_count == 2
+
+    def test_uncached_methods_pass_through(self):
+        behavior = Mock()
+        handler = _intercept(
+            ResponseCacheInterceptor(ResponseCache()),
+            '/yfinance_grpc.v1alpha1.TickerService/GetNews',
+            behavior,
+        )
+        assert handler.unary_unary is behavior
@@ -0,0 +1,196 @@
+"""
+Tests for upstream retries and hedging
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "gen"))
+
+from src.retry import LatencyTracker, RetryBudget, RetryPolicy, Upstream, backoff_delay
+from tests.helpers import servicer_context
+
+_FAST = RetryPolicy(max_attempts=3, base_delay=0.001, max_delay=0.001)
+
+
+def _flaky(failures, result="ok", error=ConnectionError):
+    calls = []
+
+    def fn():
+        calls.append(1)
+        if len(calls) <= failures:
+            raise error("upstream down")
+        return result
+
+    return fn, calls
+
+
+class TestBackoff:
+    def test_delay_is_jittered_under_a_doubling_cap(self):
+        policy = RetryPolicy(base_delay=0.1, max_delay=0.3)
+        for attempt, cap in ((1, 0.1), (2, 0.2), (3, 0.3), (6, 0.3)):
+            assert all(0 <= backoff_delay(policy, attempt) <= cap for _ in range(50))
+
+
+class TestRetryBudget:
+    def test_spends_reserve_then_refills_per_first_attempt(self):
+        budget = RetryBudget(ratio=0.5, reserve=1)
+
+        assert budget.withdraw()
+        assert not budget.withdraw()
+        budget.deposit()
+        budget.deposit()
+        assert budget.withdraw()
+        assert (budget.spent, budget.denied) == (2, 1)
+
+
+class TestLatencyTracker:
+    def test_percentile_needs_min_samples(self):
+        tracker = LatencyTracker(min_samples=10)
+        for i in range(9):
+            tracker.record(i / 100)
+        assert tracker.percentile(0.95) is None
+
+        tracker.record(1.0)
+        assert tracker.percentile(0.95) == 1.0
+        assert tracker.percentile(0.5) == 0.05
+
+
+class TestUpstreamRetry:
+    def test_retries_network_errors(self):
+        fn, calls = _flaky(2)
+
+        assert Upstream(_FAST).call(servicer_context(), fn) == "ok"
+        assert len(calls) == 3
+
+    def test_gives_up_after_max_attempts(self):
+        fn, calls = _flaky(5)
+
+        with pytest.raises(ConnectionError):
+            Upstream(_FAST).call(None, fn)
+        assert len(calls) == 3
+
+    def test_other_errors_are_not_retried(self):
+        fn, calls = _flaky(1, error=ValueError)
+
+        with pytest.raises(ValueError):
+            Upstream(_FAST).call(servicer_context(), fn)
+        assert len(calls) == 1
+
+    def test_does_not_retry_past_the_deadline(self):
+        fn, calls = _flaky(1)
+        upstream = Upstream(RetryPolicy(base_delay=1.0, max_delay=1.0))
+
+        with pytest.raises(ConnectionError):
+            # Full jitter can draw a tiny delay, so leave no time at all
+            upstream.call(servicer_context(remaining=0.0), fn)
+        assert len(calls) == 1
+
+    def test_does_not_retry_for_a_cancelled_client(self):
+        fn, calls = _flaky(1)
+
+        with pytest.raises(ConnectionError):
+            Upstream(_FAST).call(servicer_context(active=False), fn)
+        assert len(calls) == 1
+
+    def test_exhausted_budget_stops_retries(self):
+        upstream = Upstream(_FAST, retry_budget=RetryBudget(ratio=0, reserve=1))
+        fn, calls = _flaky(10)
+
+        with pytest.raises(ConnectionError):
+            upstream.call(None, fn)
+        assert len(calls) == 2
+
+
+class TestUpstreamHedging:
+    def test_slow_call_is_hedged_and_first_reply_wins(self):
+        upstream = Upstream(_FAST, hedging=True, hedge_delay=0.02)
+        release = threading.Event()
+        calls = []
+
+        def fn():
+            calls.append(1)
+            if len(calls) == 1:
+                release.wait(5)
+                return "slow"
+            return "fast"
+
+        try:
+            started = time.monotonic()
+            assert upstream.call(servicer_context(), fn, name='GetFastInfo', hedge=True) == "fast"
+            assert time.monotonic() - started < 1
+            assert len(calls) == 2
+        finally:
+            release.set()
+            upstream.shutdown()
+
+    def test_fast_call_is_not_hedged(self):
+        upstream = Upstream(_FAST, hedging=True, hedge_delay=1.0)
+        fn, calls = _flaky(0)
+
+        try:
+            assert upstream.call(servicer_context(), fn, name='GetFastInfo', hedge=True) == "ok"
+            assert len(calls) == 1
+            assert upstream.hedge_budget.spent == 0
+        finally:
+            upstream.shutdown()
+
+    def test_hedging_disabled_runs_inline(self):
+        upstream = Upstream(_FAST)
+        thread = []
+
+        upstream.call(servicer_context(), lambda: thread.append(threading.current_thread()), hedge=True)
+
+        assert thread == [threading.current_thread()]
+
+    def test_saturated_pool_runs_calls_inline(self):
+        upstream = Upstream(_FAST, hedging=True, hedge_delay=0.01, max_hedge_workers=1)
+        release = threading.Event()
+        threads = []
+
+        def slow():
+            threads.append(threading.current_thread())
+            release.wait(5)
+            return "slow"
+
+        def fast():
+            threads.append(threading.current_thread())
+            return "fast"
+
+        try:
+            # The only worker is taken by a slow call, which cannot be hedged either
+            background = threading.Thread(target=upstream.call, args=(servicer_context(), slow), kwargs={'hedge': True})
+            background.start()
+            while not threads:
+                time.sleep(0.001)
+
+            assert upstream.call(servicer_context(), fast, name='GetFastInfo', hedge=True) == "fast"
+            assert threads[1] == threading.current_thread()
+            time.sleep(0.05)
+            assert len(threads) == 2
+        finally:
+            release.set()
+            background.join()
+            upstream.shutdown()
+
+    def test_no_hedge_without_budget(self):
+        upstream = Upstream(_FAST, hedging=True, hedge_delay=0.01, hedge_budget=RetryBudget(ratio=0, reserve=0))
+        calls = []
+
+        def fn():
+            calls.append(1)
+            time.sleep(0.05)
+            return "ok"
+
+        try:
+            assert upstream.call(servicer_context(), fn, name='GetFastInfo', hedge=True) == "ok"
+            assert len(calls) == 1
+        finally:
+            upstream.shutdown()
@@ -6,13 +6,15 @@ They use mocking to avoid hitting the actual Yahoo Finance API.
 """
 
 import sys
+from types import SimpleNamespace
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, PropertyMock
 from datetime import datetime
 
 import pytest
 import pandas as pd
 import grpc
+from google.protobuf.field_mask_pb2 import FieldMask
 from google.protobuf.timestamp_pb2 import Timestamp
 
 # Add project root to path
@@ -20,8 +22,15 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 sys.path.insert(0, str(project_root / "gen"))
 
-from src.server import TickerServiceServicer, datetime_to_timestamp, safe_float, safe_int, safe_str
+from src.bar_archive import BarArchive
+from src.breaker import NegativeCache
+from src.quotes import QuoteHub
+from src.retry import RetryPolicy, Upstream
+from src.bulkhead import BulkheadConfig
+from src.server import (TickerServiceServicer, _bar_rows, _history_rows, _server_workers, datetime_to_timestamp,
+                        safe_float, safe_int, safe_str)
 from yfinance_grpc.v1alpha1 import ticker_pb2
+from tests.helpers import servicer_context
 
 
 class TestHelperFunctions:
@@ -85,6 +94,16 @@ class TestHelperFunctions:
         assert safe_str(None) == ""
         assert safe_str(float('nan')) == ""
 
+    def test_server_workers_fit_the_bulkheads(self, caplog):
+        """Test that max_workers is raised, with a warning, when the bulkheads need more threads"""
+        bulkheads = {'ticker': BulkheadConfig(8, 8)}
+
+        assert _server_workers(None, bulkheads) == 20
+        assert _server_workers(32, bulkheads) == 32
+        assert not caplog.records
+        assert _server_workers(10, bulkheads) == 20
+        assert "max_workers=10 is too few" in caplog.text
+
 
 class TestTickerServiceGetInfo:
     """Test GetInfo endpoint"""
@@ -114,7 +133,7 @@ class TestTickerServiceGetInfo:
         
         # Create servicer and call
         servicer = TickerServiceServicer()
-        context = Mock()
+        context = servicer_context()
         request = ticker_pb2.GetInfoRequest(ticker="AAPL")
         
         response = servicer.GetInfo(request, context)
@@ -133,7 +152,7 @@ class TestTickerServiceGetInfo:
         mock_ticker_class.side_effect = Exception("API Error")
         
         servicer = TickerServiceServicer()
-        context = Mock()
+        context = servicer_context()
         request = ticker_pb2.GetInfoRequest(ticker="INVALID")
         
         response = servicer.GetInfo(request, context)
@@ -142,6 +161,130 @@ class TestTickerServiceGetInfo:
         context.set_code.assert_called_once_with(grpc.StatusCode.INTERNAL)
         context.set_details.assert_called_once()
 
+    @patch('src.server.yf.Ticker')
+    def test_get_info_unknown_symbol(self, mock_ticker_class):
+        """Test GetInfo answers NOT_FOUND and remembers symbols Yahoo has no quote for"""
+        mock_ticker_class.return_value = Mock(info={'trailingPegRatio': None})
+        negative_cache = NegativeCache()
+        servicer = TickerServiceServicer(negative_cache=negative_cache)
+        context = servicer_context()
+
+        servicer.GetInfo(ticker_pb2.GetInfoRequest(ticker="NOSUCH"), context)
+
+        context.set_code.assert_called_once_with(grpc.StatusCode.NOT_FOUND)
+        assert "NOSUCH" in negative_cache
+
+    @patch('src.server.yf.Ticker')
+    def test_get_info_read_mask(self, mock_ticker_class):
+        """Test GetInfo only populates fields named in read_mask"""
+        mock_ticker = Mock()
+        mock_ticker_class.return_value = mock_ticker
+        mock_ticker.info = {
+            'symbol': 'AAPL',
+            'longName': 'Apple Inc.',
+            'longBusinessSummary': 'Apple designs smartphones...',
+            'currentPrice': 150.0,
+            'marketCap': 2500000000000,
+        }
+
+        servicer = TickerServiceServicer()
+        context = servicer_context()
+        request = ticker_pb2.GetInfoRequest(
+            ticker="AAPL",
+            read_mask=FieldMask(paths=["current_price", "market_cap"]),
+            freshness=ticker_pb2.INFO_FRESHNESS_FULL,
+        )
+
+        response = servicer.GetInfo(request, context)
+
+        assert response.source == ticker_pb2.INFO_SOURCE_FULL
+        assert response.info.current_price == 150.0
+        assert response.info.market_cap == 2500000000000
+        assert response.info.long_name == ''
+        assert response.info.long_business_summary == ''
+        assert response.info.price_hint == 0
+        context.set_code.assert_not_called()
+
+    @patch('src.server.yf.Ticker')
+    def test_get_info_unknown_read_mask_path(self, mock_ticker_class):
+        """Test GetInfo rejects read_mask paths that are not TickerInfo fields"""
+        servicer = TickerServiceServicer()
+        context = servicer_context()
+        request = ticker_pb2.GetInfoRequest(
+            ticker="AAPL",
+            read_mask=FieldMask(paths=["current_price", "not_a_field"]),
+        )
+
+        servicer.GetInfo(request, context)
+
+        context.set_code.assert_called_once_with(grpc.StatusCode.INVALID_ARGUMENT)
+        assert "not_a_field" in context.set_details.call_args[0][0]
+        mock_ticker_class.assert_not_called()
+
+    @patch('src.server.yf.Ticker')
+    def test_get_info_price_mask_uses_fast_info(self, mock_ticker_class):
+        """Test GetInfo serves price-only masks from fast_info without ticker.info"""
+        mock_ticker = Mock()
+        mock_ticker_class.return_value = mock_ticker
+        type(mock_ticker).info = property(lambda self: pytest.fail("ticker.info should not be fetched"))
+        mock_ticker.get_fast_info.return_value = Mock(last_price=151.5, market_cap=2500000000000)
+
+        servicer = TickerServiceServicer()
+        context = servicer_context()
+        request = ticker_pb2.GetInfoRequest(
+            ticker="AAPL",
+            read_mask=FieldMask(paths=["symbol", "current_price", "market_cap"]),
+        )
+
+        response = servicer.GetInfo(request, context)
+
+        assert response.source == ticker_pb2.INFO_SOURCE_FAST
+        assert response.info.symbol == 'AAPL'
+        assert response.info.current_price == 151.5
+        assert response.info.market_cap == 2500000000000
+        context.set_code.assert_not_called()
+
+    @patch('src.server.yf.Ticker')
+    def test_get_info_fundamentals_mask_uses_full_info(self, mock_ticker_class):
+        """Test GetInfo falls back to ticker.info when a masked field needs fundamentals"""
+        mock_ticker = Mock()
+        mock_ticker_class.return_value = mock_ticker
+        mock_ticker.info = {'currentPrice': 150.0, 'trailingPE': 25.5}
+
+        servicer = TickerServiceServicer()
+        context = servicer_context()
+        request = ticker_pb2.GetInfoRequest(
+            ticker="AAPL",
+            read_mask=FieldMask(paths=["current_price", "trailing_pe"]),
+        )
+
+        response = servicer.GetInfo(request, context)
+
+        assert response.source == ticker_pb2.INFO_SOURCE_FULL
+        assert response.info.trailing_pe == 25.5
+        mock_ticker.get_fast_info.assert_not_called()
+
+    @patch('src.server.yf.Ticker')
+    def test_get_info_fast_freshness_skips_unavailable_fields(self, mock_ticker_class):
+        """Test INFO_FRESHNESS_FAST leaves fields fast_info cannot supply unset"""
+        mock_ticker = Mock()
+        mock_ticker_class.return_value = mock_ticker
+        mock_ticker.get_fast_info.return_value = Mock(last_price=151.5)
+
+        servicer = TickerServiceServicer()
+        context = servicer_context()
+        request = ticker_pb2.GetInfoRequest(
+            ticker="AAPL",
+            read_mask=FieldMask(paths=["current_price", "trailing_pe"]),
+            freshness=ticker_pb2.INFO_FRESHNESS_FAST,
+        )
+
+        response = servicer.GetInfo(request, context)
+
+        assert response.source == ticker_pb2.INFO_SOURCE_FAST
+        assert response.info.current_price == 151.5
+        assert response.info.trailing_pe == 0.0
+
 
 class TestTickerServiceGetHistory:
     """Test GetHistory endpoint"""
@@ -166,7 +309,7 @@ class TestTickerServiceGetHistory:
         
         # Create servicer and call
         servicer = TickerServiceServicer()
-        context = Mock()
+        context = servicer_context()
         request = ticker_pb2.GetHistoryRequest(
             ticker="AAPL",
             period="3d",
@@ -182,6 +325,162 @@ class TestTickerServiceGetHistory:
         assert response.rows[0].close == 104.0
         assert response.rows[0].volume == 1000000
 
+    @patch('src.server.yf.Ticker')
+    def test_get_history_unknown_symbol(self, mock_ticker_class):
+        """Test GetHistory answers NOT_FOUND and remembers symbols Yahoo has no chart for"""
+        mock_ticker_class.return_value.history.return_value = pd.DataFrame()
+        mock_ticker_class.return_value.get_history_metadata.return_value = {}
+        negative_cache = NegativeCache()
+        servicer = TickerServiceServicer(negative_cache=negative_cache)
+        context = servicer_context()
+
+        servicer.GetHistory(ticker_pb2.GetHistoryRequest(ticker="NOSUCH", period="1mo"), context)
+
+        context.set_code.assert_called_once_with(grpc.StatusCode.NOT_FOUND)
+        assert "NOSUCH" in negative_cache
+
+    @patch('src.server.yf.Ticker')
+    def test_get_history_empty_range_is_not_unknown(self, mock_ticker_class):
+        """Test GetHistory returns no rows for a known symbol with no bars in range"""
+        mock_ticker_class.return_value.history.return_value = pd.DataFrame()
+        mock_ticker_class.return_value.get_history_metadata.return_value = {'currency': 'USD'}
+        context = servicer_context()
+
+        response = TickerServiceServicer().GetHistory(ticker_pb2.GetHistoryRequest(ticker="AAPL", period="1d"),
+                                                      context)
+
+        context.set_code.assert_not_called()
+        assert len(response.rows) == 0
+
+
+class TestTickerServiceBarArchive:
+    """Test serving GetHistory and DownloadHistory ranges from the bar archive"""
+
+    @staticmethod
+    def _history(tz='America/New_York'):
+        dates = pd.date_range('2024-01-02', periods=5, freq='D', tz=tz)
+        return pd.DataFrame({
+            'Open': [100.0, 101.0, 102.0, 103.0, 104.0],
+            'High': [105.0, 106.0, 107.0, 108.0, 109.0],
+            'Low': [99.0, 100.0, 101.0, 102.0, 103.0],
+            'Close': [104.0, 105.0, 106.0, 107.0, 108.0],
+            'Volume': [1000, 1100, 1200, 1300, 1400],
+            'Dividends': [0.0, 0.0, 0.24, 0.0, 0.0],
+            'Stock Splits': [0.0] * 5,
+        }, index=dates)
+
+    @staticmethod
+    def _range(**kwargs):
+        start, end = Timestamp(), Timestamp()
+        start.FromDatetime(datetime(2024, 1, 2))
+        end.FromDatetime(datetime(2024, 1, 7))
+        # Only unadjusted bars are archived
+        return dict({'start': start, 'end': end, 'auto_adjust': False}, **kwargs)
+
+    @patch('src.server.yf.Ticker')
+    def test_get_history_range_is_served_from_archive(self, mock_ticker_class, tmp_path):
+        mock_ticker = Mock()
+        mock_ticker_class.return_value = mock_ticker
+        mock_ticker.history.return_value = self._history()
+        servicer = TickerServiceServicer(bar_archive=BarArchive(str(tmp_path)))
+        request = ticker_pb2.GetHistoryRequest(ticker="AAPL", interval="1d", **self._range())
+
+        fetched = servicer.GetHistory(request, servicer_context())
+        archived = servicer.GetHistory(request, servicer_context())
+
+        assert mock_ticker.history.call_count == 1
+        assert archived == fetched
+        assert archived.rows[2].dividends == 0.24
+
+    @patch('src.server.yf.Ticker')
+    def test_get_history_with_special_options_bypasses_archive(self, mock_ticker_class, tmp_path):
+        mock_ticker = Mock()
+        mock_ticker_class.return_value = mock_ticker
+        mock_ticker.history.return_value = self._history()
+        servicer = TickerServiceServicer(bar_archive=BarArchive(str(tmp_path)))
+        request = ticker_pb2.GetHistoryRequest(ticker="AAPL", interval="1d", prepost=True, **self._range())
+
+        servicer.GetHistory(request, servicer_context())
+        servicer.GetHistory(request, servicer_context())
+
+        assert mock_ticker.history.call_count == 2
+        assert list(tmp_path.iterdir()) == []
+
+    @patch('src.server.yf.Ticker')
+    def test_adjusted_history_bypasses_archive(self, mock_ticker_class, tmp_path):
+        mock_ticker = Mock()
+        mock_ticker_class.return_value = mock_ticker
+        mock_ticker.history.return_value = self._history()
+        servicer = TickerServiceServicer(bar_archive=BarArchive(str(tmp_path)))
+        request = ticker_pb2.GetHistoryRequest(ticker="AAPL", interval="1d", **self._range(auto_adjust=True))
+
+        servicer.GetHistory(request, servicer_context())
+        servicer.GetHistory(request, servicer_context())
+
+        assert mock_ticker.history.call_count == 2
+        assert list(tmp_path.iterdir()) == []
+
+    @patch('src.server.yf.download')
+    @patch('src.server.yf.Ticker')
+    def test_download_history_is_served_from_archive(self, mock_ticker_class, mock_download, tmp_path):
+        mock_ticker = Mock()
+        mock_ticker_class.return_value = mock_ticker
+        mock_ticker.history.return_value = self._history()
+        servicer = TickerServiceServicer(bar_archive=BarArchive(str(tmp_path)))
+        request = ticker_pb2.GetHistoryRequest(ticker="AAPL", interval="1d", **self._range())
+        servicer.GetHistory(request, servicer_context())
+        # yf.download leaves daily bars as naive exchange-local dates
+        mock_download.return_value = self._history(tz=None).drop(columns=['Dividends', 'Stock Splits'])
+        request = ticker_pb2.DownloadHistoryRequest(tickers=["AAPL"], interval="1d", **self._range())
+
+        downloaded = list(servicer.DownloadHistory(request, servicer_context()))
+        mock_download.reset_mock()
+        archived = list(servicer.DownloadHistory(request, servicer_context()))
+
+        mock_download.assert_not_called()
+        assert archived == downloaded
+        assert len(archived[0].rows) == 5
+
+    @patch('src.server.yf.download')
+    def test_download_history_archives_after_streaming(self, mock_download, tmp_path):
+        mock_download.return_value = self._history(tz=None).drop(columns=['Dividends', 'Stock Splits'])
+        servicer = TickerServiceServicer(bar_archive=BarArchive(str(tmp_path)))
+        servicer._archive_bars = Mock()
+        request = ticker_pb2.DownloadHistoryRequest(tickers=["AAPL"], interval="1d", **self._range())
+        context = servicer_context()
+
+        responses = servicer.DownloadHistory(request, context)
+        first = next(responses)
+
+        assert len(first.rows) == 5
+        servicer._archive_bars.assert_not_called()
+        assert list(responses) == []
+        servicer._archive_bars.assert_called_once()
+
+    @patch('src.server.yf.Ticker')
+    def test_archived_download_converts_one_batch_at_a_time(self, mock_ticker_class, tmp_path):
+        history = pd.concat([self._history()] * 240)
+        history.index = pd.date_range('2020-01-02', periods=len(history), freq='D', tz='America/New_York')
+        mock_ticker_class.return_value.history.return_value = history
+        servicer = TickerServiceServicer(bar_archive=BarArchive(str(tmp_path)))
+        start, end = Timestamp(), Timestamp()
+        start.FromDatetime(datetime(2020, 1, 2))
+        end.FromDatetime(datetime(2023, 4, 27))
+        servicer.GetHistory(ticker_pb2.GetHistoryRequest(
+            ticker="AAPL", interval="1d", start=start, end=end, auto_adjust=False), servicer_context())
+        request = ticker_pb2.DownloadHistoryRequest(
+            tickers=["AAPL"], interval="1d", start=start, end=end, auto_adjust=False)
+        context = servicer_context()
+
+        with patch('src.server._bar_rows', wraps=_bar_rows) as bar_rows:
+            responses = servicer.DownloadHistory(request, context)
+            first = next(responses)
+            assert bar_rows.call_count == 1
+            rest = list(responses)
+
+        assert [len(response.rows) for response in [first] + rest] == [500, 500, 200]
+        assert bar_rows.call_count == 3
+
 
 class TestTickerServiceGetDividends:
     """Test GetDividends endpoint"""
@@ -199,7 +498,7 @@ class TestTickerServiceGetDividends:
         mock_ticker.get_dividends.return_value = mock_dividends
         
         servicer = TickerServiceServicer()
-        context = Mock()
+        context = servicer_context()
         request = ticker_pb2.GetDividendsRequest(ticker="AAPL", period="1y")
         
         response = servicer.GetDividends(request, context)
@@ -209,6 +508,28 @@ class TestTickerServiceGetDividends:
         mock_ticker.get_dividends.assert_called_once_with(period="1y")
 
 
+class TestTickerServiceGetActions:
+    """Test GetActions endpoint"""
+
+    @patch('src.server.yf.Ticker')
+    def test_get_actions_sets_only_positive_values(self, mock_ticker_class):
+        """Actions are converted by column; zero and missing values leave the fields unset"""
+        mock_ticker = Mock()
+        mock_ticker_class.return_value = mock_ticker
+        dates = pd.DatetimeIndex(['2024-02-09', '2024-06-10'], tz='America/New_York')
+        mock_ticker.get_actions.return_value = pd.DataFrame(
+            {'Dividends': [0.24, 0.0], 'Stock Splits': [float('nan'), 4.0]}, index=dates
+        )
+
+        servicer = TickerServiceServicer()
+        response = servicer.GetActions(ticker_pb2.GetActionsRequest(ticker="AAPL"), servicer_context())
+
+        assert len(response.rows) == 2
+        assert response.rows[0].date.ToSeconds() == int(dates[0].timestamp())
+        assert response.rows[0].HasField('dividends') and not response.rows[0].HasField('stock_splits')
+        assert response.rows[1].stock_splits == 4.0 and not response.rows[1].HasField('dividends')
+
+
 class TestTickerServiceGetRecommendations:
     """Test GetRecommendations endpoint"""
 
@@ -235,7 +556,7 @@ class TestTickerServiceGetRecommendations:
         mock_ticker.upgrades_downgrades = mock_recs
         
         servicer = TickerServiceServicer()
-        context = Mock()
+        context = servicer_context()
         request = ticker_pb2.GetRecommendationsRequest(ticker="AAPL")
         
         response = servicer.GetRecommendations(request, context)
@@ -255,7 +576,7 @@ class TestTickerServiceGetRecommendations:
         mock_ticker.upgrades_downgrades = pd.DataFrame()
         
         servicer = TickerServiceServicer()
-        context = Mock()
+        context = servicer_context()
         request = ticker_pb2.GetRecommendationsRequest(ticker="AAPL")
         
         response = servicer.GetRecommendations(request, context)
@@ -313,7 +634,7 @@ class TestTickerServiceGetNews:
         mock_ticker.news = mock_news
         
         servicer = TickerServiceServicer()
-        context = Mock()
+        context = servicer_context()
         request = ticker_pb2.GetNewsRequest(ticker="AAPL", count=5)
         
         response = servicer.GetNews(request, context)
@@ -351,7 +672,7 @@ class TestTickerServiceGetNews:
         mock_ticker.news = mock_news
 
         servicer = TickerServiceServicer()
-        context = Mock()
+        context = servicer_context()
         request = ticker_pb2.GetNewsRequest(ticker="AAPL", count=5)
 
         response = servicer.GetNews(request, context)
@@ -382,7 +703,7 @@ class TestTickerServiceGetNews:
         mock_ticker.news = mock_news
         
         servicer = TickerServiceServicer()
-        context = Mock()
+        context = servicer_context()
         request = ticker_pb2.GetNewsRequest(ticker="AAPL", count=3)
         
         response = servicer.GetNews(request, context)
@@ -402,7 +723,7 @@ class TestTickerServiceGetOptions:
         mock_ticker.options = ('2025-11-15', '2025-12-20', '2026-01-17')
         
         servicer = TickerServiceServicer()
-        context = Mock()
+        context = servicer_context()
         request = ticker_pb2.GetOptionsRequest(ticker="AAPL")
         
         response = servicer.GetOptions(request, context)
@@ -447,7 +768,7 @@ class TestTickerServiceGetOptionChain:
         mock_ticker.option_chain.return_value = mock_chain
         
         servicer = TickerServiceServicer()
-        context = Mock()
+        context = servicer_context()
         request = ticker_pb2.GetOptionChainRequest(
             ticker="AAPL",
             date="2025-11-15"  # Field name is 'date', not 'expiration_date'
@@ -496,7 +817,7 @@ class TestTickerServiceGetMultipleInfo:
         }
         
         servicer = TickerServiceServicer()
-        context = Mock()
+        context = servicer_context()
         request = ticker_pb2.GetMultipleInfoRequest(tickers=["AAPL", "MSFT"])
         
         response = servicer.GetMultipleInfo(request, context)
@@ -507,6 +828,45 @@ class TestTickerServiceGetMultipleInfo:
         assert response.info['AAPL'].long_name == 'Apple Inc.'
         assert response.info['MSFT'].long_name == 'Microsoft Corporation'
 
+    @patch('src.server.yf.Tickers')
+    def test_get_multiple_info_read_mask(self, mock_tickers_class):
+        """Test GetMultipleInfo applies read_mask to every ticker"""
+        mock_tickers = Mock()
+        mock_tickers_class.return_value = mock_tickers
+        mock_aapl = Mock()
+        mock_aapl.info = {'symbol': 'AAPL', 'longName': 'Apple Inc.', 'currentPrice': 150.0}
+        mock_msft = Mock()
+        mock_msft.info = {'symbol': 'MSFT', 'longName': 'Microsoft Corporation', 'currentPrice': 300.0}
+        mock_tickers.tickers = {'AAPL': mock_aapl, 'MSFT': mock_msft}
+
+        servicer = TickerServiceServicer()
+        context = servicer_context()
+        request = ticker_pb2.GetMultipleInfoRequest(
+            tickers=["AAPL", "MSFT"],
+            read_mask=FieldMask(paths=["symbol", "current_price"]),
+            freshness=ticker_pb2.INFO_FRESHNESS_FULL,
+        )
+
+        response = servicer.GetMultipleInfo(request, context)
+
+        assert response.info['AAPL'].symbol == 'AAPL'
+        assert response.info['AAPL'].current_price == 150.0
+        assert response.info['MSFT'].current_price == 300.0
+        assert response.info['MSFT'].long_name == ''
+
+    @patch('src.server.yf.Tickers')
+    def test_get_multiple_info_skips_unknown_symbols(self, mock_tickers_class):
+        """Test GetMultipleInfo leaves out symbols in the negative cache"""
+        mock_tickers_class.return_value = Mock(tickers={'AAPL': Mock(info={'symbol': 'AAPL'}), 'NOSUCH': Mock()})
+        negative_cache = NegativeCache()
+        negative_cache.add('NOSUCH')
+        servicer = TickerServiceServicer(negative_cache=negative_cache)
+
+        request = ticker_pb2.GetMultipleInfoRequest(tickers=["AAPL", "NOSUCH"])
+        response = servicer.GetMultipleInfo(request, servicer_context())
+
+        assert list(response.info) == ['AAPL']
+
 
 class TestTickerServiceDownloadHistory:
     """Test DownloadHistory endpoint"""
@@ -526,7 +886,7 @@ class TestTickerServiceDownloadHistory:
         mock_download.return_value = mock_data
         
         servicer = TickerServiceServicer()
-        context = Mock()
+        context = servicer_context()
         request = ticker_pb2.DownloadHistoryRequest(
             tickers=["AAPL"],
             period="3d",
@@ -561,7 +921,7 @@ class TestTickerServiceDownloadHistory:
         mock_download.return_value = mock_data
         
         servicer = TickerServiceServicer()
-        context = Mock()
+        context = servicer_context()
         request = ticker_pb2.DownloadHistoryRequest(
             tickers=["AAPL", "MSFT"],
             period="2d",
@@ -620,7 +980,7 @@ class TestTickerServiceGetIsin:
         mock_ticker.get_isin.return_value = "US0378331005"
 
         servicer = TickerServiceServicer()
-        response = servicer.GetIsin(ticker_pb2.GetIsinRequest(ticker="AAPL"), Mock())
+        response = servicer.GetIsin(ticker_pb2.GetIsinRequest(ticker="AAPL"), servicer_context())
 
         assert response.isin == "US0378331005"
 
@@ -631,7 +991,7 @@ class TestTickerServiceGetIsin:
         mock_ticker.get_isin.return_value = None
 
         servicer = TickerServiceServicer()
-        response = servicer.GetIsin(ticker_pb2.GetIsinRequest(ticker="AAPL"), Mock())
+        response = servicer.GetIsin(ticker_pb2.GetIsinRequest(ticker="AAPL"), servicer_context())
 
         assert response.isin == ""
 
@@ -668,13 +1028,43 @@ class TestTickerServiceGetFastInfo:
         mock_ticker.get_fast_info.return_value = fi
 
         servicer = TickerServiceServicer()
-        response = servicer.GetFastInfo(ticker_pb2.GetFastInfoRequest(ticker="AAPL"), Mock())
+        response = servicer.GetFastInfo(ticker_pb2.GetFastInfoRequest(ticker="AAPL"), servicer_context())
 
         assert response.info.currency == "USD"
         assert response.info.last_price == pytest.approx(175.5)
         assert response.info.market_cap == 2_500_000_000_000
         assert response.info.quote_type == "EQUITY"
 
+    @patch('src.server.yf.Ticker')
+    def test_get_fast_info_retries_network_errors(self, mock_ticker_class):
+        mock_ticker_class.return_value.get_fast_info.side_effect = [
+            ConnectionError("reset by peer"),
+            SimpleNamespace(currency="USD", last_price=175.5),
+        ]
+        servicer = TickerServiceServicer(upstream=Upstream(RetryPolicy(base_delay=0.001)))
+        context = servicer_context()
+
+        response = servicer.GetFastInfo(ticker_pb2.GetFastInfoRequest(ticker="AAPL"), context)
+
+        context.set_code.assert_not_called()
+        assert response.info.currency == "USD"
+        assert mock_ticker_class.return_value.get_fast_info.call_count == 2
+
+    @patch('src.server.yf.Ticker')
+    def test_get_fast_info_unknown_symbol(self, mock_ticker_class):
+        fast_info = Mock()
+        type(fast_info).currency = PropertyMock(side_effect=KeyError('currency'))
+        mock_ticker_class.return_value.get_fast_info.return_value = fast_info
+        mock_ticker_class.return_value.get_history_metadata.return_value = {}
+        negative_cache = NegativeCache()
+        servicer = TickerServiceServicer(negative_cache=negative_cache)
+        context = servicer_context()
+
+        servicer.GetFastInfo(ticker_pb2.GetFastInfoRequest(ticker="NOSUCH"), context)
+
+        context.set_code.assert_called_once_with(grpc.StatusCode.NOT_FOUND)
+        assert "NOSUCH" in negative_cache
+
 
 class TestTickerServiceGetSustainability:
     @patch('src.server.yf.Ticker')
@@ -717,6 +1107,26 @@ class TestTickerServiceGetSustainability:
         )
 
         assert response.total_esg == 0.0
+        assert response.etag
+
+    @patch('src.server.yf.Ticker')
+    def test_get_sustainability_if_none_match(self, mock_ticker_class):
+        mock_ticker = Mock()
+        mock_ticker_class.return_value = mock_ticker
+        mock_ticker.get_sustainability.return_value = {'totalEsg': 16.5, 'tobacco': True}
+
+        servicer = TickerServiceServicer()
+        first = servicer.GetSustainability(
+            ticker_pb2.GetSustainabilityRequest(ticker="AAPL"), Mock()
+        )
+        second = servicer.GetSustainability(
+            ticker_pb2.GetSustainabilityRequest(ticker="AAPL", if_none_match=first.etag), Mock()
+        )
+
+        assert first.not_modified is False
+        assert second.not_modified is True
+        assert second.etag == first.etag
+        assert second.total_esg == 0.0
 
 
 class TestTickerServiceGetInsiderPurchases:
@@ -1029,7 +1439,7 @@ class TestTickerServiceGetEarningsDates:
         mock_ticker.get_earnings_dates.return_value = pd.DataFrame()
 
         servicer = TickerServiceServicer()
-        servicer.GetEarningsDates(ticker_pb2.GetEarningsDatesRequest(ticker="AAPL"), Mock())
+        servicer.GetEarningsDates(ticker_pb2.GetEarningsDatesRequest(ticker="AAPL"), servicer_context())
 
         mock_ticker.get_earnings_dates.assert_called_once_with(limit=12)
 
@@ -1119,6 +1529,28 @@ class TestTickerServiceGetSecFilings:
 
         assert len(response.filings) == 0
 
+    @patch('src.server.yf.Ticker')
+    def test_get_sec_filings_etag_changes_with_content(self, mock_ticker_class):
+        mock_ticker = Mock()
+        mock_ticker_class.return_value = mock_ticker
+        mock_ticker.get_sec_filings.return_value = {
+            'filings': [{'date': '2024-11-01', 'type': '10-K', 'title': 'Annual Report'}]
+        }
+
+        servicer = TickerServiceServicer()
+        first = servicer.GetSecFilings(ticker_pb2.GetSecFilingsRequest(ticker="AAPL"), servicer_context())
+
+        mock_ticker.get_sec_filings.return_value = {
+            'filings': [{'date': '2025-02-01', 'type': '10-Q', 'title': 'Quarterly Report'}]
+        }
+        second = servicer.GetSecFilings(
+            ticker_pb2.GetSecFilingsRequest(ticker="AAPL", if_none_match=first.etag), Mock()
+        )
+
+        assert second.not_modified is False
+        assert second.etag != first.etag
+        assert second.filings[0].type == '10-Q'
+
 
 class TestTickerServiceEmptyTickers:
     """Test validation of empty tickers lists"""
@@ -1126,7 +1558,7 @@ class TestTickerServiceEmptyTickers:
     def test_download_history_empty_tickers_returns_invalid_argument(self):
         """Test DownloadHistory with empty tickers returns INVALID_ARGUMENT"""
         servicer = TickerServiceServicer()
-        context = Mock()
+        context = servicer_context()
         request = ticker_pb2.DownloadHistoryRequest(
             tickers=[],
             period="1d",
@@ -1143,7 +1575,7 @@ class TestTickerServiceEmptyTickers:
     def test_get_multiple_info_empty_tickers_returns_invalid_argument(self, mock_tickers_class):
         """Test GetMultipleInfo with empty tickers returns INVALID_ARGUMENT without calling yfinance"""
         servicer = TickerServiceServicer()
-        context = Mock()
+        context = servicer_context()
         request = ticker_pb2.GetMultipleInfoRequest(tickers=[])
 
         servicer.GetMultipleInfo(request, context)
@@ -1153,5 +1585,127 @@ class TestTickerServiceEmptyTickers:
         mock_tickers_class.assert_not_called()
 
 
+
+class TestTickerServiceSubscribeQuotes:
+    """Test SubscribeQuotes streaming"""
+
+    def test_subscribe_quotes_empty_tickers_returns_invalid_argument(self):
+        servicer = TickerServiceServicer(quote_hub=Mock())
+        context = servicer_context()
+
+        responses = list(servicer.SubscribeQuotes(ticker_pb2.SubscribeQuotesRequest(tickers=[" "]), context))
+
+        assert responses == []
+        context.set_code.assert_called_once_with(grpc.StatusCode.INVALID_ARGUMENT)
+        servicer.quote_hub.subscribe.assert_not_called()
+
+    def test_subscribe_quotes_streams_changed_fields(self):
+        hub = Mock(stopped=False)
+        subscription = Mock(closed=False)
+        subscription.next_updates.side_effect = [
+            {"AAPL": {"last_price": 101.0, "currency": "USD"}},
+            {},
+        ]
+        hub.subscribe.return_value = subscription
+        servicer = TickerServiceServicer(quote_hub=hub)
+        context = servicer_context()
+        context.is_active.side_effect = [True, True, False]
+
+        responses = list(servicer.SubscribeQuotes(
+            ticker_pb2.SubscribeQuotesRequest(tickers=["aapl", "AAPL"]), context
+        ))
+
+        hub.subscribe.assert_called_once_with(["AAPL"])
+        context.add_callback.assert_called_once_with(subscription.close)
+        hub.unsubscribe.assert_called_once_with(subscription)
+        assert len(responses) == 1
+        assert responses[0].quote.symbol == "AAPL"
+        assert responses[0].quote.last_price == 101.0
+        assert list(responses[0].changed_fields.paths) == ["currency", "last_price"]
+
+    def test_subscribe_quotes_ends_unavailable_when_hub_stops(self):
+        hub = QuoteHub(fetch=Mock(return_value={}))
+        hub._thread = Mock()
+        servicer = TickerServiceServicer(quote_hub=hub)
+        context = servicer_context()
+        context.is_active.return_value = True
+        stream = servicer.SubscribeQuotes(ticker_pb2.SubscribeQuotesRequest(tickers=["AAPL"]), context)
+
+        hub.stop()
+        responses = list(stream)
+
+        assert responses == []
+        context.set_code.assert_called_once_with(grpc.StatusCode.UNAVAILABLE)
+        assert hub.symbols == frozenset()
+
+
+class TestTickerServiceCancellation:
+    """Test that handlers stop upstream work once the client has gone away"""
+
+    @patch('src.server.yf.download')
+    def test_download_history_skips_download_when_cancelled(self, mock_download):
+        context = servicer_context()
+        context.is_active.return_value = False
+        request = ticker_pb2.DownloadHistoryRequest(tickers=["AAPL"], period="1y")
+
+        responses = list(TickerServiceServicer().DownloadHistory(request, context))
+
+        assert responses == []
+        mock_download.assert_not_called()
+        context.set_code.assert_called_once_with(grpc.StatusCode.CANCELLED)
+
+    @patch('src.server.yf.download')
+    def test_download_history_stops_between_batches(self, mock_download):
+        dates = pd.date_range('2020-01-01', periods=1200, freq='D')
+        mock_download.return_value = pd.DataFrame({
+            'Open': 1.0, 'High': 1.0, 'Low': 1.0, 'Close': 1.0, 'Volume': 1,
+        }, index=dates)
+        context = servicer_context()
+        # Active before and after the download, then cancelled after the first batch
+        context.is_active.side_effect = [True, True, False]
+        request = ticker_pb2.DownloadHistoryRequest(tickers=["AAPL"], period="5y")
+
+        responses = list(TickerServiceServicer().DownloadHistory(request, context))
+
+        assert len(responses) == 1
+        assert len(responses[0].rows) == 500
+        context.set_code.assert_called_once_with(grpc.StatusCode.CANCELLED)
+
+    @patch('src.server.yf.Ticker')
+    def test_get_history_stops_between_conversion_chunks(self, mock_ticker_class):
+        dates = pd.date_range('2020-01-01', periods=1200, freq='D')
+        mock_ticker_class.return_value.history.return_value = pd.DataFrame({
+            'Open': 1.0, 'High': 1.0, 'Low': 1.0, 'Close': 1.0, 'Volume': 1,
+        }, index=dates)
+        # The deadline passes while the first chunk is converted
+        context = servicer_context()
+        context.time_remaining.side_effect = [5.0, 0.0]
+        request = ticker_pb2.GetHistoryRequest(ticker="AAPL", period="5y")
+
+        with patch('src.server._history_rows', wraps=_history_rows) as history_rows:
+            response = TickerServiceServicer().GetHistory(request, context)
+
+        assert len(response.rows) == 0
+        assert history_rows.call_count == 1
+        context.set_code.assert_called_once_with(grpc.StatusCode.DEADLINE_EXCEEDED)
+
+    @patch('src.server.yf.Tickers')
+    def test_get_multiple_info_stops_at_deadline(self, mock_tickers_class):
+        first, second = Mock(), Mock()
+        first.info = {'symbol': 'AAPL'}
+        mock_tickers_class.return_value = Mock(tickers={'AAPL': first, 'MSFT': second})
+        context = servicer_context()
+        context.is_active.return_value = True
+        context.time_remaining.side_effect = [2.0, 0.0]
+        request = ticker_pb2.GetMultipleInfoRequest(
+            tickers=["AAPL", "MSFT"], freshness=ticker_pb2.INFO_FRESHNESS_FULL
+        )
+
+        response = TickerServiceServicer().GetMultipleInfo(request, context)
+
+        assert len(response.info) == 0
+        context.set_code.assert_called_once_with(grpc.StatusCode.DEADLINE_EXCEEDED)
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -0,0 +1,216 @@
+"""
+Tests for multiplexed Session streams
+"""
+
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import grpc
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "gen"))
+
+from src.breaker import CircuitBreakerInterceptor, NegativeCache
+from src.response_cache import ResponseCache, ResponseCacheInterceptor
+from src.server import TickerServiceServicer
+from src.session import SessionMultiplexer, session_handlers
+from yfinance_grpc.v1alpha1 import ticker_pb2
+
+
+def _context():
+    context = Mock()
+    context.is_active.return_value = True
+    return context
+
+
+class _Servicer:
+    """Answers GetNews immediately and blocks GetInfo until released"""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.info_started = threading.Event()
+        self.info_contexts = []
+
+    def GetInfo(self, request, context):
+        self.info_contexts.append(context)
+        self.info_started.set()
+        self.release.wait(5)
+        return ticker_pb2.GetInfoResponse(info=ticker_pb2.TickerInfo(symbol=request.ticker))
+
+    def GetNews(self, request, context):
+        return ticker_pb2.GetNewsResponse(articles=[ticker_pb2.NewsArticle(title=request.ticker)])
+
+    def GetOptionChain(self, request, context):
+        # Large chains come back already encoded by the conversion pool
+        contract = ticker_pb2.OptionContract(contract_symbol=request.ticker)
+        return ticker_pb2.GetOptionChainResponse(calls=[contract]).SerializeToString()
+
+    def GetHistory(self, request, context):
+        context.set_code(grpc.StatusCode.NOT_FOUND)
+        context.set_details("No data")
+        return ticker_pb2.GetHistoryResponse()
+
+
+class TestSessionMultiplexer:
+    def test_responses_are_tagged_and_out_of_order(self):
+        servicer = _Servicer()
+        requests = [
+            ticker_pb2.SessionRequest(request_id="1", info=ticker_pb2.GetInfoRequest(ticker="AAPL")),
+            ticker_pb2.SessionRequest(request_id="2", news=ticker_pb2.GetNewsRequest(ticker="MSFT")),
+        ]
+        stream = SessionMultiplexer(servicer, _context()).run(iter(requests))
+
+        first = next(stream)
+        servicer.release.set()
+        rest = list(stream)
+
+        assert first.request_id == "2"
+        assert first.news.articles[0].title == "MSFT"
+        assert [r.request_id for r in rest] == ["1"]
+        assert rest[0].info.info.symbol == "AAPL"
+
+    def test_encoded_results_are_embedded_as_messages(self):
+        requests = [
+            ticker_pb2.SessionRequest(request_id="1", option_chain=ticker_pb2.GetOptionChainRequest(ticker="AAPL")),
+        ]
+
+        responses = list(SessionMultiplexer(_Servicer(), _context()).run(iter(requests)))
+
+        assert responses[0].option_chain.calls[0].contract_symbol == "AAPL"
+
+    def test_cancel_answers_with_cancelled_and_drops_result(self):
+        servicer = _Servicer()
+        cancel_sent = threading.Event()
+
+        def requests():
+            yield ticker_pb2.SessionRequest(request_id="1", info=ticker_pb2.GetInfoRequest(ticker="AAPL"))
+            servicer.info_started.wait(5)
+            yield ticker_pb2.SessionRequest(request_id="1", cancel=ticker_pb2.SessionCancel())
+            cancel_sent.set()
+
+        stream = SessionMultiplexer(servicer, _context()).run(requests())
+        first = next(stream)
+        assert cancel_sent.wait(5)
+        assert not servicer.info_contexts[0].is_active()
+        servicer.release.set()
+        rest = list(stream)
+
+        assert first.request_id == "1"
+        assert first.error.code == grpc.StatusCode.CANCELLED.value[0]
+        assert rest == []
+
+    def test_servicer_errors_become_session_errors(self):
+        requests = [ticker_pb2.SessionRequest(request_id="h", history=ticker_pb2.GetHistoryRequest(ticker="XX"))]
+
+        responses = list(SessionMultiplexer(_Servicer(), _context()).run(iter(requests)))
+
+        assert len(responses) == 1
+        assert responses[0].WhichOneof('response') == 'error'
+        assert responses[0].error.code == grpc.StatusCode.NOT_FOUND.value[0]
+        assert responses[0].error.message == "No data"
+
+    def test_empty_and_duplicate_requests_are_rejected(self):
+        servicer = _Servicer()
+        requests = [
+            ticker_pb2.SessionRequest(request_id="a"),
+            ticker_pb2.SessionRequest(request_id="1", info=ticker_pb2.GetInfoRequest(ticker="AAPL")),
+            ticker_pb2.SessionRequest(request_id="1", info=ticker_pb2.GetInfoRequest(ticker="AAPL")),
+        ]
+        stream = SessionMultiplexer(servicer, _context()).run(iter(requests))
+
+        errors = [next(stream), next(stream)]
+        servicer.release.set()
+        rest = list(stream)
+
+        assert [(r.request_id, r.error.code) for r in errors] == [
+            ("a", grpc.StatusCode.INVALID_ARGUMENT.value[0]),
+            ("1", grpc.StatusCode.INVALID_ARGUMENT.value[0]),
+        ]
+        assert rest[0].info.info.symbol == "AAPL"
+
+    def test_requests_are_skipped_once_client_disconnects(self):
+        servicer = Mock()
+        context = Mock()
+        context.is_active.return_value = False
+        requests = [ticker_pb2.SessionRequest(request_id="n", news=ticker_pb2.GetNewsRequest(ticker="AAPL"))]
+
+        responses = list(SessionMultiplexer(servicer, context).run(iter(requests)))
+
+        assert responses == []
+        servicer.GetNews.assert_not_called()
+
+    def test_draining_refuses_new_requests_and_ends_after_in_flight(self):
+        servicer = _Servicer()
+        draining = threading.Event()
+
+        def requests():
+            yield ticker_pb2.SessionRequest(request_id="1", info=ticker_pb2.GetInfoRequest(ticker="AAPL"))
+            servicer.info_started.wait(5)
+            draining.set()
+            yield ticker_pb2.SessionRequest(request_id="2", news=ticker_pb2.GetNewsRequest(ticker="MSFT"))
+            # The client keeps its side open; the server ends the stream
+            threading.Event().wait(5)
+
+        stream = SessionMultiplexer(servicer, _context(), draining=draining).run(requests())
+        refused = next(stream)
+        servicer.release.set()
+        rest = list(stream)
+
+        assert refused.request_id == "2"
+        assert refused.error.code == grpc.StatusCode.UNAVAILABLE.value[0]
+        assert [r.request_id for r in rest] == ["1"]
+        assert rest[0].info.info.symbol == "AAPL"
+
+    def test_queued_requests_start_in_priority_order(self):
+        servicer = _Servicer()
+
+        def requests():
+            yield ticker_pb2.SessionRequest(request_id="1", info=ticker_pb2.GetInfoRequest(ticker="AAPL"))
+            servicer.info_started.wait(5)
+            yield ticker_pb2.SessionRequest(request_id="low", news=ticker_pb2.GetNewsRequest(ticker="A"))
+            yield ticker_pb2.SessionRequest(request_id="high", priority=5, news=ticker_pb2.GetNewsRequest(ticker="B"))
+            yield ticker_pb2.SessionRequest(request_id="next", news=ticker_pb2.GetNewsRequest(ticker="C"))
+            servicer.release.set()
+
+        responses = list(SessionMultiplexer(servicer, _context(), max_workers=1).run(requests()))
+
+        assert [r.request_id for r in responses] == ["1", "high", "low", "next"]
+
+    def test_requests_pass_through_interceptors(self):
+        servicer = Mock(wraps=_Servicer())
+        negative_cache = NegativeCache()
+        negative_cache.add("ZZZZ")
+        interceptors = [
+            ResponseCacheInterceptor(ResponseCache(), ttls={'/yfinance_grpc.v1alpha1.TickerService/GetNews': 60.0}),
+            CircuitBreakerInterceptor(negative_cache),
+        ]
+        requests = [
+            ticker_pb2.SessionRequest(request_id="1", news=ticker_pb2.GetNewsRequest(ticker="AAPL")),
+            ticker_pb2.SessionRequest(request_id="2", news=ticker_pb2.GetNewsRequest(ticker="AAPL")),
+            ticker_pb2.SessionRequest(request_id="3", news=ticker_pb2.GetNewsRequest(ticker="ZZZZ")),
+        ]
+        handlers = session_handlers(servicer, interceptors)
+
+        responses = list(SessionMultiplexer(servicer, _context(), max_workers=1, handlers=handlers).run(iter(requests)))
+
+        assert [r.news.articles[0].title for r in responses[:2]] == ["AAPL", "AAPL"]
+        assert responses[2].error.code == grpc.StatusCode.NOT_FOUND.value[0]
+        assert servicer.GetNews.call_count == 1
+
+
+class TestTickerServiceSession:
+    @patch('src.server.yf.Ticker')
+    def test_session_dispatches_to_servicer_methods(self, mock_ticker_class):
+        mock_ticker = Mock()
+        mock_ticker.news = [{"content": {"title": "Headline"}}]
+        mock_ticker_class.return_value = mock_ticker
+        requests = [ticker_pb2.SessionRequest(request_id="n", news=ticker_pb2.GetNewsRequest(ticker="AAPL"))]
+
+        responses = list(TickerServiceServicer(quote_hub=Mock()).Session(iter(requests), _context()))
+
+        assert [r.request_id for r in responses] == ["n"]
+        assert responses[0].WhichOneof('response') == 'news'
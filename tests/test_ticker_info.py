@@ -0,0 +1,68 @@
+"""
+Tests for the compiled TickerInfo builders
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "gen"))
+
+from src.ticker_info import TICKER_INFO_FIELDS, builder, create_ticker_info
+from yfinance_grpc.v1alpha1 import ticker_pb2
+
+
+def _reference(info: dict, symbol: str, fields=None) -> ticker_pb2.TickerInfo:
+    """The table interpreted field by field, as create_ticker_info used to"""
+    kwargs = {}
+    for name in (TICKER_INFO_FIELDS if fields is None else fields):
+        key, convert, default = TICKER_INFO_FIELDS[name]
+        kwargs[name] = convert(info.get(key, symbol if name == 'symbol' else default))
+    return ticker_pb2.TickerInfo(**kwargs)
+
+
+_INFOS = [
+    {},
+    {'symbol': 'AAPL', 'longName': 'Apple Inc.', 'currentPrice': 150.25, 'marketCap': 2_500_000_000_000,
+     'volume': np.int64(51_000_000), 'trailingPE': float('nan'), 'beta': None, 'priceHint': None,
+     'enterpriseValue': 2_600_000_000_000, 'zip': 95014, 'exDividendDate': 1_731_024_000.0},
+    {'shortName': '', 'dayLow': 0.0, 'dividendYield': np.float64(0.0044), 'averageVolume': 'n/a',
+     'forwardPE': '31.2', 'numberOfAnalystOpinions': True, 'sharesOutstanding': float('inf')},
+]
+
+
+class TestBuilder:
+    @pytest.mark.parametrize('info', _INFOS)
+    def test_matches_table_interpretation(self, info):
+        assert create_ticker_info(info, 'SYM') == _reference(info, 'SYM')
+
+    @pytest.mark.parametrize('info', _INFOS)
+    def test_masked_build_matches(self, info):
+        fields = ['current_price', 'symbol', 'price_hint', 'volume']
+
+        assert create_ticker_info(info, 'SYM', fields) == _reference(info, 'SYM', fields)
+
+    def test_missing_keys_use_table_defaults(self):
+        message = create_ticker_info({}, 'MSFT')
+
+        assert message.symbol == 'MSFT'
+        assert message.price_hint == 2
+        assert message.current_price == 0.0
+
+    def test_builders_are_compiled_once_per_field_selection(self):
+        assert builder() is builder(list(TICKER_INFO_FIELDS))
+        assert builder(['symbol']) is builder(('symbol',))
+        assert builder(['symbol']) is not builder()
+
+    @pytest.mark.parametrize('info', _INFOS)
+    def test_field_order_shares_one_builder(self, info):
+        fields = ['symbol', 'current_price', 'long_name', 'market_cap']
+        shuffled = ['market_cap', 'long_name', 'symbol', 'current_price', 'symbol']
+
+        assert builder(shuffled) is builder(fields)
+        assert builder(shuffled)(info, 'AAPL') == _reference(info, 'AAPL', fields)